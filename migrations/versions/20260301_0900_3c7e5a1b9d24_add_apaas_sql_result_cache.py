@@ -0,0 +1,44 @@
+"""add apaas_sql_result_cache
+
+Revision ID: 3c7e5a1b9d24
+Revises: dfd31b9964f6
+Create Date: 2026-03-01 09:00:00.000000+00:00
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "3c7e5a1b9d24"
+down_revision: str | None = "dfd31b9964f6"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # Create shared result cache for read-only aPaaS SQL queries
+    op.create_table(
+        "apaas_sql_result_cache",
+        sa.Column("cache_key", sa.String(length=64), nullable=False),
+        sa.Column("workspace_id", sa.String(length=128), nullable=False),
+        sa.Column("tables", sa.String(length=1024), nullable=False),
+        sa.Column("payload", sa.Text(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), server_default=sa.text("now()"), nullable=True),
+        sa.Column("expires_at", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("cache_key"),
+    )
+    op.create_index(
+        "idx_sql_result_cache_workspace", "apaas_sql_result_cache", ["workspace_id"], unique=False
+    )
+    op.create_index(
+        "idx_sql_result_cache_expires", "apaas_sql_result_cache", ["expires_at"], unique=False
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_sql_result_cache_expires", table_name="apaas_sql_result_cache")
+    op.drop_index("idx_sql_result_cache_workspace", table_name="apaas_sql_result_cache")
+    op.drop_table("apaas_sql_result_cache")
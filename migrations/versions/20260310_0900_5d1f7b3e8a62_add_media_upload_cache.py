@@ -0,0 +1,42 @@
+"""add media_upload_cache
+
+Revision ID: 5d1f7b3e8a62
+Revises: 3c7e5a1b9d24
+Create Date: 2026-03-10 09:00:00.000000+00:00
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "5d1f7b3e8a62"
+down_revision: str | None = "3c7e5a1b9d24"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # Create shared dedup cache of uploaded media keys
+    op.create_table(
+        "media_upload_cache",
+        sa.Column("cache_key", sa.String(length=64), nullable=False),
+        sa.Column("app_id", sa.String(length=64), nullable=False),
+        sa.Column("kind", sa.String(length=16), nullable=False),
+        sa.Column("digest", sa.String(length=64), nullable=False),
+        sa.Column("media_key", sa.String(length=255), nullable=False),
+        sa.Column("file_size", sa.BigInteger(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), server_default=sa.text("now()"), nullable=True),
+        sa.Column("expires_at", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("cache_key"),
+    )
+    op.create_index("idx_media_cache_app", "media_upload_cache", ["app_id"], unique=False)
+    op.create_index("idx_media_cache_expires", "media_upload_cache", ["expires_at"], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index("idx_media_cache_expires", table_name="media_upload_cache")
+    op.drop_index("idx_media_cache_app", table_name="media_upload_cache")
+    op.drop_table("media_upload_cache")
@@ -6,6 +6,8 @@ This module provides Feishu aPaaS data space table CRUD capabilities, supporting
 - Batch operations (batch create, batch update)
 - Field definition query and parsing
 - Pagination query and filtering
+- Opt-in result cache for read-only SQL queries
+- Opt-in workspace schema cache (tables, field types)
 - user_access_token authentication
 
 Capability Scope:
@@ -16,6 +18,11 @@ Reference:
 https://open.feishu.cn/document/uAjLw4CM/ukTMukTMukTM/apaas-v1/workspace-table/list
 """
 
+from lark_service.apaas.cache import (
+    DatabaseSQLResultCache,
+    InMemorySQLResultCache,
+    SQLResultCache,
+)
 from lark_service.apaas.client import WorkspaceTableClient
 from lark_service.apaas.models import (
     FieldDefinition,
@@ -23,6 +30,7 @@ from lark_service.apaas.models import (
     TableRecord,
     WorkspaceTable,
 )
+from lark_service.apaas.schema import SchemaCache, TableSchema
 
 __all__ = [
     "WorkspaceTableClient",
@@ -30,4 +38,9 @@ __all__ = [
     "TableRecord",
     "FieldDefinition",
     "FieldType",
+    "SQLResultCache",
+    "InMemorySQLResultCache",
+    "DatabaseSQLResultCache",
+    "SchemaCache",
+    "TableSchema",
 ]
@@ -1,13 +1,29 @@
+import json
+import time
+from collections import deque
+from collections.abc import Iterable, Iterator, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
+from itertools import islice
 from typing import Any
 
 import requests
 
+from lark_service.apaas.cache import (
+    SQLCacheKey,
+    SQLResultCache,
+    is_read_only_sql,
+    is_schema_change_sql,
+    normalize_sql,
+    referenced_tables,
+    user_scope,
+)
 from lark_service.apaas.models import (
     FieldDefinition,
     FieldType,
     TableRecord,
     WorkspaceTable,
 )
+from lark_service.apaas.schema import SchemaCache, TableSchema, WorkspaceSchema
 from lark_service.core.base_service_client import BaseServiceClient
 from lark_service.core.credential_pool import CredentialPool
 from lark_service.core.exceptions import (
@@ -29,6 +45,32 @@ logger = get_logger()
 # Feishu aPaaS API base URL
 APAAS_API_BASE = "https://open.feishu.cn/open-apis"
 
+# Upper bound for one batch SQL statement (UTF-8 bytes)
+DEFAULT_MAX_SQL_BYTES = 512 * 1024
+
+# Concurrent SQL statements per batch operation
+DEFAULT_SQL_WORKERS = 4
+
+INSERT_RETURNING = " RETURNING id"
+
+_JSON_DECODER = json.JSONDecoder()
+
+# Raw records page: (items, next page token, has more, total)
+_RecordPage = tuple[list[dict[str, Any]], str | None, bool, int]
+
+# Maximum page size of the GET /records endpoint
+MAX_RECORD_PAGE_SIZE = 500
+
+# Rows per page for iter_sql
+DEFAULT_SQL_PAGE_SIZE = 1000
+MAX_SQL_PAGE_SIZE = 10000
+
+# Execution strategies of batch_update_records
+UPDATE_STRATEGIES = ("auto", "grouped", "case")
+
+# Estimated cost of one extra SQL request, in payload bytes
+STATEMENT_OVERHEAD_BYTES = 2048
+
 # Field type mapping from API response to FieldType enum
 FIELD_TYPE_MAP = {
     1: FieldType.TEXT,
@@ -48,6 +90,84 @@ FIELD_TYPE_MAP = {
     21: FieldType.LOOKUP,
 }
 
+# aPaaS database column type -> FieldType (unknown types map to TEXT)
+DATA_TYPE_MAP = {
+    "varchar": FieldType.TEXT,
+    "text": FieldType.TEXT,
+    "uuid": FieldType.TEXT,
+    "int4": FieldType.NUMBER,
+    "int8": FieldType.NUMBER,
+    "float4": FieldType.NUMBER,
+    "float8": FieldType.NUMBER,
+    "numeric": FieldType.NUMBER,
+    "bool": FieldType.CHECKBOX,
+    "timestamptz": FieldType.DATETIME,
+    "timestamp": FieldType.DATETIME,
+    "date": FieldType.DATE,
+    "user_profile": FieldType.PERSON,
+}
+
+
+def _decode_sql_result(result_str: str) -> list[dict[str, Any]]:
+    """
+    Decode the ``result`` field of a SQL Commands response.
+
+    The API returns a JSON array holding one JSON string with the rows. The
+    inner string is decoded straight from its offset, so the outer array is
+    never materialized.
+
+    Raises
+    ----------
+        ValueError: If the payload is not valid JSON
+    """
+    text = result_str.strip()
+    if not text.startswith("["):
+        raise ValueError(f"Unexpected SQL result: {text[:50]!r}")
+
+    pos = 1
+    while pos < len(text) and text[pos] in " \t\r\n":
+        pos += 1
+
+    if pos >= len(text) or text[pos] == "]":
+        return []
+
+    if text[pos] != '"':
+        # Rows returned without the inner string wrapper
+        rows: list[dict[str, Any]] = json.loads(text)
+        return rows
+
+    inner, _ = _JSON_DECODER.raw_decode(text, pos)
+    records: list[dict[str, Any]] = json.loads(inner)
+    return records
+
+
+def _to_table_record(item: dict[str, Any], table_id: str) -> TableRecord:
+    """
+    Build a TableRecord from a raw record item.
+
+    The item is owned by the caller and is reused as the ``fields`` dict:
+    ``id`` is popped and system fields (``_`` prefix) are only filtered out
+    when present.
+    """
+    record_id = item.pop("id", "")
+    if any(key.startswith("_") for key in item):
+        item = {k: v for k, v in item.items() if not k.startswith("_")}
+    return TableRecord(record_id=record_id, table_id=table_id, fields=item)
+
+
+def _index_runs(batches: Iterable[Sequence[int]]) -> list[list[int]]:
+    """Return the record indices of ``batches`` as sorted [start, count] runs."""
+    runs: list[list[int]] = []
+    for indices in batches:
+        batch_runs: list[list[int]] = []
+        for index in sorted(indices):
+            if batch_runs and batch_runs[-1][0] + batch_runs[-1][1] == index:
+                batch_runs[-1][1] += 1
+            else:
+                batch_runs.append([index, 1])
+        runs.extend(batch_runs)
+    return sorted(runs)
+
 
 class WorkspaceTableClient(BaseServiceClient):
     """
@@ -71,6 +191,10 @@ class WorkspaceTableClient(BaseServiceClient):
             Credential pool for token management
         retry_strategy : RetryStrategy
             Retry strategy for API calls
+        result_cache : SQLResultCache | None
+            Optional cache for read-only SQL query results
+        schema_cache : SchemaCache | None
+            Optional cache for workspace table and field definitions
 
     Examples
     --------
@@ -90,6 +214,8 @@ class WorkspaceTableClient(BaseServiceClient):
         credential_pool: CredentialPool,
         app_id: str | None = None,
         retry_strategy: RetryStrategy | None = None,
+        result_cache: SQLResultCache | None = None,
+        schema_cache: SchemaCache | None = None,
     ) -> None:
         """
         Initialize workspace table client.
@@ -99,9 +225,16 @@ class WorkspaceTableClient(BaseServiceClient):
             credential_pool: Credential pool for token management
             app_id: Optional client-level default app_id
             retry_strategy: Retry strategy for API calls (optional)
+            result_cache: Cache for read-only sql_query results (optional,
+                disabled by default)
+            schema_cache: Cache for table and field definitions (optional,
+                disabled by default). When set, record writes check column
+                names against the cached schema before sending SQL.
         """
         super().__init__(credential_pool, app_id)
         self.retry_strategy = retry_strategy or RetryStrategy()
+        self.result_cache = result_cache
+        self.schema_cache = schema_cache
 
     def _handle_api_error(self, result: dict[str, Any], method_name: str) -> None:
         """
@@ -150,24 +283,7 @@ class WorkspaceTableClient(BaseServiceClient):
         ----------
             Corresponding FieldType enum value
         """
-        # Map common database types to FieldType
-        type_mapping = {
-            "varchar": FieldType.TEXT,
-            "text": FieldType.TEXT,
-            "uuid": FieldType.TEXT,
-            "int4": FieldType.NUMBER,
-            "int8": FieldType.NUMBER,
-            "float4": FieldType.NUMBER,
-            "float8": FieldType.NUMBER,
-            "numeric": FieldType.NUMBER,
-            "bool": FieldType.CHECKBOX,
-            "timestamptz": FieldType.DATETIME,
-            "timestamp": FieldType.DATETIME,
-            "date": FieldType.DATE,
-            "user_profile": FieldType.PERSON,
-        }
-
-        return type_mapping.get(data_type.lower(), FieldType.TEXT)
+        return DATA_TYPE_MAP.get(data_type.lower(), FieldType.TEXT)
 
     def _format_sql_value(self, value: Any) -> str:
         """
@@ -203,11 +319,317 @@ class WorkspaceTableClient(BaseServiceClient):
         str_value = str(value).replace("'", "''")
         return f"'{str_value}'"
 
+    def _validate_batch_tuning(self, max_batch_bytes: int, max_workers: int) -> None:
+        """Validate payload size and concurrency settings of batch operations."""
+        if max_batch_bytes < 1024:
+            raise InvalidParameterError("max_batch_bytes must be at least 1024")
+        if max_workers < 1:
+            raise InvalidParameterError("max_workers must be at least 1")
+
+    def _iter_insert_batches(
+        self,
+        table_id: str,
+        records: list[dict[str, Any]],
+        batch_size: int,
+        max_batch_bytes: int,
+    ) -> Iterator[tuple[Sequence[int], str]]:
+        """
+        Split records into INSERT statements bounded by row count and size.
+
+        Each VALUES tuple is formatted once; a batch is closed as soon as
+        adding the next tuple would exceed ``batch_size`` rows or
+        ``max_batch_bytes`` bytes. A batch always holds at least one row.
+
+        Yields
+        ----------
+            Tuples of (record indices, SQL statement)
+        """
+        start = 0
+        columns: list[str] = []
+        prefix = ""
+        clauses: list[str] = []
+        size = 0
+
+        for index, record in enumerate(records):
+            clause = ""
+            if clauses:
+                clause = "(" + ", ".join([self._format_sql_value(record.get(c)) for c in columns])
+                clause += ")"
+                if len(clauses) >= batch_size or size + len(clause.encode()) > max_batch_bytes:
+                    yield (
+                        range(start, start + len(clauses)),
+                        prefix + ", ".join(clauses) + INSERT_RETURNING,
+                    )
+                    clauses = []
+
+            if not clauses:
+                # Columns come from the first record of each batch
+                start = index
+                columns = list(record)
+                prefix = f"INSERT INTO {table_id} ({', '.join(columns)}) VALUES "  # nosec B608
+                size = len(prefix.encode()) + len(INSERT_RETURNING)
+                clause = "(" + ", ".join([self._format_sql_value(record[c]) for c in columns])
+                clause += ")"
+
+            clauses.append(clause)
+            size += len(clause.encode()) + 2  # ", " separator
+
+        if clauses:
+            yield range(start, start + len(clauses)), prefix + ", ".join(clauses) + INSERT_RETURNING
+
+    def _plan_update_batches(
+        self,
+        table_id: str,
+        records: list[tuple[str, dict[str, Any]]],
+        batch_size: int,
+        max_batch_bytes: int,
+        strategy: str,
+    ) -> tuple[str, list[tuple[Sequence[int], str]]]:
+        """
+        Build UPDATE statements for batch_update_records.
+
+        Values are formatted once. The grouped plan is built first; for
+        "auto" the CASE plan is only built when its estimated size
+        (statement bytes plus a per-request overhead) is smaller.
+
+        Returns
+        ----------
+            Tuple of (chosen strategy, list of (record indices, SQL))
+        """
+        formatted = [
+            (
+                index,
+                self._format_sql_value(record_id),
+                tuple((name, self._format_sql_value(value)) for name, value in fields.items()),
+            )
+            for index, (record_id, fields) in enumerate(records)
+            if fields
+        ]
+
+        if strategy in ("auto", "grouped"):
+            grouped = self._grouped_update_batches(table_id, formatted, batch_size, max_batch_bytes)
+            if strategy == "grouped":
+                return "grouped", grouped
+
+            grouped_cost = sum(len(sql) for _, sql in grouped)
+            grouped_cost += len(grouped) * STATEMENT_OVERHEAD_BYTES
+            # Each CASE branch repeats "WHEN id = <id> THEN <value> "
+            case_cost = sum(
+                len(rid) + 2 + sum(len(rid) + len(value) + 18 for _, value in items)
+                for _, rid, items in formatted
+            )
+            case_cost += -(-len(formatted) // batch_size) * STATEMENT_OVERHEAD_BYTES
+            if grouped_cost <= case_cost:
+                return "grouped", grouped
+
+        return "case", self._case_update_batches(table_id, formatted, batch_size, max_batch_bytes)
+
+    def _grouped_update_batches(
+        self,
+        table_id: str,
+        formatted: list[tuple[int, str, tuple[tuple[str, str], ...]]],
+        batch_size: int,
+        max_batch_bytes: int,
+    ) -> list[tuple[Sequence[int], str]]:
+        """
+        Group records by identical changes into ``WHERE id IN (...)`` statements.
+
+        A statement covers records from anywhere in the input, so each batch
+        carries the explicit indices of its records.
+        """
+        groups: dict[tuple[tuple[str, str], ...], list[tuple[int, str]]] = {}
+        for index, rid, items in formatted:
+            groups.setdefault(items, []).append((index, rid))
+
+        batches: list[tuple[Sequence[int], str]] = []
+        for items, members in groups.items():
+            set_clause = ", ".join(f"{name} = {value}" for name, value in items)
+            prefix = f"UPDATE {table_id} SET {set_clause} WHERE id IN ("  # nosec B608
+            base_size = len(prefix.encode()) + 1
+
+            chunk: list[tuple[int, str]] = []
+            size = base_size
+            for index, rid in members:
+                rid_size = len(rid.encode()) + 2
+                if chunk and (len(chunk) >= batch_size or size + rid_size > max_batch_bytes):
+                    batches.append(
+                        ([i for i, _ in chunk], prefix + ", ".join(r for _, r in chunk) + ")")
+                    )
+                    chunk = []
+                    size = base_size
+                chunk.append((index, rid))
+                size += rid_size
+            if chunk:
+                batches.append(
+                    ([i for i, _ in chunk], prefix + ", ".join(r for _, r in chunk) + ")")
+                )
+
+        return batches
+
+    def _case_update_batches(
+        self,
+        table_id: str,
+        formatted: list[tuple[int, str, tuple[tuple[str, str], ...]]],
+        batch_size: int,
+        max_batch_bytes: int,
+    ) -> list[tuple[Sequence[int], str]]:
+        """Chunk records into ``SET field = CASE id WHEN ... END`` statements."""
+
+        def _build(chunk: list[tuple[int, str, tuple[tuple[str, str], ...]]]) -> str:
+            cases: dict[str, list[str]] = {}
+            for _, rid, items in chunk:
+                for name, value in items:
+                    cases.setdefault(name, []).append(f"WHEN id = {rid} THEN {value}")
+            set_clause = ", ".join(
+                f"{name} = CASE {' '.join(whens)} ELSE {name} END" for name, whens in cases.items()
+            )
+            ids = ", ".join(rid for _, rid, _ in chunk)
+            return f"UPDATE {table_id} SET {set_clause} WHERE id IN ({ids})"  # nosec B608
+
+        batches: list[tuple[Sequence[int], str]] = []
+        chunk: list[tuple[int, str, tuple[tuple[str, str], ...]]] = []
+        chunk_fields: set[str] = set()
+        base_size = len(table_id) + 40
+        size = base_size
+        for entry in formatted:
+            _, rid, items = entry
+            rid_size = len(rid.encode())
+            entry_size = rid_size + 2
+            entry_size += sum(rid_size + len(value.encode()) + 18 for _, value in items)
+            # "name = CASE ... ELSE name END, " for fields new to this chunk
+            entry_size += sum(2 * len(name) + 20 for name, _ in items if name not in chunk_fields)
+            if chunk and (len(chunk) >= batch_size or size + entry_size > max_batch_bytes):
+                batches.append(([i for i, _, _ in chunk], _build(chunk)))
+                chunk = []
+                chunk_fields = set()
+                size = base_size
+                entry_size = rid_size + 2
+                entry_size += sum(
+                    rid_size + len(value.encode()) + 2 * len(name) + 38 for name, value in items
+                )
+            chunk.append(entry)
+            chunk_fields.update(name for name, _ in items)
+            size += entry_size
+        if chunk:
+            batches.append(([i for i, _, _ in chunk], _build(chunk)))
+
+        return batches
+
+    def _execute_sql_batches(
+        self,
+        user_access_token: str,
+        workspace_id: str,
+        batches: Iterable[tuple[Sequence[int], str]],
+        max_workers: int,
+        action: str,
+        app_id: str | None = None,
+    ) -> Iterator[tuple[int, Sequence[int], list[dict[str, Any]]]]:
+        """
+        Run batch statements with bounded parallelism, yielding in input order.
+
+        At most ``max_workers`` statements are in flight; the next statement
+        is only built once a slot frees up, so memory stays bounded for
+        large loads.
+
+        Yields
+        ----------
+            Tuples of (1-based batch number, record indices, result rows)
+
+        Raises
+        ----------
+            APIError: If a batch fails. Queued batches are cancelled, but
+                batches already running are awaited: ``details`` lists the
+                record indices of ``committed_ranges`` and ``failed_ranges``
+                as [start, count] runs, and committed batches may lie after
+                the failed one
+        """
+
+        def _run(sql: str) -> list[dict[str, Any]]:
+            return self.sql_query(
+                app_id=app_id,
+                user_access_token=user_access_token,
+                workspace_id=workspace_id,
+                sql=sql,
+                use_cache=False,
+            )
+
+        source = iter(batches)
+        in_flight: deque[tuple[Sequence[int], Future[list[dict[str, Any]]]]] = deque()
+        committed: list[Sequence[int]] = []
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            try:
+                for indices, sql in islice(source, max_workers):
+                    in_flight.append((indices, executor.submit(_run, sql)))
+
+                batch_num = 0
+                while in_flight:
+                    indices, future = in_flight.popleft()
+                    batch_num += 1
+                    try:
+                        result = future.result()
+                    except Exception as e:
+                        logger.error(f"Error in batch {batch_num}: {e}")
+                        raise self._batch_error(action, indices, e, committed, in_flight) from e
+
+                    for next_indices, next_sql in islice(source, 1):
+                        in_flight.append((next_indices, executor.submit(_run, next_sql)))
+
+                    committed.append(indices)
+                    yield batch_num, indices, result
+            finally:
+                for _, pending in in_flight:
+                    pending.cancel()
+
+    @staticmethod
+    def _batch_error(
+        action: str,
+        indices: Sequence[int],
+        error: Exception,
+        committed: list[Sequence[int]],
+        in_flight: deque[tuple[Sequence[int], Future[list[dict[str, Any]]]]],
+    ) -> APIError:
+        """Build the error of a failed batch after draining the running ones.
+
+        Batches queued after the failed one may already have been applied;
+        they are awaited so the error reports exactly which rows were
+        written and a caller can resume without duplicating them.
+        """
+        later = 0
+        committed = list(committed)
+        failed = [indices]
+        while in_flight:
+            other_indices, other = in_flight.popleft()
+            if other.cancel():
+                continue
+            try:
+                other.result()
+            except Exception:
+                failed.append(other_indices)
+            else:
+                committed.append(other_indices)
+                later += 1
+
+        start = min(indices)
+        message = f"Failed to {action} batch at index {start}: {error}"
+        if later:
+            message += f" ({later} later batches were applied; see details['committed_ranges'])"
+        return APIError(
+            message,
+            details={
+                "failed_index": start,
+                "committed_ranges": _index_runs(committed),
+                "failed_ranges": _index_runs(failed),
+                "committed_rows": sum(len(batch) for batch in committed),
+            },
+        )
+
     def list_workspace_tables(
         self,
         user_access_token: str,
         workspace_id: str,
         app_id: str | None = None,
+        refresh: bool = False,
     ) -> list[WorkspaceTable]:
         """
         List all data tables in a workspace.
@@ -217,6 +639,7 @@ class WorkspaceTableClient(BaseServiceClient):
             user_access_token: User access token for authentication
             workspace_id: Workspace ID, format: ws_xxx
             app_id: Optional app_id (uses resolution priority if not provided)
+            refresh: Reload the schema even if it is cached (default: False)
 
         Returns
         ----------
@@ -254,49 +677,29 @@ class WorkspaceTableClient(BaseServiceClient):
         )
 
         try:
-            url = f"{APAAS_API_BASE}/apaas/v1/workspaces/{workspace_id}/tables"
-            headers = {
-                "Authorization": f"Bearer {user_access_token}",
-                "Content-Type": "application/json",
-            }
-
-            response = requests.get(url, headers=headers, timeout=30)
-            result = response.json()
-
-            if result.get("code") != 0:
-                self._handle_api_error(result, "list_workspace_tables")
-
-            # Parse response data - aPaaS returns 'items' not 'tables'
-            tables_data = result.get("data", {}).get("items", [])
-            tables = []
-
-            for table_data in tables_data:
-                table = WorkspaceTable(
-                    table_id=table_data.get("name", ""),  # aPaaS uses table name as ID
-                    workspace_id=workspace_id,
-                    name=table_data.get("name", ""),
-                    description=table_data.get("description"),
-                    field_count=len(table_data.get("columns", [])),  # Count columns
-                )
-                tables.append(table)
-
-            logger.info(
-                f"Successfully listed {len(tables)} tables",
-                extra={"workspace_id": workspace_id, "count": len(tables)},
+            schema = self._get_workspace_schema(
+                user_access_token, workspace_id, "list_workspace_tables", refresh
             )
-
-            return tables
-
         except requests.RequestException as e:
             logger.error(f"Network error listing workspace tables: {e}")
             raise APIError(f"Failed to list workspace tables: {e}") from e
 
+        tables = [table_schema.table for table_schema in schema.tables.values()]
+
+        logger.info(
+            f"Successfully listed {len(tables)} tables",
+            extra={"workspace_id": workspace_id, "count": len(tables)},
+        )
+
+        return tables
+
     def list_fields(
         self,
         user_access_token: str,
         table_id: str,
         workspace_id: str,
         app_id: str | None = None,
+        refresh: bool = False,
     ) -> list[FieldDefinition]:
         """
         Get field definitions for a data table.
@@ -310,6 +713,7 @@ class WorkspaceTableClient(BaseServiceClient):
             table_id: Table name (e.g., "follow_ups")
             workspace_id: Workspace ID where the table exists
             app_id: Optional app_id (uses resolution priority if not provided)
+            refresh: Reload the schema even if it is cached (default: False)
 
         Returns
         ----------
@@ -349,59 +753,252 @@ class WorkspaceTableClient(BaseServiceClient):
         )
 
         try:
-            # aPaaS doesn't have separate fields endpoint, get from table list
-            url = f"{APAAS_API_BASE}/apaas/v1/workspaces/{workspace_id}/tables"
-            headers = {
-                "Authorization": f"Bearer {user_access_token}",
-                "Content-Type": "application/json",
-            }
+            table_schema = self._get_table_schema(
+                user_access_token, table_id, workspace_id, "list_fields", refresh
+            )
+        except requests.RequestException as e:
+            logger.error(f"Network error listing table fields: {e}")
+            raise APIError(f"Failed to list table fields: {e}") from e
 
-            response = requests.get(url, headers=headers, timeout=30)
-            result = response.json()
+        fields = list(table_schema.fields)
 
-            if result.get("code") != 0:
-                self._handle_api_error(result, "list_fields")
+        logger.info(
+            f"Successfully listed {len(fields)} fields",
+            extra={"table_id": table_id, "count": len(fields)},
+        )
+
+        return fields
+
+    def get_field_types(
+        self,
+        user_access_token: str,
+        table_id: str,
+        workspace_id: str,
+        app_id: str | None = None,
+        refresh: bool = False,
+    ) -> dict[str, FieldType]:
+        """
+        Get the column name -> FieldType map of a data table.
+
+        With a schema cache the map is computed once per schema load, so
+        repeated lookups (e.g. before every write) need no API call.
+
+        Args
+        ----------
+            user_access_token: User access token for authentication
+            table_id: Table name (e.g., "follow_ups")
+            workspace_id: Workspace ID where the table exists
+            app_id: Optional app_id (uses resolution priority if not provided)
+            refresh: Reload the schema even if it is cached (default: False)
+
+        Returns
+        ----------
+            Mapping of column name to FieldType
+
+        Raises
+        ----------
+            InvalidParameterError: If parameters are invalid
+            NotFoundError: If table not found
+            PermissionDeniedError: If user lacks permission
+            APIError: If API call fails
+
+        Example
+        --------
+            >>> types = client.get_field_types(
+            ...     user_access_token="u-xxx",
+            ...     table_id="follow_ups",
+            ...     workspace_id="workspace_xxx"
+            ... )
+            >>> types["followup_date"]
+            <FieldType.DATETIME: 'datetime'>
+        """
+        resolved_app_id = self._resolve_app_id(app_id)
+
+        validate_app_id(resolved_app_id)
+        validate_non_empty_string(user_access_token, "user_access_token")
+        validate_non_empty_string(table_id, "table_id")
+        validate_non_empty_string(workspace_id, "workspace_id")
+
+        try:
+            table_schema = self._get_table_schema(
+                user_access_token, table_id, workspace_id, "get_field_types", refresh
+            )
+        except requests.RequestException as e:
+            logger.error(f"Network error loading table schema: {e}")
+            raise APIError(f"Failed to load table schema: {e}") from e
+
+        return dict(table_schema.field_types)
 
-            # Find the specified table
-            tables_data = result.get("data", {}).get("items", [])
-            target_table = None
-            for table_data in tables_data:
-                if table_data.get("name") == table_id:
-                    target_table = table_data
-                    break
+    def refresh_schema(self, workspace_id: str | None = None) -> int:
+        """
+        Drop cached table definitions so the next lookup reloads them.
 
-            if not target_table:
-                raise NotFoundError(f"Table not found: {table_id}")
+        Args
+        ----------
+            workspace_id: Workspace to refresh (default: every workspace)
+
+        Returns
+        ----------
+            Number of cached schemas dropped (0 without a schema cache)
+        """
+        if self.schema_cache is None:
+            return 0
+        return self.schema_cache.invalidate(workspace_id)
 
-            # Parse columns from table data
-            columns_data = target_table.get("columns", [])
-            fields = []
+    def _fetch_workspace_schema(
+        self, user_access_token: str, workspace_id: str, method_name: str
+    ) -> WorkspaceSchema:
+        """
+        Download and parse every table definition of a workspace.
 
-            for col_data in columns_data:
-                # Map database column type to FieldType
-                data_type = col_data.get("data_type", "text")
-                field_type = self._map_data_type_to_field_type(data_type)
+        aPaaS has no separate fields endpoint; the table list carries the
+        column definitions of all tables, so one request fills the schema.
+        """
+        url = f"{APAAS_API_BASE}/apaas/v1/workspaces/{workspace_id}/tables"
+        headers = {
+            "Authorization": f"Bearer {user_access_token}",
+            "Content-Type": "application/json",
+        }
 
-                field = FieldDefinition(
+        response = requests.get(url, headers=headers, timeout=30)
+        result = response.json()
+
+        if result.get("code") != 0:
+            self._handle_api_error(result, method_name)
+
+        # aPaaS returns 'items' not 'tables' and uses the table name as ID
+        tables: dict[str, TableSchema] = {}
+        for table_data in result.get("data", {}).get("items", []):
+            name = table_data.get("name", "")
+            if name in tables:
+                continue
+            columns = table_data.get("columns", [])
+            table = WorkspaceTable(
+                table_id=name,
+                workspace_id=workspace_id,
+                name=name,
+                description=table_data.get("description"),
+                field_count=len(columns),
+            )
+            fields = tuple(
+                FieldDefinition(
                     field_id=col_data.get("name", ""),  # Use column name as field_id
                     field_name=col_data.get("name", ""),
-                    field_type=field_type,
+                    field_type=self._map_data_type_to_field_type(col_data.get("data_type", "text")),
                     is_required=not col_data.get("is_allow_null", True),
                     description=col_data.get("description"),
                     options=None,  # aPaaS columns don't have select options
                 )
-                fields.append(field)
-
-            logger.info(
-                f"Successfully listed {len(fields)} fields",
-                extra={"table_id": table_id, "count": len(fields)},
+                for col_data in columns
             )
+            tables[name] = TableSchema(table, fields)
+
+        return WorkspaceSchema(workspace_id, tables, time.monotonic())
+
+    def _get_workspace_schema(
+        self,
+        user_access_token: str,
+        workspace_id: str,
+        method_name: str,
+        refresh: bool = False,
+    ) -> WorkspaceSchema:
+        """Return the workspace schema, from the schema cache when possible."""
+        cache = self.schema_cache
+        if cache is None:
+            return self._fetch_workspace_schema(user_access_token, workspace_id, method_name)
+
+        scope = user_scope(user_access_token)
+        if not refresh:
+            schema = cache.get(workspace_id, scope)
+            if schema is not None:
+                return schema
+
+        schema = self._fetch_workspace_schema(user_access_token, workspace_id, method_name)
+        cache.set(scope, schema)
+        return schema
+
+    def _get_table_schema(
+        self,
+        user_access_token: str,
+        table_id: str,
+        workspace_id: str,
+        method_name: str,
+        refresh: bool = False,
+    ) -> TableSchema:
+        """Return one table's schema, reloading once if a cached schema lacks it."""
+        schema = self._get_workspace_schema(user_access_token, workspace_id, method_name, refresh)
+        table_schema = schema.get(table_id)
+        if table_schema is None and self.schema_cache is not None and not refresh:
+            # The table may have been created after the schema was cached
+            schema = self._get_workspace_schema(user_access_token, workspace_id, method_name, True)
+            table_schema = schema.get(table_id)
+        if table_schema is None:
+            raise NotFoundError(f"Table not found: {table_id}")
+        return table_schema
+
+    def _check_record_fields(
+        self,
+        user_access_token: str,
+        table_id: str,
+        workspace_id: str,
+        field_names: Iterable[str],
+        new_records: Sequence[dict[str, Any]] = (),
+    ) -> None:
+        """
+        Reject unknown column names and inserts missing required columns.
+
+        Does nothing without a schema cache. An unknown or missing column
+        triggers one schema reload before failing, so columns added (or
+        made nullable) since the schema was cached are accepted.
+
+        Args
+        ----------
+            field_names: Column names written by the call
+            new_records: Records to be inserted, checked for required columns
 
-            return fields
+        Raises
+        ----------
+            NotFoundError: If table not found
+            InvalidParameterError: If a column does not exist or a required
+                column is missing
+        """
+        if self.schema_cache is None:
+            return
 
+        def _first_missing(table_schema: TableSchema) -> tuple[int, list[str]] | None:
+            for index, record in enumerate(new_records):
+                missing = table_schema.missing_fields(record)
+                if missing:
+                    return index, missing
+            return None
+
+        names = list(dict.fromkeys(field_names))
+        try:
+            table_schema = self._get_table_schema(
+                user_access_token, table_id, workspace_id, "validate_fields"
+            )
+            unknown = table_schema.unknown_fields(names)
+            missing = _first_missing(table_schema)
+            if unknown or missing:
+                table_schema = self._get_table_schema(
+                    user_access_token, table_id, workspace_id, "validate_fields", refresh=True
+                )
+                unknown = table_schema.unknown_fields(unknown)
+                missing = _first_missing(table_schema)
         except requests.RequestException as e:
-            logger.error(f"Network error listing table fields: {e}")
-            raise APIError(f"Failed to list table fields: {e}") from e
+            logger.error(f"Network error loading table schema: {e}")
+            raise APIError(f"Failed to load table schema: {e}") from e
+
+        if unknown:
+            raise InvalidParameterError(
+                f"Unknown field(s) for table {table_id}: {', '.join(unknown)}"
+            )
+        if missing:
+            index, fields = missing
+            raise InvalidParameterError(
+                f"Missing required field(s) for table {table_id}: {', '.join(fields)}",
+                details={"record_index": index, "missing_fields": fields},
+            )
 
     def sql_query(
         self,
@@ -409,6 +1006,8 @@ class WorkspaceTableClient(BaseServiceClient):
         workspace_id: str,
         sql: str,
         app_id: str | None = None,
+        use_cache: bool = True,
+        refresh: bool = False,
     ) -> list[dict[str, Any]]:
         """
         Execute SQL SELECT query on workspace tables.
@@ -423,6 +1022,12 @@ class WorkspaceTableClient(BaseServiceClient):
             sql: SQL SELECT statement
 
                     app_id: Optional app_id (uses resolution priority if not provided)
+            use_cache: Read and store read-only results in the client's result
+                cache (default: True; no effect without a cache). False
+                bypasses the cache, e.g. for pages of a streamed export;
+                writes still invalidate cached reads
+            refresh: Skip the cache lookup but store the new result
+                (default: False)
 
         Returns
         ----------
@@ -449,6 +1054,8 @@ class WorkspaceTableClient(BaseServiceClient):
             - Only SELECT queries are recommended
             - INSERT/UPDATE/DELETE have syntax limitations
             - SQL follows PostgreSQL syntax
+            - With a result cache, read-only results are cached per user and
+              any other statement invalidates cached reads of its tables
             - Refer to: https://open.feishu.cn/document/uAjLw4CM/ukTMukTMukTM/apaas-v1/workspace/sql_commands
         """
         # Resolve app_id
@@ -459,6 +1066,55 @@ class WorkspaceTableClient(BaseServiceClient):
         validate_non_empty_string(workspace_id, "workspace_id")
         validate_non_empty_string(sql, "sql")
 
+        cache = self.result_cache
+        if cache is None:
+            return self._execute_sql(user_access_token, workspace_id, sql, app_id)
+
+        tables = referenced_tables(sql)
+        if not is_read_only_sql(sql):
+            # Each invalidation advances the write generation, so reads in
+            # this process that overlap the write do not store their rows;
+            # other processes sharing the cache are bounded by its TTL
+            cache.invalidate(workspace_id, tables)
+            try:
+                return self._execute_sql(user_access_token, workspace_id, sql, app_id)
+            finally:
+                cache.invalidate(workspace_id, tables)
+
+        if not use_cache:
+            return self._execute_sql(user_access_token, workspace_id, sql, app_id)
+
+        key = SQLCacheKey(workspace_id, user_scope(user_access_token), normalize_sql(sql))
+        if not refresh:
+            cached = cache.get(key)
+            if cached is not None:
+                logger.debug(
+                    "SQL query served from cache",
+                    extra={"workspace_id": workspace_id, "count": len(cached)},
+                )
+                return cached
+
+        generation = cache.generation(workspace_id)
+        records = self._execute_sql(user_access_token, workspace_id, sql, app_id)
+        cache.set(key, tables, records, generation)
+        return records
+
+    def _execute_sql(
+        self,
+        user_access_token: str,
+        workspace_id: str,
+        sql: str,
+        app_id: str | None = None,
+    ) -> list[dict[str, Any]]:
+        """
+        Send one statement to the SQL Commands API and decode the rows.
+
+        Raises
+        ----------
+            PermissionDeniedError: If user lacks permission
+            APIError: If API call fails or SQL syntax error
+        """
+
         logger.info(
             "Executing SQL query",
             extra={
@@ -483,17 +1139,11 @@ class WorkspaceTableClient(BaseServiceClient):
             if result.get("code") != 0:
                 self._handle_api_error(result, "sql_query")
 
-            # Parse nested JSON response
-            import json as jsonlib
-
-            data = result.get("data", {})
-            result_str = data.get("result", "[]")
+            result_str = result.get("data", {}).get("result", "[]")
+            # Drop the response envelope before decoding the (possibly large) rows
+            del response, result
 
-            # Result is a JSON string containing an array with one element (another JSON string)
-            outer_array = jsonlib.loads(result_str)
-            records: list[dict[str, Any]] = (
-                jsonlib.loads(outer_array[0]) if outer_array and len(outer_array) > 0 else []
-            )
+            records = _decode_sql_result(result_str)
 
             logger.info(
                 f"Successfully executed SQL query, {len(records)} records returned",
@@ -508,6 +1158,114 @@ class WorkspaceTableClient(BaseServiceClient):
         except (ValueError, KeyError) as e:
             logger.error(f"Failed to parse SQL query response: {e}")
             raise APIError(f"Failed to parse SQL response: {e}") from e
+        finally:
+            # DDL may have changed tables even if the call failed midway
+            if self.schema_cache is not None and is_schema_change_sql(sql):
+                self.schema_cache.invalidate(workspace_id)
+
+    def iter_sql(
+        self,
+        user_access_token: str,
+        workspace_id: str,
+        sql: str,
+        page_size: int = DEFAULT_SQL_PAGE_SIZE,
+        key_column: str | None = None,
+        app_id: str | None = None,
+    ) -> Iterator[dict[str, Any]]:
+        """
+        Execute a SELECT query page by page and yield rows lazily.
+
+        The query is wrapped as a subquery and paged with LIMIT/OFFSET, or
+        with keyset pagination (``WHERE key > last ORDER BY key``) when
+        ``key_column`` is given. Only one page is held in memory at a time,
+        and pages bypass the result cache.
+
+        Args
+        ----------
+            user_access_token: User access token for authentication
+            workspace_id: Workspace ID to execute query in
+            sql: SQL SELECT statement (without trailing LIMIT/OFFSET)
+            page_size: Rows per request (default: 1000)
+            key_column: Unique, ordered column for keyset pagination
+                (recommended for large tables; must be in the SELECT list)
+
+                    app_id: Optional app_id (uses resolution priority if not provided)
+
+        Yields
+        ----------
+            Result records as dictionaries
+
+        Raises
+        ----------
+            InvalidParameterError: If parameters are invalid
+            PermissionDeniedError: If user lacks permission
+            APIError: If API call fails or SQL syntax error
+
+        Example
+        --------
+            >>> for row in client.iter_sql(
+            ...     user_access_token="u-xxx",
+            ...     workspace_id="workspace_xxx",
+            ...     sql="SELECT id, name FROM customers",
+            ...     key_column="id",
+            ... ):
+            ...     writer.writerow([row["id"], row["name"]])
+
+        Notes
+        -----
+            - OFFSET paging needs a deterministic ORDER BY in ``sql``
+            - Keyset paging ignores any ORDER BY in ``sql``
+        """
+        validate_non_empty_string(sql, "sql")
+        validate_non_negative_int(page_size, "page_size", min_value=1, max_value=MAX_SQL_PAGE_SIZE)
+
+        base_sql = sql.strip().rstrip(";").rstrip()
+        keyword = base_sql.split(None, 1)[0].upper() if base_sql else ""
+        if keyword not in ("SELECT", "WITH"):
+            raise InvalidParameterError("iter_sql only supports SELECT queries")
+
+        offset = 0
+        last_key: Any = None
+
+        while True:
+            if key_column is None:
+                page_sql = (
+                    f"SELECT * FROM ({base_sql}) AS _page "  # nosec B608
+                    f"LIMIT {page_size} OFFSET {offset}"
+                )
+            else:
+                where = (
+                    ""
+                    if last_key is None
+                    else f"WHERE {key_column} > {self._format_sql_value(last_key)} "
+                )
+                page_sql = (
+                    f"SELECT * FROM ({base_sql}) AS _page {where}"  # nosec B608
+                    f"ORDER BY {key_column} LIMIT {page_size}"
+                )
+
+            page = self.sql_query(
+                app_id=app_id,
+                user_access_token=user_access_token,
+                workspace_id=workspace_id,
+                sql=page_sql,
+                use_cache=False,
+            )
+            count = len(page)
+
+            if key_column is not None and page:
+                if key_column not in page[-1]:
+                    raise InvalidParameterError(
+                        f"key_column '{key_column}' is not in the query result"
+                    )
+                last_key = page[-1][key_column]
+
+            yield from page
+            del page
+
+            if count < page_size:
+                return
+            offset += count
 
     def query_records(
         self,
@@ -582,6 +1340,42 @@ class WorkspaceTableClient(BaseServiceClient):
             },
         )
 
+        items, next_page_token, has_more, total = self._fetch_record_items(
+            user_access_token, table_id, workspace_id, page_size, page_token
+        )
+        records = [_to_table_record(item, table_id) for item in items]
+
+        logger.info(
+            f"Successfully queried {len(records)} records (total: {total})",
+            extra={
+                "table_id": table_id,
+                "count": len(records),
+                "total": total,
+                "has_more": has_more,
+            },
+        )
+
+        return (records, next_page_token, has_more)
+
+    def _fetch_record_items(
+        self,
+        user_access_token: str,
+        table_id: str,
+        workspace_id: str,
+        page_size: int,
+        page_token: str | None = None,
+    ) -> _RecordPage:
+        """
+        Fetch one raw page from the GET /records endpoint.
+
+        Returns
+        ----------
+            Tuple of (raw items, next page token, has more flag, total count)
+
+        Raises
+        ----------
+            APIError: If API call fails
+        """
         try:
             url = f"{APAAS_API_BASE}/apaas/v1/workspaces/{workspace_id}/tables/{table_id}/records"
             headers = {
@@ -600,51 +1394,169 @@ class WorkspaceTableClient(BaseServiceClient):
             if result.get("code") != 0:
                 self._handle_api_error(result, "query_records")
 
-            # Parse response data
-            import json as jsonlib
-
             data = result.get("data", {})
-            items = data.get("items")
+            items = data.get("items") or []
 
             # aPaaS returns items as JSON string, need to parse
             if isinstance(items, str):
-                items = jsonlib.loads(items)
+                items = json.loads(items)
 
-            next_page_token = data.get("page_token")
-            has_more = data.get("has_more", False)
-            total = data.get("total", 0)
+            return (
+                items,
+                data.get("page_token"),
+                data.get("has_more", False),
+                data.get("total", 0),
+            )
 
-            # Convert to TableRecord objects
-            records = []
-            for item in items:
-                # Extract record_id (usually 'id' field)
-                record_id = item.get("id", "")
+        except requests.RequestException as e:
+            logger.error(f"Network error querying records: {e}")
+            raise APIError(f"Failed to query records: {e}") from e
+
+    def iter_records(
+        self,
+        user_access_token: str,
+        table_id: str,
+        workspace_id: str,
+        page_size: int = MAX_RECORD_PAGE_SIZE,
+        parallel: bool = False,
+        total: int | None = None,
+        max_workers: int = DEFAULT_SQL_WORKERS,
+        app_id: str | None = None,
+    ) -> Iterator[TableRecord]:
+        """
+        Iterate over all records of a data table.
 
-                # Remove system fields and keep user fields
-                fields = {k: v for k, v in item.items() if not k.startswith("_") and k != "id"}
+        Pages are fetched with the maximum page size and the next page is
+        requested while the current one is being consumed. TableRecord
+        objects are built one at a time as the caller iterates.
 
-                record = TableRecord(
-                    record_id=record_id,
-                    table_id=table_id,
-                    fields=fields,
-                )
-                records.append(record)
+        With ``parallel=True`` the table is read through the SQL Commands API
+        as ``ORDER BY id`` LIMIT/OFFSET pages, up to ``max_workers`` at a
+        time. The page plan comes from ``total`` (or a ``COUNT(*)`` query
+        when omitted), so use it for tables whose size is known and stable
+        during the read. Pages bypass the result cache.
 
-            logger.info(
-                f"Successfully queried {len(records)} records (total: {total})",
-                extra={
-                    "table_id": table_id,
-                    "count": len(records),
-                    "total": total,
-                    "has_more": has_more,
-                },
+        Args
+        ----------
+            user_access_token: User access token for authentication
+            table_id: Table name (e.g., "follow_ups")
+            workspace_id: Workspace ID where the table exists
+            page_size: Number of records per page (default: 500, max: 500)
+            parallel: Fetch pages concurrently via SQL (default: False)
+            total: Known row count for parallel mode (optional)
+            max_workers: Maximum concurrent page requests in parallel mode
+
+                    app_id: Optional app_id (uses resolution priority if not provided)
+
+        Yields
+        ----------
+            TableRecord objects in table order
+
+        Raises
+        ----------
+            InvalidParameterError: If parameters are invalid
+            NotFoundError: If table not found
+            PermissionDeniedError: If user lacks permission
+            APIError: If API call fails
+
+        Example
+        --------
+            >>> for record in client.iter_records(
+            ...     user_access_token="u-xxx",
+            ...     table_id="follow_ups",
+            ...     workspace_id="workspace_xxx",
+            ... ):
+            ...     process(record.fields)
+        """
+        resolved_app_id = self._resolve_app_id(app_id)
+
+        validate_app_id(resolved_app_id)
+        validate_non_empty_string(user_access_token, "user_access_token")
+        validate_non_empty_string(table_id, "table_id")
+        validate_non_empty_string(workspace_id, "workspace_id")
+        validate_non_negative_int(
+            page_size, "page_size", min_value=1, max_value=MAX_RECORD_PAGE_SIZE
+        )
+
+        if max_workers < 1:
+            raise InvalidParameterError("max_workers must be at least 1")
+
+        if parallel:
+            yield from self._iter_records_parallel(
+                user_access_token, table_id, workspace_id, page_size, total, max_workers, app_id
             )
+            return
 
-            return (records, next_page_token, has_more)
+        logger.info(
+            "Iterating table records",
+            extra={"table_id": table_id, "workspace_id": workspace_id, "page_size": page_size},
+        )
 
-        except requests.RequestException as e:
-            logger.error(f"Network error querying records: {e}")
-            raise APIError(f"Failed to query records: {e}") from e
+        seen_tokens: set[str] = set()
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            future: Future[_RecordPage] | None = executor.submit(
+                self._fetch_record_items, user_access_token, table_id, workspace_id, page_size
+            )
+            while future is not None:
+                items, next_token, has_more, _ = future.result()
+
+                future = None
+                if has_more and next_token:
+                    if next_token in seen_tokens:
+                        raise APIError(f"Pagination did not advance for table {table_id}")
+                    seen_tokens.add(next_token)
+                    # Prefetch the next page while this one is consumed
+                    future = executor.submit(
+                        self._fetch_record_items,
+                        user_access_token,
+                        table_id,
+                        workspace_id,
+                        page_size,
+                        next_token,
+                    )
+
+                for item in items:
+                    yield _to_table_record(item, table_id)
+
+    def _iter_records_parallel(
+        self,
+        user_access_token: str,
+        table_id: str,
+        workspace_id: str,
+        page_size: int,
+        total: int | None,
+        max_workers: int,
+        app_id: str | None,
+    ) -> Iterator[TableRecord]:
+        """Read a table as concurrent SQL OFFSET pages planned from its row count."""
+        if total is None:
+            rows = self.sql_query(
+                app_id=app_id,
+                user_access_token=user_access_token,
+                workspace_id=workspace_id,
+                sql=f"SELECT COUNT(*) AS total FROM {table_id}",  # nosec B608
+                use_cache=False,
+            )
+            total = int(rows[0].get("total") or 0) if rows else 0
+
+        logger.info(
+            f"Reading {total} records in parallel",
+            extra={"table_id": table_id, "total": total, "max_workers": max_workers},
+        )
+
+        pages = (
+            (
+                range(offset, min(offset + page_size, total)),
+                f"SELECT * FROM {table_id} ORDER BY id "  # nosec B608
+                f"LIMIT {page_size} OFFSET {offset}",
+            )
+            for offset in range(0, total, page_size)
+        )
+        for _, _, items in self._execute_sql_batches(
+            user_access_token, workspace_id, pages, max_workers, "query", app_id
+        ):
+            for item in items:
+                yield _to_table_record(item, table_id)
 
     def create_record(
         self,
@@ -706,6 +1618,8 @@ class WorkspaceTableClient(BaseServiceClient):
         if not fields:
             raise InvalidParameterError("fields cannot be empty")
 
+        self._check_record_fields(user_access_token, table_id, workspace_id, fields, [fields])
+
         logger.info(
             "Creating table record via SQL",
             extra={"table_id": table_id, "workspace_id": workspace_id, "field_count": len(fields)},
@@ -804,6 +1718,8 @@ class WorkspaceTableClient(BaseServiceClient):
         if not fields:
             raise InvalidParameterError("fields cannot be empty")
 
+        self._check_record_fields(user_access_token, table_id, workspace_id, fields)
+
         logger.info(
             "Updating table record via SQL",
             extra={
@@ -939,11 +1855,15 @@ class WorkspaceTableClient(BaseServiceClient):
         records: list[dict[str, Any]],
         batch_size: int = 500,
         app_id: str | None = None,
+        max_batch_bytes: int = DEFAULT_MAX_SQL_BYTES,
+        max_workers: int = DEFAULT_SQL_WORKERS,
     ) -> list[str]:
         """
         Batch create multiple records using SQL INSERT.
 
-        Note: For DataFrame sync. Automatically chunks large datasets.
+        Note: For DataFrame sync. Automatically chunks large datasets by row
+        count and by SQL payload size, and runs up to ``max_workers``
+        INSERT statements concurrently. Returned IDs keep input order.
 
         Args
         ----------
@@ -954,6 +1874,8 @@ class WorkspaceTableClient(BaseServiceClient):
             batch_size: Maximum records per batch (default: 500)
 
                     app_id: Optional app_id (uses resolution priority if not provided)
+            max_batch_bytes: Maximum UTF-8 size of one INSERT statement
+            max_workers: Maximum concurrent INSERT statements (default: 4)
 
         Returns
         ----------
@@ -964,7 +1886,8 @@ class WorkspaceTableClient(BaseServiceClient):
             InvalidParameterError: If parameters are invalid
             NotFoundError: If table not found
             PermissionDeniedError: If user lacks permission
-            APIError: If API call fails
+            APIError: If API call fails; with concurrent batches, later batches may
+                already be written (see ``details['committed_ranges']``)
 
         Example
         --------
@@ -993,6 +1916,11 @@ class WorkspaceTableClient(BaseServiceClient):
         if batch_size < 1 or batch_size > 500:
             raise InvalidParameterError("batch_size must be between 1 and 500")
 
+        self._validate_batch_tuning(max_batch_bytes, max_workers)
+        self._check_record_fields(
+            user_access_token, table_id, workspace_id, (k for r in records for k in r), records
+        )
+
         logger.info(
             f"Batch creating {len(records)} records",
             extra={
@@ -1003,55 +1931,19 @@ class WorkspaceTableClient(BaseServiceClient):
             },
         )
 
-        all_record_ids = []
-
-        # Process in chunks
-        for i in range(0, len(records), batch_size):
-            batch = records[i : i + batch_size]
-
-            try:
-                # Build SQL INSERT for batch
-                if not batch:
-                    continue
-
-                # Get columns from first record
-                columns = list(batch[0].keys())
-                columns_str = ", ".join(columns)
-
-                # Build VALUES clauses for all records
-                values_clauses = []
-                for record in batch:
-                    values = [self._format_sql_value(record.get(col)) for col in columns]
-                    values_clause = f"({', '.join(values)})"
-                    values_clauses.append(values_clause)
+        all_record_ids: list[str] = []
 
-                values_str = ", ".join(values_clauses)
+        batches = self._iter_insert_batches(table_id, records, batch_size, max_batch_bytes)
+        for batch_num, _, result_records in self._execute_sql_batches(
+            user_access_token, workspace_id, batches, max_workers, "create", app_id
+        ):
+            batch_ids = [r.get("id", "") for r in result_records]
+            all_record_ids.extend(batch_ids)
 
-                sql = f"""
-                    INSERT INTO {table_id} ({columns_str})
-                    VALUES {values_str}
-                    RETURNING id
-                """  # nosec B608
-
-                # Execute batch
-                result_records = self.sql_query(
-                    app_id=app_id,
-                    user_access_token=user_access_token,
-                    workspace_id=workspace_id,
-                    sql=sql,
-                )
-
-                batch_ids = [r.get("id", "") for r in result_records]
-                all_record_ids.extend(batch_ids)
-
-                logger.info(
-                    f"Batch {i // batch_size + 1}: Created {len(batch_ids)} records",
-                    extra={"batch_num": i // batch_size + 1, "count": len(batch_ids)},
-                )
-
-            except Exception as e:
-                logger.error(f"Error in batch {i // batch_size + 1}: {e}")
-                raise APIError(f"Failed to create batch at index {i}: {e}") from e
+            logger.info(
+                f"Batch {batch_num}: Created {len(batch_ids)} records",
+                extra={"batch_num": batch_num, "count": len(batch_ids)},
+            )
 
         logger.info(
             f"Successfully created {len(all_record_ids)} records in total",
@@ -1068,11 +1960,22 @@ class WorkspaceTableClient(BaseServiceClient):
         records: list[tuple[str, dict[str, Any]]],
         batch_size: int = 500,
         app_id: str | None = None,
+        strategy: str = "auto",
+        max_batch_bytes: int = DEFAULT_MAX_SQL_BYTES,
+        max_workers: int = DEFAULT_SQL_WORKERS,
     ) -> int:
         """
         Batch update multiple records using SQL UPDATE.
 
-        Note: For DataFrame sync. Automatically chunks large datasets.
+        Note: For DataFrame sync. Automatically chunks large datasets by row
+        count and SQL payload size, and runs up to ``max_workers`` statements
+        concurrently. Each record ID should appear only once.
+
+        Strategies:
+        - "grouped": records with identical changes share one
+          ``UPDATE ... SET ... WHERE id IN (...)`` statement
+        - "case": one ``SET field = CASE id WHEN ... END`` statement per chunk
+        - "auto": pick the strategy with the smaller estimated payload
 
         Args
         ----------
@@ -1083,6 +1986,9 @@ class WorkspaceTableClient(BaseServiceClient):
             batch_size: Maximum records per batch (default: 500)
 
                     app_id: Optional app_id (uses resolution priority if not provided)
+            strategy: "auto", "grouped" or "case" (default: "auto")
+            max_batch_bytes: Maximum UTF-8 size of one UPDATE statement
+            max_workers: Maximum concurrent UPDATE statements (default: 4)
 
         Returns
         ----------
@@ -1093,7 +1999,8 @@ class WorkspaceTableClient(BaseServiceClient):
             InvalidParameterError: If parameters are invalid
             NotFoundError: If table or some records not found
             PermissionDeniedError: If user lacks permission
-            APIError: If API call fails
+            APIError: If API call fails; with concurrent batches, later batches may
+                already be written (see ``details['committed_ranges']``)
 
         Example
         --------
@@ -1122,6 +2029,16 @@ class WorkspaceTableClient(BaseServiceClient):
         if batch_size < 1 or batch_size > 500:
             raise InvalidParameterError("batch_size must be between 1 and 500")
 
+        if strategy not in UPDATE_STRATEGIES:
+            raise InvalidParameterError(
+                f"strategy must be one of {', '.join(UPDATE_STRATEGIES)}, got '{strategy}'"
+            )
+
+        self._validate_batch_tuning(max_batch_bytes, max_workers)
+        self._check_record_fields(
+            user_access_token, table_id, workspace_id, (k for _, f in records for k in f)
+        )
+
         logger.info(
             f"Batch updating {len(records)} records",
             extra={
@@ -1134,62 +2051,21 @@ class WorkspaceTableClient(BaseServiceClient):
 
         total_updated = 0
 
-        # Process in chunks
-        for i in range(0, len(records), batch_size):
-            batch = records[i : i + batch_size]
-
-            try:
-                # Build SQL UPDATE with CASE for batch
-                if not batch:
-                    continue
-
-                record_ids = [record_id for record_id, _ in batch]
-                record_ids_str = ", ".join(f"'{rid}'" for rid in record_ids)
-
-                # Get all unique fields
-                all_fields: set[str] = set()
-                for _, fields in batch:
-                    all_fields.update(fields.keys())
-
-                # Build CASE statements for each field
-                set_clauses = []
-                for field in all_fields:
-                    cases = []
-                    for record_id, fields in batch:
-                        if field in fields:
-                            value = self._format_sql_value(fields[field])
-                            cases.append(f"WHEN id = '{record_id}' THEN {value}")
-
-                    if cases:
-                        case_str = " ".join(cases)
-                        set_clauses.append(f"{field} = CASE {case_str} ELSE {field} END")
-
-                set_clause = ", ".join(set_clauses)
-
-                sql = f"""
-                    UPDATE {table_id}
-                    SET {set_clause}
-                    WHERE id IN ({record_ids_str})
-                """  # nosec B608
-
-                # Execute batch
-                self.sql_query(
-                    app_id=app_id,
-                    user_access_token=user_access_token,
-                    workspace_id=workspace_id,
-                    sql=sql,
-                )
+        chosen, batches = self._plan_update_batches(
+            table_id, records, batch_size, max_batch_bytes, strategy
+        )
+        logger.debug(f"batch_update_records using '{chosen}' strategy ({len(batches)} statements)")
 
-                total_updated += len(batch)
+        for batch_num, indices, _ in self._execute_sql_batches(
+            user_access_token, workspace_id, batches, max_workers, "update", app_id
+        ):
+            count = len(indices)
+            total_updated += count
 
-                logger.info(
-                    f"Batch {i // batch_size + 1}: Updated {len(batch)} records",
-                    extra={"batch_num": i // batch_size + 1, "count": len(batch)},
-                )
-
-            except Exception as e:
-                logger.error(f"Error in batch {i // batch_size + 1}: {e}")
-                raise APIError(f"Failed to update batch at index {i}: {e}") from e
+            logger.info(
+                f"Batch {batch_num}: Updated {count} records",
+                extra={"batch_num": batch_num, "count": count},
+            )
 
         logger.info(
             f"Successfully updated {total_updated} records in total",
@@ -0,0 +1,169 @@
+"""
+Workspace schema cache for aPaaS data tables.
+
+aPaaS has no separate fields endpoint, so every list_workspace_tables or
+list_fields call downloads the full table list of a workspace. SchemaCache
+keeps one parsed WorkspaceSchema per (workspace_id, user scope) for a TTL,
+with per-table field-type maps computed once when the schema is loaded.
+Write paths use those maps to check column names, and inserts to check
+required columns, without a network call.
+"""
+
+import threading
+import time
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Any
+
+from lark_service.apaas.models import FieldDefinition, FieldType, WorkspaceTable
+from lark_service.core.exceptions import InvalidParameterError
+
+
+def _is_system_field(name: str) -> bool:
+    """Return True for columns the platform fills in (``id`` and ``_``-prefixed)."""
+    return name == "id" or name.startswith("_")
+
+
+@dataclass(frozen=True)
+class TableSchema:
+    """
+    Parsed definition of one data table.
+
+    Attributes
+    ----------
+        table : WorkspaceTable
+            Table metadata
+        fields : tuple[FieldDefinition, ...]
+            Column definitions in API order
+        field_types : Mapping[str, FieldType]
+            Read-only column name -> FieldType map
+        required_fields : tuple[str, ...]
+            Columns that do not allow NULL and are not filled in by the
+            platform, in API order
+    """
+
+    table: WorkspaceTable
+    fields: tuple[FieldDefinition, ...]
+    field_types: Mapping[str, FieldType] = field(init=False)
+    required_fields: tuple[str, ...] = field(init=False)
+
+    def __post_init__(self) -> None:
+        types = {f.field_name: f.field_type for f in self.fields}
+        object.__setattr__(self, "field_types", MappingProxyType(types))
+        required = tuple(
+            f.field_name
+            for f in self.fields
+            if f.is_required and not _is_system_field(f.field_name)
+        )
+        object.__setattr__(self, "required_fields", required)
+
+    def unknown_fields(self, names: Iterable[str]) -> list[str]:
+        """Return the names that are not columns of this table, in input order."""
+        types = self.field_types
+        return [name for name in names if name not in types]
+
+    def missing_fields(self, record: Mapping[str, Any]) -> list[str]:
+        """Return the required columns that ``record`` omits or sets to None."""
+        return [name for name in self.required_fields if record.get(name) is None]
+
+
+@dataclass(frozen=True)
+class WorkspaceSchema:
+    """
+    All tables of a workspace as seen by one user.
+
+    Attributes
+    ----------
+        workspace_id : str
+            Workspace ID
+        tables : Mapping[str, TableSchema]
+            Table name -> TableSchema, in API order
+        loaded_at : float
+            time.monotonic() when the schema was fetched
+    """
+
+    workspace_id: str
+    tables: Mapping[str, TableSchema]
+    loaded_at: float
+
+    def get(self, table_id: str) -> TableSchema | None:
+        """Return the schema of ``table_id`` or None."""
+        return self.tables.get(table_id)
+
+
+class SchemaCache:
+    """
+    Thread-safe in-memory cache of WorkspaceSchema objects.
+
+    Entries are keyed by (workspace_id, user scope), because table
+    visibility depends on the user's permissions.
+
+    Attributes
+    ----------
+        ttl_seconds : float
+            Entry lifetime
+        max_workspaces : int
+            Maximum cached entries (oldest loaded are evicted first)
+        hits : int
+            Lookups served from the cache
+        misses : int
+            Lookups that missed or found an expired entry
+    """
+
+    def __init__(self, ttl_seconds: float = 300.0, max_workspaces: int = 256) -> None:
+        if ttl_seconds <= 0:
+            raise InvalidParameterError("ttl_seconds must be positive")
+        if max_workspaces < 1:
+            raise InvalidParameterError("max_workspaces must be at least 1")
+        self.ttl_seconds = ttl_seconds
+        self.max_workspaces = max_workspaces
+        self.hits = 0
+        self.misses = 0
+        self._entries: dict[tuple[str, str], WorkspaceSchema] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def get(self, workspace_id: str, scope: str) -> WorkspaceSchema | None:
+        """Return a fresh cached schema or None."""
+        key = (workspace_id, scope)
+        with self._lock:
+            schema = self._entries.get(key)
+            if schema is not None and time.monotonic() - schema.loaded_at < self.ttl_seconds:
+                self.hits += 1
+                return schema
+            if schema is not None:
+                del self._entries[key]
+            self.misses += 1
+            return None
+
+    def set(self, scope: str, schema: WorkspaceSchema) -> None:
+        """Store ``schema`` for ``scope``, evicting the oldest entries if full."""
+        key = (schema.workspace_id, scope)
+        with self._lock:
+            self._entries.pop(key, None)
+            while len(self._entries) >= self.max_workspaces:
+                oldest = min(self._entries, key=lambda k: self._entries[k].loaded_at)
+                del self._entries[oldest]
+            self._entries[key] = schema
+
+    def invalidate(self, workspace_id: str | None = None) -> int:
+        """
+        Drop cached schemas of ``workspace_id`` (all users), or everything.
+
+        Returns
+        ----------
+            Number of entries removed
+        """
+        with self._lock:
+            if workspace_id is None:
+                count = len(self._entries)
+                self._entries.clear()
+                return count
+            keys = [key for key in self._entries if key[0] == workspace_id]
+            for key in keys:
+                del self._entries[key]
+            return len(keys)
@@ -4,15 +4,23 @@ This module provides interactive card capabilities including:
 - Card building with flexible layouts
 - Card callback handling
 - Card content updates
+- Coalesced, rate-limited card updates
 - Pre-built card templates
+- Compiled card templates for high-volume rendering
 """
 
 from lark_service.cardkit.builder import CardBuilder
 from lark_service.cardkit.callback_handler import CallbackHandler
+from lark_service.cardkit.payload import CardPayload
+from lark_service.cardkit.template import CardTemplate
+from lark_service.cardkit.update_dispatcher import CardUpdateDispatcher
 from lark_service.cardkit.updater import CardUpdater
 
 __all__ = [
     "CardBuilder",
     "CallbackHandler",
+    "CardPayload",
+    "CardTemplate",
+    "CardUpdateDispatcher",
     "CardUpdater",
 ]
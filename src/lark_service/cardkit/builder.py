@@ -5,9 +5,12 @@ This module provides a builder for constructing interactive cards
 with various templates and components.
 """
 
+from collections.abc import Iterable
 from typing import Any
 
 from lark_service.cardkit.models import CardConfig
+from lark_service.cardkit.payload import CardPayload
+from lark_service.cardkit.template import CardTemplate, SlotType
 from lark_service.core.exceptions import InvalidParameterError
 from lark_service.utils.logger import get_logger
 
@@ -303,6 +306,38 @@ class CardBuilder:
         self._elements.append(img_element)
         return self
 
+    def add_images(self, image_keys: Iterable[str], alt: str = "") -> "CardBuilder":
+        """
+        Add one image element per key (fluent API).
+
+        Pairs with MediaUploader.upload_many, which uploads all images of a
+        card concurrently.
+
+        Parameters
+        ----------
+            image_keys : Iterable[str]
+                Image keys from Lark media upload
+            alt : str
+                Alt text for every image
+
+        Returns
+        -------
+            CardBuilder
+                Self for method chaining
+
+        Examples
+        --------
+            >>> uploaded = uploader.upload_many("cli_xxx", ["a.png", "b.png"])
+            >>> card = (CardBuilder()
+            ...     .add_header("Daily Report")
+            ...     .add_images(uploaded.media_keys, alt="Chart")
+            ...     .build()
+            ... )
+        """
+        for image_key in image_keys:
+            self.add_image(image_key, alt=alt)
+        return self
+
     def add_note(self, content: str, note_type: str = "default") -> "CardBuilder":
         """
         Add note/alert element (fluent API).
@@ -419,6 +454,63 @@ class CardBuilder:
 
         return config.model_dump(exclude_none=True)
 
+    def build_payload(self) -> CardPayload:
+        """
+        Build final card as a serialized payload and reset state (fluent API).
+
+        The card is validated once and serialized once; the payload is sent
+        and updated without being validated or serialized again.
+
+        Returns
+        -------
+            CardPayload
+                Card JSON string
+
+        Raises
+        ------
+            InvalidParameterError
+                If no elements added
+
+        Examples
+        --------
+            >>> payload = CardBuilder().add_text("Done").build_payload()
+            >>> client.send_card_message("ou_xxx", payload)
+        """
+        return CardPayload.from_card(self.build(), validate=False)
+
+    def compile(self, slots: dict[str, SlotType] | None = None) -> CardTemplate:
+        """
+        Build the card as a compiled template and reset state (fluent API).
+
+        The card is validated and serialized once; ``{{name}}`` placeholders
+        in its text become slots filled by ``CardTemplate.render``.
+
+        Parameters
+        ----------
+            slots : dict[str, type] | None
+                Types of non-text slots (int, float or bool)
+
+        Returns
+        -------
+            CardTemplate
+                Compiled card template
+
+        Raises
+        ------
+            InvalidParameterError
+                If no elements added or a slot type is invalid
+
+        Examples
+        --------
+            >>> template = (CardBuilder()
+            ...     .add_header("Deploy {{service}}", template="green")
+            ...     .add_markdown("Version **{{version}}** is live")
+            ...     .compile()
+            ... )
+            >>> content = template.render(service="api", version="1.4.2")
+        """
+        return CardTemplate.compile(self.build(), slots)
+
     # ========================================================================
     # Template Methods (Quick & Easy)
     # ========================================================================
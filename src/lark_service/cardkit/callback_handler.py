@@ -2,21 +2,57 @@
 Callback handler for Lark CardKit interactions.
 
 This module provides functionality for handling card interaction callbacks,
-including signature verification, URL verification, and event routing.
+including signature verification, replay protection, URL verification, and
+event routing.
 """
 
 import hashlib
 import hmac
 import json
-from collections.abc import Callable
+import re
+import threading
+import time
+from collections.abc import Callable, Hashable
 from typing import Any
 
-from lark_service.cardkit.models import CallbackEvent
+from lark_service.cardkit.models import CallbackCheck, CallbackEvent
 from lark_service.core.exceptions import InvalidParameterError, ValidationError
 from lark_service.utils.logger import get_logger
+from lark_service.utils.ttl_set import TTLSet
 
 logger = get_logger()
 
+# Event ID of a raw body, found without parsing the JSON: a top-level
+# "event_id"/"uuid" or "header.event_id". Only scalar members may precede
+# it, so IDs inside nested objects (e.g. a card's action.value) never match.
+_SCALAR_MEMBERS = r'(?:\s*"[^"\\]*"\s*:\s*(?:"(?:[^"\\]|\\.)*"|[-+.\w]+)\s*,)*'
+_EVENT_ID_PATTERN = (
+    r"^\s*\{"
+    + _SCALAR_MEMBERS
+    + r'\s*(?:"header"\s*:\s*\{'
+    + _SCALAR_MEMBERS
+    + r'\s*"event_id"|"(?:event_id|uuid)")\s*:\s*"([^"\\]{1,128})"'
+)
+_EVENT_ID_STR = re.compile(_EVENT_ID_PATTERN)
+_EVENT_ID_BYTES = re.compile(_EVENT_ID_PATTERN.encode())
+
+
+def _raw_event_id(body: str | bytes) -> str | None:
+    """Return the event ID of a raw callback body, if it has one."""
+    if isinstance(body, bytes):
+        match_bytes = _EVENT_ID_BYTES.match(body)
+        return match_bytes.group(1).decode() if match_bytes else None
+    match_str = _EVENT_ID_STR.match(body)
+    return match_str.group(1) if match_str else None
+
+
+def _parsed_event_id(request_data: dict[str, Any]) -> str | None:
+    """Return the event ID of a parsed callback, if it has one."""
+    header = request_data.get("header")
+    event_id = header.get("event_id") if isinstance(header, dict) else None
+    event_id = event_id or request_data.get("event_id") or request_data.get("uuid")
+    return str(event_id) if event_id else None
+
 
 class CallbackHandler:
     """
@@ -31,8 +67,12 @@ class CallbackHandler:
             Lark app verification token
         encrypt_key : str | None
             Optional encryption key for signature verification
+        max_timestamp_skew : float | None
+            Maximum age (and clock skew) of signed requests in seconds
         handlers : dict[str, Callable]
             Registered callback handlers by action_id
+        stats : dict[str, int]
+            Request counts by CallbackCheck outcome
 
     Examples
     --------
@@ -48,6 +88,9 @@ class CallbackHandler:
         self,
         verification_token: str,
         encrypt_key: str | None = None,
+        max_timestamp_skew: float | None = 300.0,
+        replay_ttl: float = 900.0,
+        replay_max_size: int = 100_000,
     ) -> None:
         """
         Initialize CallbackHandler.
@@ -58,22 +101,40 @@ class CallbackHandler:
                 Lark app verification token
             encrypt_key : str | None
                 Optional encryption key for signature verification
+            max_timestamp_skew : float | None
+                Reject signed requests whose timestamp is further than this
+                from now, in seconds (default: 300; None disables the check)
+            replay_ttl : float
+                Seconds a request nonce or event_id is remembered; keep it
+                above twice ``max_timestamp_skew`` (default: 900)
+            replay_max_size : int
+                Maximum remembered nonces and event IDs (default: 100000)
         """
         self.verification_token = verification_token
         self.encrypt_key = encrypt_key
+        self.max_timestamp_skew = max_timestamp_skew
         self.handlers: dict[str, Callable[[CallbackEvent], dict[str, Any]]] = {}
+        self.stats = dict.fromkeys(CallbackCheck, 0)
+        # Pooled servers call check_request from several threads
+        self._stats_lock = threading.Lock()
+
+        self._seen = TTLSet(ttl_seconds=replay_ttl, max_size=replay_max_size)
+        # Keyed HMAC state, copied per request instead of re-keyed
+        self._key = encrypt_key.encode("utf-8") if encrypt_key else b""
+        self._mac = hmac.new(self._key, digestmod=hashlib.sha256) if encrypt_key else None
 
     def verify_signature(
         self,
         timestamp: str,
         nonce: str,
-        body: str,
+        body: str | bytes,
         signature: str,
     ) -> bool:
         """
         Verify callback request signature.
 
-        Uses HMAC-SHA256 to verify that the callback is from Lark.
+        Uses HMAC-SHA256 to verify that the callback is from Lark. The body
+        is hashed as received, without building the signed string.
 
         Parameters
         ----------
@@ -81,8 +142,8 @@ class CallbackHandler:
                 Request timestamp
             nonce : str
                 Request nonce
-            body : str
-                Request body (raw JSON string)
+            body : str | bytes
+                Request body (raw JSON string or bytes)
             signature : str
                 Request signature from header
 
@@ -100,35 +161,152 @@ class CallbackHandler:
             ...     signature="sha256_signature_here"
             ... )
         """
-        if not self.encrypt_key:
+        if self._mac is None:
             logger.warning("Encrypt key not configured, skipping signature verification")
             return True
 
-        # Construct signature string: timestamp + nonce + encrypt_key + body
-        sign_str = f"{timestamp}{nonce}{self.encrypt_key}{body}"
-
-        # Calculate HMAC-SHA256
-        calculated_signature = hmac.new(
-            self.encrypt_key.encode("utf-8"),
-            sign_str.encode("utf-8"),
-            hashlib.sha256,
-        ).hexdigest()
+        # Signed string: timestamp + nonce + encrypt_key + body
+        mac = self._mac.copy()
+        mac.update(timestamp.encode("utf-8"))
+        mac.update(nonce.encode("utf-8"))
+        mac.update(self._key)
+        mac.update(body.encode("utf-8") if isinstance(body, str) else body)
 
-        is_valid = hmac.compare_digest(calculated_signature, signature)
+        is_valid = hmac.compare_digest(mac.hexdigest(), signature)
 
         if not is_valid:
             logger.warning(
                 "Signature verification failed",
-                extra={
-                    "timestamp": timestamp,
-                    "nonce": nonce,
-                    "expected": calculated_signature,
-                    "received": signature,
-                },
+                extra={"timestamp": timestamp, "nonce": nonce},
             )
 
         return is_valid
 
+    @staticmethod
+    def _replay_keys(
+        event_id: str | None,
+        timestamp: str | None,
+        nonce: str | None,
+        signature: str | None,
+    ) -> tuple[Hashable | None, Hashable | None]:
+        """Return the (request, event) dedup keys of a callback."""
+        signed = bool(timestamp and nonce and signature)
+        request_key = ("request", timestamp, nonce, signature) if signed else None
+        return request_key, ("event", event_id) if event_id else None
+
+    def _count(self, check: CallbackCheck) -> CallbackCheck:
+        with self._stats_lock:
+            self.stats[check] += 1
+        return check
+
+    def check_request(
+        self,
+        body: str | bytes,
+        timestamp: str | None = None,
+        nonce: str | None = None,
+        signature: str | None = None,
+    ) -> CallbackCheck:
+        """
+        Check a raw callback request before it is parsed.
+
+        Duplicates are recognized first, by the request nonce and signature
+        or by the body's top-level event_id, so redelivered callbacks are
+        dropped without JSON parsing, HMAC or handler dispatch. Signed
+        requests must then be within ``max_timestamp_skew`` and carry a
+        valid signature. Accepted requests are remembered for
+        ``replay_ttl``; with an encrypt key configured, only signed ones
+        are, so unsigned requests cannot suppress real callbacks.
+
+        Parameters
+        ----------
+            body : str | bytes
+                Raw request body
+            timestamp : str | None
+                X-Lark-Request-Timestamp header (Unix seconds)
+            nonce : str | None
+                X-Lark-Request-Nonce header
+            signature : str | None
+                X-Lark-Signature header
+
+        Returns
+        -------
+            CallbackCheck
+                ACCEPTED, or why the request must not be processed
+
+        Examples
+        --------
+            >>> check = handler.check_request(raw_body, timestamp, nonce, signature)
+            >>> if check is CallbackCheck.DUPLICATE:
+            ...     return {}  # already handled
+        """
+        return self._check(body, _raw_event_id(body), timestamp, nonce, signature)
+
+    def _check(
+        self,
+        body: str | bytes | None,
+        event_id: str | None,
+        timestamp: str | None,
+        nonce: str | None,
+        signature: str | None,
+    ) -> CallbackCheck:
+        """Run ``check_request``; ``body`` is only read for signed requests."""
+        request_key, event_key = self._replay_keys(event_id, timestamp, nonce, signature)
+        if (request_key is not None and request_key in self._seen) or (
+            event_key is not None and event_key in self._seen
+        ):
+            logger.info("Duplicate callback ignored", extra={"nonce": nonce})
+            return self._count(CallbackCheck.DUPLICATE)
+
+        signed = bool(timestamp and nonce and signature)
+        if timestamp and nonce and signature:
+            if self.max_timestamp_skew is not None:
+                try:
+                    skew = abs(time.time() - int(timestamp))
+                except ValueError:
+                    skew = float("inf")
+                if skew > self.max_timestamp_skew:
+                    logger.warning(
+                        "Callback timestamp outside allowed window",
+                        extra={"timestamp": timestamp, "max_skew": self.max_timestamp_skew},
+                    )
+                    return self._count(CallbackCheck.EXPIRED)
+            if body is None or not self.verify_signature(timestamp, nonce, body, signature):
+                return self._count(CallbackCheck.INVALID_SIGNATURE)
+
+        if self._mac is not None and not signed:
+            # Unverified: remembering it would let a forged request block the real one
+            return self._count(CallbackCheck.ACCEPTED)
+        for key in (request_key, event_key):
+            if key is not None and not self._seen.add(key):
+                return self._count(CallbackCheck.DUPLICATE)
+        return self._count(CallbackCheck.ACCEPTED)
+
+    def forget_request(
+        self,
+        body: str | bytes,
+        timestamp: str | None = None,
+        nonce: str | None = None,
+        signature: str | None = None,
+    ) -> None:
+        """
+        Forget an accepted request so a redelivery is processed again.
+
+        Call this when an accepted callback could not be processed (e.g.
+        the server answered with an error and Feishu will retry).
+        """
+        self._forget(_raw_event_id(body), timestamp, nonce, signature)
+
+    def _forget(
+        self,
+        event_id: str | None,
+        timestamp: str | None,
+        nonce: str | None,
+        signature: str | None,
+    ) -> None:
+        for key in self._replay_keys(event_id, timestamp, nonce, signature):
+            if key is not None:
+                self._seen.discard(key)
+
     def handle_url_verification(
         self,
         challenge: str,
@@ -303,6 +481,8 @@ class CallbackHandler:
 
         Handles both URL verification and card interaction callbacks.
         Optionally verifies signature if timestamp, nonce, and signature are provided.
+        Duplicate callbacks (see ``check_request``) are acknowledged without
+        reaching the handlers.
 
         Parameters
         ----------
@@ -323,7 +503,8 @@ class CallbackHandler:
         Raises
         ------
             ValidationError
-                If signature verification fails or data is invalid
+                If signature verification fails, the timestamp is outside the
+                allowed window or data is invalid
 
         Examples
         --------
@@ -346,14 +527,24 @@ class CallbackHandler:
             ...     signature="sha256_signature"
             ... )
         """
-        # Verify signature if provided
-        if timestamp and nonce and signature:
-            body = json.dumps(request_data, separators=(",", ":"))
-            if not self.verify_signature(timestamp, nonce, body, signature):
-                raise ValidationError(
-                    "Signature verification failed",
-                    details={"timestamp": timestamp, "nonce": nonce},
-                )
+        # Verify signature if provided and drop replays; the body is only
+        # serialized when there is a signature to check
+        event_id = _parsed_event_id(request_data)
+        body = (
+            json.dumps(request_data, separators=(",", ":"))
+            if timestamp and nonce and signature
+            else None
+        )
+        check = self._check(body, event_id, timestamp, nonce, signature)
+        if check is CallbackCheck.DUPLICATE:
+            return {"status": "success", "message": "Duplicate callback ignored"}
+        if check is not CallbackCheck.ACCEPTED:
+            raise ValidationError(
+                "Signature verification failed"
+                if check is CallbackCheck.INVALID_SIGNATURE
+                else "Callback timestamp outside allowed window",
+                details={"timestamp": timestamp, "nonce": nonce, "check": str(check)},
+            )
 
         # Get callback type
         callback_type = request_data.get("type")
@@ -365,8 +556,12 @@ class CallbackHandler:
             return self.handle_url_verification(challenge, token)
 
         elif callback_type == "card_action_trigger":
-            # Handle card interaction
-            return self.route_callback(request_data)
+            # Handle card interaction; forget it on failure so Feishu's retry is processed
+            try:
+                return self.route_callback(request_data)
+            except Exception:
+                self._forget(event_id, timestamp, nonce, signature)
+                raise
 
         else:
             logger.warning(
@@ -31,6 +31,15 @@ class CardTemplateType(StrEnum):
     FORM = "form"
 
 
+class CallbackCheck(StrEnum):
+    """Outcome of checking a raw callback request before parsing it."""
+
+    ACCEPTED = "accepted"
+    DUPLICATE = "duplicate"
+    INVALID_SIGNATURE = "invalid_signature"
+    EXPIRED = "expired"
+
+
 class CardElement(BaseModel):
     """
     Card element base model.
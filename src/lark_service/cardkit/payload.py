@@ -0,0 +1,91 @@
+"""
+Pre-serialized card payloads.
+
+A CardPayload is card JSON that has already been validated and
+serialized. It is a ``str`` subclass, so it can be used wherever message
+content strings are accepted, and ``MessagingClient.send_card_message``
+and ``CardUpdater.update_card_content`` pass it through as is instead of
+validating and dumping the card again. Build one with
+``CardBuilder.build_payload()``, ``CardTemplate.render()`` or
+``CardPayload.from_card()``.
+"""
+
+import json
+from collections.abc import Mapping
+from typing import Any
+
+from lark_service.cardkit.models import CardConfig
+from lark_service.core.exceptions import InvalidParameterError
+from lark_service.utils.json_codec import dumps
+
+
+class CardPayload(str):
+    """
+    Card JSON serialized exactly once.
+
+    Examples
+    --------
+        >>> payload = CardPayload.from_card(card)
+        >>> client.send_card_message("ou_xxx", payload)
+        >>> updater.update_card_content("cli_xxx", "om_xxx", payload)
+    """
+
+    __slots__ = ()
+
+    @classmethod
+    def from_card(cls, card: Mapping[str, Any], validate: bool = True) -> "CardPayload":
+        """
+        Validate and serialize a card structure.
+
+        Parameters
+        ----------
+            card : Mapping[str, Any]
+                Card JSON structure
+            validate : bool
+                Validate through CardConfig first (default: True); pass False
+                for cards that were already validated, e.g. by CardBuilder
+
+        Returns
+        -------
+            CardPayload
+                Serialized card
+
+        Raises
+        ------
+            InvalidParameterError
+                If the card is invalid
+        """
+        if not validate:
+            return cls(dumps(card))
+        try:
+            config = CardConfig(**card)
+        except Exception as e:
+            raise InvalidParameterError(
+                f"Invalid card content: {e}",
+                details={"error": str(e)},
+            ) from e
+        return cls(dumps(config.model_dump(exclude_none=True)))
+
+    @classmethod
+    def from_json(cls, data: str | bytes) -> "CardPayload":
+        """
+        Wrap card JSON serialized elsewhere, without validating it.
+
+        Parameters
+        ----------
+            data : str | bytes
+                Card JSON text or UTF-8 encoded bytes
+
+        Returns
+        -------
+            CardPayload
+                Serialized card
+        """
+        if isinstance(data, bytes):
+            data = data.decode()
+        return data if isinstance(data, cls) else cls(data)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Parse the payload back into a card structure."""
+        card: dict[str, Any] = json.loads(self)
+        return card
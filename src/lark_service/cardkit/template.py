@@ -0,0 +1,230 @@
+"""
+Compiled card templates for CardKit.
+
+High-volume notifications usually share one card structure and differ in
+a few fields. A CardTemplate validates such a card once through
+CardConfig, serializes it once, and splits the JSON into literal segments
+and typed slots. Rendering a message then only JSON-escapes the slot
+values and joins the segments, without building dicts, running Pydantic
+validation or serializing the whole card again.
+
+Slots are written as ``{{name}}`` placeholders anywhere in string values
+of the card. A placeholder embedded in a longer string is rendered as
+escaped text; a string value consisting only of a placeholder declared
+as int, float or bool is replaced by the JSON literal, quotes included.
+"""
+
+import json
+import re
+from collections.abc import Mapping
+from json.encoder import encode_basestring
+from typing import Any
+
+from lark_service.cardkit.models import CardConfig
+from lark_service.cardkit.payload import CardPayload
+from lark_service.core.exceptions import InvalidParameterError
+from lark_service.utils.logger import get_logger
+
+logger = get_logger()
+
+# Slot value types and the JSON they render to
+SlotType = type[str] | type[int] | type[float] | type[bool]
+SLOT_TYPES: tuple[SlotType, ...] = (str, int, float, bool)
+
+_PLACEHOLDER = re.compile(r"\{\{(\w+)\}\}")
+# A complete JSON string token, escapes included
+_JSON_STRING = re.compile(r'"(?:[^"\\]|\\.)*"')
+
+
+def _escape(value: str) -> str:
+    """Return ``value`` as JSON string content (without the quotes)."""
+    return encode_basestring(value)[1:-1]
+
+
+class CardTemplate:
+    """
+    Pre-validated, pre-serialized card with typed slots.
+
+    Attributes
+    ----------
+        slots : dict[str, type]
+            Slot names and their value types
+
+    Examples
+    --------
+        >>> template = CardTemplate.compile(
+        ...     CardBuilder().build_notification_card(
+        ...         title="Build {{build_id}}",
+        ...         content="**{{project}}** finished in {{seconds}}s",
+        ...         level="success",
+        ...     ),
+        ...     slots={"build_id": int, "seconds": float},
+        ... )
+        >>> template.render(build_id=42, project="lark-service", seconds=3.5)
+        '{"header": {"title": {"tag": "plain_text", "content": "Build 42"}, ...'
+    """
+
+    __slots__ = ("slots", "_literals", "_refs")
+
+    def __init__(
+        self,
+        literals: list[str],
+        refs: list[str],
+        slots: dict[str, SlotType],
+    ) -> None:
+        # literals[i] precedes refs[i]; len(literals) == len(refs) + 1
+        self._literals = literals
+        self._refs = refs
+        self.slots = slots
+
+    @classmethod
+    def compile(
+        cls,
+        card: Mapping[str, Any],
+        slots: Mapping[str, SlotType] | None = None,
+    ) -> "CardTemplate":
+        """
+        Validate and pre-serialize a card containing ``{{name}}`` placeholders.
+
+        Parameters
+        ----------
+            card : Mapping[str, Any]
+                Card JSON structure, e.g. from ``CardBuilder.build()`` or a
+                template method called with placeholders as arguments
+            slots : Mapping[str, type] | None
+                Types of slots that are not plain text (int, float or bool);
+                placeholders not listed here are str slots
+
+        Returns
+        -------
+            CardTemplate
+                Compiled template
+
+        Raises
+        ------
+            InvalidParameterError
+                If the card is invalid or a slot type is unsupported or unused
+        """
+        try:
+            config = CardConfig(**card)
+        except Exception as e:
+            raise InvalidParameterError(
+                f"Invalid card template: {e}",
+                details={"error": str(e)},
+            ) from e
+        declared = dict(slots or {})
+        for name, slot_type in declared.items():
+            if slot_type not in SLOT_TYPES:
+                raise InvalidParameterError(
+                    f"Unsupported type for slot '{name}': {slot_type!r}",
+                    details={"slot": name, "supported": [t.__name__ for t in SLOT_TYPES]},
+                )
+
+        skeleton = json.dumps(config.model_dump(exclude_none=True), ensure_ascii=False)
+
+        literals: list[str] = []
+        refs: list[str] = []
+        found: dict[str, SlotType] = {}
+        start = 0
+        for token in _JSON_STRING.finditer(skeleton):
+            whole = _PLACEHOLDER.fullmatch(token.group(), 1, len(token.group()) - 1)
+            if whole and declared.get(whole.group(1), str) is not str:
+                # Typed value: replace the quoted string with the JSON literal
+                literals.append(skeleton[start : token.start()])
+                refs.append(whole.group(1))
+                found[whole.group(1)] = declared[whole.group(1)]
+                start = token.end()
+                continue
+            for match in _PLACEHOLDER.finditer(skeleton, token.start(), token.end()):
+                literals.append(skeleton[start : match.start()])
+                refs.append(match.group(1))
+                found.setdefault(match.group(1), declared.get(match.group(1), str))
+                start = match.end()
+        literals.append(skeleton[start:])
+
+        unused = sorted(set(declared) - set(found))
+        if unused:
+            raise InvalidParameterError(
+                f"Slots not found in card template: {', '.join(unused)}",
+                details={"slots": unused},
+            )
+
+        logger.debug(
+            "Card template compiled",
+            extra={"slot_count": len(found), "segment_count": len(literals)},
+        )
+        return cls(literals, refs, found)
+
+    def _encode(self, name: str, value: Any) -> str:
+        slot_type = self.slots[name]
+        if slot_type is str:
+            if not isinstance(value, str):
+                raise InvalidParameterError(
+                    f"Slot '{name}' expects str, got {type(value).__name__}",
+                    details={"slot": name},
+                )
+            return _escape(value)
+
+        # bool is an int subclass; ints are accepted for float slots
+        if slot_type is bool:
+            valid = isinstance(value, bool)
+        elif slot_type is float:
+            valid = isinstance(value, int | float) and not isinstance(value, bool)
+        else:
+            valid = isinstance(value, int) and not isinstance(value, bool)
+        if not valid:
+            raise InvalidParameterError(
+                f"Slot '{name}' expects {slot_type.__name__}, got {type(value).__name__}",
+                details={"slot": name},
+            )
+        try:
+            literal = json.dumps(value, allow_nan=False)
+        except ValueError as e:
+            raise InvalidParameterError(
+                f"Slot '{name}' value is not valid JSON: {value!r}",
+                details={"slot": name},
+            ) from e
+        # Numbers and booleans never need escaping inside a string either
+        return literal
+
+    def render(self, **values: Any) -> CardPayload:
+        """
+        Render the card to a JSON string.
+
+        Parameters
+        ----------
+            **values : Any
+                Value of every slot, by name
+
+        Returns
+        -------
+            CardPayload
+                Card JSON, sent and updated without re-serialization
+
+        Raises
+        ------
+            InvalidParameterError
+                If a slot is missing, unknown or has a value of the wrong type
+
+        Examples
+        --------
+            >>> template.render(build_id=43, project="lark-service", seconds=2)
+        """
+        if values.keys() != self.slots.keys():
+            missing = sorted(self.slots.keys() - values.keys())
+            unknown = sorted(values.keys() - self.slots.keys())
+            raise InvalidParameterError(
+                "Card template values do not match its slots",
+                details={"missing": missing, "unknown": unknown},
+            )
+
+        encoded = {name: self._encode(name, value) for name, value in values.items()}
+        parts = [self._literals[0]]
+        for name, literal in zip(self._refs, self._literals[1:], strict=True):
+            parts.append(encoded[name])
+            parts.append(literal)
+        return CardPayload("".join(parts))
+
+    def render_dict(self, **values: Any) -> dict[str, Any]:
+        """Render the card and parse it back (for APIs that still take dicts)."""
+        return self.render(**values).to_dict()
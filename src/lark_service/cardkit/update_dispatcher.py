@@ -0,0 +1,326 @@
+"""
+Coalescing dispatcher for card updates.
+
+Progress and status cards change far more often than anyone can read
+them, and every ``CardUpdater.update_card_content`` call is a PATCH
+against Feishu rate limits. CardUpdateDispatcher keeps at most one
+pending update per message_id: a newer update replaces the pending one,
+and each message is patched at most ``max_rate`` times per second, so
+request volume follows the refresh rate instead of the event rate. The
+latest content of every message is always sent, on its next slot or
+when the dispatcher is flushed or closed.
+"""
+
+import heapq
+import itertools
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+from lark_service.cardkit.payload import CardPayload
+from lark_service.cardkit.updater import CardUpdater
+from lark_service.core.exceptions import InvalidParameterError, LarkServiceError, QueueFullError
+from lark_service.utils.logger import get_logger
+
+logger = get_logger()
+
+CardContent = dict[str, Any] | CardPayload
+
+
+class _Lane:
+    """Update state of one message."""
+
+    __slots__ = ("app_id", "content", "due", "last_sent", "in_flight", "attempts")
+
+    def __init__(self) -> None:
+        self.app_id = ""
+        self.content: CardContent | None = None
+        self.due = 0.0
+        self.last_sent = float("-inf")
+        self.in_flight = False
+        self.attempts = 0
+
+
+class CardUpdateDispatcher:
+    """
+    Debounce card updates per message and send only the latest content.
+
+    A message's first pending update is sent after ``debounce`` seconds,
+    but never sooner than ``1 / max_rate`` seconds after its previous
+    update; updates arriving meanwhile replace the pending content.
+    Updates of one message are sent in order, one at a time; different
+    messages are sent in parallel on ``workers`` threads.
+
+    Attributes
+    ----------
+        updater : CardUpdater
+            Updater used to send the updates
+        max_rate : float
+            Maximum updates per second per message
+        debounce : float
+            Seconds to wait for newer content before sending
+        max_attempts : int
+            Attempts per content before an update is dropped as failed
+
+    Examples
+    --------
+        >>> with CardUpdateDispatcher(CardUpdater(credential_pool), max_rate=2) as dispatcher:
+        ...     for done in range(1000):
+        ...         dispatcher.submit("cli_xxx", "om_xxx", progress.render(done=done))
+        >>> # The card now shows done=999, after a handful of PATCH requests
+    """
+
+    def __init__(
+        self,
+        updater: CardUpdater,
+        max_rate: float = 2.0,
+        debounce: float = 0.1,
+        workers: int = 4,
+        max_pending: int = 10000,
+        max_attempts: int = 3,
+    ) -> None:
+        """
+        Initialize CardUpdateDispatcher.
+
+        Parameters
+        ----------
+            updater : CardUpdater
+                Updater used to send the updates
+            max_rate : float
+                Maximum updates per second per message (default: 2)
+            debounce : float
+                Seconds to wait for newer content before sending (default: 0.1)
+            workers : int
+                Threads sending updates of different messages (default: 4)
+            max_pending : int
+                Maximum messages with a pending update (default: 10000)
+            max_attempts : int
+                Attempts per content when updates fail (default: 3)
+        """
+        if max_rate <= 0:
+            raise InvalidParameterError(f"max_rate must be positive, got {max_rate}")
+        if debounce < 0:
+            raise InvalidParameterError(f"debounce cannot be negative, got {debounce}")
+        if workers < 1 or max_pending < 1 or max_attempts < 1:
+            raise InvalidParameterError("workers, max_pending and max_attempts must be positive")
+
+        self.updater = updater
+        self.max_rate = max_rate
+        self.debounce = debounce
+        self.workers = workers
+        self.max_pending = max_pending
+        self.max_attempts = max_attempts
+        self._min_interval = 1.0 / max_rate
+
+        self._lanes: dict[str, _Lane] = {}
+        # (due, sequence, message_id); stale entries are skipped when popped
+        self._heap: list[tuple[float, int, str]] = []
+        self._seq = itertools.count()
+        self._cond = threading.Condition()
+        self._pending = 0
+        self._in_flight = 0
+        self._closing = False
+        self._stopped = False
+        self._thread: threading.Thread | None = None
+        self._executor: ThreadPoolExecutor | None = None
+        self._stats = dict.fromkeys(("submitted", "coalesced", "sent", "retried", "failed"), 0)
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """Counters plus the numbers of pending and in-flight updates."""
+        with self._cond:
+            return {**self._stats, "pending": self._pending, "in_flight": self._in_flight}
+
+    def submit(
+        self,
+        app_id: str,
+        message_id: str,
+        card_content: CardContent,
+        final: bool = False,
+    ) -> None:
+        """
+        Queue new content for a card, replacing any pending content.
+
+        Parameters
+        ----------
+            app_id : str
+                Lark application ID that sent the card
+            message_id : str
+                Message ID of the card to update
+            card_content : dict[str, Any] | CardPayload
+                New card content
+            final : bool
+                Skip the debounce delay (e.g. for a job's last state); the
+                rate limit still applies
+
+        Raises
+        ------
+            InvalidParameterError
+                If message_id or card_content is empty
+            QueueFullError
+                If ``max_pending`` messages already have pending updates
+            LarkServiceError
+                If the dispatcher is closed
+        """
+        if not message_id or not message_id.strip():
+            raise InvalidParameterError("Message ID cannot be empty")
+        if not card_content:
+            raise InvalidParameterError("Card content cannot be empty")
+
+        now = time.monotonic()
+        with self._cond:
+            if self._closing:
+                raise LarkServiceError("Card update dispatcher is closed")
+            lane = self._lanes.get(message_id)
+            first = lane is None or lane.content is None
+            if first:
+                if self._pending >= self.max_pending:
+                    raise QueueFullError(
+                        "Too many cards with pending updates",
+                        details={"max_pending": self.max_pending},
+                    )
+                self._pending += 1
+            else:
+                self._stats["coalesced"] += 1
+            if lane is None:
+                lane = self._lanes[message_id] = _Lane()
+            self._stats["submitted"] += 1
+            lane.app_id = app_id
+            lane.content = card_content
+            lane.attempts = 0
+
+            if not lane.in_flight:
+                # Later updates do not postpone a scheduled send; final ones advance it
+                due = max(now + (0.0 if final else self.debounce), self._next_slot(lane))
+                if first or due < lane.due:
+                    self._schedule(message_id, lane, due)
+                    self._cond.notify_all()
+
+    def start(self) -> None:
+        """Start the scheduler thread (no-op if already running)."""
+        with self._cond:
+            if self._thread is not None:
+                return
+            self._executor = ThreadPoolExecutor(self.workers, thread_name_prefix="CardUpdate")
+            self._thread = threading.Thread(
+                target=self._run, args=(self._executor,), name="CardUpdateScheduler", daemon=True
+            )
+            self._thread.start()
+        logger.info(
+            "Card update dispatcher started",
+            extra={"max_rate": self.max_rate, "workers": self.workers},
+        )
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """
+        Wait until every submitted update has been sent.
+
+        Returns
+        -------
+            bool
+                False if the timeout expired first
+        """
+        with self._cond:
+            return self._cond.wait_for(lambda: self._pending == 0 and self._in_flight == 0, timeout)
+
+    def close(self, timeout: float = 10.0) -> None:
+        """
+        Send all pending updates now, then stop.
+
+        Pending content skips the debounce and rate limit, so the final
+        state of every card is delivered before shutdown.
+        """
+        if self._thread is None and self._pending:
+            self.start()
+        with self._cond:
+            self._closing = True
+            now = time.monotonic()
+            for message_id, lane in self._lanes.items():
+                if lane.content is not None and not lane.in_flight:
+                    self._schedule(message_id, lane, now)
+            self._cond.notify_all()
+
+        if self._thread is not None and not self.flush(timeout):
+            logger.warning("Card updates still pending at shutdown", extra=self.stats)
+
+        with self._cond:
+            self._stopped = True
+            self._cond.notify_all()
+        if self._thread is not None:
+            self._thread.join(timeout)
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+
+    def __enter__(self) -> "CardUpdateDispatcher":
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def _next_slot(self, lane: _Lane) -> float:
+        return lane.last_sent + self._min_interval
+
+    def _schedule(self, message_id: str, lane: _Lane, due: float) -> None:
+        lane.due = due
+        heapq.heappush(self._heap, (due, next(self._seq), message_id))
+
+    def _run(self, executor: ThreadPoolExecutor) -> None:
+        with self._cond:
+            while not self._stopped:
+                now = time.monotonic()
+                while self._heap and self._heap[0][0] <= now:
+                    due, _, message_id = heapq.heappop(self._heap)
+                    lane = self._lanes.get(message_id)
+                    if lane is None or lane.in_flight or due != lane.due:
+                        continue
+                    content = lane.content
+                    if content is None:
+                        # Idle since its last update went out; forget the message
+                        del self._lanes[message_id]
+                        continue
+                    lane.content = None
+                    lane.in_flight = True
+                    lane.last_sent = now
+                    self._pending -= 1
+                    self._in_flight += 1
+                    executor.submit(self._send, message_id, lane, lane.app_id, content)
+                timeout = self._heap[0][0] - now if self._heap else None
+                self._cond.wait(timeout)
+
+    def _send(self, message_id: str, lane: _Lane, app_id: str, content: CardContent) -> None:
+        error: Exception | None = None
+        try:
+            self.updater.update_card_content(app_id, message_id, content)
+        except Exception as e:
+            error = e
+
+        with self._cond:
+            lane.in_flight = False
+            self._in_flight -= 1
+            if error is None:
+                self._stats["sent"] += 1
+            elif (
+                lane.content is None
+                and lane.attempts + 1 < self.max_attempts
+                and not isinstance(error, InvalidParameterError)
+            ):
+                # Nothing newer arrived: send this content again on the next slot
+                lane.content = content
+                lane.attempts += 1
+                self._pending += 1
+                self._stats["retried"] += 1
+            else:
+                self._stats["failed"] += 1
+                logger.error(
+                    f"Failed to update card: {error}",
+                    extra={"app_id": app_id, "message_id": message_id},
+                )
+
+            if lane.content is not None:
+                due = time.monotonic() if self._closing else self._next_slot(lane)
+            else:
+                due = self._next_slot(lane)
+            self._schedule(message_id, lane, due)
+            self._cond.notify_all()
@@ -10,6 +10,7 @@ from typing import Any
 from lark_oapi.api.im.v1 import PatchMessageRequest, PatchMessageRequestBody
 
 from lark_service.cardkit.models import CardConfig
+from lark_service.cardkit.payload import CardPayload
 from lark_service.core.credential_pool import CredentialPool
 from lark_service.core.exceptions import InvalidParameterError, RetryableError
 from lark_service.core.retry import RetryStrategy
@@ -64,7 +65,7 @@ class CardUpdater:
         self,
         app_id: str,
         message_id: str,
-        card_content: dict[str, Any],
+        card_content: dict[str, Any] | CardPayload,
     ) -> dict[str, Any]:
         """
         Update card content proactively via API.
@@ -78,8 +79,9 @@ class CardUpdater:
                 Lark application ID
             message_id : str
                 Message ID of the card to update (e.g., "om_xxx")
-            card_content : dict[str, Any]
-                New card content (header, elements, etc.)
+            card_content : dict[str, Any] | CardPayload
+                New card content (header, elements, etc.); a CardPayload is
+                sent as is, without validating or serializing it again
 
         Returns
         -------
@@ -117,23 +119,15 @@ class CardUpdater:
                 details={"card_content": card_content},
             )
 
-        # Validate card content using Pydantic model
-        try:
-            card_config = CardConfig(**card_content)
-        except Exception as e:
-            raise InvalidParameterError(
-                f"Invalid card content: {e}",
-                details={"card_content": card_content},
-            ) from e
+        # Validate and serialize card content (payloads already are)
+        if isinstance(card_content, CardPayload):
+            content_str: str = card_content
+        else:
+            content_str = CardPayload.from_card(card_content)
 
         # Get SDK client
         client = self.credential_pool._get_sdk_client(app_id)
 
-        # Prepare content
-        import json
-
-        content_str = json.dumps(card_config.model_dump(exclude_none=True))
-
         # Create request
         request = (
             PatchMessageRequest.builder()
@@ -1,17 +1,22 @@
 """CloudDoc module for Lark Service.
 
 This module provides cloud document capabilities including:
-- Document operations (metadata, permissions)
+- Document operations (metadata, permissions, block trees)
 - Bitable (multi-dimensional table) operations
 - Sheet (spreadsheet) operations
+- Columnar bulk export of Bitable and Sheet data
 """
 
 from lark_service.clouddoc.bitable.client import BitableClient
+from lark_service.clouddoc.blocks import BlockTree
 from lark_service.clouddoc.client import DocClient
+from lark_service.clouddoc.export import ColumnarTable
 from lark_service.clouddoc.sheet.client import SheetClient
 
 __all__ = [
     "DocClient",
     "BitableClient",
     "SheetClient",
+    "ColumnarTable",
+    "BlockTree",
 ]
@@ -5,10 +5,13 @@ This module provides a high-level client for multi-dimensional table operations
 via Lark Base API, including CRUD operations with filters and pagination.
 """
 
-from typing import TYPE_CHECKING, Any
+from collections.abc import Iterator
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, TextIO
 
 from lark_oapi.api.bitable.v1 import SearchAppTableRecordRequest, SearchAppTableRecordRequestBody
 
+from lark_service.clouddoc.export import ColumnarTable, write_csv
 from lark_service.clouddoc.models import BaseRecord, FieldDefinition, FilterCondition
 
 if TYPE_CHECKING:
@@ -592,77 +595,23 @@ class BitableClient:
 
         logger.info(f"Querying records (structured) from table {table_id}, page_size={page_size}")
 
-        def _query() -> tuple[list[BaseRecord], str | None]:
-            # Use direct HTTP request as SDK may not support new filter format
-            import requests
+        payload: dict[str, Any] = {
+            "page_size": page_size,
+        }
 
-            token = self.credential_pool.get_token(app_id, token_type="tenant_access_token")  # nosec B106
+        if page_token:
+            payload["page_token"] = page_token
 
-            url = f"https://open.feishu.cn/open-apis/bitable/v1/apps/{app_token}/tables/{table_id}/records/search"
-            headers = {
-                "Authorization": f"Bearer {token}",
-                "Content-Type": "application/json; charset=utf-8",
-            }
-
-            payload: dict[str, Any] = {
-                "page_size": page_size,
-            }
+        # Construct structured filter
+        if filter_info:
+            payload["filter"] = self._build_structured_filter(filter_info)
+            logger.debug(f"Filter: {payload['filter']}")
 
-            if page_token:
-                payload["page_token"] = page_token
-
-            # Construct structured filter
-            if filter_info:
-                filter_dict: dict[str, Any] = {
-                    "conjunction": filter_info.conjunction,
-                    "conditions": [],
-                }
-
-                for condition in filter_info.conditions:
-                    cond_dict: dict[str, Any] = {
-                        "field_name": condition.field_name,
-                        "operator": condition.operator,
-                    }
-
-                    # 只有非空操作符才需要 value
-                    if condition.operator not in ["isEmpty", "isNotEmpty"] and condition.value:
-                        cond_dict["value"] = condition.value
-
-                    filter_dict["conditions"].append(cond_dict)
-
-                payload["filter"] = filter_dict
-                logger.debug(f"Filter: {filter_dict}")
-
-            response = requests.post(url, headers=headers, json=payload, timeout=30)
-
-            if response.status_code != 200:
-                error_msg = f"Failed to query records: HTTP {response.status_code}"
-                try:
-                    error_data = response.json()
-                    error_msg = f"{error_msg} - {error_data.get('msg', 'Unknown error')}"
-                    error_code = error_data.get("code", 0)
-
-                    if error_code == 1770002:
-                        raise NotFoundError(f"Table not found: {table_id}")
-                    elif error_code in [1770032, 403]:
-                        raise PermissionDeniedError(f"No permission to access table: {table_id}")
-                    elif error_code in [1770001, 400]:
-                        raise InvalidParameterError(error_msg)
-                except Exception as e:
-                    if isinstance(e, NotFoundError | PermissionDeniedError | InvalidParameterError):
-                        raise
-                    logger.error(f"Failed to parse error response: {e}")
-
-                raise APIError(error_msg)
-
-            result = response.json()
-            if result.get("code") != 0:
-                error_msg = f"API returned error: {result.get('msg', 'Unknown error')}"
-                raise APIError(error_msg)
+        def _query() -> tuple[list[BaseRecord], str | None]:
+            data = self._search_records_raw(app_id, app_token, table_id, payload)
 
             records = []
-            data = result.get("data", {})
-            items = data.get("items", [])
+            items = data.get("items") or []
 
             for item in items:
                 record_id = item.get("record_id")
@@ -688,6 +637,283 @@ class BitableClient:
 
         return self.retry_strategy.execute(_query)
 
+    @staticmethod
+    def _build_structured_filter(filter_info: "StructuredFilterInfo") -> dict[str, Any]:
+        """Convert StructuredFilterInfo to the search API ``filter`` payload."""
+        filter_dict: dict[str, Any] = {
+            "conjunction": filter_info.conjunction,
+            "conditions": [],
+        }
+
+        for condition in filter_info.conditions:
+            cond_dict: dict[str, Any] = {
+                "field_name": condition.field_name,
+                "operator": condition.operator,
+            }
+
+            # 只有非空操作符才需要 value
+            if condition.operator not in ["isEmpty", "isNotEmpty"] and condition.value:
+                cond_dict["value"] = condition.value
+
+            filter_dict["conditions"].append(cond_dict)
+
+        return filter_dict
+
+    def _search_records_raw(
+        self,
+        app_id: str,
+        app_token: str,
+        table_id: str,
+        payload: dict[str, Any],
+    ) -> dict[str, Any]:
+        """
+        Call the records search API and return the raw ``data`` dict (no retry).
+
+        Parameters
+        ----------
+            app_id : str
+                Lark application ID
+            app_token : str
+                Bitable app token
+            table_id : str
+                Table ID
+            payload : dict
+                Search request body (page_size, page_token, filter, field_names)
+
+        Returns
+        -------
+            dict
+                Raw response data with ``items``, ``page_token`` and ``has_more``
+        """
+        # Use direct HTTP request as SDK may not support new filter format
+        import requests
+
+        token = self.credential_pool.get_token(app_id, token_type="tenant_access_token")  # nosec B106
+
+        url = f"https://open.feishu.cn/open-apis/bitable/v1/apps/{app_token}/tables/{table_id}/records/search"
+        headers = {
+            "Authorization": f"Bearer {token}",
+            "Content-Type": "application/json; charset=utf-8",
+        }
+
+        response = requests.post(url, headers=headers, json=payload, timeout=30)
+
+        if response.status_code != 200:
+            error_msg = f"Failed to query records: HTTP {response.status_code}"
+            try:
+                error_data = response.json()
+                error_msg = f"{error_msg} - {error_data.get('msg', 'Unknown error')}"
+                error_code = error_data.get("code", 0)
+
+                if error_code == 1770002:
+                    raise NotFoundError(f"Table not found: {table_id}")
+                elif error_code in [1770032, 403]:
+                    raise PermissionDeniedError(f"No permission to access table: {table_id}")
+                elif error_code in [1770001, 400]:
+                    raise InvalidParameterError(error_msg)
+            except Exception as e:
+                if isinstance(e, NotFoundError | PermissionDeniedError | InvalidParameterError):
+                    raise
+                logger.error(f"Failed to parse error response: {e}")
+
+            raise APIError(error_msg)
+
+        result = response.json()
+        if result.get("code") != 0:
+            error_msg = f"API returned error: {result.get('msg', 'Unknown error')}"
+            raise APIError(error_msg)
+
+        data: dict[str, Any] = result.get("data") or {}
+        return data
+
+    def _iter_raw_pages(
+        self,
+        app_id: str,
+        app_token: str,
+        table_id: str,
+        filter_info: "StructuredFilterInfo | None",
+        field_names: list[str] | None,
+        page_size: int,
+    ) -> Iterator[list[dict[str, Any]]]:
+        """Yield raw ``items`` pages from the search API until exhausted."""
+        payload: dict[str, Any] = {"page_size": page_size}
+        if filter_info:
+            payload["filter"] = self._build_structured_filter(filter_info)
+        if field_names:
+            payload["field_names"] = field_names
+
+        while True:
+            data = self.retry_strategy.execute(
+                self._search_records_raw, app_id, app_token, table_id, payload
+            )
+            items = data.get("items") or []
+            if items:
+                yield items
+
+            page_token = data.get("page_token")
+            if (
+                not data.get("has_more")
+                or not page_token
+                or page_token == payload.get("page_token")
+            ):
+                return
+            payload["page_token"] = page_token
+
+    def export_columns(
+        self,
+        app_id: str,
+        app_token: str,
+        table_id: str,
+        field_names: list[str] | None = None,
+        filter_info: "StructuredFilterInfo | None" = None,
+        page_size: int = 500,
+    ) -> ColumnarTable:
+        """
+        Export all matching records into a columnar table.
+
+        Pages through the search API and writes raw field values directly
+        into per-field column lists; no BaseRecord models are built.
+
+        Parameters
+        ----------
+            app_id : str
+                Lark application ID
+            app_token : str
+                Bitable app token
+            table_id : str
+                Table ID
+            field_names : list[str] | None
+                Fields to export (default: all fields, discovered from data)
+            filter_info : StructuredFilterInfo | None
+                Structured filter (default: no filter)
+            page_size : int
+                Page size (default: 500, max: 500)
+
+        Returns
+        -------
+            ColumnarTable
+                ``record_id`` column followed by one column per field
+
+        Raises
+        ------
+            InvalidParameterError
+                If parameters are invalid
+            NotFoundError
+                If table not found
+            PermissionDeniedError
+                If user has no permission
+
+        Examples
+        --------
+            >>> table = client.export_columns(
+            ...     app_id="cli_xxx",
+            ...     app_token="bascn123",
+            ...     table_id="tbl123",
+            ...     field_names=["Name", "Age"]
+            ... )
+            >>> df = pandas.DataFrame(table.to_pydict())
+        """
+        if page_size < 1 or page_size > 500:
+            raise InvalidParameterError(f"Invalid page_size: {page_size} (1-500)")
+
+        logger.info(f"Exporting records (columnar) from table {table_id}")
+
+        table = ColumnarTable(columns=["record_id", *(field_names or [])])
+        record_ids = table.data["record_id"]
+
+        for items in self._iter_raw_pages(
+            app_id, app_token, table_id, filter_info, field_names, page_size
+        ):
+            if field_names:
+                columns = [table.data[name] for name in field_names]
+                for item in items:
+                    record_ids.append(item.get("record_id"))
+                    fields = item.get("fields") or {}
+                    for name, column in zip(field_names, columns, strict=True):
+                        column.append(fields.get(name))
+            else:
+                for item in items:
+                    table.append_record(
+                        {"record_id": item.get("record_id"), **(item.get("fields") or {})}
+                    )
+
+        logger.info(
+            f"Exported {table.num_rows} records x {len(table.columns) - 1} fields "
+            f"from table {table_id}"
+        )
+        return table
+
+    def export_csv(
+        self,
+        app_id: str,
+        app_token: str,
+        table_id: str,
+        dest: str | Path | TextIO,
+        field_names: list[str] | None = None,
+        filter_info: "StructuredFilterInfo | None" = None,
+        page_size: int = 500,
+    ) -> int:
+        """
+        Stream all matching records to CSV page by page.
+
+        Only one page of raw records is held in memory at a time. Nested
+        field values (multi-select, users, rich text) are written as JSON.
+
+        Parameters
+        ----------
+            app_id : str
+                Lark application ID
+            app_token : str
+                Bitable app token
+            table_id : str
+                Table ID
+            dest : str | Path | TextIO
+                Output file path or open text stream
+            field_names : list[str] | None
+                Fields to export (default: all table fields via get_table_fields)
+            filter_info : StructuredFilterInfo | None
+                Structured filter (default: no filter)
+            page_size : int
+                Page size (default: 500, max: 500)
+
+        Returns
+        -------
+            int
+                Number of records written
+
+        Examples
+        --------
+            >>> count = client.export_csv(
+            ...     app_id="cli_xxx",
+            ...     app_token="bascn123",
+            ...     table_id="tbl123",
+            ...     dest="records.csv"
+            ... )
+        """
+        if page_size < 1 or page_size > 500:
+            raise InvalidParameterError(f"Invalid page_size: {page_size} (1-500)")
+
+        if not field_names:
+            field_names = [
+                field["field_name"] for field in self.get_table_fields(app_id, app_token, table_id)
+            ]
+
+        logger.info(f"Exporting records (csv) from table {table_id}")
+        names = field_names
+
+        def _rows() -> Iterator[list[Any]]:
+            for items in self._iter_raw_pages(
+                app_id, app_token, table_id, filter_info, names, page_size
+            ):
+                for item in items:
+                    fields = item.get("fields") or {}
+                    yield [item.get("record_id"), *(fields.get(name) for name in names)]
+
+        count = write_csv(dest, _rows(), header=["record_id", *names])
+
+        logger.info(f"Exported {count} records (csv) from table {table_id}")
+        return count
+
     def update_record(
         self,
         app_id: str,
@@ -0,0 +1,161 @@
+"""
+Compact in-memory block tree for Lark documents.
+
+DocClient.load_block_tree fills a BlockTree from the raw docx block items
+returned by the "list block children" API. Nodes keep the raw block dict
+(no per-block model validation) and are indexed by block_id, so lookups,
+parent/child navigation and document-order walks are all dictionary
+operations.
+
+Trees returned by load_block_tree are shared with its cache and frozen:
+the node index is read-only and child lists are tuples. Raw block dicts
+are not frozen, so callers must take ``tree.copy()`` before modifying
+anything.
+"""
+
+import copy
+import dataclasses
+from collections.abc import Iterator, Mapping, Sequence
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Any
+
+
+@dataclass(slots=True)
+class BlockNode:
+    """
+    Single block in a document tree.
+
+    Attributes
+    ----------
+        block_id : str
+            Block ID
+        block_type : int
+            docx block type (2 = text, 3-11 = heading1-9, ...)
+        parent_id : str | None
+            Parent block ID (None for the page block)
+        children : Sequence[str]
+            Child block IDs in document order (a tuple in frozen trees)
+        data : dict[str, Any]
+            Raw block item as returned by the API
+    """
+
+    block_id: str
+    block_type: int
+    parent_id: str | None
+    children: Sequence[str]
+    data: dict[str, Any]
+
+    @classmethod
+    def from_item(cls, item: dict[str, Any]) -> "BlockNode":
+        """Build a node from a raw API block item."""
+        return cls(
+            block_id=item["block_id"],
+            block_type=int(item.get("block_type") or 0),
+            parent_id=item.get("parent_id") or None,
+            children=list(item.get("children") or ()),
+            data=item,
+        )
+
+
+@dataclass
+class BlockTree:
+    """
+    Block tree of one document revision.
+
+    Attributes
+    ----------
+        document_id : str
+            Document ID
+        revision_id : int
+            Document revision the tree was read at
+        root_id : str
+            Page (root) block ID
+        nodes : Mapping[str, BlockNode]
+            block_id -> node index (read-only in frozen trees)
+
+    Examples
+    --------
+        >>> tree = client.load_block_tree(doc_id="doxcn123")
+        >>> for node in tree.walk():
+        ...     print(node.block_type, node.block_id)
+    """
+
+    document_id: str
+    revision_id: int
+    root_id: str
+    nodes: Mapping[str, BlockNode] = field(default_factory=dict)
+
+    def __len__(self) -> int:
+        return len(self.nodes)
+
+    def __contains__(self, block_id: object) -> bool:
+        return block_id in self.nodes
+
+    @property
+    def root(self) -> BlockNode:
+        """Page (root) block."""
+        return self.nodes[self.root_id]
+
+    def copy(self) -> "BlockTree":
+        """Return a mutable deep copy that shares no nodes or block data with this tree."""
+        return BlockTree(
+            document_id=self.document_id,
+            revision_id=self.revision_id,
+            root_id=self.root_id,
+            nodes={
+                block_id: BlockNode(
+                    block_id=node.block_id,
+                    block_type=node.block_type,
+                    parent_id=node.parent_id,
+                    children=list(node.children),
+                    data=copy.deepcopy(node.data),
+                )
+                for block_id, node in self.nodes.items()
+            },
+        )
+
+    def frozen(self) -> "BlockTree":
+        """
+        Return a read-only view of this tree for sharing between callers.
+
+        The node index becomes a read-only mapping and child lists become
+        tuples. Block data dicts are shared with this tree, not copied.
+        """
+        return dataclasses.replace(
+            self,
+            nodes=MappingProxyType(
+                {
+                    block_id: dataclasses.replace(node, children=tuple(node.children))
+                    for block_id, node in self.nodes.items()
+                }
+            ),
+        )
+
+    def get(self, block_id: str) -> BlockNode | None:
+        """Return the node for ``block_id`` or None."""
+        return self.nodes.get(block_id)
+
+    def children_of(self, block_id: str) -> list[BlockNode]:
+        """Return loaded child nodes of ``block_id`` in document order."""
+        node = self.nodes.get(block_id)
+        if node is None:
+            return []
+        return [self.nodes[child] for child in node.children if child in self.nodes]
+
+    def walk(self, block_id: str | None = None) -> Iterator[BlockNode]:
+        """
+        Iterate the subtree rooted at ``block_id`` depth-first in document order.
+
+        Defaults to the whole document (starting with the page block).
+        """
+        start = self.nodes.get(block_id or self.root_id)
+        if start is None:
+            return
+        stack = [start]
+        while stack:
+            node = stack.pop()
+            yield node
+            stack.extend(
+                self.nodes[child] for child in reversed(node.children) if child in self.nodes
+            )
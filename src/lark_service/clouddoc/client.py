@@ -5,6 +5,19 @@ This module provides a high-level client for document operations via Lark CloudD
 including creating documents, appending content, getting content, and updating blocks.
 """
 
+import hashlib
+import threading
+import uuid
+from collections import OrderedDict, deque
+from collections.abc import Callable, Iterable
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    CancelledError,
+    Future,
+    ThreadPoolExecutor,
+    wait,
+)
+from itertools import islice
 from typing import Any
 
 import requests
@@ -14,12 +27,14 @@ from lark_oapi.api.docx.v1 import (
     GetDocumentRequest,
 )
 
+from lark_service.clouddoc.blocks import BlockNode, BlockTree
 from lark_service.clouddoc.models import ContentBlock, Document, Permission
 from lark_service.core.base_service_client import BaseServiceClient
 from lark_service.core.credential_pool import CredentialPool
 from lark_service.core.exceptions import (
     APIError,
     InvalidParameterError,
+    LarkServiceError,
     NotFoundError,
     PermissionDeniedError,
 )
@@ -28,6 +43,72 @@ from lark_service.utils.logger import get_logger
 
 logger = get_logger()
 
+# Maximum blocks per "create children" request
+MAX_APPEND_BLOCKS = 100
+
+# Block type mapping: string -> docx integer block type
+_BLOCK_TYPE_MAP = {
+    "paragraph": 2,  # Text paragraph
+    "heading": 3,  # Heading (need to specify level)
+    "heading_1": 3,
+    "heading_2": 4,
+    "heading_3": 5,
+    "list": 6,  # Bullet list
+    "ordered_list": 7,  # Ordered list
+    "code": 8,  # Code block
+    "divider": 11,  # Divider line
+    "image": 27,  # Image
+    "table": 31,  # Table
+}
+
+
+def _text_body(content: Any) -> dict[str, Any]:
+    """Build a docx text body with a single text run."""
+    return {
+        "elements": [
+            {
+                "text_run": {
+                    "content": str(content) if content else "",
+                    "text_element_style": {},
+                }
+            }
+        ],
+        "style": {},
+    }
+
+
+def _batch_client_token(doc_id: str, stream_id: str, batch_index: int) -> str:
+    """Derive a stable UUID client_token for one batch of a content stream."""
+    digest = hashlib.sha256(f"{doc_id}/{stream_id}/{batch_index}".encode()).digest()
+    return str(uuid.UUID(bytes=digest[:16], version=4))
+
+
+def _block_to_dict(block: ContentBlock) -> dict[str, Any]:
+    """Convert a ContentBlock to the docx API block structure."""
+    block_type_str = str(block.block_type)
+
+    # Build block structure based on type
+    if block_type_str in ["paragraph", "text"]:
+        return {"block_type": _BLOCK_TYPE_MAP["paragraph"], "text": _text_body(block.content)}
+
+    if block_type_str.startswith("heading"):
+        # Heading block - need to check string value for subtype
+        level = 1
+        if block_type_str == "heading_2":
+            level = 2
+        elif block_type_str == "heading_3":
+            level = 3
+        return {
+            "block_type": _BLOCK_TYPE_MAP.get(block_type_str, 3),
+            f"heading{level}": _text_body(block.content),
+        }
+
+    if block_type_str == "divider":
+        return {"block_type": _BLOCK_TYPE_MAP["divider"]}
+
+    # Default to text
+    return {"block_type": 2, "text": _text_body(block.content)}
+
 
 class DocClient(BaseServiceClient):
     """
@@ -56,6 +137,11 @@ class DocClient(BaseServiceClient):
         >>> doc = client.create_document(title="My Document")
     """
 
+    # Max page size of the "list block children" API
+    BLOCK_PAGE_SIZE = 500
+    # Documents kept in the per-client block tree cache
+    BLOCK_TREE_CACHE_SIZE = 32
+
     def __init__(
         self,
         credential_pool: CredentialPool,
@@ -76,6 +162,8 @@ class DocClient(BaseServiceClient):
         """
         super().__init__(credential_pool, app_id)
         self.retry_strategy = retry_strategy or RetryStrategy()
+        self._block_tree_cache: OrderedDict[tuple[str, str], BlockTree] = OrderedDict()
+        self._block_tree_lock = threading.Lock()
 
     def create_document(
         self,
@@ -153,6 +241,95 @@ class DocClient(BaseServiceClient):
 
         return self.retry_strategy.execute(_create)
 
+    def _post_children(
+        self,
+        app_id: str,
+        doc_id: str,
+        children: list[dict[str, Any]],
+        client_token: str | None = None,
+    ) -> dict[str, Any]:
+        """
+        Append converted blocks to the end of the document root (no retry).
+
+        Parameters
+        ----------
+            app_id : str
+                Resolved app_id
+            doc_id : str
+                Document ID
+            children : list[dict]
+                Blocks in docx API format
+            client_token : str | None
+                Idempotency token; retries with the same token do not
+                append the blocks twice
+
+        Returns
+        -------
+            dict
+                Response ``data`` (contains created ``children``)
+        """
+        # Get tenant access token
+        token = self.credential_pool.get_token(app_id, token_type="tenant_access_token")  # nosec B106
+
+        # Make API request
+        # First, get the document to find the root block_id
+        # For simplicity, we'll use the document_id as the parent block
+        # In practice, you might need to query the document structure first
+
+        url = (
+            f"https://open.feishu.cn/open-apis/docx/v1/documents/{doc_id}/blocks/{doc_id}/children"
+        )
+
+        headers = {
+            "Authorization": f"Bearer {token}",
+            "Content-Type": "application/json; charset=utf-8",
+        }
+
+        payload = {
+            "index": -1,  # Append to end
+            "children": children,
+        }
+
+        if client_token:
+            response = requests.post(
+                url,
+                headers=headers,
+                params={"client_token": client_token},
+                json=payload,
+                timeout=30,
+            )
+        else:
+            response = requests.post(url, headers=headers, json=payload, timeout=30)
+
+        if response.status_code != 200:
+            error_msg = f"Failed to append blocks: HTTP {response.status_code}"
+            try:
+                error_data = response.json()
+                error_msg = f"{error_msg} - {error_data.get('msg', 'Unknown error')}"
+                error_code = error_data.get("code", 0)
+
+                # Map error codes
+                if error_code == 1770002:
+                    raise NotFoundError(f"Document or block not found: {doc_id}")
+                elif error_code in [1770032, 403]:
+                    raise PermissionDeniedError(f"No permission to edit document: {doc_id}")
+                elif error_code in [1770001, 1770007, 1770005, 1770028]:
+                    raise InvalidParameterError(error_msg)
+            except Exception as e:
+                if isinstance(e, NotFoundError | PermissionDeniedError | InvalidParameterError):
+                    raise
+                logger.error(f"Failed to parse error response: {e}")
+
+            raise APIError(error_msg)
+
+        result = response.json()
+        if result.get("code") != 0:
+            error_msg = f"API returned error: {result.get('msg', 'Unknown error')}"
+            raise APIError(error_msg)
+
+        data: dict[str, Any] = result.get("data") or {}
+        return data
+
     def append_content(
         self,
         doc_id: str,
@@ -198,154 +375,185 @@ class DocClient(BaseServiceClient):
         if not blocks:
             raise InvalidParameterError("Blocks cannot be empty")
 
-        if len(blocks) > 100:
-            raise InvalidParameterError(f"Too many blocks: {len(blocks)} (max 100)")
+        if len(blocks) > MAX_APPEND_BLOCKS:
+            raise InvalidParameterError(f"Too many blocks: {len(blocks)} (max {MAX_APPEND_BLOCKS})")
 
         # Resolve app_id
         resolved_app_id = self._resolve_app_id(app_id)
 
         logger.info(f"Appending {len(blocks)} blocks to document {doc_id}")
 
-        def _append() -> bool:
-            # Get tenant access token
-            token = self.credential_pool.get_token(
-                resolved_app_id, token_type="tenant_access_token"
-            )  # nosec B106
-
-            # Convert ContentBlock to Lark API format
-            children: list[dict[str, Any]] = []
-
-            # Block type mapping: string -> integer
-            block_type_map = {
-                "paragraph": 2,  # Text paragraph
-                "heading": 3,  # Heading (need to specify level)
-                "heading_1": 3,
-                "heading_2": 4,
-                "heading_3": 5,
-                "list": 6,  # Bullet list
-                "ordered_list": 7,  # Ordered list
-                "code": 8,  # Code block
-                "divider": 11,  # Divider line
-                "image": 27,  # Image
-                "table": 31,  # Table
-            }
+        # Convert ContentBlock to Lark API format
+        children = [_block_to_dict(block) for block in blocks]
 
-            for block in blocks:
-                block_type_int = block_type_map.get(block.block_type, 2)  # Default to paragraph
-
-                # Build block structure based on type
-                if block.block_type in ["paragraph", "text"]:
-                    # Text block
-                    block_dict: dict[str, Any] = {
-                        "block_type": block_type_int,
-                        "text": {
-                            "elements": [
-                                {
-                                    "text_run": {
-                                        "content": str(block.content) if block.content else "",
-                                        "text_element_style": {},
-                                    }
-                                }
-                            ],
-                            "style": {},
-                        },
-                    }
-                elif block.block_type.startswith("heading"):
-                    # Heading block - need to check string value for subtype
-                    level = 1
-                    block_type_str = str(block.block_type)
-                    if block_type_str == "heading_2":
-                        level = 2
-                    elif block_type_str == "heading_3":
-                        level = 3
-
-                    block_dict = {
-                        "block_type": block_type_int,
-                        f"heading{level}": {
-                            "elements": [
-                                {
-                                    "text_run": {
-                                        "content": str(block.content) if block.content else "",
-                                        "text_element_style": {},
-                                    }
-                                }
-                            ],
-                            "style": {},
-                        },
-                    }
-                elif block.block_type == "divider":
-                    # Divider block
-                    block_dict = {
-                        "block_type": block_type_int,
-                    }
-                else:
-                    # Default to text
-                    block_dict = {
-                        "block_type": 2,
-                        "text": {
-                            "elements": [
-                                {
-                                    "text_run": {
-                                        "content": str(block.content) if block.content else "",
-                                        "text_element_style": {},
-                                    }
-                                }
-                            ],
-                            "style": {},
-                        },
-                    }
-
-                children.append(block_dict)
-
-            # Make API request
-            # First, get the document to find the root block_id
-            # For simplicity, we'll use the document_id as the parent block
-            # In practice, you might need to query the document structure first
+        def _append() -> bool:
+            self._post_children(resolved_app_id, doc_id, children)
 
-            url = f"https://open.feishu.cn/open-apis/docx/v1/documents/{doc_id}/blocks/{doc_id}/children"
+            logger.info(f"Successfully appended {len(blocks)} blocks to document {doc_id}")
+            return True
 
-            headers = {
-                "Authorization": f"Bearer {token}",
-                "Content-Type": "application/json; charset=utf-8",
-            }
+        return self.retry_strategy.execute(_append)
 
-            payload = {
-                "index": -1,  # Append to end
-                "children": children,
-            }
+    def append_content_stream(
+        self,
+        doc_id: str,
+        blocks: Iterable[ContentBlock],
+        batch_size: int = MAX_APPEND_BLOCKS,
+        start_batch: int = 0,
+        on_batch: Callable[[int, int], None] | None = None,
+        app_id: str | None = None,
+        stream_id: str | None = None,
+    ) -> int:
+        """
+        Append an arbitrarily long stream of content blocks to a document.
+
+        Blocks are converted once and flushed in order in batches of at most
+        100. The next batch is built while the previous request is in flight,
+        but only one request is sent at a time so the document order matches
+        the input order. Each batch's client_token is derived from
+        (doc_id, stream_id, batch index), so retries, and a resumed run with
+        the same ``stream_id``, never append a batch twice.
+
+        If the stream stops (a batch fails, or the input iterator or
+        ``on_batch`` raises), the raised error's ``details`` contain
+        ``acknowledged_batches`` and ``stream_id``. A batch already in flight
+        is awaited first and counted if the server accepted it. Pass both
+        back as ``start_batch`` and ``stream_id`` with the same input to
+        resume after the last batch the server accepted.
 
-            response = requests.post(url, headers=headers, json=payload, timeout=30)
+        Parameters
+        ----------
+            doc_id : str
+                Document ID
+            blocks : Iterable[ContentBlock]
+                Content blocks to append (consumed lazily)
+            batch_size : int
+                Blocks per request (1-100, default: 100)
+            start_batch : int
+                Number of leading batches to skip when resuming (default: 0)
+            on_batch : Callable[[int, int], None] | None
+                Called as ``on_batch(batch_index, block_count)`` after each
+                acknowledged batch (e.g. to persist a checkpoint)
+            app_id : str | None
+                Optional app_id (uses resolution priority if not provided)
+            stream_id : str | None
+                Identifies this stream in the batch client_tokens; pass the
+                reported value when resuming (default: a new random ID)
 
-            if response.status_code != 200:
-                error_msg = f"Failed to append blocks: HTTP {response.status_code}"
-                try:
-                    error_data = response.json()
-                    error_msg = f"{error_msg} - {error_data.get('msg', 'Unknown error')}"
-                    error_code = error_data.get("code", 0)
+        Returns
+        -------
+            int
+                Number of blocks appended by this call
 
-                    # Map error codes
-                    if error_code == 1770002:
-                        raise NotFoundError(f"Document or block not found: {doc_id}")
-                    elif error_code in [1770032, 403]:
-                        raise PermissionDeniedError(f"No permission to edit document: {doc_id}")
-                    elif error_code in [1770001, 1770007, 1770005, 1770028]:
-                        raise InvalidParameterError(error_msg)
-                except Exception as e:
-                    if isinstance(e, NotFoundError | PermissionDeniedError | InvalidParameterError):
-                        raise
-                    logger.error(f"Failed to parse error response: {e}")
+        Raises
+        ------
+            InvalidParameterError
+                If parameters are invalid
+            LarkServiceError
+                If the stream stops (details include ``acknowledged_batches``,
+                ``appended_blocks`` and ``stream_id``)
 
-                raise APIError(error_msg)
+        Examples
+        --------
+            >>> blocks = (
+            ...     ContentBlock(block_type="paragraph", content=line) for line in lines
+            ... )
+            >>> client.append_content_stream(doc_id="doxcn123", blocks=blocks)
+        """
+        if not 1 <= batch_size <= MAX_APPEND_BLOCKS:
+            raise InvalidParameterError(
+                f"Invalid batch_size: {batch_size} (must be 1-{MAX_APPEND_BLOCKS})"
+            )
 
-            result = response.json()
-            if result.get("code") != 0:
-                error_msg = f"API returned error: {result.get('msg', 'Unknown error')}"
-                raise APIError(error_msg)
+        if start_batch < 0:
+            raise InvalidParameterError(f"Invalid start_batch: {start_batch} (>= 0)")
 
-            logger.info(f"Successfully appended {len(blocks)} blocks to document {doc_id}")
-            return True
+        resolved_app_id = self._resolve_app_id(app_id)
+        stream_id = stream_id or uuid.uuid4().hex
+        source = iter(blocks)
+
+        # Skip batches acknowledged by a previous run without converting them
+        skipped = sum(1 for _ in islice(source, start_batch * batch_size))
+        if skipped < start_batch * batch_size:
+            logger.warning(
+                f"Resume point beyond end of input for document {doc_id}: "
+                f"{skipped} blocks available, batch {start_batch} requested"
+            )
+            return 0
+
+        # Set by the worker on failure so already-queued batches are not sent
+        failed = threading.Event()
+
+        def _send(children: list[dict[str, Any]], batch_index: int) -> None:
+            if failed.is_set():
+                raise CancelledError()
+            client_token = _batch_client_token(doc_id, stream_id, batch_index)
+            try:
+                self.retry_strategy.execute(
+                    self._post_children, resolved_app_id, doc_id, children, client_token
+                )
+            except BaseException:
+                failed.set()
+                raise
+
+        acknowledged = start_batch
+        appended = 0
+
+        def _acknowledge(future: "Future[None]", count: int) -> None:
+            nonlocal acknowledged, appended
+            future.result()
+            batch_index = acknowledged
+            acknowledged += 1
+            appended += count
+            if on_batch is not None:
+                on_batch(batch_index, count)
+
+        logger.info(f"Streaming blocks to document {doc_id} from batch {start_batch}")
+
+        # Single worker: at most one request in flight and one batch queued
+        # behind it, while the caller's iterator produces the next batch.
+        pending: deque[tuple[Future[None], int]] = deque()
+        next_batch = start_batch
+        try:
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                while True:
+                    children = [_block_to_dict(block) for block in islice(source, batch_size)]
+                    if not children:
+                        break
+                    pending.append((executor.submit(_send, children, next_batch), len(children)))
+                    next_batch += 1
+                    if len(pending) > 1:
+                        _acknowledge(*pending.popleft())
+                while pending:
+                    _acknowledge(*pending.popleft())
+        except Exception as e:
+            # The executor has finished every submitted batch by now; count
+            # the ones the server accepted so the resume point is exact
+            for future, count in pending:
+                if future.cancelled() or future.exception() is not None:
+                    break
+                acknowledged += 1
+                appended += count
+            failed.set()
+            progress = {
+                "doc_id": doc_id,
+                "stream_id": stream_id,
+                "acknowledged_batches": acknowledged,
+                "appended_blocks": appended,
+            }
+            logger.error(
+                f"Streaming append to document {doc_id} stopped at batch {acknowledged}: {e}"
+            )
+            if isinstance(e, LarkServiceError):
+                e.details.update(progress)
+                raise
+            raise APIError(f"Failed to append blocks: {e}", details=progress) from e
 
-        return self.retry_strategy.execute(_append)
+        logger.info(
+            f"Successfully streamed {appended} blocks to document {doc_id} "
+            f"({acknowledged - start_batch} batches)"
+        )
+        return appended
 
     def get_document_content(
         self,
@@ -475,6 +683,211 @@ class DocClient(BaseServiceClient):
         """
         return self.get_document_content(doc_id, app_id)
 
+    def _get_json(
+        self, app_id: str, doc_id: str, path: str, params: dict[str, Any] | None = None
+    ) -> dict[str, Any]:
+        """
+        GET a docx API path for ``doc_id`` and return response ``data`` (no retry).
+
+        Parameters
+        ----------
+            app_id : str
+                Resolved app_id
+            doc_id : str
+                Document ID (used for error messages)
+            path : str
+                Path below ``/open-apis/docx/v1/``
+            params : dict | None
+                Query parameters
+
+        Returns
+        -------
+            dict
+                Response ``data``
+        """
+        token = self.credential_pool.get_token(app_id, token_type="tenant_access_token")  # nosec B106
+
+        url = f"https://open.feishu.cn/open-apis/docx/v1/{path}"
+        headers = {"Authorization": f"Bearer {token}"}
+
+        response = requests.get(url, headers=headers, params=params, timeout=30)
+
+        if response.status_code != 200:
+            error_msg = f"Failed to read document: HTTP {response.status_code}"
+            try:
+                error_data = response.json()
+                error_msg = f"{error_msg} - {error_data.get('msg', 'Unknown error')}"
+                error_code = error_data.get("code", 0)
+
+                if error_code in [1770002, 404]:
+                    raise NotFoundError(f"Document or block not found: {doc_id}")
+                elif error_code in [1770032, 403]:
+                    raise PermissionDeniedError(f"No permission to read document: {doc_id}")
+            except Exception as e:
+                if isinstance(e, NotFoundError | PermissionDeniedError):
+                    raise
+                logger.error(f"Failed to parse error response: {e}")
+
+            raise APIError(error_msg)
+
+        result = response.json()
+        if result.get("code") != 0:
+            error_msg = f"API returned error: {result.get('msg', 'Unknown error')}"
+            raise APIError(error_msg)
+
+        data: dict[str, Any] = result.get("data") or {}
+        return data
+
+    def _get_revision_id(self, app_id: str, doc_id: str) -> int:
+        """Return the current revision of a document (one metadata request)."""
+        data = self.retry_strategy.execute(self._get_json, app_id, doc_id, f"documents/{doc_id}")
+        document = data.get("document") or {}
+        return int(document.get("revision_id") or 0)
+
+    def _list_block_children(
+        self, app_id: str, doc_id: str, block_id: str, revision_id: int
+    ) -> list[dict[str, Any]]:
+        """Return all child block items of ``block_id``, following pagination."""
+        items: list[dict[str, Any]] = []
+        params: dict[str, Any] = {
+            "page_size": self.BLOCK_PAGE_SIZE,
+            "document_revision_id": revision_id,
+        }
+        path = f"documents/{doc_id}/blocks/{block_id}/children"
+
+        while True:
+            data = self.retry_strategy.execute(self._get_json, app_id, doc_id, path, params)
+            items.extend(data.get("items") or [])
+
+            page_token = data.get("page_token")
+            if not data.get("has_more") or not page_token:
+                return items
+            if page_token == params.get("page_token"):
+                raise APIError(f"Pagination did not advance for block {block_id}")
+            params = {**params, "page_token": page_token}
+
+    def load_block_tree(
+        self,
+        doc_id: str,
+        app_id: str | None = None,
+        max_workers: int = 4,
+        use_cache: bool = True,
+    ) -> BlockTree:
+        """
+        Load the complete block tree of a document.
+
+        Child lists are paginated and sibling subtrees are fetched
+        concurrently. Trees are cached per document and keyed by revision,
+        so re-reading an unchanged document costs a single metadata request.
+        The returned tree is frozen and shared with the cache (no copy per
+        call); callers must take ``tree.copy()`` before modifying it.
+
+        Parameters
+        ----------
+            doc_id : str
+                Document ID
+            app_id : str | None
+                Optional app_id (uses resolution priority if not provided)
+            max_workers : int
+                Maximum concurrent child-list requests (default: 4)
+            use_cache : bool
+                Reuse a cached tree for the same revision (default: True)
+
+        Returns
+        -------
+            BlockTree
+                Frozen block tree indexed by block_id
+
+        Raises
+        ------
+            InvalidParameterError
+                If parameters are invalid
+            NotFoundError
+                If document not found
+            PermissionDeniedError
+                If app has no permission
+
+        Examples
+        --------
+            >>> tree = client.load_block_tree(doc_id="doxcn123")
+            >>> headings = [n for n in tree.walk() if 3 <= n.block_type <= 11]
+        """
+        if max_workers < 1:
+            raise InvalidParameterError(f"Invalid max_workers: {max_workers} (>= 1)")
+
+        resolved_app_id = self._resolve_app_id(app_id)
+        cache_key = (resolved_app_id, doc_id)
+
+        revision_id = self._get_revision_id(resolved_app_id, doc_id)
+
+        if use_cache:
+            with self._block_tree_lock:
+                cached = self._block_tree_cache.get(cache_key)
+                if cached is not None and cached.revision_id == revision_id:
+                    self._block_tree_cache.move_to_end(cache_key)
+                    logger.debug(f"Block tree cache hit: {doc_id} (revision {revision_id})")
+                    return cached
+
+        logger.info(f"Loading block tree: {doc_id} (revision {revision_id})")
+
+        # The page block's ID is the document ID
+        root = BlockNode(
+            block_id=doc_id,
+            block_type=1,
+            parent_id=None,
+            children=[],
+            data={"block_id": doc_id, "block_type": 1},
+        )
+        nodes: dict[str, BlockNode] = {doc_id: root}
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            pending = {
+                executor.submit(
+                    self._list_block_children, resolved_app_id, doc_id, doc_id, revision_id
+                ): root
+            }
+            try:
+                while pending:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        parent = pending.pop(future)
+                        items = future.result()
+                        parent.children = [item["block_id"] for item in items]
+                        for item in items:
+                            node = BlockNode.from_item(item)
+                            if node.parent_id is None:
+                                node.parent_id = parent.block_id
+                            nodes[node.block_id] = node
+                            if node.children:
+                                pending[
+                                    executor.submit(
+                                        self._list_block_children,
+                                        resolved_app_id,
+                                        doc_id,
+                                        node.block_id,
+                                        revision_id,
+                                    )
+                                ] = node
+            except BaseException:
+                for future in pending:
+                    future.cancel()
+                raise
+
+        logger.info(f"Loaded {len(nodes)} blocks from document {doc_id}")
+
+        tree = BlockTree(
+            document_id=doc_id, revision_id=revision_id, root_id=doc_id, nodes=nodes
+        ).frozen()
+
+        if use_cache:
+            with self._block_tree_lock:
+                self._block_tree_cache[cache_key] = tree
+                self._block_tree_cache.move_to_end(cache_key)
+                while len(self._block_tree_cache) > self.BLOCK_TREE_CACHE_SIZE:
+                    self._block_tree_cache.popitem(last=False)
+
+        return tree
+
     def update_block(
         self,
         doc_id: str,
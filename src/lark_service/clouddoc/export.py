@@ -0,0 +1,192 @@
+"""
+Columnar bulk export for CloudDoc data.
+
+Bulk export paths in SheetClient and BitableClient write raw API values
+straight into per-column lists instead of building one Pydantic model per
+cell or record. The resulting ColumnarTable can be handed to analytics
+libraries with no intermediate copy on our side
+(``pyarrow.Table.from_pydict(table.to_pydict())``,
+``pandas.DataFrame(table.to_pydict())``; both still convert the lists into
+their own storage) or streamed to CSV.
+"""
+
+import csv
+import json
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, TextIO
+
+
+def column_letter(index: int) -> str:
+    """
+    Convert 0-based column index to sheet column letters.
+
+    Examples
+    --------
+        >>> column_letter(0)
+        'A'
+        >>> column_letter(27)
+        'AB'
+    """
+    letters = ""
+    index += 1
+    while index > 0:
+        index, remainder = divmod(index - 1, 26)
+        letters = chr(ord("A") + remainder) + letters
+    return letters
+
+
+def csv_cell(value: Any) -> Any:
+    """
+    Normalize a raw API value for CSV output.
+
+    Scalars are written as-is, None becomes an empty cell and nested
+    structures (Bitable multi-select, user or rich-text fields) are
+    serialized as compact JSON.
+    """
+    if value is None:
+        return ""
+    if isinstance(value, str | int | float | bool):
+        return value
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+
+
+@dataclass
+class ColumnarTable:
+    """
+    Column-oriented table of raw values.
+
+    Each column is a plain Python list, so memory cost is one list slot per
+    cell rather than one model instance per cell.
+
+    Attributes
+    ----------
+        columns : list[str]
+            Column names in output order
+        data : dict[str, list[Any]]
+            Column name -> column values (all columns have equal length)
+
+    Examples
+    --------
+        >>> table = ColumnarTable(columns=["name", "age"])
+        >>> table.append_row(["John", "30"])
+        >>> table.num_rows
+        1
+        >>> table.to_pydict()
+        {'name': ['John'], 'age': ['30']}
+    """
+
+    columns: list[str] = field(default_factory=list)
+    data: dict[str, list[Any]] = field(default_factory=dict)
+
+    def __post_init__(self) -> None:
+        for name in self.columns:
+            self.data.setdefault(name, [])
+
+    @property
+    def num_rows(self) -> int:
+        """Number of rows in the table."""
+        if not self.columns:
+            return 0
+        return len(self.data[self.columns[0]])
+
+    def add_column(self, name: str, backfill: int | None = None) -> list[Any]:
+        """
+        Add a column, backfilling None for rows already present.
+
+        Returns the existing column if ``name`` is already known.
+        """
+        column = self.data.get(name)
+        if column is None:
+            column = [None] * (self.num_rows if backfill is None else backfill)
+            self.columns.append(name)
+            self.data[name] = column
+        return column
+
+    def append_row(self, row: Sequence[Any]) -> None:
+        """Append a positional row; short rows are padded with None."""
+        width = len(row)
+        for i, name in enumerate(self.columns):
+            self.data[name].append(row[i] if i < width else None)
+
+    def append_record(self, values: Mapping[str, Any]) -> None:
+        """
+        Append a keyed row.
+
+        Unknown keys create new columns; missing keys are filled with None.
+        """
+        rows_before = self.num_rows
+        for name, value in values.items():
+            column = self.data.get(name)
+            if column is None:
+                column = self.add_column(name, backfill=rows_before)
+            column.append(value)
+        for name in self.columns:
+            column = self.data[name]
+            if len(column) == rows_before:
+                column.append(None)
+
+    def to_pydict(self) -> dict[str, list[Any]]:
+        """Return ``{column: values}`` in column order, sharing the column lists."""
+        return {name: self.data[name] for name in self.columns}
+
+    def iter_rows(self) -> Iterator[tuple[Any, ...]]:
+        """Iterate rows as tuples in column order."""
+        return zip(*(self.data[name] for name in self.columns), strict=True)
+
+    def to_csv(self, dest: str | Path | TextIO, include_header: bool = True) -> int:
+        """
+        Write the table as CSV.
+
+        Parameters
+        ----------
+            dest : str | Path | TextIO
+                File path or open text stream
+            include_header : bool
+                Write column names as the first row (default: True)
+
+        Returns
+        -------
+            int
+                Number of data rows written
+        """
+        header = self.columns if include_header else None
+        return write_csv(dest, self.iter_rows(), header=header)
+
+
+def write_csv(
+    dest: str | Path | TextIO,
+    rows: Iterable[Sequence[Any]],
+    header: Sequence[str] | None = None,
+) -> int:
+    """
+    Stream rows to CSV without materializing them.
+
+    Parameters
+    ----------
+        dest : str | Path | TextIO
+            File path or open text stream
+        rows : Iterable[Sequence[Any]]
+            Rows of raw values (consumed lazily)
+        header : Sequence[str] | None
+            Optional header row
+
+    Returns
+    -------
+        int
+            Number of data rows written
+    """
+    if isinstance(dest, str | Path):
+        with open(dest, "w", newline="", encoding="utf-8") as f:
+            return write_csv(f, rows, header=header)
+
+    writer = csv.writer(dest)
+    if header is not None:
+        writer.writerow(header)
+
+    count = 0
+    for row in rows:
+        writer.writerow([csv_cell(value) for value in row])
+        count += 1
+    return count
@@ -1,5 +1,6 @@
 """Sheet (spreadsheet) module."""
 
 from lark_service.clouddoc.sheet.client import SheetClient
+from lark_service.clouddoc.sheet.writer import SheetWriteBuffer
 
-__all__ = ["SheetClient"]
+__all__ = ["SheetClient", "SheetWriteBuffer"]
@@ -5,10 +5,16 @@ This module provides a high-level client for spreadsheet operations
 via Lark Sheets API, including reading, updating, formatting, and managing cells.
 """
 
-from typing import Any
+import re
+from collections import deque
+from collections.abc import Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from itertools import islice
+from typing import TYPE_CHECKING, Any
 
 import requests
 
+from lark_service.clouddoc.export import ColumnarTable, column_letter
 from lark_service.clouddoc.models import CellData
 from lark_service.core.credential_pool import CredentialPool
 from lark_service.core.exceptions import (
@@ -20,9 +26,67 @@ from lark_service.core.exceptions import (
 from lark_service.core.retry import RetryStrategy
 from lark_service.utils.logger import get_logger
 
+if TYPE_CHECKING:
+    from lark_service.clouddoc.sheet.writer import SheetWriteBuffer
+
 logger = get_logger()
 
 
+def _column_index(letters: str) -> int:
+    """Convert sheet column letters to a 0-based index ("A" -> 0, "AB" -> 27)."""
+    index = 0
+    for char in letters:
+        index = index * 26 + (ord(char) - ord("A") + 1)
+    return index - 1
+
+
+def _parse_range(range_str: str) -> tuple[int, int | None, int, int | None]:
+    """
+    Parse an A1-style range into 0-based column and 1-based row bounds.
+
+    Returns ``(start_col, end_col, start_row, end_row)``; ``end_col`` or
+    ``end_row`` is None when the range is open-ended ("A:D", "A2:D", "1:100").
+    Column letters are case-insensitive ("a1:d5" equals "A1:D5").
+
+    Raises
+    ------
+        InvalidParameterError
+            If the range is not in A1 notation
+    """
+    match = re.fullmatch(r"([A-Z]*)(\d*)(?::([A-Z]*)(\d*))?", range_str.upper())
+    if not match or not (match.group(1) or match.group(2)):
+        raise InvalidParameterError(f"Unsupported range for block reads: {range_str}")
+
+    start_letters, start_digits, end_letters, end_digits = match.groups()
+    start_col = _column_index(start_letters) if start_letters else 0
+    end_col = _column_index(end_letters) if end_letters else None
+    start_row = int(start_digits) if start_digits else 1
+    end_row = int(end_digits) if end_digits else None
+
+    if match.group(3) is None:
+        # Single cell "B5" or single column "B"
+        end_col = start_col if start_letters else None
+        end_row = start_row if start_digits else None
+
+    return start_col, end_col, start_row, end_row
+
+
+def _split_full_range(full_range: str) -> tuple[str, str]:
+    """Split "sheetId!A1:B2" into ("sheetId", "A1:B2")."""
+    sheet_id, sep, range_str = full_range.partition("!")
+    if not sep or not sheet_id or not range_str:
+        raise InvalidParameterError(f"Range must include sheet ID (sheetId!A1:B2): {full_range}")
+    return sheet_id, range_str
+
+
+def _values_range(sheet_id: str, start_col: int, start_row: int, values: list[list[Any]]) -> str:
+    """Build the full range covered by ``values`` written at (start_col, start_row)."""
+    width = max((len(row) for row in values), default=1) or 1
+    end_col = column_letter(start_col + width - 1)
+    end_row = start_row + len(values) - 1
+    return f"{sheet_id}!{column_letter(start_col)}{start_row}:{end_col}{end_row}"
+
+
 class SheetClient:
     """
     High-level client for Lark Sheet operations.
@@ -49,6 +113,18 @@ class SheetClient:
         >>> print(len(data))
     """
 
+    # Sheets v2 read limit per request
+    MAX_READ_CELLS = 100_000
+
+    # Upper bound of rows per block for concurrent large-range reads
+    DEFAULT_BLOCK_ROWS = 5_000
+
+    # Sheets v2 write limit per request
+    MAX_WRITE_CELLS = 10_000
+
+    # Maximum ranges per values_batch_get / values_batch_update request
+    MAX_BATCH_RANGES = 100
+
     def __init__(
         self,
         credential_pool: CredentialPool,
@@ -180,6 +256,81 @@ class SheetClient:
 
         return self.retry_strategy.execute(_get_info)
 
+    def _fetch_values(
+        self,
+        app_id: str,
+        spreadsheet_token: str,
+        full_range: str,
+    ) -> list[list[Any]]:
+        """
+        Fetch raw cell values for a range (single request, no retry).
+
+        Parameters
+        ----------
+            app_id : str
+                Lark application ID
+            spreadsheet_token : str
+                Spreadsheet token
+            full_range : str
+                Range with sheet prefix (e.g., "sheet1!A1:B10")
+
+        Returns
+        -------
+            list[list[Any]]
+                Raw ``valueRange.values`` rows as returned by the API
+        """
+        # Get tenant access token
+        token = self.credential_pool.get_token(app_id, token_type="tenant_access_token")  # nosec B106
+
+        # Make API request
+        # Using Sheets v2 API: GET /open-apis/sheets/v2/spreadsheets/{spreadsheetToken}/values/{range}
+        url = f"https://open.feishu.cn/open-apis/sheets/v2/spreadsheets/{spreadsheet_token}/values/{full_range}"
+
+        headers = {
+            "Authorization": f"Bearer {token}",
+            "Content-Type": "application/json; charset=utf-8",
+        }
+
+        # Optional query parameters for formatting
+        params = {
+            "valueRenderOption": "ToString",  # Convert values to string
+            "dateTimeRenderOption": "FormattedString",  # Format dates as strings
+        }
+
+        response = requests.get(url, headers=headers, params=params, timeout=30)
+
+        if response.status_code != 200:
+            error_msg = f"Failed to get sheet data: HTTP {response.status_code}"
+            try:
+                error_data = response.json()
+                error_msg = f"{error_msg} - {error_data.get('msg', 'Unknown error')}"
+                error_code = error_data.get("code", 0)
+
+                # Map error codes
+                if error_code in [404, 1770002]:
+                    raise NotFoundError(f"Sheet or range not found: {full_range}")
+                elif error_code in [403, 1770032]:
+                    raise PermissionDeniedError(f"No permission to access sheet: {full_range}")
+                elif error_code in [400, 1770001]:
+                    raise InvalidParameterError(error_msg)
+            except Exception as e:
+                if isinstance(e, NotFoundError | PermissionDeniedError | InvalidParameterError):
+                    raise
+                logger.error(f"Failed to parse error response: {e}")
+
+            raise APIError(error_msg)
+
+        result = response.json()
+        if result.get("code") != 0:
+            error_msg = f"API returned error: {result.get('msg', 'Unknown error')}"
+            raise APIError(error_msg)
+
+        # Parse response data
+        data = result.get("data", {})
+        value_range = data.get("valueRange", {})
+        values: list[list[Any]] = value_range.get("values") or []
+        return values
+
     def get_sheet_data(
         self,
         app_id: str,
@@ -233,94 +384,374 @@ class SheetClient:
         logger.info(f"Getting sheet data: {sheet_id}!{range_str}")
 
         def _get() -> list[list[CellData]]:
-            # Get tenant access token
-            token = self.credential_pool.get_token(app_id, token_type="tenant_access_token")  # nosec B106
+            values = self._fetch_values(app_id, spreadsheet_token, f"{sheet_id}!{range_str}")
+
+            # Convert to CellData objects. No formatting is returned with the
+            # ToString render option, so only the value is passed and the
+            # formatting fields keep their None defaults.
+            cell_data_rows: list[list[CellData]] = [
+                [
+                    CellData(value=str(cell_value) if cell_value is not None else "")
+                    for cell_value in row
+                ]
+                if isinstance(row, list)
+                else []
+                for row in values
+            ]
 
-            # Build the range parameter: sheetId!A1:B10
-            full_range = f"{sheet_id}!{range_str}"
+            logger.info(
+                f"Successfully retrieved {len(cell_data_rows)} rows "
+                f"from sheet {sheet_id}!{range_str}"
+            )
 
-            # Make API request
-            # Using Sheets v2 API: GET /open-apis/sheets/v2/spreadsheets/{spreadsheetToken}/values/{range}
-            url = f"https://open.feishu.cn/open-apis/sheets/v2/spreadsheets/{spreadsheet_token}/values/{full_range}"
+            return cell_data_rows
 
-            headers = {
-                "Authorization": f"Bearer {token}",
-                "Content-Type": "application/json; charset=utf-8",
-            }
+        return self.retry_strategy.execute(_get)
 
-            # Optional query parameters for formatting
-            params = {
-                "valueRenderOption": "ToString",  # Convert values to string
-                "dateTimeRenderOption": "FormattedString",  # Format dates as strings
-            }
+    def get_sheet_values(
+        self,
+        app_id: str,
+        spreadsheet_token: str,
+        sheet_id: str,
+        range_str: str,
+    ) -> list[list[Any]]:
+        """
+        Get raw sheet values within specified range.
 
-            response = requests.get(url, headers=headers, params=params, timeout=30)
+        Fast path of get_sheet_data that returns plain nested lists instead of
+        one CellData model per cell. Use it for large ranges where only the
+        values are needed.
 
-            if response.status_code != 200:
-                error_msg = f"Failed to get sheet data: HTTP {response.status_code}"
-                try:
-                    error_data = response.json()
-                    error_msg = f"{error_msg} - {error_data.get('msg', 'Unknown error')}"
-                    error_code = error_data.get("code", 0)
+        Parameters
+        ----------
+            app_id : str
+                Lark application ID
+            spreadsheet_token : str
+                Spreadsheet token
+            sheet_id : str
+                Sheet ID
+            range_str : str
+                Range string (e.g., "A1:B10")
 
-                    # Map error codes
-                    if error_code in [404, 1770002]:
-                        raise NotFoundError(f"Sheet or range not found: {full_range}")
-                    elif error_code in [403, 1770032]:
-                        raise PermissionDeniedError(f"No permission to access sheet: {full_range}")
-                    elif error_code in [400, 1770001]:
-                        raise InvalidParameterError(error_msg)
-                except Exception as e:
-                    if isinstance(e, NotFoundError | PermissionDeniedError | InvalidParameterError):
-                        raise
-                    logger.error(f"Failed to parse error response: {e}")
+        Returns
+        -------
+            list[list[Any]]
+                2D array of values as returned by the API (strings, None for
+                empty cells)
 
-                raise APIError(error_msg)
+        Raises
+        ------
+            InvalidParameterError
+                If parameters are invalid
+            NotFoundError
+                If sheet not found
+            PermissionDeniedError
+                If user has no permission
 
-            result = response.json()
-            if result.get("code") != 0:
-                error_msg = f"API returned error: {result.get('msg', 'Unknown error')}"
-                raise APIError(error_msg)
+        Examples
+        --------
+            >>> rows = client.get_sheet_values(
+            ...     app_id="cli_xxx",
+            ...     spreadsheet_token="shtcn123",
+            ...     sheet_id="sheet1",
+            ...     range_str="A1:J10000"
+            ... )
+            >>> print(rows[0][0])
+        """
+        if not range_str:
+            raise InvalidParameterError("Range string cannot be empty")
 
-            # Parse response data
-            data = result.get("data", {})
-            value_range = data.get("valueRange", {})
-            values = value_range.get("values", [])
-
-            # Convert to CellData objects
-            cell_data_rows: list[list[CellData]] = []
-
-            for row in values:
-                cell_data_row: list[CellData] = []
-
-                if isinstance(row, list):
-                    for cell_value in row:
-                        # Create CellData object
-                        cell_data = CellData(
-                            value=str(cell_value) if cell_value is not None else "",
-                            formula=None,
-                            number_format=None,
-                            font_size=None,
-                            font_color=None,
-                            background_color=None,
-                            bold=None,
-                            italic=None,
-                            underline=None,
-                            align=None,
-                            vertical_align=None,
-                        )
-                        cell_data_row.append(cell_data)
+        logger.info(f"Getting sheet values: {sheet_id}!{range_str}")
 
-                cell_data_rows.append(cell_data_row)
+        values = self.retry_strategy.execute(
+            self._fetch_values, app_id, spreadsheet_token, f"{sheet_id}!{range_str}"
+        )
 
-            logger.info(
-                f"Successfully retrieved {len(cell_data_rows)} rows "
-                f"from sheet {sheet_id}!{range_str}"
+        logger.info(f"Successfully retrieved {len(values)} rows from sheet {sheet_id}!{range_str}")
+        return values
+
+    def iter_sheet_value_blocks(
+        self,
+        app_id: str,
+        spreadsheet_token: str,
+        sheet_id: str,
+        range_str: str | None = None,
+        block_rows: int | None = None,
+        max_workers: int = 4,
+    ) -> Iterator[list[list[Any]]]:
+        """
+        Read a large range as row blocks fetched concurrently, yielded in order.
+
+        The range is split into row blocks of at most ``block_rows`` rows.
+        Open-ended ranges ("A:J", "A2:J", or no range at all) are bounded
+        with the sheet dimensions from get_sheet_info. Up to ``max_workers``
+        blocks are in flight at once; blocks are yielded strictly in sheet
+        order, so memory stays bounded to the in-flight window.
+
+        Parameters
+        ----------
+            app_id : str
+                Lark application ID
+            spreadsheet_token : str
+                Spreadsheet token
+            sheet_id : str
+                Sheet ID
+            range_str : str | None
+                A1 range (e.g., "A1:J50000", "A:J"); None reads the whole sheet
+            block_rows : int | None
+                Rows per request (default: fits MAX_READ_CELLS, at most
+                DEFAULT_BLOCK_ROWS)
+            max_workers : int
+                Maximum concurrent block requests (default: 4)
+
+        Yields
+        ------
+            list[list[Any]]
+                Raw value rows of each block, in order
+
+        Raises
+        ------
+            InvalidParameterError
+                If parameters are invalid
+            NotFoundError
+                If sheet not found
+            PermissionDeniedError
+                If user has no permission
+
+        Examples
+        --------
+            >>> for rows in client.iter_sheet_value_blocks(
+            ...     app_id="cli_xxx",
+            ...     spreadsheet_token="shtcn123",
+            ...     sheet_id="sheet1",
+            ...     range_str="A1:J50000",
+            ... ):
+            ...     process(rows)
+        """
+        if block_rows is not None and block_rows < 1:
+            raise InvalidParameterError(f"Invalid block_rows: {block_rows} (>= 1)")
+
+        if max_workers < 1:
+            raise InvalidParameterError(f"Invalid max_workers: {max_workers} (>= 1)")
+
+        start_col, end_col, start_row, end_row = _parse_range(range_str or "A1")
+        if range_str is None:
+            end_col = end_row = None
+
+        if end_col is None or end_row is None:
+            sheet = next(
+                (
+                    info
+                    for info in self.get_sheet_info(app_id, spreadsheet_token)
+                    if info.get("sheet_id") == sheet_id
+                ),
+                None,
+            )
+            if sheet is None:
+                raise NotFoundError(f"Sheet not found: {sheet_id}")
+
+            row_count = int(sheet.get("row_count") or 0)
+            column_count = int(sheet.get("column_count") or 0)
+            if (end_row is None and not row_count) or (end_col is None and not column_count):
+                raise InvalidParameterError(
+                    f"Cannot determine dimensions of sheet {sheet_id} for range {range_str}"
+                )
+
+            if end_row is None:
+                end_row = row_count
+            if end_col is None:
+                end_col = column_count - 1
+
+        if end_row < start_row or end_col < start_col:
+            return
+
+        width = end_col - start_col + 1
+        if block_rows is None:
+            block_rows = max(1, min(self.DEFAULT_BLOCK_ROWS, self.MAX_READ_CELLS // width))
+
+        first_letter = column_letter(start_col)
+        last_letter = column_letter(end_col)
+        block_ranges = [
+            f"{sheet_id}!{first_letter}{row}:{last_letter}{min(row + block_rows - 1, end_row)}"
+            for row in range(start_row, end_row + 1, block_rows)
+        ]
+
+        logger.info(
+            f"Reading {sheet_id} rows {start_row}-{end_row} in {len(block_ranges)} blocks "
+            f"of {block_rows} rows ({max_workers} workers)"
+        )
+
+        def _fetch(full_range: str) -> list[list[Any]]:
+            return self.retry_strategy.execute(
+                self._fetch_values, app_id, spreadsheet_token, full_range
             )
 
-            return cell_data_rows
+        with ThreadPoolExecutor(
+            max_workers=min(max_workers, len(block_ranges)),
+            thread_name_prefix="sheet-block",
+        ) as executor:
+            remaining = iter(block_ranges)
+            in_flight: deque[Future[list[list[Any]]]] = deque(
+                executor.submit(_fetch, full_range) for full_range in islice(remaining, max_workers)
+            )
+            try:
+                while in_flight:
+                    values = in_flight.popleft().result()
+                    next_range = next(remaining, None)
+                    if next_range is not None:
+                        in_flight.append(executor.submit(_fetch, next_range))
+                    yield values
+            finally:
+                for future in in_flight:
+                    future.cancel()
+
+    def get_large_sheet_values(
+        self,
+        app_id: str,
+        spreadsheet_token: str,
+        sheet_id: str,
+        range_str: str | None = None,
+        block_rows: int | None = None,
+        max_workers: int = 4,
+    ) -> list[list[Any]]:
+        """
+        Read a large range with concurrent row-block requests.
 
-        return self.retry_strategy.execute(_get)
+        Same as iter_sheet_value_blocks, with the blocks concatenated in order.
+
+        Parameters
+        ----------
+            app_id : str
+                Lark application ID
+            spreadsheet_token : str
+                Spreadsheet token
+            sheet_id : str
+                Sheet ID
+            range_str : str | None
+                A1 range (e.g., "A1:J50000", "A:J"); None reads the whole sheet
+            block_rows : int | None
+                Rows per request (default: derived from MAX_READ_CELLS)
+            max_workers : int
+                Maximum concurrent block requests (default: 4)
+
+        Returns
+        -------
+            list[list[Any]]
+                2D array of raw values
+
+        Examples
+        --------
+            >>> rows = client.get_large_sheet_values(
+            ...     app_id="cli_xxx",
+            ...     spreadsheet_token="shtcn123",
+            ...     sheet_id="sheet1",
+            ...     range_str="A:J",
+            ...     max_workers=8,
+            ... )
+        """
+        rows: list[list[Any]] = []
+        for block in self.iter_sheet_value_blocks(
+            app_id,
+            spreadsheet_token,
+            sheet_id,
+            range_str=range_str,
+            block_rows=block_rows,
+            max_workers=max_workers,
+        ):
+            rows.extend(block)
+        return rows
+
+    def export_columns(
+        self,
+        app_id: str,
+        spreadsheet_token: str,
+        sheet_id: str,
+        range_str: str,
+        header_row: bool = True,
+    ) -> ColumnarTable:
+        """
+        Export a sheet range into a columnar table without CellData models.
+
+        Raw values are transposed straight into per-column lists, which is
+        the preferred path for analytics exports of large ranges.
+
+        Parameters
+        ----------
+            app_id : str
+                Lark application ID
+            spreadsheet_token : str
+                Spreadsheet token
+            sheet_id : str
+                Sheet ID
+            range_str : str
+                Range string (e.g., "A1:D50000")
+            header_row : bool
+                Use the first row as column names (default: True). Empty or
+                duplicate header cells fall back to the column letter.
+
+        Returns
+        -------
+            ColumnarTable
+                Columns of raw values (None for empty cells)
+
+        Raises
+        ------
+            InvalidParameterError
+                If parameters are invalid
+            NotFoundError
+                If sheet not found
+            PermissionDeniedError
+                If user has no permission
+
+        Examples
+        --------
+            >>> table = client.export_columns(
+            ...     app_id="cli_xxx",
+            ...     spreadsheet_token="shtcn123",
+            ...     sheet_id="sheet1",
+            ...     range_str="A1:D50000"
+            ... )
+            >>> table.to_csv("report.csv")
+        """
+        if not range_str:
+            raise InvalidParameterError("Range string cannot be empty")
+
+        logger.info(f"Exporting sheet columns: {sheet_id}!{range_str}")
+
+        values = self.retry_strategy.execute(
+            self._fetch_values, app_id, spreadsheet_token, f"{sheet_id}!{range_str}"
+        )
+
+        start_match = re.match(r"^([A-Z]+)", range_str.upper())
+        start_column = _column_index(start_match.group(1)) if start_match else 0
+        width = max((len(row) for row in values), default=0)
+
+        rows = iter(values)
+        names = [column_letter(start_column + i) for i in range(width)]
+        if header_row and values:
+            header = next(rows)
+            seen: set[str] = set()
+            for i, letter in enumerate(names):
+                cell = header[i] if i < len(header) else None
+                name = str(cell).strip() if cell is not None else ""
+                if not name or name in seen:
+                    name = letter
+                while name in seen:
+                    name = f"{name}_{i}"
+                names[i] = name
+                seen.add(name)
+
+        table = ColumnarTable(columns=names)
+        columns = [table.data[name] for name in names]
+        for row in rows:
+            row_width = len(row)
+            for i, column in enumerate(columns):
+                column.append(row[i] if i < row_width else None)
+
+        logger.info(
+            f"Exported {table.num_rows} rows x {width} columns from sheet {sheet_id}!{range_str}"
+        )
+        return table
 
     def update_sheet_data(
         self,
@@ -565,6 +996,304 @@ class SheetClient:
 
         return self.retry_strategy.execute(_append)
 
+    def batch_get_sheet_values(
+        self,
+        app_id: str,
+        spreadsheet_token: str,
+        ranges: list[str],
+    ) -> list[list[list[Any]]]:
+        """
+        Read many ranges with Sheets v2 ``values_batch_get``.
+
+        Ranges are sent in chunks of MAX_BATCH_RANGES per request instead of
+        one request per range.
+
+        Parameters
+        ----------
+            app_id : str
+                Lark application ID
+            spreadsheet_token : str
+                Spreadsheet token
+            ranges : list[str]
+                Full ranges with sheet prefix (e.g., ["sheet1!A1:B2", "sheet2!C1:C9"])
+
+        Returns
+        -------
+            list[list[list[Any]]]
+                Raw values of each range, in the order of ``ranges``
+
+        Raises
+        ------
+            InvalidParameterError
+                If parameters are invalid
+            NotFoundError
+                If sheet not found
+            PermissionDeniedError
+                If user has no permission
+            APIError
+                If API call fails
+
+        Examples
+        --------
+            >>> header, totals = client.batch_get_sheet_values(
+            ...     app_id="cli_xxx",
+            ...     spreadsheet_token="shtcn123",
+            ...     ranges=["sheet1!A1:F1", "sheet1!A100:F100"]
+            ... )
+        """
+        if not ranges:
+            raise InvalidParameterError("Ranges cannot be empty")
+
+        for full_range in ranges:
+            _split_full_range(full_range)
+
+        logger.info(f"Batch getting {len(ranges)} ranges from spreadsheet {spreadsheet_token}")
+
+        def _batch_get(chunk: list[str]) -> list[list[list[Any]]]:
+            token = self.credential_pool.get_token(app_id, token_type="tenant_access_token")  # nosec B106
+
+            url = f"https://open.feishu.cn/open-apis/sheets/v2/spreadsheets/{spreadsheet_token}/values_batch_get"
+            headers = {
+                "Authorization": f"Bearer {token}",
+                "Content-Type": "application/json; charset=utf-8",
+            }
+            params = {
+                "ranges": ",".join(chunk),
+                "valueRenderOption": "ToString",
+                "dateTimeRenderOption": "FormattedString",
+            }
+
+            response = requests.get(url, headers=headers, params=params, timeout=30)
+
+            if response.status_code != 200:
+                error_msg = f"Failed to batch get sheet data: HTTP {response.status_code}"
+                try:
+                    error_data = response.json()
+                    error_msg = f"{error_msg} - {error_data.get('msg', 'Unknown error')}"
+                    error_code = error_data.get("code", 0)
+
+                    if error_code in [404, 1770002]:
+                        raise NotFoundError(f"Sheet or range not found: {params['ranges']}")
+                    elif error_code in [403, 1770032]:
+                        raise PermissionDeniedError(
+                            f"No permission to access spreadsheet: {spreadsheet_token}"
+                        )
+                    elif error_code in [400, 1770001]:
+                        raise InvalidParameterError(error_msg)
+                except Exception as e:
+                    if isinstance(e, NotFoundError | PermissionDeniedError | InvalidParameterError):
+                        raise
+                    logger.error(f"Failed to parse error response: {e}")
+
+                raise APIError(error_msg)
+
+            result = response.json()
+            if result.get("code") != 0:
+                error_msg = f"API returned error: {result.get('msg', 'Unknown error')}"
+                raise APIError(error_msg)
+
+            value_ranges = (result.get("data") or {}).get("valueRanges") or []
+            if len(value_ranges) != len(chunk):
+                raise APIError(
+                    f"Batch get returned {len(value_ranges)} ranges, expected {len(chunk)}"
+                )
+
+            return [value_range.get("values") or [] for value_range in value_ranges]
+
+        results: list[list[list[Any]]] = []
+        for i in range(0, len(ranges), self.MAX_BATCH_RANGES):
+            results.extend(
+                self.retry_strategy.execute(_batch_get, ranges[i : i + self.MAX_BATCH_RANGES])
+            )
+
+        logger.info(f"Successfully batch retrieved {len(results)} ranges")
+        return results
+
+    def batch_update_sheet_data(
+        self,
+        app_id: str,
+        spreadsheet_token: str,
+        value_ranges: list[tuple[str, list[list[Any]]]],
+    ) -> int:
+        """
+        Write many ranges with Sheets v2 ``values_batch_update``.
+
+        Value ranges are packed into as few requests as the API limits allow
+        (MAX_BATCH_RANGES ranges and MAX_WRITE_CELLS cells per request).
+        A single range larger than MAX_WRITE_CELLS is split by rows.
+
+        Parameters
+        ----------
+            app_id : str
+                Lark application ID
+            spreadsheet_token : str
+                Spreadsheet token
+            value_ranges : list[tuple[str, list[list]]]
+                (full range, values) pairs. Only the start cell of each range
+                is used; the end is derived from the shape of ``values``.
+
+        Returns
+        -------
+            int
+                Number of cells updated (``updatedCells`` summed over responses)
+
+        Raises
+        ------
+            InvalidParameterError
+                If parameters are invalid
+            PermissionDeniedError
+                If user has no permission
+            APIError
+                If API call fails
+
+        Examples
+        --------
+            >>> client.batch_update_sheet_data(
+            ...     app_id="cli_xxx",
+            ...     spreadsheet_token="shtcn123",
+            ...     value_ranges=[
+            ...         ("sheet1!A1:B1", [["Name", "Age"]]),
+            ...         ("sheet2!C5:C6", [[1], [2]]),
+            ...     ]
+            ... )
+        """
+        if not value_ranges:
+            raise InvalidParameterError("Value ranges cannot be empty")
+
+        # Normalize to (range, values, cells), splitting oversized ranges by rows
+        entries: list[tuple[str, list[list[Any]], int]] = []
+        for full_range, values in value_ranges:
+            if not values:
+                raise InvalidParameterError(f"Values cannot be empty: {full_range}")
+
+            sheet_id, range_str = _split_full_range(full_range)
+            start_col, _, start_row, _ = _parse_range(range_str)
+            width = max(len(row) for row in values) or 1
+            rows_per_entry = max(1, self.MAX_WRITE_CELLS // width)
+
+            for offset in range(0, len(values), rows_per_entry):
+                chunk = values[offset : offset + rows_per_entry]
+                entries.append(
+                    (
+                        _values_range(sheet_id, start_col, start_row + offset, chunk),
+                        chunk,
+                        len(chunk) * width,
+                    )
+                )
+
+        # Pack entries into requests
+        batches: list[list[tuple[str, list[list[Any]], int]]] = [[]]
+        batch_cells = 0
+        for entry in entries:
+            if batches[-1] and (
+                len(batches[-1]) >= self.MAX_BATCH_RANGES
+                or batch_cells + entry[2] > self.MAX_WRITE_CELLS
+            ):
+                batches.append([])
+                batch_cells = 0
+            batches[-1].append(entry)
+            batch_cells += entry[2]
+
+        logger.info(
+            f"Batch updating {len(entries)} ranges in spreadsheet {spreadsheet_token} "
+            f"with {len(batches)} requests"
+        )
+
+        def _batch_update(batch: list[tuple[str, list[list[Any]], int]]) -> int:
+            token = self.credential_pool.get_token(app_id, token_type="tenant_access_token")  # nosec B106
+
+            url = f"https://open.feishu.cn/open-apis/sheets/v2/spreadsheets/{spreadsheet_token}/values_batch_update"
+            headers = {
+                "Authorization": f"Bearer {token}",
+                "Content-Type": "application/json; charset=utf-8",
+            }
+
+            payload = {
+                "valueRanges": [
+                    {"range": full_range, "values": values} for full_range, values, _ in batch
+                ]
+            }
+
+            response = requests.post(url, headers=headers, json=payload, timeout=30)
+
+            if response.status_code != 200:
+                error_msg = f"Failed to batch update sheet data: HTTP {response.status_code}"
+                try:
+                    error_data = response.json()
+                    error_msg = f"{error_msg} - {error_data.get('msg', 'Unknown error')}"
+                    error_code = error_data.get("code", 0)
+
+                    if error_code in [403, 1254302]:
+                        raise PermissionDeniedError(
+                            f"No permission to update spreadsheet: {spreadsheet_token}"
+                        )
+                    elif error_code in [400, 1254001]:
+                        raise InvalidParameterError(error_msg)
+                except Exception as e:
+                    if isinstance(e, PermissionDeniedError | InvalidParameterError):
+                        raise
+                    logger.error(f"Failed to parse error response: {e}")
+
+                raise APIError(error_msg)
+
+            result = response.json()
+            if result.get("code") != 0:
+                error_msg = f"API returned error: {result.get('msg', 'Unknown error')}"
+                error_code = result.get("code", 0)
+
+                if error_code in [403, 1254302]:
+                    raise PermissionDeniedError(
+                        f"No permission to update spreadsheet: {spreadsheet_token}"
+                    )
+                elif error_code in [400, 1254001]:
+                    raise InvalidParameterError(error_msg)
+
+                raise APIError(error_msg)
+
+            responses = (result.get("data") or {}).get("responses") or []
+            return sum(int(item.get("updatedCells", 0)) for item in responses)
+
+        updated_cells = 0
+        for batch in batches:
+            updated_cells += self.retry_strategy.execute(_batch_update, batch)
+
+        logger.info(f"Successfully batch updated {updated_cells} cells in {len(batches)} requests")
+        return updated_cells
+
+    def buffered_writer(
+        self,
+        app_id: str,
+        spreadsheet_token: str,
+        auto_flush_cells: int | None = None,
+    ) -> "SheetWriteBuffer":
+        """
+        Create a write buffer that coalesces range updates into batch requests.
+
+        Parameters
+        ----------
+            app_id : str
+                Lark application ID
+            spreadsheet_token : str
+                Spreadsheet token
+            auto_flush_cells : int | None
+                Flush automatically once this many cells are pending
+                (default: never, flush on exit)
+
+        Returns
+        -------
+            SheetWriteBuffer
+                Context manager; pending writes are flushed on normal exit
+
+        Examples
+        --------
+            >>> with client.buffered_writer("cli_xxx", "shtcn123") as writer:
+            ...     for i, row in enumerate(report_rows, start=2):
+            ...         writer.write("sheet1", f"A{i}", [row])
+        """
+        from lark_service.clouddoc.sheet.writer import SheetWriteBuffer
+
+        return SheetWriteBuffer(self, app_id, spreadsheet_token, auto_flush_cells=auto_flush_cells)
+
     def format_cells(
         self,
         app_id: str,
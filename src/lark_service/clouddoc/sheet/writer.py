@@ -0,0 +1,229 @@
+"""
+Buffered, coalescing writer for Lark Sheets.
+
+SheetWriteBuffer collects many small range updates and sends them through
+SheetClient.batch_update_sheet_data. Adjacent writes (next rows below, or
+next columns to the right, of the previous write) are merged into a single
+value range before flushing, so row-by-row report generation turns into a
+handful of batch requests.
+"""
+
+from dataclasses import dataclass
+from types import TracebackType
+from typing import TYPE_CHECKING, Any
+
+from lark_service.clouddoc.sheet.client import _parse_range, _values_range
+from lark_service.core.exceptions import InvalidParameterError
+from lark_service.utils.logger import get_logger
+
+if TYPE_CHECKING:
+    from lark_service.clouddoc.sheet.client import SheetClient
+
+logger = get_logger()
+
+
+@dataclass(slots=True)
+class _PendingWrite:
+    """Pending rectangular write (rows are owned copies)."""
+
+    sheet_id: str
+    start_col: int
+    start_row: int
+    width: int | None  # None when rows have different lengths
+    rows: list[list[Any]]
+
+    @property
+    def full_range(self) -> str:
+        return _values_range(self.sheet_id, self.start_col, self.start_row, self.rows)
+
+
+def _uniform_width(rows: list[list[Any]]) -> int | None:
+    """Return the common row length, or None for ragged rows."""
+    width = len(rows[0])
+    return width if all(len(row) == width for row in rows) else None
+
+
+class SheetWriteBuffer:
+    """
+    Coalescing write buffer for one spreadsheet.
+
+    Use as a context manager (pending writes are flushed on normal exit and
+    discarded if the block raises) or call flush() explicitly. A flush that
+    fails keeps its writes pending, so calling flush() again retries them.
+
+    Attributes
+    ----------
+        client : SheetClient
+            Client used for batch requests
+        app_id : str
+            Lark application ID
+        spreadsheet_token : str
+            Spreadsheet token
+        auto_flush_cells : int | None
+            Pending cell count that triggers an automatic flush
+        cells_written : int
+            Cells reported as updated by successful flushes
+
+    Examples
+    --------
+        >>> with client.buffered_writer("cli_xxx", "shtcn123") as writer:
+        ...     writer.write("sheet1", "A1", [["Name", "Score"]])
+        ...     writer.write("sheet1", "A2", [["John", 90]])  # merged into A1:B2
+    """
+
+    def __init__(
+        self,
+        client: "SheetClient",
+        app_id: str,
+        spreadsheet_token: str,
+        auto_flush_cells: int | None = None,
+    ) -> None:
+        """
+        Initialize SheetWriteBuffer.
+
+        Parameters
+        ----------
+            client : SheetClient
+                Client used for batch requests
+            app_id : str
+                Lark application ID
+            spreadsheet_token : str
+                Spreadsheet token
+            auto_flush_cells : int | None
+                Flush automatically once this many cells are pending
+        """
+        if auto_flush_cells is not None and auto_flush_cells < 1:
+            raise InvalidParameterError(f"Invalid auto_flush_cells: {auto_flush_cells} (>= 1)")
+
+        self.client = client
+        self.app_id = app_id
+        self.spreadsheet_token = spreadsheet_token
+        self.auto_flush_cells = auto_flush_cells
+        self.cells_written = 0
+        self._pending: list[_PendingWrite] = []
+        self._pending_cells = 0
+
+    @property
+    def pending_ranges(self) -> list[str]:
+        """Full ranges that would be written by the next flush."""
+        return [write.full_range for write in self._pending]
+
+    def write(self, sheet_id: str, range_str: str, values: list[list[Any]]) -> None:
+        """
+        Queue a write of ``values`` starting at the first cell of ``range_str``.
+
+        Parameters
+        ----------
+            sheet_id : str
+                Sheet ID
+            range_str : str
+                Start cell or range (e.g., "A5" or "A5:C5")
+            values : list[list]
+                2D array of values
+
+        Raises
+        ------
+            InvalidParameterError
+                If range or values are invalid
+        """
+        if not range_str:
+            raise InvalidParameterError("Range string cannot be empty")
+
+        if not values or not any(values):
+            raise InvalidParameterError("Values cannot be empty")
+
+        start_col, _, start_row, _ = _parse_range(range_str)
+        rows = [list(row) for row in values]
+        width = _uniform_width(rows)
+
+        if not self._merge(sheet_id, start_col, start_row, width, rows):
+            self._pending.append(_PendingWrite(sheet_id, start_col, start_row, width, rows))
+
+        self._pending_cells += sum(len(row) for row in rows)
+        if self.auto_flush_cells is not None and self._pending_cells >= self.auto_flush_cells:
+            self.flush()
+
+    def _merge(
+        self,
+        sheet_id: str,
+        start_col: int,
+        start_row: int,
+        width: int | None,
+        rows: list[list[Any]],
+    ) -> bool:
+        """Merge into the previous write when the new block is directly adjacent."""
+        if not self._pending or width is None:
+            return False
+
+        last = self._pending[-1]
+        if last.sheet_id != sheet_id or last.width is None:
+            return False
+
+        # Directly below, same columns
+        if (
+            start_col == last.start_col
+            and width == last.width
+            and start_row == last.start_row + len(last.rows)
+        ):
+            last.rows.extend(rows)
+            return True
+
+        # Directly to the right, same rows
+        if (
+            start_row == last.start_row
+            and len(rows) == len(last.rows)
+            and start_col == last.start_col + last.width
+        ):
+            for target, extra in zip(last.rows, rows, strict=True):
+                target.extend(extra)
+            last.width += width
+            return True
+
+        return False
+
+    def flush(self) -> int:
+        """
+        Send all pending writes as batch requests.
+
+        Pending writes are only cleared once every request succeeded. If a
+        request fails the error propagates and all writes stay pending;
+        re-sending the ones that already landed is harmless since value
+        updates are idempotent.
+
+        Returns
+        -------
+            int
+                Number of cells updated by this flush
+        """
+        if not self._pending:
+            return 0
+
+        logger.debug(f"Flushing {len(self._pending)} coalesced ranges to {self.spreadsheet_token}")
+
+        updated = self.client.batch_update_sheet_data(
+            self.app_id,
+            self.spreadsheet_token,
+            [(write.full_range, write.rows) for write in self._pending],
+        )
+        self._pending = []
+        self._pending_cells = 0
+        self.cells_written += updated
+        return updated
+
+    def __enter__(self) -> "SheetWriteBuffer":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        if exc_type is None:
+            self.flush()
+        elif self._pending:
+            logger.warning(
+                f"Discarding {len(self._pending)} pending sheet writes after error: {exc}"
+            )
+            self._pending = []
+            self._pending_cells = 0
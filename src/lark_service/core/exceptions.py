@@ -171,6 +171,22 @@ class StorageError(LarkServiceError):
     pass
 
 
+class QueueFullError(LarkServiceError):
+    """Bounded work queue errors.
+
+    Raised when a work queue is at capacity and cannot accept more items.
+
+    Example
+    ----------
+        >>> raise QueueFullError(
+        ...     "Callback queue is full",
+        ...     details={"maxsize": 10000}
+        ... )
+    """
+
+    pass
+
+
 class LockAcquisitionError(LarkServiceError):
     """Lock acquisition errors.
 
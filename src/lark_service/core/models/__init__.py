@@ -2,6 +2,8 @@
 
 from lark_service.core.models.application import Application, ConfigBase
 from lark_service.core.models.auth_session import UserAuthSession
+from lark_service.core.models.media_cache import MediaCacheEntry
+from lark_service.core.models.sql_result_cache import SQLResultCacheEntry
 
 # PostgreSQL models use the same Base
 from lark_service.core.models.token_storage import Base, TokenStorage
@@ -13,5 +15,7 @@ __all__ = [
     "TokenStorage",
     "UserCache",
     "UserAuthSession",
+    "SQLResultCacheEntry",
+    "MediaCacheEntry",
     "Base",
 ]
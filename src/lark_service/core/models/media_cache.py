@@ -0,0 +1,83 @@
+"""Media upload cache model for PostgreSQL.
+
+This module defines the MediaCacheEntry model backing the shared media
+upload dedup cache, which maps uploaded content digests to the image_key
+or file_key returned by Lark.
+"""
+
+from datetime import datetime
+
+from sqlalchemy import BigInteger, Index, String, func
+from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
+
+
+class Base(DeclarativeBase):
+    """Base class for PostgreSQL database models."""
+
+    pass
+
+
+class MediaCacheEntry(Base):
+    """Lark media key of previously uploaded content.
+
+    Attributes
+    ----------
+        cache_key: SHA-256 of (app_id, kind, variant, content digest)
+        app_id: Lark application ID that owns the media key
+        kind: "image" or "file"
+        digest: SHA-256 of the uploaded bytes
+        media_key: Returned image_key or file_key
+        file_size: Uploaded size in bytes
+        created_at: Upload timestamp
+        expires_at: Cache expiration timestamp
+
+    Example
+    ----------
+        >>> entry = MediaCacheEntry(
+        ...     cache_key="9b2e...",
+        ...     app_id="cli_xxx",
+        ...     kind="image",
+        ...     digest="5d41...",
+        ...     media_key="img_v2_xxx",
+        ...     file_size=20480,
+        ...     expires_at=datetime.now(),
+        ... )
+    """
+
+    __tablename__ = "media_upload_cache"
+
+    cache_key: Mapped[str] = mapped_column(String(64), primary_key=True)
+    app_id: Mapped[str] = mapped_column(String(64))
+    kind: Mapped[str] = mapped_column(String(16))
+    digest: Mapped[str] = mapped_column(String(64))
+    media_key: Mapped[str] = mapped_column(String(255))
+    file_size: Mapped[int] = mapped_column(BigInteger)
+    created_at: Mapped[datetime] = mapped_column(default=func.now())
+    expires_at: Mapped[datetime] = mapped_column()
+
+    __table_args__ = (
+        Index("idx_media_cache_app", "app_id"),
+        Index("idx_media_cache_expires", "expires_at"),
+    )
+
+    def is_expired(self, now: datetime | None = None) -> bool:
+        """Check if cache entry has expired.
+
+        Parameters
+        ----------
+            now: Current timestamp (defaults to datetime.now())
+
+        Returns
+        ----------
+            True if cache is expired, False otherwise
+        """
+        if now is None:
+            now = datetime.now()
+        return self.expires_at <= now
+
+    def __repr__(self) -> str:
+        """Return string representation of MediaCacheEntry."""
+        return (
+            f"<MediaCacheEntry(app_id='{self.app_id}', kind='{self.kind}', "
+            f"media_key='{self.media_key}', expires_at='{self.expires_at}')>"
+        )
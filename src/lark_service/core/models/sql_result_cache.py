@@ -0,0 +1,78 @@
+"""SQL result cache model for PostgreSQL.
+
+This module defines the SQLResultCacheEntry model backing the shared
+aPaaS SQL query result cache, so several worker processes can reuse the
+results of identical read-only queries.
+"""
+
+from datetime import datetime
+
+from sqlalchemy import Index, String, Text, func
+from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
+
+
+class Base(DeclarativeBase):
+    """Base class for PostgreSQL database models."""
+
+    pass
+
+
+class SQLResultCacheEntry(Base):
+    """Cached result of a read-only aPaaS SQL query.
+
+    Attributes
+    ----------
+        cache_key: SHA-256 of (workspace_id, user scope, normalized SQL)
+        workspace_id: aPaaS workspace ID
+        tables: Referenced tables as ",name1,name2," ("*" when unknown)
+        payload: JSON-encoded result rows
+        created_at: Cache creation timestamp
+        expires_at: Cache expiration timestamp
+
+    Example
+    ----------
+        >>> entry = SQLResultCacheEntry(
+        ...     cache_key="3f1c...",
+        ...     workspace_id="ws_001",
+        ...     tables=",customers,",
+        ...     payload='[{"id": "1"}]',
+        ...     expires_at=datetime.now(),
+        ... )
+    """
+
+    __tablename__ = "apaas_sql_result_cache"
+
+    cache_key: Mapped[str] = mapped_column(String(64), primary_key=True)
+    workspace_id: Mapped[str] = mapped_column(String(128))
+    tables: Mapped[str] = mapped_column(String(1024))
+    payload: Mapped[str] = mapped_column(Text)
+    created_at: Mapped[datetime] = mapped_column(default=func.now())
+    expires_at: Mapped[datetime] = mapped_column()
+
+    __table_args__ = (
+        Index("idx_sql_result_cache_workspace", "workspace_id"),
+        Index("idx_sql_result_cache_expires", "expires_at"),
+    )
+
+    def is_expired(self, now: datetime | None = None) -> bool:
+        """Check if cache entry has expired.
+
+        Parameters
+        ----------
+            now: Current timestamp (defaults to datetime.now())
+
+        Returns
+        ----------
+            True if cache is expired, False otherwise
+        """
+        if now is None:
+            now = datetime.now()
+        return self.expires_at <= now
+
+    def __repr__(self) -> str:
+        """Return string representation of SQLResultCacheEntry."""
+        return (
+            f"<SQLResultCacheEntry(cache_key='{self.cache_key[:12]}', "
+            f"workspace_id='{self.workspace_id}', "
+            f"expires_at='{self.expires_at}')>"
+        )
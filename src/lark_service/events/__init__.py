@@ -4,11 +4,18 @@ This module provides WebSocket client for receiving real-time events from Feishu
 """
 
 from .exceptions import WebSocketConnectionError, WebSocketError
+from .executor import EventExecutor
+from .pipeline import EventDeduplicator, EventPipeline
+from .supervisor import WebSocketSupervisor
 from .types import WebSocketConfig, WebSocketConnectionStatus
 
 __all__ = [
+    "EventDeduplicator",
+    "EventExecutor",
+    "EventPipeline",
     "WebSocketConnectionError",
     "WebSocketError",
     "WebSocketConfig",
     "WebSocketConnectionStatus",
+    "WebSocketSupervisor",
 ]
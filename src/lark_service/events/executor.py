@@ -0,0 +1,261 @@
+"""Bounded executor for WebSocket event handlers.
+
+The SDK delivers WebSocket events on its receive loop, so a handler that
+runs inline holds back every later event. EventExecutor runs handlers on
+a shared thread pool instead, with a concurrency limit per event type so
+one busy event type cannot occupy every worker. Events beyond the limit
+wait in a bounded per-type queue; when that queue is full the receive
+thread waits up to ``block_timeout`` (backpressure) and then gets a
+QueueFullError, which the SDK reports to Feishu as a failed delivery to
+be retried later. Callers running on an event loop shared with other
+connections submit with ``block=False`` and are rejected at once instead
+of stalling the loop. Queue depth, in-flight handlers, handler duration and
+backpressure waits are exported as Prometheus metrics.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import inspect
+import threading
+import time
+from collections import deque
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any
+
+from lark_service.core.exceptions import InvalidParameterError, QueueFullError
+from lark_service.monitoring.websocket_metrics import (
+    websocket_event_backpressure_seconds,
+    websocket_event_handler_duration_seconds,
+    websocket_event_in_flight,
+    websocket_event_queue_depth,
+    websocket_event_total,
+)
+from lark_service.utils.logger import get_logger
+
+logger = get_logger()
+
+EventHandler = Callable[[Any], object]
+
+
+@dataclass
+class _Lane:
+    """Queue and counters of one event type."""
+
+    limit: int
+    running: int = 0
+    queue: deque[tuple[EventHandler, Any]] = field(default_factory=deque)
+    completed: int = 0
+    failed: int = 0
+    rejected: int = 0
+
+
+class EventExecutor:
+    """Run event handlers off the receive thread with per-type limits.
+
+    Attributes
+    ----------
+        app_id: App ID used as the metrics label
+        max_workers: Threads shared by all event types
+        default_concurrency: Concurrent handlers per event type unless set
+        max_queue: Events waiting per event type before backpressure
+        block_timeout: Seconds ``submit`` waits for queue space
+
+    Example
+    ----------
+        >>> executor = EventExecutor("cli_xxx", max_workers=8)
+        >>> executor.set_concurrency("im.message.receive_v1", 4)
+        >>> executor.submit("im.message.receive_v1", handle_message, event)
+    """
+
+    def __init__(
+        self,
+        app_id: str = "",
+        max_workers: int = 8,
+        default_concurrency: int = 4,
+        max_queue: int = 1000,
+        block_timeout: float = 1.0,
+    ) -> None:
+        """Initialize event executor.
+
+        Parameters
+        ----------
+            app_id: App ID used as the metrics label
+            max_workers: Threads shared by all event types
+            default_concurrency: Concurrent handlers per event type unless set
+            max_queue: Events waiting per event type before backpressure
+            block_timeout: Seconds ``submit`` waits for queue space
+        """
+        if max_workers < 1 or default_concurrency < 1 or max_queue < 0:
+            raise InvalidParameterError(
+                "max_workers and default_concurrency must be positive, max_queue non-negative"
+            )
+        self.app_id = app_id
+        self.max_workers = max_workers
+        self.default_concurrency = default_concurrency
+        self.max_queue = max_queue
+        self.block_timeout = block_timeout
+
+        self._lanes: dict[str, _Lane] = {}
+        self._cond = threading.Condition()
+        self._pool = ThreadPoolExecutor(max_workers, thread_name_prefix="LarkEvent")
+        self._closed = False
+
+    def set_concurrency(self, event_type: str, limit: int) -> None:
+        """Set the number of concurrent handlers of ``event_type``."""
+        if limit < 1:
+            raise InvalidParameterError(f"Concurrency limit must be positive, got {limit}")
+        with self._cond:
+            self._lane(event_type).limit = limit
+
+    def _lane(self, event_type: str) -> _Lane:
+        lane = self._lanes.get(event_type)
+        if lane is None:
+            lane = self._lanes[event_type] = _Lane(self.default_concurrency)
+        return lane
+
+    def submit(
+        self,
+        event_type: str,
+        handler: EventHandler,
+        event: Any,
+        enforce_queue_limit: bool = True,
+        block: bool = True,
+    ) -> None:
+        """Run ``handler(event)`` on the pool, or queue it behind the type's limit.
+
+        Parameters
+        ----------
+            event_type: Event type the limit and metrics are tracked under
+            handler: Sync or async event handler
+            event: Event object passed to the handler
+            enforce_queue_limit: Apply ``max_queue`` backpressure; False queues
+                the event regardless, for events already admitted upstream
+            block: Wait up to ``block_timeout`` for queue space; False rejects
+                a full queue at once, for callers on a shared event loop
+
+        Raises
+        ------
+            QueueFullError: If the type's queue stayed full for ``block_timeout``
+        """
+        labels = {"app_id": self.app_id, "event_type": event_type}
+        with self._cond:
+            if self._closed:
+                raise QueueFullError("Event executor is shut down", details=labels)
+            lane = self._lane(event_type)
+            if lane.running < lane.limit:
+                self._start(event_type, lane, handler, event)
+                return
+
+            if enforce_queue_limit and len(lane.queue) >= self.max_queue:
+                if block:
+                    started = time.monotonic()
+                    self._cond.wait_for(
+                        lambda: len(lane.queue) < self.max_queue or self._closed,
+                        self.block_timeout,
+                    )
+                    websocket_event_backpressure_seconds.labels(**labels).observe(
+                        time.monotonic() - started
+                    )
+                if self._closed or len(lane.queue) >= self.max_queue:
+                    lane.rejected += 1
+                    websocket_event_total.labels(**labels, outcome="rejected").inc()
+                    logger.warning("WebSocket event queue full, rejecting event", extra=labels)
+                    raise QueueFullError(
+                        f"Event queue full for {event_type}",
+                        details={**labels, "max_queue": self.max_queue},
+                    )
+                if lane.running < lane.limit:
+                    self._start(event_type, lane, handler, event)
+                    return
+
+            lane.queue.append((handler, event))
+            websocket_event_queue_depth.labels(**labels).set(len(lane.queue))
+
+    def _start(self, event_type: str, lane: _Lane, handler: EventHandler, event: Any) -> None:
+        # Called with the lock held
+        lane.running += 1
+        websocket_event_in_flight.labels(app_id=self.app_id, event_type=event_type).set(
+            lane.running
+        )
+        self._pool.submit(self._run, event_type, lane, handler, event)
+
+    def _run(self, event_type: str, lane: _Lane, handler: EventHandler, event: Any) -> None:
+        labels = {"app_id": self.app_id, "event_type": event_type}
+        while True:
+            started = time.monotonic()
+            try:
+                run_handler(handler, event)
+                outcome = "completed"
+            except Exception as exc:
+                outcome = "failed"
+                logger.error(
+                    f"WebSocket event handler failed: {exc}",
+                    extra=labels,
+                    exc_info=True,
+                )
+            websocket_event_handler_duration_seconds.labels(**labels).observe(
+                time.monotonic() - started
+            )
+            websocket_event_total.labels(**labels, outcome=outcome).inc()
+
+            with self._cond:
+                if outcome == "completed":
+                    lane.completed += 1
+                else:
+                    lane.failed += 1
+                # Keep this worker on the lane while events are waiting for it
+                if lane.queue and lane.running <= lane.limit:
+                    handler, event = lane.queue.popleft()
+                    websocket_event_queue_depth.labels(**labels).set(len(lane.queue))
+                    self._cond.notify_all()
+                    continue
+                lane.running -= 1
+                websocket_event_in_flight.labels(**labels).set(lane.running)
+                self._cond.notify_all()
+                return
+
+    def stats(self) -> dict[str, dict[str, int]]:
+        """Return per-event-type counters."""
+        with self._cond:
+            return {
+                event_type: {
+                    "limit": lane.limit,
+                    "running": lane.running,
+                    "queued": len(lane.queue),
+                    "completed": lane.completed,
+                    "failed": lane.failed,
+                    "rejected": lane.rejected,
+                }
+                for event_type, lane in self._lanes.items()
+            }
+
+    def wait_idle(self, timeout: float | None = None) -> bool:
+        """Wait until no handler is running or queued."""
+        with self._cond:
+            return self._cond.wait_for(
+                lambda: all(not lane.running and not lane.queue for lane in self._lanes.values()),
+                timeout,
+            )
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop accepting events; with ``wait``, finish queued ones first."""
+        if wait:
+            self.wait_idle()
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        self._pool.shutdown(wait=wait)
+
+
+def run_handler(handler: EventHandler, event: Any) -> None:
+    """Call ``handler(event)``, running it to completion if it is async."""
+    result = handler(event)
+    if inspect.isawaitable(result):
+        asyncio.run(_await(result))
+
+
+async def _await(awaitable: Any) -> Any:
+    return await awaitable
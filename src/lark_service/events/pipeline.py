@@ -0,0 +1,397 @@
+"""Deduplicating, per-key ordered event pipeline.
+
+Feishu redelivers events it considers unacknowledged, over WebSocket as
+well as HTTP, and running handlers concurrently lets two messages of one
+chat be processed out of order. EventPipeline is a stage in front of an
+EventExecutor that drops events whose ``event_id`` was already seen
+(EventDeduplicator, optionally persisted in SQLite so restarts and
+sibling processes share it) and partitions the rest by an ordering key,
+by default the chat ID or open_message_id. Events of one key form a
+serial lane: only the oldest is handed to the executor, and the next one
+follows when it finishes. Lanes of different keys run in parallel within
+the executor's per-event-type limits.
+"""
+
+from __future__ import annotations
+
+import itertools
+import os
+import sqlite3
+import threading
+import time
+from collections import deque
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+from lark_service.core.exceptions import InvalidParameterError, QueueFullError
+from lark_service.events.executor import EventExecutor, EventHandler, run_handler
+from lark_service.monitoring.websocket_metrics import websocket_event_total
+from lark_service.utils.logger import get_logger
+from lark_service.utils.ttl_set import TTLSet
+
+logger = get_logger()
+
+KeyFunc = Callable[[Any], str | None]
+
+
+def _field(obj: Any, name: str) -> Any:
+    """Read ``name`` from an SDK event object or a parsed JSON dict."""
+    if obj is None:
+        return None
+    if isinstance(obj, dict):
+        return obj.get(name)
+    return getattr(obj, name, None)
+
+
+def event_id_of(event: Any) -> str | None:
+    """Return ``header.event_id`` of a v2 event (or top-level ``uuid`` of v1)."""
+    event_id = _field(_field(event, "header"), "event_id") or _field(event, "uuid")
+    return str(event_id) if event_id else None
+
+
+def event_order_key(event: Any) -> str | None:
+    """Return the key events must stay ordered by.
+
+    Uses the chat ID of message and chat events, then the open_message_id
+    of card and message-scoped events; None means the event has no
+    ordering constraint.
+    """
+    body = _field(event, "event")
+    for value in (
+        _field(_field(body, "message"), "chat_id"),
+        _field(body, "chat_id"),
+        _field(body, "open_message_id"),
+        _field(_field(body, "context"), "open_message_id"),
+        _field(body, "message_id"),
+    ):
+        if value:
+            return str(value)
+    return None
+
+
+class EventDeduplicator:
+    """Remember event IDs for ``ttl_seconds`` to drop redelivered events.
+
+    IDs are kept in a bounded in-memory TTLSet. With ``path`` they are also
+    written to a SQLite database, so duplicates are recognized after a
+    restart and across processes sharing the file. The two checks are
+    available separately (``add_memory``/``add_persisted``) so callers on an
+    event loop can leave the SQLite write to a worker thread. A SQLite
+    failure is logged and the event treated as not seen: a rare duplicate
+    is preferable to dropping an event.
+
+    Attributes
+    ----------
+        ttl_seconds: How long an event ID is remembered
+        max_size: Maximum IDs remembered in memory
+        path: SQLite database file path (None keeps IDs in memory only)
+
+    Example
+    ----------
+        >>> dedup = EventDeduplicator(ttl_seconds=3600, path="data/events.db")
+        >>> dedup.add("evt_1")
+        True
+        >>> dedup.add("evt_1")
+        False
+    """
+
+    _SCHEMA = """
+        CREATE TABLE IF NOT EXISTS seen_events (
+            event_id TEXT PRIMARY KEY,
+            expires_at REAL NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS idx_seen_events_expires_at ON seen_events (expires_at);
+    """
+
+    # Seconds to wait for a lock held by a sibling process
+    _BUSY_TIMEOUT = 1.0
+
+    def __init__(
+        self,
+        ttl_seconds: float = 3600.0,
+        max_size: int = 100_000,
+        path: str | Path | None = None,
+    ) -> None:
+        """Initialize event deduplicator.
+
+        Parameters
+        ----------
+            ttl_seconds: How long an event ID is remembered
+            max_size: Maximum IDs remembered in memory
+            path: SQLite database file path (optional)
+        """
+        self.ttl_seconds = ttl_seconds
+        self.max_size = max_size
+        self.path = None if path is None else str(path)
+        self._seen = TTLSet(ttl_seconds=ttl_seconds, max_size=max_size)
+        self._local = threading.local()
+        self._adds = itertools.count()
+
+        if self.path is not None:
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+            self._connection().executescript(self._SCHEMA)
+
+    def _connection(self) -> sqlite3.Connection:
+        conn: sqlite3.Connection | None = getattr(self._local, "conn", None)
+        if conn is None or getattr(self._local, "pid", None) != os.getpid():
+            conn = sqlite3.connect(str(self.path), timeout=self._BUSY_TIMEOUT, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            self._local.conn = conn
+            self._local.pid = os.getpid()
+        return conn
+
+    @property
+    def persistent(self) -> bool:
+        """Whether IDs are also recorded in SQLite."""
+        return self.path is not None
+
+    def add(self, event_id: str) -> bool:
+        """Record ``event_id`` and return True if it was not seen within the TTL."""
+        return self.add_memory(event_id) and self.add_persisted(event_id)
+
+    def add_memory(self, event_id: str) -> bool:
+        """Record ``event_id`` in memory only; never blocks on I/O."""
+        return self._seen.add(event_id)
+
+    def add_persisted(self, event_id: str) -> bool:
+        """Record ``event_id`` in SQLite and return True if it was not stored yet.
+
+        Always True without ``path`` or when the database cannot be written.
+        """
+        if self.path is None:
+            return True
+
+        now = time.time()
+        try:
+            conn = self._connection()
+            if next(self._adds) % 1000 == 0:
+                conn.execute("DELETE FROM seen_events WHERE expires_at <= ?", (now,))
+            cursor = conn.execute(
+                "INSERT INTO seen_events (event_id, expires_at) VALUES (?, ?) "
+                "ON CONFLICT (event_id) DO UPDATE SET expires_at = excluded.expires_at "
+                "WHERE seen_events.expires_at <= ?",
+                (event_id, now + self.ttl_seconds, now),
+            )
+        except sqlite3.Error as exc:
+            logger.warning(
+                f"Cannot record event ID, treating event as new: {exc}",
+                extra={"event_id": event_id},
+            )
+            return True
+        return cursor.rowcount > 0
+
+    def discard(self, event_id: str, persisted: bool = True) -> None:
+        """Forget ``event_id`` so a redelivery is processed again.
+
+        Parameters
+        ----------
+            event_id: Event ID to forget
+            persisted: Also delete it from SQLite (False when it was only
+                recorded in memory)
+        """
+        self._seen.discard(event_id)
+        if self.path is None or not persisted:
+            return
+        try:
+            self._connection().execute("DELETE FROM seen_events WHERE event_id = ?", (event_id,))
+        except sqlite3.Error as exc:
+            logger.warning(
+                f"Cannot forget event ID: {exc}",
+                extra={"event_id": event_id},
+            )
+
+    def close(self) -> None:
+        """Close the calling thread's connection."""
+        conn: sqlite3.Connection | None = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+
+class EventPipeline:
+    """Deduplicate events and keep events of one key in order.
+
+    Accepts the same ``submit(event_type, handler, event)`` calls as
+    EventExecutor and forwards them to ``executor`` once an event is the
+    oldest of its key. Events without an ordering key are forwarded
+    immediately. Only the in-memory duplicate check runs in ``submit``; the
+    SQLite check of a persistent deduplicator runs on the executor thread
+    right before the handler, so a slow or locked database never stalls
+    the (shared) receive loop.
+
+    Attributes
+    ----------
+        executor: Executor running the handlers
+        deduplicator: Event IDs seen within the dedup TTL
+        key_func: Returns the ordering key of an event
+        max_pending: Events waiting behind their key before rejecting
+
+    Example
+    ----------
+        >>> pipeline = EventPipeline(EventExecutor("cli_xxx"), EventDeduplicator())
+        >>> client = LarkWebSocketClient(config, pipeline=pipeline)
+        >>> client.register_handler("im.message.receive_v1", handle_message)
+    """
+
+    def __init__(
+        self,
+        executor: EventExecutor,
+        deduplicator: EventDeduplicator | None = None,
+        key_func: KeyFunc = event_order_key,
+        max_pending: int = 10_000,
+    ) -> None:
+        """Initialize event pipeline.
+
+        Parameters
+        ----------
+            executor: Executor running the handlers
+            deduplicator: Seen event IDs (defaults to an in-memory EventDeduplicator)
+            key_func: Returns the ordering key of an event (None for unordered)
+            max_pending: Events waiting behind their key before rejecting
+        """
+        if max_pending < 1:
+            raise InvalidParameterError("max_pending must be at least 1")
+        self.executor = executor
+        self.deduplicator = deduplicator if deduplicator is not None else EventDeduplicator()
+        self.key_func = key_func
+        self.max_pending = max_pending
+
+        # key -> events waiting behind the one currently in the executor
+        self._lanes: dict[str, deque[tuple[str, EventHandler, Any]]] = {}
+        self._pending = 0
+        self._lock = threading.Lock()
+        self._stats = dict.fromkeys(("submitted", "duplicates", "ordered", "rejected"), 0)
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """Counters plus the numbers of active keys and waiting events."""
+        with self._lock:
+            return {**self._stats, "keys": len(self._lanes), "pending": self._pending}
+
+    def submit(
+        self, event_type: str, handler: EventHandler, event: Any, block: bool = True
+    ) -> None:
+        """Drop duplicates, then queue ``event`` behind earlier events of its key.
+
+        Parameters
+        ----------
+            event_type: Event type passed on to the executor
+            handler: Sync or async event handler
+            event: SDK event object or parsed event dict
+            block: Passed on to ``EventExecutor.submit``
+
+        Raises
+        ------
+            QueueFullError: If the executor or ``max_pending`` rejects the event
+        """
+        event_id = event_id_of(event)
+        if event_id is not None:
+            if not self.deduplicator.add_memory(event_id):
+                self._drop_duplicate(event_type, event_id)
+                return
+            if self.deduplicator.persistent:
+                handler = self._unless_persisted(event_type, event_id, handler)
+
+        key = self.key_func(event)
+        try:
+            if key is None:
+                self.executor.submit(event_type, handler, event, block=block)
+            else:
+                self._submit_ordered(key, event_type, handler, event, block)
+        except QueueFullError:
+            # Let Feishu's redelivery through once there is room again
+            if event_id is not None:
+                self.deduplicator.discard(event_id, persisted=False)
+            with self._lock:
+                self._stats["rejected"] += 1
+            raise
+        with self._lock:
+            self._stats["submitted"] += 1
+
+    def _drop_duplicate(self, event_type: str, event_id: str) -> None:
+        with self._lock:
+            self._stats["duplicates"] += 1
+        websocket_event_total.labels(
+            app_id=self.executor.app_id, event_type=event_type, outcome="duplicate"
+        ).inc()
+        logger.info(
+            "Duplicate event ignored",
+            extra={"event_type": event_type, "event_id": event_id},
+        )
+
+    def _unless_persisted(
+        self, event_type: str, event_id: str, handler: EventHandler
+    ) -> EventHandler:
+        """Wrap ``handler`` to skip events another process or run already stored."""
+
+        def run(event: Any) -> None:
+            if not self.deduplicator.add_persisted(event_id):
+                self._drop_duplicate(event_type, event_id)
+                return
+            run_handler(handler, event)
+
+        return run
+
+    def _submit_ordered(
+        self, key: str, event_type: str, handler: EventHandler, event: Any, block: bool
+    ) -> None:
+        with self._lock:
+            lane = self._lanes.get(key)
+            if lane is not None:
+                if self._pending >= self.max_pending:
+                    raise QueueFullError(
+                        "Too many events waiting for their key",
+                        details={"max_pending": self.max_pending, "key": key},
+                    )
+                lane.append((event_type, handler, event))
+                self._pending += 1
+                self._stats["ordered"] += 1
+                return
+            self._lanes[key] = deque()
+
+        try:
+            self.executor.submit(event_type, self._in_lane(key, handler), event, block=block)
+        except BaseException:
+            # Events that arrived meanwhile keep the lane going
+            self._advance(key)
+            raise
+
+    def _in_lane(self, key: str, handler: EventHandler) -> EventHandler:
+        def run(event: Any) -> None:
+            try:
+                run_handler(handler, event)
+            finally:
+                self._advance(key)
+
+        return run
+
+    def _advance(self, key: str) -> None:
+        """Hand the next waiting event of ``key`` to the executor, or close the lane."""
+        while True:
+            with self._lock:
+                lane = self._lanes[key]
+                if not lane:
+                    del self._lanes[key]
+                    return
+                event_type, handler, event = lane.popleft()
+                self._pending -= 1
+            try:
+                # Admitted already; the executor's queue limit must not drop it
+                self.executor.submit(
+                    event_type, self._in_lane(key, handler), event, enforce_queue_limit=False
+                )
+                return
+            except Exception as exc:
+                logger.error(
+                    f"Failed to forward ordered event, skipping: {exc}",
+                    extra={"event_type": event_type, "key": key},
+                )
+
+    def set_concurrency(self, event_type: str, limit: int) -> None:
+        """Set the executor's concurrency limit of ``event_type``."""
+        self.executor.set_concurrency(event_type, limit)
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Shut down the executor."""
+        self.executor.shutdown(wait=wait)
@@ -0,0 +1,241 @@
+"""Supervisor running WebSocket connections for every active app.
+
+``LarkWebSocketClient.start()`` blocks its thread for the lifetime of one
+connection, and the SDK runs all clients on a single module-level event
+loop, so one app per process used to be the only option. The supervisor
+runs that loop on a background thread and keeps one
+``LarkWebSocketClient.run_async`` coroutine per active app in
+ApplicationManager. It re-reads the application table every
+``sync_interval`` seconds: apps enabled with ``lark-service-cli app enable``
+(or added) are connected, disabled or deleted apps are disconnected, and
+apps whose secret changed are reconnected. Connection health is exported
+per app through ``websocket_connection_status``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import dataclasses
+import threading
+from collections.abc import Callable
+from dataclasses import dataclass
+
+import lark_oapi as lark
+
+from lark_service.core.exceptions import LarkServiceError
+from lark_service.core.storage.sqlite_storage import ApplicationManager
+from lark_service.events.types import WebSocketConfig, WebSocketConnectionStatus
+from lark_service.events.websocket_client import LarkWebSocketClient
+from lark_service.monitoring.websocket_metrics import websocket_connection_status
+from lark_service.utils.logger import get_logger
+
+logger = get_logger()
+
+ClientFactory = Callable[[WebSocketConfig], LarkWebSocketClient]
+
+
+@dataclass
+class _AppRunner:
+    """Running connection of one app."""
+
+    client: LarkWebSocketClient
+    secret: str
+    stop: asyncio.Event
+    task: asyncio.Future[None]
+
+
+class WebSocketSupervisor:
+    """Keep a WebSocket connection up for each active application.
+
+    Attributes
+    ----------
+        app_manager: Application store the active apps are read from
+        client_factory: Creates a client for an app and registers its handlers
+        sync_interval: Seconds between application table checks
+        stop_timeout: Seconds to wait for a connection to close
+
+    Example
+    ----------
+        >>> def make_client(config: WebSocketConfig) -> LarkWebSocketClient:
+        ...     client = LarkWebSocketClient(config)
+        ...     client.register_handler("im.message.receive_v1", handle_message)
+        ...     return client
+        >>> supervisor = WebSocketSupervisor(app_manager, make_client)
+        >>> supervisor.start()
+        >>> supervisor.health()["cli_xxx"].is_connected
+        True
+    """
+
+    def __init__(
+        self,
+        app_manager: ApplicationManager,
+        client_factory: ClientFactory = LarkWebSocketClient,
+        sync_interval: float = 30.0,
+        stop_timeout: float = 10.0,
+    ) -> None:
+        """Initialize WebSocket supervisor.
+
+        Parameters
+        ----------
+            app_manager: Application store the active apps are read from
+            client_factory: Creates a client for an app and registers its handlers
+            sync_interval: Seconds between application table checks
+            stop_timeout: Seconds to wait for a connection to close
+        """
+        self.app_manager = app_manager
+        self.client_factory = client_factory
+        self.sync_interval = sync_interval
+        self.stop_timeout = stop_timeout
+
+        # The SDK creates its receive tasks on this loop
+        self._loop: asyncio.AbstractEventLoop = lark.ws.client.loop
+        self._runners: dict[str, _AppRunner] = {}
+        self._thread: threading.Thread | None = None
+        self._sync_task: asyncio.Future[None] | None = None
+        self._sync_lock = asyncio.Lock()
+
+    def start(self) -> None:
+        """Start the event loop thread and connect all active apps.
+
+        A failing first sync is logged and retried by the periodic sync, so
+        the supervisor is always fully started when this returns.
+        """
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(
+            target=self._run_loop, name="LarkWebSocketSupervisor", daemon=True
+        )
+        self._thread.start()
+        asyncio.run_coroutine_threadsafe(self._start_sync(), self._loop).result()
+        logger.info(
+            "WebSocket supervisor started",
+            extra={"sync_interval": self.sync_interval},
+        )
+
+    def sync(self, timeout: float | None = None) -> None:
+        """Apply application table changes now instead of at the next interval.
+
+        Raises
+        ----------
+            LarkServiceError: If the supervisor is not running
+        """
+        if self._thread is None:
+            raise LarkServiceError("WebSocket supervisor is not running")
+        asyncio.run_coroutine_threadsafe(self._sync(), self._loop).result(timeout)
+
+    def health(self) -> dict[str, WebSocketConnectionStatus]:
+        """Return a snapshot of the connection status of each supervised app."""
+        return {
+            app_id: dataclasses.replace(runner.client.status)
+            for app_id, runner in list(self._runners.items())
+        }
+
+    def stop(self) -> None:
+        """Disconnect all apps and stop the event loop thread."""
+        if self._thread is None:
+            return
+        future = asyncio.run_coroutine_threadsafe(self._shutdown(), self._loop)
+        try:
+            future.result(self.stop_timeout + 5)
+        finally:
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join(self.stop_timeout)
+            self._thread = None
+        logger.info("WebSocket supervisor stopped")
+
+    def __enter__(self) -> WebSocketSupervisor:
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.stop()
+
+    def _run_loop(self) -> None:
+        asyncio.set_event_loop(self._loop)
+        self._loop.run_forever()
+
+    async def _start_sync(self) -> None:
+        try:
+            await self._sync()
+        except Exception as exc:
+            logger.error(f"WebSocket supervisor initial sync failed: {exc}", exc_info=True)
+        finally:
+            self._sync_task = asyncio.ensure_future(self._sync_loop())
+
+    async def _sync_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.sync_interval)
+            try:
+                await self._sync()
+            except Exception as exc:
+                logger.error(f"WebSocket supervisor sync failed: {exc}", exc_info=True)
+
+    async def _sync(self) -> None:
+        async with self._sync_lock:
+            await self._apply(await self._loop.run_in_executor(None, self._active_apps))
+
+    async def _apply(self, apps: dict[str, str]) -> None:
+        for app_id, runner in list(self._runners.items()):
+            if app_id not in apps:
+                reason = "disabled"
+            elif apps[app_id] != runner.secret:
+                reason = "secret changed"
+            elif runner.task.done():
+                reason = "connection gave up"
+            else:
+                continue
+            logger.info("Stopping WebSocket connection", extra={"app_id": app_id, "reason": reason})
+            await self._stop_app(app_id)
+
+        for app_id, secret in apps.items():
+            if app_id in self._runners:
+                continue
+            try:
+                self._start_app(app_id, secret)
+            except Exception as exc:
+                # Retried on the next sync; other apps still get connected
+                logger.error(
+                    f"Cannot start WebSocket connection: {exc}",
+                    extra={"app_id": app_id},
+                    exc_info=True,
+                )
+
+    def _active_apps(self) -> dict[str, str]:
+        apps: dict[str, str] = {}
+        for app in self.app_manager.list_applications(status="active"):
+            try:
+                apps[app.app_id] = app.get_decrypted_secret(self.app_manager.encryption_key)
+            except Exception as exc:
+                logger.error(
+                    f"Cannot decrypt app secret, skipping WebSocket connection: {exc}",
+                    extra={"app_id": app.app_id},
+                )
+        return apps
+
+    def _start_app(self, app_id: str, secret: str) -> None:
+        client = self.client_factory(WebSocketConfig(app_id=app_id, app_secret=secret))
+        stop = asyncio.Event()
+        task = asyncio.ensure_future(client.run_async(stop))
+        self._runners[app_id] = _AppRunner(client=client, secret=secret, stop=stop, task=task)
+        logger.info("WebSocket connection added", extra={"app_id": app_id})
+
+    async def _stop_app(self, app_id: str) -> None:
+        runner = self._runners.pop(app_id)
+        runner.stop.set()
+        try:
+            await asyncio.wait_for(runner.task, self.stop_timeout)
+        except Exception as exc:
+            logger.warning(
+                f"WebSocket connection ended with error: {exc}",
+                extra={"app_id": app_id},
+            )
+        runner.client.executor.shutdown(wait=False)
+        with contextlib.suppress(KeyError):
+            websocket_connection_status.remove(app_id)
+
+    async def _shutdown(self) -> None:
+        if self._sync_task is not None:
+            self._sync_task.cancel()
+            self._sync_task = None
+        await asyncio.gather(*(self._stop_app(app_id) for app_id in list(self._runners)))
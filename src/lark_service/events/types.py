@@ -19,6 +19,9 @@ class WebSocketConfig:
         app_id: Feishu application ID
         app_secret: Feishu application secret
         max_reconnect_retries: Maximum number of reconnection attempts
+        reconnect_base_delay: Reconnect delay in seconds before the first retry
+        max_reconnect_delay: Upper bound of the exponential reconnect delay
+        reconnect_jitter: Fraction of each reconnect delay that is randomized
         heartbeat_interval: Heartbeat interval in seconds
         fallback_to_http_callback: Enable fallback to HTTP callback on failure
         token_refresh_threshold: Token refresh threshold (0.0-1.0)
@@ -39,6 +42,9 @@ class WebSocketConfig:
     app_id: str
     app_secret: str
     max_reconnect_retries: int = 10
+    reconnect_base_delay: float = 1.0
+    max_reconnect_delay: float = 8.0
+    reconnect_jitter: float = 0.5
     heartbeat_interval: int = 30
     fallback_to_http_callback: bool = True
     token_refresh_threshold: float = 0.8
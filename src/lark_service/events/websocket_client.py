@@ -7,11 +7,16 @@ and heartbeat tracking for the Feishu WebSocket client.
 from __future__ import annotations
 
 import asyncio
+import contextlib
+import random
 from collections.abc import Callable
+from typing import Any
 
 import lark_oapi as lark
 
 from lark_service.events.exceptions import WebSocketConnectionError
+from lark_service.events.executor import EventExecutor
+from lark_service.events.pipeline import EventPipeline
 from lark_service.events.types import WebSocketConfig, WebSocketConnectionStatus
 from lark_service.monitoring.websocket_metrics import (
     websocket_connection_status,
@@ -21,39 +26,117 @@ from lark_service.utils.logger import get_logger
 
 logger = get_logger()
 
+# Card actions need their response inline, so they bypass the executor and
+# run on the SDK's receive loop; their handlers must return quickly
+CARD_ACTION_EVENT = "card.action.trigger"
+
+# Event types with a typed SDK registrar; other types are registered as
+# customized events and receive the raw event payload
+EVENT_REGISTRARS: dict[str, str] = {
+    "im.message.receive_v1": "register_p2_im_message_receive_v1",
+    "im.message.message_read_v1": "register_p2_im_message_message_read_v1",
+    "im.message.recalled_v1": "register_p2_im_message_recalled_v1",
+    "im.message.reaction.created_v1": "register_p2_im_message_reaction_created_v1",
+    "im.message.reaction.deleted_v1": "register_p2_im_message_reaction_deleted_v1",
+    "im.chat.updated_v1": "register_p2_im_chat_updated_v1",
+    "im.chat.disbanded_v1": "register_p2_im_chat_disbanded_v1",
+    "im.chat.member.user.added_v1": "register_p2_im_chat_member_user_added_v1",
+    "im.chat.member.user.deleted_v1": "register_p2_im_chat_member_user_deleted_v1",
+    "im.chat.member.user.withdrawn_v1": "register_p2_im_chat_member_user_withdrawn_v1",
+    "im.chat.member.bot.added_v1": "register_p2_im_chat_member_bot_added_v1",
+    "im.chat.member.bot.deleted_v1": "register_p2_im_chat_member_bot_deleted_v1",
+    "im.chat.access_event.bot_p2p_chat_entered_v1": (
+        "register_p2_im_chat_access_event_bot_p2p_chat_entered_v1"
+    ),
+}
+
+
+def reconnect_delay(config: WebSocketConfig, attempt: int) -> float:
+    """Return the jittered delay before reconnect ``attempt`` (0-based).
+
+    The delay doubles from ``reconnect_base_delay`` up to ``max_reconnect_delay``
+    and is then reduced by a random share of up to ``reconnect_jitter``, so
+    connections dropped together do not all retry at the same moment.
+    """
+    delay = min(config.reconnect_base_delay * 2.0**attempt, config.max_reconnect_delay)
+    return delay - random.uniform(0, delay * config.reconnect_jitter)
+
+
+class _SupervisedClient(lark.ws.Client):  # type: ignore[misc]
+    """SDK client whose receive loop exits quietly when the connection drops.
+
+    ``run_async`` creates it with ``auto_reconnect=False`` and reconnects by
+    itself; the SDK would otherwise re-raise the close error in a task
+    nobody awaits.
+    """
+
+    async def _receive_message_loop(self) -> None:
+        with contextlib.suppress(Exception):
+            await super()._receive_message_loop()
+
 
 class LarkWebSocketClient:
     """Feishu WebSocket long connection client.
 
     Handles connection setup, reconnection, heartbeat, and event registration.
+    Handlers other than card actions run on an EventExecutor, so a slow
+    handler does not hold up the SDK's receive loop. Card action handlers
+    run on that loop to return their response, so they must be fast and
+    hand slow work to another thread.
     """
 
     def __init__(
         self,
         config: WebSocketConfig,
         log_level: lark.LogLevel | None = None,
+        executor: EventExecutor | None = None,
+        pipeline: EventPipeline | None = None,
     ) -> None:
         """Initialize WebSocket client.
 
         Args:
             config: WebSocket client configuration
             log_level: SDK log level override (optional)
+            executor: Executor running event handlers (optional, one per client by default)
+            pipeline: Deduplicating, per-chat ordered stage in front of its
+                executor (optional; replaces ``executor``)
         """
         self.config = config
         self.log_level = log_level or lark.LogLevel.INFO
         self.status = WebSocketConnectionStatus()
+        self.pipeline = pipeline
+        if pipeline is not None:
+            self.executor = pipeline.executor
+        else:
+            self.executor = executor or EventExecutor(app_id=config.app_id)
 
         self._handlers: dict[str, Callable[..., object]] = {}
         self._ws_client: lark.ws.Client | None = None
         self._heartbeat_task: asyncio.Task[None] | None = None
         self._shutdown_event = asyncio.Event()
 
-    def register_handler(self, event_type: str, handler: Callable[..., object]) -> None:
-        """Register event handler for specific event type."""
+    def register_handler(
+        self,
+        event_type: str,
+        handler: Callable[..., object],
+        max_concurrency: int | None = None,
+    ) -> None:
+        """Register event handler for specific event type.
+
+        Args:
+            event_type: Feishu event type, e.g. ``im.message.receive_v1``
+            handler: Sync or async handler called with the SDK event object
+            max_concurrency: Handlers of this type running at once (optional,
+                executor default otherwise); not used for card actions
+        """
         if not event_type:
             raise ValueError("event_type cannot be empty")
         if not callable(handler):
             raise ValueError("handler must be callable")
+        if max_concurrency is not None:
+            if max_concurrency < 1:
+                raise ValueError("max_concurrency must be positive")
+            self.executor.set_concurrency(event_type, max_concurrency)
 
         self._handlers[event_type] = handler
         logger.info(
@@ -129,8 +212,91 @@ class LarkWebSocketClient:
             extra={"app_id": self.config.app_id},
         )
 
+    async def run_async(self, stop: asyncio.Event, poll_interval: float = 1.0) -> None:
+        """Keep the connection up until ``stop`` is set.
+
+        Uses the SDK client's coroutines instead of the blocking ``start()``,
+        so several clients can share one event loop. The SDK schedules its
+        receive tasks on its module-level loop (``lark.ws.client.loop``),
+        which therefore must be the loop running this coroutine. Events are
+        handed to the executor without waiting for queue space, so a full
+        queue rejects the event (Feishu redelivers it) instead of stalling
+        the other connections on the loop.
+
+        Args:
+            stop: Event that closes the connection and ends the coroutine
+            poll_interval: Seconds between connection liveness checks
+
+        Raises:
+            WebSocketConnectionError: If ``max_reconnect_retries`` consecutive
+                connection attempts fail
+        """
+        app_id = self.config.app_id
+        failures = 0
+        while not stop.is_set():
+            ws_client = _SupervisedClient(
+                app_id,
+                self.config.app_secret,
+                log_level=self.log_level,
+                event_handler=self._build_event_handler(block=False),
+                auto_reconnect=False,
+            )
+            self._ws_client = ws_client
+            try:
+                await ws_client._connect()
+            except Exception as exc:
+                self.status.mark_disconnected(str(exc))
+                websocket_connection_status.labels(app_id=app_id).set(0)
+                if failures:
+                    websocket_reconnect_total.labels(app_id=app_id, outcome="failure").inc()
+                failures += 1
+                if failures > self.config.max_reconnect_retries:
+                    raise WebSocketConnectionError(
+                        f"WebSocket reconnect failed after max retries: {exc}",
+                        app_id=app_id,
+                    ) from exc
+                delay = reconnect_delay(self.config, failures - 1)
+                self.status.increment_reconnect()
+                websocket_reconnect_total.labels(app_id=app_id, outcome="attempt").inc()
+                logger.warning(
+                    "WebSocket connection failed, retrying",
+                    extra={"app_id": app_id, "attempt": failures, "delay": delay},
+                )
+                await _wait(stop, delay)
+                continue
+
+            if failures:
+                websocket_reconnect_total.labels(app_id=app_id, outcome="success").inc()
+            failures = 0
+            self.status.mark_connected()
+            websocket_connection_status.labels(app_id=app_id).set(1)
+            logger.info("WebSocket connected", extra={"app_id": app_id})
+
+            ping_task = asyncio.ensure_future(ws_client._ping_loop())
+            try:
+                while ws_client._conn is not None and not await _wait(stop, poll_interval):
+                    self.status.record_heartbeat()
+            finally:
+                ping_task.cancel()
+                with contextlib.suppress(Exception):
+                    await ws_client._disconnect()
+                self.status.mark_disconnected(None if stop.is_set() else "Connection closed")
+                websocket_connection_status.labels(app_id=app_id).set(0)
+
+            if not stop.is_set():
+                # Dropped by the server: first retry after a jittered delay
+                failures = 1
+                delay = reconnect_delay(self.config, 0)
+                self.status.increment_reconnect()
+                websocket_reconnect_total.labels(app_id=app_id, outcome="attempt").inc()
+                logger.warning(
+                    "WebSocket connection lost, reconnecting",
+                    extra={"app_id": app_id, "delay": delay},
+                )
+                await _wait(stop, delay)
+
     def _reconnect_with_backoff(self) -> None:
-        """Reconnect with exponential backoff (1s → 2s → 4s → 8s).
+        """Reconnect with jittered exponential backoff (up to 1s → 2s → 4s → 8s).
 
         Note: Since connect() is blocking, this method should be called
         in a separate thread if non-blocking behavior is needed.
@@ -140,7 +306,7 @@ class LarkWebSocketClient:
         last_error: Exception | None = None
 
         for attempt in range(self.config.max_reconnect_retries):
-            delay = min(2**attempt, 8)
+            delay = reconnect_delay(self.config, attempt)
             self.status.increment_reconnect()
             websocket_reconnect_total.labels(app_id=self.config.app_id, outcome="attempt").inc()
             logger.warning(
@@ -172,17 +338,33 @@ class LarkWebSocketClient:
             app_id=self.config.app_id,
         ) from last_error
 
-    def _build_event_handler(self) -> lark.EventDispatcherHandler:
+    def _build_event_handler(self, block: bool = True) -> lark.EventDispatcherHandler:
         builder = lark.EventDispatcherHandler.builder("", "")
 
         for event_type, handler in self._handlers.items():
-            if event_type == "card.action.trigger":
+            if event_type == CARD_ACTION_EVENT:
                 builder = builder.register_p2_card_action_trigger(handler)
+                continue
+
+            dispatch = self._dispatch_to_executor(event_type, handler, block)
+            registrar = EVENT_REGISTRARS.get(event_type)
+            if registrar is not None:
+                builder = getattr(builder, registrar)(dispatch)
             else:
-                raise ValueError(f"Unsupported event_type: {event_type}")
+                builder = builder.register_p2_customized_event(event_type, dispatch)
 
         return builder.build()
 
+    def _dispatch_to_executor(
+        self, event_type: str, handler: Callable[..., object], block: bool = True
+    ) -> Callable[[Any], None]:
+        target = self.pipeline or self.executor
+
+        def dispatch(event: Any) -> None:
+            target.submit(event_type, handler, event, block=block)
+
+        return dispatch
+
     def _start_heartbeat(self) -> None:
         if self._heartbeat_task and not self._heartbeat_task.done():
             return
@@ -206,3 +388,10 @@ class LarkWebSocketClient:
     def is_connected(self) -> bool:
         """Check if WebSocket is connected."""
         return self.status.is_connected
+
+
+async def _wait(event: asyncio.Event, timeout: float) -> bool:
+    """Wait up to ``timeout`` seconds for ``event``; return whether it is set."""
+    with contextlib.suppress(TimeoutError):
+        await asyncio.wait_for(event.wait(), timeout)
+    return event.is_set()
@@ -3,16 +3,23 @@
 This module provides messaging capabilities including:
 - Sending various types of messages (text, rich text, image, file, card)
 - Message lifecycle management (recall, edit, reply)
-- Media upload functionality
+- Media upload functionality with content-hash dedup caching
 - Batch messaging
 """
 
 from lark_service.messaging.client import MessagingClient
 from lark_service.messaging.lifecycle import MessageLifecycleManager
-from lark_service.messaging.media_uploader import MediaUploader
+from lark_service.messaging.media_cache import DatabaseMediaCache, InMemoryMediaCache, MediaCache
+from lark_service.messaging.media_source import MediaSource
+from lark_service.messaging.media_uploader import MediaUploader, UploadItem
 
 __all__ = [
     "MessagingClient",
     "MessageLifecycleManager",
     "MediaUploader",
+    "MediaCache",
+    "InMemoryMediaCache",
+    "DatabaseMediaCache",
+    "MediaSource",
+    "UploadItem",
 ]
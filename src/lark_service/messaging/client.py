@@ -5,20 +5,22 @@ This module provides a high-level client for sending messages via Lark IM API,
 including text, rich text, images, files, and interactive cards.
 """
 
-from pathlib import Path
 from typing import Any
 
 from lark_oapi.api.im.v1 import CreateMessageRequest, CreateMessageRequestBody
 
+from lark_service.cardkit.payload import CardPayload
 from lark_service.core.base_service_client import BaseServiceClient
 from lark_service.core.credential_pool import CredentialPool
 from lark_service.core.exceptions import InvalidParameterError, RetryableError
 from lark_service.core.retry import RetryStrategy
+from lark_service.messaging.media_source import MediaSource
 from lark_service.messaging.media_uploader import MediaUploader
 from lark_service.messaging.models import (
     BatchSendResponse,
     BatchSendResult,
 )
+from lark_service.utils.json_codec import dumps
 from lark_service.utils.logger import get_logger
 
 logger = get_logger()
@@ -111,7 +113,8 @@ class MessagingClient(BaseServiceClient):
             msg_type : str
                 Message type (text, post, image, file, interactive)
             content : str | dict[str, Any]
-                Message content (string or dict depending on type)
+                Message content; dicts are serialized with the active JSON
+                backend, strings (including CardPayload) are sent as is
             receive_id_type : str
                 Receiver ID type (default: "open_id")
             app_id : str | None
@@ -136,12 +139,7 @@ class MessagingClient(BaseServiceClient):
         logger.debug(f"Sending message using app_id: {resolved_app_id}")
 
         # Prepare content string
-        if isinstance(content, dict):
-            import json
-
-            content_str = json.dumps(content)
-        else:
-            content_str = content
+        content_str = dumps(content) if isinstance(content, dict) else content
 
         # Create request
         request = (
@@ -345,7 +343,7 @@ class MessagingClient(BaseServiceClient):
     def send_image_message(
         self,
         receiver_id: str,
-        image_path: str | Path | None = None,
+        image_path: MediaSource | None = None,
         image_key: str | None = None,
         receive_id_type: str = "open_id",
         app_id: str | None = None,
@@ -359,8 +357,9 @@ class MessagingClient(BaseServiceClient):
         ----------
             receiver_id : str
                 Receiver user or chat ID
-            image_path : str | Path | None
-                Path to image file (will be uploaded automatically)
+            image_path : MediaSource | None
+                Path to image file, or image bytes/stream (will be uploaded
+                automatically)
             image_key : str | None
                 Pre-uploaded image key (e.g., "img_v2_xxx")
             receive_id_type : str
@@ -394,7 +393,7 @@ class MessagingClient(BaseServiceClient):
             ...     image_key="img_v2_a1b2c3d4"
             ... )
         """
-        if not image_path and not image_key:
+        if image_path is None and not image_key:
             raise InvalidParameterError(
                 "Either image_path or image_key must be provided",
                 details={"image_path": image_path, "image_key": image_key},
@@ -404,7 +403,7 @@ class MessagingClient(BaseServiceClient):
         resolved_app_id = self._resolve_app_id(app_id)
 
         # Upload image if path is provided
-        if image_path:
+        if image_path is not None:
             asset = self.media_uploader.upload_image(resolved_app_id, image_path)
             image_key = asset.image_key
 
@@ -422,7 +421,7 @@ class MessagingClient(BaseServiceClient):
     def send_file_message(
         self,
         receiver_id: str,
-        file_path: str | Path | None = None,
+        file_path: MediaSource | None = None,
         file_key: str | None = None,
         receive_id_type: str = "open_id",
         app_id: str | None = None,
@@ -436,8 +435,9 @@ class MessagingClient(BaseServiceClient):
         ----------
             receiver_id : str
                 Receiver user or chat ID
-            file_path : str | Path | None
-                Path to file (will be uploaded automatically)
+            file_path : MediaSource | None
+                Path to file, or a named stream (will be uploaded
+                automatically)
             file_key : str | None
                 Pre-uploaded file key (e.g., "file_v2_xxx")
             receive_id_type : str
@@ -471,7 +471,7 @@ class MessagingClient(BaseServiceClient):
             ...     file_key="file_v2_a1b2c3d4"
             ... )
         """
-        if not file_path and not file_key:
+        if file_path is None and not file_key:
             raise InvalidParameterError(
                 "Either file_path or file_key must be provided",
                 details={"file_path": file_path, "file_key": file_key},
@@ -481,7 +481,7 @@ class MessagingClient(BaseServiceClient):
         resolved_app_id = self._resolve_app_id(app_id)
 
         # Upload file if path is provided
-        if file_path:
+        if file_path is not None:
             asset = self.media_uploader.upload_file(resolved_app_id, file_path)
             file_key = asset.file_key
 
@@ -499,7 +499,7 @@ class MessagingClient(BaseServiceClient):
     def send_card_message(
         self,
         receiver_id: str,
-        card_content: dict[str, Any],
+        card_content: dict[str, Any] | CardPayload,
         receive_id_type: str = "open_id",
         app_id: str | None = None,
     ) -> dict[str, Any]:
@@ -512,8 +512,9 @@ class MessagingClient(BaseServiceClient):
         ----------
             receiver_id : str
                 Receiver user or chat ID
-            card_content : dict[str, Any]
-                Card JSON structure (built by CardKit)
+            card_content : dict[str, Any] | CardPayload
+                Card JSON structure (built by CardKit), or a pre-serialized
+                payload that is sent without serializing it again
             receive_id_type : str
                 Receiver ID type (default: "open_id")
             app_id : str | None
@@ -0,0 +1,322 @@
+"""
+Content-addressed dedup cache for media uploads.
+
+MediaUploader consults an optional MediaCache before uploading: content
+is identified by the SHA-256 of its bytes, and entries map (app_id,
+digest) to the image_key or file_key Lark returned for it, so repeated
+uploads of the same logo or chart template need no network I/O. Media
+keys belong to the uploading app, hence every entry is scoped by app_id.
+
+Two backends are provided:
+- InMemoryMediaCache: per-process LRU bounded by entry count
+- DatabaseMediaCache: shared SQLAlchemy table (PostgreSQL or SQLite)
+  that survives restarts and is shared by worker processes
+"""
+
+import hashlib
+import threading
+import time
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any, cast
+
+from sqlalchemy import CursorResult, Result, create_engine, delete, select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import sessionmaker
+
+from lark_service.core.exceptions import InvalidParameterError
+from lark_service.core.models.media_cache import Base, MediaCacheEntry
+from lark_service.utils.logger import get_logger
+
+logger = get_logger()
+
+# Media keys stay valid for 30 days; expire cache entries well before that
+DEFAULT_MEDIA_TTL = 25 * 24 * 3600
+
+# Read size used when hashing streams
+HASH_CHUNK_SIZE = 1024 * 1024
+
+
+@dataclass(frozen=True, slots=True)
+class MediaCacheKey:
+    """
+    Cache key of one uploaded media object.
+
+    ``variant`` holds upload options that change the result for the same
+    bytes (image_type, or file_type and file name for files).
+    """
+
+    app_id: str
+    kind: str
+    digest: str
+    variant: str = ""
+
+    @property
+    def cache_key(self) -> str:
+        """Stable SHA-256 hex digest (used by shared backends)."""
+        raw = f"{self.app_id}\0{self.kind}\0{self.variant}\0{self.digest}"
+        return hashlib.sha256(raw.encode()).hexdigest()
+
+
+@dataclass(frozen=True, slots=True)
+class CachedMedia:
+    """Media key of previously uploaded content."""
+
+    media_key: str
+    file_size: int
+    uploaded_at: datetime
+
+
+def _rowcount(result: Result[Any]) -> int:
+    """Return affected rows of a DML result."""
+    return int(cast(CursorResult[Any], result).rowcount or 0)
+
+
+class MediaCache(ABC):
+    """
+    Base class of media upload cache backends.
+
+    Attributes
+    ----------
+        ttl_seconds : float
+            Entry lifetime (must stay below the 30-day media key validity)
+        hits : int
+            Uploads served from the cache
+        misses : int
+            Lookups that missed
+    """
+
+    def __init__(self, ttl_seconds: float = DEFAULT_MEDIA_TTL) -> None:
+        if ttl_seconds <= 0:
+            raise InvalidParameterError(f"ttl_seconds must be positive, got {ttl_seconds}")
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: MediaCacheKey) -> CachedMedia | None:
+        """Return the cached media key for ``key`` or None."""
+        cached = self._get(key)
+        if cached is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return cached
+
+    def set(
+        self,
+        key: MediaCacheKey,
+        media_key: str,
+        file_size: int,
+        uploaded_at: datetime | None = None,
+    ) -> None:
+        """Remember the media key returned for ``key``."""
+        self._set(key, CachedMedia(media_key, file_size, uploaded_at or datetime.now()))
+
+    @abstractmethod
+    def _get(self, key: MediaCacheKey) -> CachedMedia | None:
+        """Return the entry for ``key`` if present and not expired."""
+
+    @abstractmethod
+    def _set(self, key: MediaCacheKey, media: CachedMedia) -> None:
+        """Store an entry."""
+
+    @abstractmethod
+    def invalidate(self, app_id: str) -> int:
+        """
+        Drop every entry of ``app_id``.
+
+        Returns
+        -------
+            int
+                Number of entries removed
+        """
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Drop all entries."""
+
+
+class InMemoryMediaCache(MediaCache):
+    """
+    Thread-safe in-process LRU cache bounded by entry count.
+
+    Examples
+    --------
+        >>> cache = InMemoryMediaCache(max_entries=1000)
+        >>> uploader = MediaUploader(credential_pool, cache=cache)
+    """
+
+    def __init__(self, ttl_seconds: float = DEFAULT_MEDIA_TTL, max_entries: int = 10000) -> None:
+        """
+        Initialize in-memory cache.
+
+        Parameters
+        ----------
+            ttl_seconds : float
+                Entry lifetime in seconds (default: 25 days)
+            max_entries : int
+                Maximum cached media keys (default: 10000)
+        """
+        super().__init__(ttl_seconds)
+        if max_entries < 1:
+            raise InvalidParameterError("max_entries must be positive")
+        self.max_entries = max_entries
+        self._entries: dict[MediaCacheKey, tuple[float, CachedMedia]] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _get(self, key: MediaCacheKey) -> CachedMedia | None:
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is None or entry[0] <= time.monotonic():
+                return None
+            # Re-insert to keep dict order least recently used first
+            self._entries[key] = entry
+            return entry[1]
+
+    def _set(self, key: MediaCacheKey, media: CachedMedia) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, media)
+            while len(self._entries) > self.max_entries:
+                del self._entries[next(iter(self._entries))]
+
+    def invalidate(self, app_id: str) -> int:
+        with self._lock:
+            stale = [key for key in self._entries if key.app_id == app_id]
+            for key in stale:
+                del self._entries[key]
+        return len(stale)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+class DatabaseMediaCache(MediaCache):
+    """
+    Persistent cache stored in a database table (``media_upload_cache``).
+
+    Entries survive restarts and are shared by every process pointing at
+    the same database. Writes are upserts, so processes storing the same
+    content at once do not conflict.
+
+    Examples
+    --------
+        >>> cache = DatabaseMediaCache("sqlite:///data/media_cache.db")
+        >>> uploader = MediaUploader(credential_pool, cache=cache)
+    """
+
+    def __init__(
+        self,
+        database_url: str,
+        ttl_seconds: float = DEFAULT_MEDIA_TTL,
+        max_entries: int = 100000,
+    ) -> None:
+        """
+        Initialize database-backed cache.
+
+        Parameters
+        ----------
+            database_url : str
+                SQLAlchemy database URL
+            ttl_seconds : float
+                Entry lifetime in seconds (default: 25 days)
+            max_entries : int
+                Entry count kept when pruning (default: 100000)
+        """
+        super().__init__(ttl_seconds)
+        if max_entries < 1:
+            raise InvalidParameterError("max_entries must be positive")
+        self.max_entries = max_entries
+        self.engine = create_engine(database_url, pool_pre_ping=True, echo=False)
+        self.session_factory = sessionmaker(bind=self.engine)
+        self._writes = 0
+
+        # Create table if not exist
+        Base.metadata.create_all(self.engine)
+
+    def close(self) -> None:
+        """Dispose of database connections."""
+        self.engine.dispose()
+
+    def _get(self, key: MediaCacheKey) -> CachedMedia | None:
+        with self.session_factory() as session:
+            entry = session.get(MediaCacheEntry, key.cache_key)
+            if entry is None or entry.is_expired():
+                return None
+            return CachedMedia(entry.media_key, entry.file_size, entry.created_at)
+
+    def _set(self, key: MediaCacheKey, media: CachedMedia) -> None:
+        values = {
+            "cache_key": key.cache_key,
+            "app_id": key.app_id,
+            "kind": key.kind,
+            "digest": key.digest,
+            "media_key": media.media_key,
+            "file_size": media.file_size,
+            "created_at": media.uploaded_at,
+            "expires_at": media.uploaded_at + timedelta(seconds=self.ttl_seconds),
+        }
+        dialect = self.engine.dialect.name
+        with self.session_factory() as session:
+            if dialect in ("postgresql", "sqlite"):
+                insert = postgresql.insert if dialect == "postgresql" else sqlite.insert
+                stmt = insert(MediaCacheEntry).values(**values)
+                stmt = stmt.on_conflict_do_update(
+                    index_elements=[MediaCacheEntry.cache_key],
+                    set_={name: stmt.excluded[name] for name in values if name != "cache_key"},
+                )
+                session.execute(stmt)
+                session.commit()
+            else:
+                try:
+                    session.merge(MediaCacheEntry(**values))
+                    session.commit()
+                except IntegrityError:
+                    # Another process stored the same content first
+                    session.rollback()
+
+        self._writes += 1
+        if self._writes % 100 == 0:
+            self.prune()
+
+    def prune(self) -> int:
+        """Delete expired entries and the oldest ones above ``max_entries``."""
+        with self.session_factory() as session:
+            removed = _rowcount(
+                session.execute(
+                    delete(MediaCacheEntry).where(MediaCacheEntry.expires_at <= datetime.now())
+                )
+            )
+            overflow = session.execute(
+                select(MediaCacheEntry.cache_key)
+                .order_by(MediaCacheEntry.created_at.desc())
+                .offset(self.max_entries)
+            ).scalars()
+            keys = list(overflow)
+            if keys:
+                removed += _rowcount(
+                    session.execute(
+                        delete(MediaCacheEntry).where(MediaCacheEntry.cache_key.in_(keys))
+                    )
+                )
+            session.commit()
+        return removed
+
+    def invalidate(self, app_id: str) -> int:
+        with self.session_factory() as session:
+            removed = _rowcount(
+                session.execute(delete(MediaCacheEntry).where(MediaCacheEntry.app_id == app_id))
+            )
+            session.commit()
+        return removed
+
+    def clear(self) -> None:
+        with self.session_factory() as session:
+            session.execute(delete(MediaCacheEntry))
+            session.commit()
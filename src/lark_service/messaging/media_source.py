@@ -0,0 +1,260 @@
+"""
+Upload sources for MediaUploader.
+
+An UploadSource wraps whatever the caller has (a path, bytes, a
+memoryview or a seekable binary stream) as a seekable stream that the SDK
+multipart encoder reads in chunks, and that can be rewound before every
+retry. Large files are memory-mapped so hashing and uploading read them
+through the page cache without copying them into Python buffers; in-memory
+content is read through a memoryview, so callers never need temp files.
+"""
+
+import hashlib
+import io
+import mmap
+import os
+from pathlib import Path
+from typing import IO, Any, BinaryIO
+
+from lark_service.core.exceptions import InvalidParameterError
+from lark_service.messaging.media_cache import HASH_CHUNK_SIZE
+
+# Anything MediaUploader can upload from
+MediaSource = str | Path | bytes | bytearray | memoryview | BinaryIO
+
+# Files at least this large are memory-mapped instead of read through a file object
+MMAP_THRESHOLD = 1024 * 1024
+
+
+class _BufferReader(io.RawIOBase):
+    """Seekable read-only stream over a buffer that does not copy the buffer."""
+
+    def __init__(self, buffer: memoryview) -> None:
+        super().__init__()
+        self._view = buffer
+        self._pos = 0
+
+    def __len__(self) -> int:
+        return len(self._view)
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def read(self, size: int | None = -1) -> bytes:
+        end = len(self._view) if size is None or size < 0 else self._pos + size
+        data = self._view[self._pos : end].tobytes()
+        self._pos += len(data)
+        return data
+
+    def readinto(self, buffer: Any) -> int:
+        data = self.read(len(buffer))
+        buffer[: len(data)] = data
+        return len(data)
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        base = {io.SEEK_SET: 0, io.SEEK_CUR: self._pos, io.SEEK_END: len(self._view)}[whence]
+        self._pos = max(0, base + offset)
+        return self._pos
+
+    def tell(self) -> int:
+        return self._pos
+
+    def close(self) -> None:
+        if not self.closed:
+            self._view.release()
+        super().close()
+
+
+class _StreamReader(io.RawIOBase):
+    """Read-only view of a caller's stream from its initial position onwards.
+
+    Seeks are relative to that position, so rewinding never rereads bytes
+    the caller had already consumed, and closing leaves the stream open.
+    """
+
+    def __init__(self, stream: IO[bytes], size: int) -> None:
+        super().__init__()
+        self._stream = stream
+        self._start = stream.tell()
+        self._size = size
+
+    def __len__(self) -> int:
+        return self._size
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def read(self, size: int | None = -1) -> bytes:
+        remaining = self._size - self.tell()
+        if size is None or size < 0 or size > remaining:
+            size = remaining
+        return self._stream.read(size) if size > 0 else b""
+
+    def readinto(self, buffer: Any) -> int:
+        data = self.read(len(buffer))
+        buffer[: len(data)] = data
+        return len(data)
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        base = {io.SEEK_SET: 0, io.SEEK_CUR: self.tell(), io.SEEK_END: self._size}[whence]
+        return self._stream.seek(self._start + max(0, base + offset)) - self._start
+
+    def tell(self) -> int:
+        return self._stream.tell() - self._start
+
+
+class UploadSource:
+    """
+    Seekable, rewindable view of upload content.
+
+    Use as a context manager; files and memory maps opened by the source
+    are closed on exit, caller-owned streams are left open.
+
+    Attributes
+    ----------
+        stream : io.IOBase
+            Stream to hand to the SDK request body
+        size : int
+            Content size in bytes
+        name : str | None
+            File name (path name, stream name or the explicit file_name)
+        path : Path | None
+            Source path when uploading from a file
+
+    Examples
+    --------
+        >>> with UploadSource.open(chart_png_bytes, file_name="chart.png") as source:
+        ...     source.digest()
+        '5d41402abc4b2a76...'
+    """
+
+    def __init__(
+        self,
+        stream: io.IOBase,
+        size: int,
+        name: str | None,
+        path: Path | None = None,
+        buffer: memoryview | None = None,
+        owned: tuple[Any, ...] = (),
+    ) -> None:
+        self.stream = stream
+        self.size = size
+        self.name = name
+        self.path = path
+        self._buffer = buffer
+        self._owned = owned
+        self._digest: str | None = None
+
+    @classmethod
+    def open(cls, source: MediaSource, file_name: str | None = None) -> "UploadSource":
+        """
+        Wrap ``source`` for uploading.
+
+        Parameters
+        ----------
+            source : MediaSource
+                Path, bytes-like object or seekable binary stream
+            file_name : str | None
+                Name to upload under (defaults to the path or stream name)
+
+        Returns
+        -------
+            UploadSource
+                Source positioned at the start of the content
+
+        Raises
+        ------
+            InvalidParameterError
+                If a path does not exist or a stream is not seekable
+        """
+        if isinstance(source, str | Path):
+            return cls._open_path(Path(source), file_name)
+
+        if isinstance(source, bytes | bytearray | memoryview):
+            view = memoryview(source)
+            if not view.c_contiguous:
+                raise InvalidParameterError("Upload buffer must be C-contiguous")
+            view = view.cast("B")
+            return cls(_BufferReader(view), len(view), file_name, buffer=view)
+
+        if not hasattr(source, "read") or not source.seekable():
+            raise InvalidParameterError(
+                "Upload source must be a path, bytes-like object or seekable binary stream",
+                details={"source_type": type(source).__name__},
+            )
+        start = source.tell()
+        size = source.seek(0, io.SEEK_END) - start
+        source.seek(start)
+        stream_name = getattr(source, "name", None)
+        if file_name is None and isinstance(stream_name, str):
+            file_name = os.path.basename(stream_name)
+        return cls(_StreamReader(source, size), size, file_name)
+
+    @classmethod
+    def _open_path(cls, path: Path, file_name: str | None) -> "UploadSource":
+        if not path.is_file():
+            raise InvalidParameterError(
+                f"File not found: {path}",
+                details={"file_path": str(path)},
+            )
+        name = file_name or path.name
+        file = open(path, "rb")  # noqa: SIM115 - closed by UploadSource.close
+        size = os.fstat(file.fileno()).st_size
+        if size < MMAP_THRESHOLD:
+            return cls(file, size, name, path=path, owned=(file,))
+
+        try:
+            mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        except BaseException:
+            file.close()
+            raise
+        view = memoryview(mapped)
+        return cls(_BufferReader(view), size, name, path, view, owned=(mapped, file))
+
+    def rewind(self) -> None:
+        """Seek back to the start of the content (before every attempt)."""
+        self.stream.seek(0)
+
+    def head(self, size: int = 32) -> bytes:
+        """Return the first ``size`` bytes of the content."""
+        if self._buffer is not None:
+            return self._buffer[:size].tobytes()
+        self.rewind()
+        data: bytes = self.stream.read(size)
+        self.rewind()
+        return data
+
+    def digest(self) -> str:
+        """Return the SHA-256 hex digest of the content (computed once)."""
+        if self._digest is None:
+            if self._buffer is not None:
+                # Hash the buffer or memory map in place
+                self._digest = hashlib.sha256(self._buffer).hexdigest()
+            else:
+                sha = hashlib.sha256()
+                self.rewind()
+                while chunk := self.stream.read(HASH_CHUNK_SIZE):
+                    sha.update(chunk)
+                self.rewind()
+                self._digest = sha.hexdigest()
+        return self._digest
+
+    def close(self) -> None:
+        """Release the stream and anything the source opened itself."""
+        self.stream.close()
+        if self._buffer is not None:
+            self._buffer.release()
+        for resource in self._owned:
+            resource.close()
+
+    def __enter__(self) -> "UploadSource":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
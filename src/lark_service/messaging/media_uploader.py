@@ -2,15 +2,28 @@
 Media uploader for Lark messaging.
 
 This module provides functionality to upload images and files to Lark servers,
-with validation for file size, type, and format.
+with validation for file size, type, and format. Content can come from a
+path, bytes, a memoryview or a seekable stream; it is streamed to the SDK
+and rewound before every retry. An optional MediaCache skips re-uploading
+content that was already uploaded by the same app, and upload_many uploads
+a batch of images or files concurrently.
 """
 
 import mimetypes
+import threading
+from collections.abc import Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Literal
+from typing import Any, Literal
 
-from lark_oapi.api.im.v1 import CreateFileRequest, CreateImageRequest
+from lark_oapi.api.im.v1 import (
+    CreateFileRequest,
+    CreateFileRequestBody,
+    CreateImageRequest,
+    CreateImageRequestBody,
+)
 
 from lark_service.core.credential_pool import CredentialPool
 from lark_service.core.exceptions import (
@@ -18,7 +31,14 @@ from lark_service.core.exceptions import (
     RetryableError,
 )
 from lark_service.core.retry import RetryStrategy
-from lark_service.messaging.models import FileAsset, ImageAsset
+from lark_service.messaging.media_cache import CachedMedia, MediaCache, MediaCacheKey
+from lark_service.messaging.media_source import MediaSource, UploadSource
+from lark_service.messaging.models import (
+    BatchUploadResponse,
+    BatchUploadResult,
+    FileAsset,
+    ImageAsset,
+)
 from lark_service.utils.logger import get_logger
 
 logger = get_logger()
@@ -64,6 +84,66 @@ SUPPORTED_DOCUMENT_TYPES = {
     ".txt": "text/plain",
 }
 
+# Maximum number of items per upload_many call
+MAX_BATCH_UPLOAD = 100
+
+# Leading bytes of supported image formats, for unnamed in-memory images
+IMAGE_SIGNATURES = (
+    (b"\x89PNG\r\n\x1a\n", ".png"),
+    (b"\xff\xd8\xff", ".jpg"),
+    (b"GIF87a", ".gif"),
+    (b"GIF89a", ".gif"),
+    (b"II*\x00", ".tiff"),
+    (b"MM\x00*", ".tiff"),
+    (b"BM", ".bmp"),
+    (b"\x00\x00\x01\x00", ".ico"),
+)
+
+
+def guess_image_extension(head: bytes) -> str | None:
+    """
+    Guess an image file extension from its leading bytes.
+
+    Parameters
+    ----------
+        head : bytes
+            First bytes of the image (12 are enough)
+
+    Returns
+    -------
+        str | None
+            Extension such as ".png", or None if the format is unknown
+    """
+    if head[:4] == b"RIFF" and head[8:12] == b"WEBP":
+        return ".webp"
+    for signature, extension in IMAGE_SIGNATURES:
+        if head.startswith(signature):
+            return extension
+    return None
+
+
+@dataclass
+class UploadItem:
+    """
+    One item of a batch upload with per-item options.
+
+    Attributes
+    ----------
+        source : MediaSource
+            Path, bytes-like object or seekable binary stream
+        file_name : str | None
+            Name to upload under (see upload_image/upload_file)
+        image_type : str
+            Image type for image uploads (default: "message")
+        file_type : str
+            File type for file uploads (default: "stream")
+    """
+
+    source: MediaSource
+    file_name: str | None = None
+    image_type: Literal["message", "avatar"] = "message"
+    file_type: Literal["opus", "mp4", "pdf", "doc", "xls", "ppt", "stream"] = "stream"
+
 
 class MediaUploader:
     """
@@ -78,6 +158,8 @@ class MediaUploader:
             Credential pool for token management
         retry_strategy : RetryStrategy
             Retry strategy for API calls
+        cache : MediaCache | None
+            Content-hash dedup cache of uploaded media keys
 
     Examples
     --------
@@ -85,12 +167,18 @@ class MediaUploader:
         >>> asset = uploader.upload_image("cli_xxx", "/path/to/image.jpg")
         >>> print(asset.image_key)
         img_v2_a1b2c3d4
+        >>>
+        >>> # Reuse keys of identical content across uploads and restarts
+        >>> uploader = MediaUploader(
+        ...     credential_pool, cache=DatabaseMediaCache("sqlite:///data/media_cache.db")
+        ... )
     """
 
     def __init__(
         self,
         credential_pool: CredentialPool,
         retry_strategy: RetryStrategy | None = None,
+        cache: MediaCache | None = None,
     ) -> None:
         """
         Initialize MediaUploader.
@@ -101,9 +189,78 @@ class MediaUploader:
                 Credential pool for token management
             retry_strategy : Optional[RetryStrategy]
                 Retry strategy for API calls (default: None, uses default strategy)
+            cache : Optional[MediaCache]
+                Dedup cache; uploads of content already uploaded by the same
+                app return the cached key without network I/O (default: None)
         """
         self.credential_pool = credential_pool
         self.retry_strategy = retry_strategy or RetryStrategy()
+        self.cache = cache
+        self._inflight: dict[MediaCacheKey, Future[CachedMedia | None]] = {}
+        self._inflight_lock = threading.Lock()
+
+    def _lookup_cache(
+        self, app_id: str, kind: str, source: UploadSource, variant: str
+    ) -> tuple[MediaCacheKey | None, CachedMedia | None]:
+        """
+        Look up previously uploaded content in the dedup cache.
+
+        Returns
+        -------
+            tuple[MediaCacheKey | None, CachedMedia | None]
+                Cache key (None without a cache) and the cached upload
+        """
+        if self.cache is None:
+            return None, None
+        key = MediaCacheKey(app_id, kind, source.digest(), variant)
+        try:
+            cached = self.cache.get(key)
+        except Exception as e:
+            # The cache only saves uploads; never fail one because of it
+            logger.warning(f"Media cache lookup failed, uploading: {e}", extra={"app_id": app_id})
+            cached = None
+        cached = cached or self._join_upload(key)
+        if cached is not None:
+            logger.info(
+                f"Reusing uploaded {kind}: {cached.media_key}",
+                extra={"app_id": app_id, "media_key": cached.media_key, "digest": key.digest},
+            )
+        return key, cached
+
+    def _join_upload(self, key: MediaCacheKey) -> CachedMedia | None:
+        """
+        Wait for a concurrent upload of the same content.
+
+        Returns the other upload's result, or None once the caller has been
+        registered as the uploader of ``key`` and must call _finish_upload.
+        """
+        while True:
+            with self._inflight_lock:
+                pending = self._inflight.get(key)
+                if pending is None:
+                    self._inflight[key] = Future()
+                    return None
+            media = pending.result()
+            if media is not None:
+                return media
+            # The other upload failed; try to upload ourselves
+
+    def _finish_upload(self, key: MediaCacheKey | None, media: CachedMedia | None) -> None:
+        """Cache a successful upload (best effort) and release threads waiting for it."""
+        if key is None:
+            return
+        if media is not None and self.cache is not None:
+            try:
+                self.cache.set(key, media.media_key, media.file_size, media.uploaded_at)
+            except Exception as e:
+                logger.warning(
+                    f"Failed to cache uploaded media {media.media_key}: {e}",
+                    extra={"app_id": key.app_id},
+                )
+        with self._inflight_lock:
+            pending = self._inflight.pop(key, None)
+        if pending is not None:
+            pending.set_result(media)
 
     def _validate_file_size(self, file_path: Path, max_size: int, file_type: str) -> None:
         """
@@ -123,12 +280,32 @@ class MediaUploader:
             InvalidParameterError
                 If file size exceeds the limit or file is empty
         """
-        file_size = file_path.stat().st_size
+        self._validate_size(file_path.stat().st_size, max_size, file_type, str(file_path))
+
+    def _validate_size(self, file_size: int, max_size: int, file_type: str, label: str) -> None:
+        """
+        Validate content size.
 
+        Parameters
+        ----------
+            file_size : int
+                Content size in bytes
+            max_size : int
+                Maximum allowed size in bytes
+            file_type : str
+                Type of file (for error message)
+            label : str
+                File path or name (for error details)
+
+        Raises
+        ------
+            InvalidParameterError
+                If the size exceeds the limit or the content is empty
+        """
         if file_size == 0:
             raise InvalidParameterError(
                 f"Cannot upload empty {file_type}",
-                details={"file_path": str(file_path), "file_size": 0},
+                details={"file_path": label, "file_size": 0},
             )
 
         if file_size > max_size:
@@ -137,7 +314,7 @@ class MediaUploader:
             raise InvalidParameterError(
                 f"{file_type.capitalize()} size exceeds maximum limit of {max_size_mb}MB",
                 details={
-                    "file_path": str(file_path),
+                    "file_path": label,
                     "file_size": file_size,
                     "max_size": max_size,
                     "actual_size_mb": f"{actual_size_mb:.2f}",
@@ -203,8 +380,9 @@ class MediaUploader:
     def upload_image(
         self,
         app_id: str,
-        image_path: str | Path,
+        image_path: MediaSource,
         image_type: Literal["message", "avatar"] = "message",
+        file_name: str | None = None,
     ) -> ImageAsset:
         """
         Upload an image to Lark servers.
@@ -213,10 +391,14 @@ class MediaUploader:
         ----------
             app_id : str
                 Lark application ID
-            image_path : str | Path
-                Path to the image file
+            image_path : MediaSource
+                Path to the image file, image bytes/memoryview, or a
+                seekable binary stream (read from its current position)
             image_type : Literal["message", "avatar"]
                 Type of image (default: "message")
+            file_name : str | None
+                Name used to validate the format of in-memory images
+                (default: path or stream name, else detected from content)
 
         Returns
         -------
@@ -237,57 +419,87 @@ class MediaUploader:
             >>> asset = uploader.upload_image("cli_xxx", "/path/to/image.jpg")
             >>> print(asset.image_key)
             img_v2_a1b2c3d4
+            >>>
+            >>> # Rendered chart, no temp file needed
+            >>> asset = uploader.upload_image("cli_xxx", buffer.getvalue())
         """
-        image_path = Path(image_path)
-
-        if not image_path.exists():
+        if isinstance(image_path, str | Path) and not Path(image_path).is_file():
             raise InvalidParameterError(
                 f"Image file not found: {image_path}",
                 details={"file_path": str(image_path)},
             )
 
-        # Validate file size
-        self._validate_file_size(image_path, MAX_IMAGE_SIZE, "image")
+        with UploadSource.open(image_path, file_name) as source:
+            label = str(source.path or source.name or "<bytes>")
+
+            # Validate file size
+            self._validate_size(source.size, MAX_IMAGE_SIZE, "image", label)
 
-        # Validate file type
-        mime_type = self._validate_file_type(image_path, SUPPORTED_IMAGE_TYPES, "image")
+            # Validate file type
+            name = source.name or f"image{guess_image_extension(source.head()) or ''}"
+            mime_type = self._validate_file_type(Path(name), SUPPORTED_IMAGE_TYPES, "image")
 
-        # Get SDK client (token is managed internally)
-        client = self.credential_pool._get_sdk_client(app_id)
+            # Return the key of identical content uploaded before
+            cache_key, cached = self._lookup_cache(app_id, "image", source, image_type)
+            if cached is not None:
+                return ImageAsset(
+                    image_key=cached.media_key,
+                    image_type=image_type,
+                    file_size=cached.file_size,
+                    upload_time=cached.uploaded_at,
+                )
 
-        # Create upload request
-        with open(image_path, "rb") as image_file:
-            request = (
-                CreateImageRequest.builder()
-                .request_body(
-                    CreateImageRequest.RequestBody.builder()
-                    .image_type(image_type)
-                    .image(image_file)
+            def create_image(**kwargs: Any) -> Any:
+                # Get SDK client (token is managed internally)
+                client = self.credential_pool._get_sdk_client(app_id)
+
+                # The SDK consumes the stream and replaces the request body
+                # with its multipart encoder, so rebuild both per attempt
+                source.rewind()
+                request = (
+                    CreateImageRequest.builder()
+                    .request_body(
+                        CreateImageRequestBody.builder()
+                        .image_type(image_type)
+                        .image(source.stream)
+                        .build()
+                    )
                     .build()
                 )
-                .build()
-            )
+                return client.im.v1.image.create(request)
 
-        # Upload with retry
-        try:
-            response = self.retry_strategy.execute(
-                lambda **kwargs: client.im.v1.image.create(request),
-                operation_name=f"upload_image_{image_path.name}",
-            )
+            # Upload with retry
+            try:
+                response = self.retry_strategy.execute(
+                    create_image,
+                    operation_name=f"upload_image_{name}",
+                )
 
-            if not response.success():
-                raise RetryableError(
-                    f"Failed to upload image: {response.msg}",
-                    details={
-                        "code": response.code,
-                        "msg": response.msg,
-                        "file_path": str(image_path),
-                    },
+                if not response.success():
+                    raise RetryableError(
+                        f"Failed to upload image: {response.msg}",
+                        details={
+                            "code": response.code,
+                            "msg": response.msg,
+                            "file_path": label,
+                        },
+                    )
+
+                # Extract image_key from response
+                image_key = response.data.image_key
+
+            except Exception as e:
+                self._finish_upload(cache_key, None)
+                logger.error(
+                    f"Failed to upload image: {e}",
+                    extra={"app_id": app_id, "file_path": label},
+                    exc_info=True,
                 )
+                raise
 
-            # Extract image_key from response
-            image_key = response.data.image_key
-            file_size = image_path.stat().st_size
+            file_size = source.size
+            upload_time = datetime.now()
+            self._finish_upload(cache_key, CachedMedia(image_key, file_size, upload_time))
 
             logger.info(
                 f"Image uploaded successfully: {image_key}",
@@ -303,22 +515,15 @@ class MediaUploader:
                 image_key=image_key,
                 image_type=image_type,
                 file_size=file_size,
-                upload_time=datetime.now(),
-            )
-
-        except Exception as e:
-            logger.error(
-                f"Failed to upload image: {e}",
-                extra={"app_id": app_id, "file_path": str(image_path)},
-                exc_info=True,
+                upload_time=upload_time,
             )
-            raise
 
     def upload_file(
         self,
         app_id: str,
-        file_path: str | Path,
+        file_path: MediaSource,
         file_type: Literal["opus", "mp4", "pdf", "doc", "xls", "ppt", "stream"] = "stream",
+        file_name: str | None = None,
     ) -> FileAsset:
         """
         Upload a file to Lark servers.
@@ -327,10 +532,14 @@ class MediaUploader:
         ----------
             app_id : str
                 Lark application ID
-            file_path : str | Path
-                Path to the file
+            file_path : MediaSource
+                Path to the file, file bytes/memoryview, or a seekable
+                binary stream (read from its current position)
             file_type : Literal["opus", "mp4", "pdf", "doc", "xls", "ppt", "stream"]
                 Type of file (default: "stream" for generic files)
+            file_name : str | None
+                Name shown in Lark (default: path or stream name; required
+                for bytes and unnamed streams)
 
         Returns
         -------
@@ -340,7 +549,7 @@ class MediaUploader:
         Raises
         ------
             InvalidParameterError
-                If file size or type is invalid
+                If file size or type is invalid, or no file name is known
             RetryableError
                 If upload fails after retries
             RequestTimeoutError
@@ -351,75 +560,112 @@ class MediaUploader:
             >>> asset = uploader.upload_file("cli_xxx", "/path/to/document.pdf")
             >>> print(asset.file_key)
             file_v2_a1b2c3d4
+            >>>
+            >>> asset = uploader.upload_file("cli_xxx", csv_bytes, file_name="report.csv")
         """
-        file_path = Path(file_path)
-
-        if not file_path.exists():
+        if isinstance(file_path, str | Path) and not Path(file_path).is_file():
             raise InvalidParameterError(
                 f"File not found: {file_path}",
                 details={"file_path": str(file_path)},
             )
 
-        # Validate file size
-        self._validate_file_size(file_path, MAX_FILE_SIZE, "file")
+        with UploadSource.open(file_path, file_name) as source:
+            if not source.name:
+                raise InvalidParameterError(
+                    "file_name is required when uploading from bytes or an unnamed stream"
+                )
+            name = source.name
+            label = str(source.path or name)
+
+            # Validate file size
+            self._validate_size(source.size, MAX_FILE_SIZE, "file", label)
+
+            # Determine file category and validate type
+            name_path = Path(name)
+            file_ext = name_path.suffix.lower()
+            if file_ext in SUPPORTED_VIDEO_TYPES:
+                mime_type = self._validate_file_type(name_path, SUPPORTED_VIDEO_TYPES, "video")
+            elif file_ext in SUPPORTED_AUDIO_TYPES:
+                mime_type = self._validate_file_type(name_path, SUPPORTED_AUDIO_TYPES, "audio")
+            elif file_ext in SUPPORTED_DOCUMENT_TYPES:
+                mime_type = self._validate_file_type(
+                    name_path, SUPPORTED_DOCUMENT_TYPES, "document"
+                )
+            else:
+                # Generic file type
+                guessed_mime = mimetypes.guess_type(name)[0]
+                mime_type = guessed_mime if guessed_mime else "application/octet-stream"
+
+            # Return the key of identical content uploaded before
+            cache_key, cached = self._lookup_cache(app_id, "file", source, f"{file_type}:{name}")
+            if cached is not None:
+                return FileAsset(
+                    file_key=cached.media_key,
+                    file_name=name,
+                    file_type=mime_type,
+                    file_size=cached.file_size,
+                    upload_time=cached.uploaded_at,
+                )
 
-        # Determine file category and validate type
-        file_ext = file_path.suffix.lower()
-        if file_ext in SUPPORTED_VIDEO_TYPES:
-            mime_type = self._validate_file_type(file_path, SUPPORTED_VIDEO_TYPES, "video")
-        elif file_ext in SUPPORTED_AUDIO_TYPES:
-            mime_type = self._validate_file_type(file_path, SUPPORTED_AUDIO_TYPES, "audio")
-        elif file_ext in SUPPORTED_DOCUMENT_TYPES:
-            mime_type = self._validate_file_type(file_path, SUPPORTED_DOCUMENT_TYPES, "document")
-        else:
-            # Generic file type
-            guessed_mime = mimetypes.guess_type(str(file_path))[0]
-            mime_type = guessed_mime if guessed_mime else "application/octet-stream"
-
-        # Get SDK client (token is managed internally)
-        client = self.credential_pool._get_sdk_client(app_id)
-
-        # Create upload request
-        with open(file_path, "rb") as file:
-            request = (
-                CreateFileRequest.builder()
-                .request_body(
-                    CreateFileRequest.RequestBody.builder()
-                    .file_type(file_type)
-                    .file_name(file_path.name)
-                    .file(file)
+            def create_file(**kwargs: Any) -> Any:
+                # Get SDK client (token is managed internally)
+                client = self.credential_pool._get_sdk_client(app_id)
+
+                # The SDK consumes the stream and replaces the request body
+                # with its multipart encoder, so rebuild both per attempt
+                source.rewind()
+                request = (
+                    CreateFileRequest.builder()
+                    .request_body(
+                        CreateFileRequestBody.builder()
+                        .file_type(file_type)
+                        .file_name(name)
+                        .file(source.stream)
+                        .build()
+                    )
                     .build()
                 )
-                .build()
-            )
+                return client.im.v1.file.create(request)
 
-        # Upload with retry
-        try:
-            response = self.retry_strategy.execute(
-                lambda **kwargs: client.im.v1.file.create(request),
-                operation_name=f"upload_file_{file_path.name}",
-            )
+            # Upload with retry
+            try:
+                response = self.retry_strategy.execute(
+                    create_file,
+                    operation_name=f"upload_file_{name}",
+                )
 
-            if not response.success():
-                raise RetryableError(
-                    f"Failed to upload file: {response.msg}",
-                    details={
-                        "code": response.code,
-                        "msg": response.msg,
-                        "file_path": str(file_path),
-                    },
+                if not response.success():
+                    raise RetryableError(
+                        f"Failed to upload file: {response.msg}",
+                        details={
+                            "code": response.code,
+                            "msg": response.msg,
+                            "file_path": label,
+                        },
+                    )
+
+                # Extract file_key from response
+                file_key = response.data.file_key
+
+            except Exception as e:
+                self._finish_upload(cache_key, None)
+                logger.error(
+                    f"Failed to upload file: {e}",
+                    extra={"app_id": app_id, "file_path": label},
+                    exc_info=True,
                 )
+                raise
 
-            # Extract file_key from response
-            file_key = response.data.file_key
-            file_size = file_path.stat().st_size
+            file_size = source.size
+            upload_time = datetime.now()
+            self._finish_upload(cache_key, CachedMedia(file_key, file_size, upload_time))
 
             logger.info(
                 f"File uploaded successfully: {file_key}",
                 extra={
                     "app_id": app_id,
                     "file_key": file_key,
-                    "file_name": file_path.name,
+                    "file_name": name,
                     "file_size": file_size,
                     "mime_type": mime_type,
                 },
@@ -427,16 +673,105 @@ class MediaUploader:
 
             return FileAsset(
                 file_key=file_key,
-                file_name=file_path.name,
+                file_name=name,
                 file_type=mime_type,
                 file_size=file_size,
-                upload_time=datetime.now(),
+                upload_time=upload_time,
             )
 
-        except Exception as e:
-            logger.error(
-                f"Failed to upload file: {e}",
-                extra={"app_id": app_id, "file_path": str(file_path)},
-                exc_info=True,
+    def upload_many(
+        self,
+        app_id: str,
+        items: Sequence[MediaSource | UploadItem],
+        kind: Literal["image", "file"] = "image",
+        max_workers: int = 4,
+    ) -> BatchUploadResponse:
+        """
+        Upload several images or files concurrently.
+
+        Items are uploaded on up to ``max_workers`` threads; a failing item
+        does not stop the others. With a cache, content uploaded before is
+        not uploaded again, and identical items in the batch are uploaded
+        only once.
+
+        Parameters
+        ----------
+            app_id : str
+                Lark application ID
+            items : Sequence[MediaSource | UploadItem]
+                Sources, or UploadItem for per-item names and types
+                (at most 100)
+            kind : Literal["image", "file"]
+                Upload items with upload_image or upload_file (default: "image")
+            max_workers : int
+                Maximum concurrent uploads (default: 4)
+
+        Returns
+        -------
+            BatchUploadResponse
+                Counts and per-item results in request order; its
+                ``media_keys`` raises if any item failed
+
+        Raises
+        ------
+            InvalidParameterError
+                If items is empty or too long, or max_workers < 1
+
+        Examples
+        --------
+            >>> response = uploader.upload_many(
+            ...     "cli_xxx", ["logo.png", chart_png_bytes, UploadItem(stream, "trend.png")]
+            ... )
+            >>> card = CardBuilder().add_images(response.media_keys).build()
+        """
+        if not items:
+            raise InvalidParameterError("Upload items list cannot be empty")
+        if len(items) > MAX_BATCH_UPLOAD:
+            raise InvalidParameterError(
+                f"Upload items list exceeds maximum limit of {MAX_BATCH_UPLOAD}",
+                details={"count": len(items), "max": MAX_BATCH_UPLOAD},
+            )
+        if max_workers < 1:
+            raise InvalidParameterError(f"Invalid max_workers: {max_workers} (>= 1)")
+
+        def upload_one(index: int, item: MediaSource | UploadItem) -> BatchUploadResult:
+            if not isinstance(item, UploadItem):
+                item = UploadItem(item)
+            try:
+                if kind == "image":
+                    image = self.upload_image(app_id, item.source, item.image_type, item.file_name)
+                    media_key, file_size = image.image_key, image.file_size
+                else:
+                    file = self.upload_file(app_id, item.source, item.file_type, item.file_name)
+                    media_key, file_size = file.file_key, file.file_size
+            except Exception as e:
+                return BatchUploadResult(index=index, status="failed", error=str(e))
+            return BatchUploadResult(
+                index=index, status="success", media_key=media_key, file_size=file_size
             )
-            raise
+
+        workers = min(max_workers, len(items))
+        if workers == 1:
+            results = [upload_one(i, item) for i, item in enumerate(items)]
+        else:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                results = list(executor.map(upload_one, range(len(items)), items))
+
+        success_count = sum(1 for r in results if r.status == "success")
+        logger.info(
+            f"Batch upload completed: {success_count} success, "
+            f"{len(results) - success_count} failed",
+            extra={
+                "app_id": app_id,
+                "kind": kind,
+                "total": len(results),
+                "max_workers": workers,
+            },
+        )
+
+        return BatchUploadResponse(
+            total=len(results),
+            success=success_count,
+            failed=len(results) - success_count,
+            results=results,
+        )
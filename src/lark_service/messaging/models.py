@@ -11,6 +11,8 @@ from typing import Any
 
 from pydantic import BaseModel, Field, field_validator
 
+from lark_service.core.exceptions import LarkServiceError
+
 
 class MessageType(StrEnum):
     """Supported message types in Lark IM API."""
@@ -204,3 +206,78 @@ class BatchSendResponse(BaseModel):
         if "results" in info.data and v != len(info.data["results"]):
             raise ValueError("total must match the number of results")
         return v
+
+
+class BatchUploadResult(BaseModel):
+    """
+    Result for a single item in a batch media upload.
+
+    Attributes
+    ----------
+        index : int
+            Position of the item in the request
+        status : str
+            Upload status ("success" or "failed")
+        media_key : Optional[str]
+            image_key or file_key if successful
+        file_size : Optional[int]
+            Uploaded size in bytes if successful
+        error : Optional[str]
+            Error message if failed
+    """
+
+    index: int = Field(..., ge=0, description="Position of the item in the request")
+    status: str = Field(..., description="Upload status (success/failed)")
+    media_key: str | None = Field(None, description="image_key or file_key if successful")
+    file_size: int | None = Field(None, description="Uploaded size in bytes")
+    error: str | None = Field(None, description="Error message if failed")
+
+
+class BatchUploadResponse(BaseModel):
+    """
+    Response for batch media upload.
+
+    Attributes
+    ----------
+        total : int
+            Total number of items
+        success : int
+            Number of successful uploads
+        failed : int
+            Number of failed uploads
+        results : list[BatchUploadResult]
+            Individual results in request order
+
+    Examples
+    --------
+        >>> response = uploader.upload_many("cli_xxx", ["a.png", "b.png"])
+        >>> builder.add_images(response.media_keys)
+    """
+
+    total: int = Field(..., ge=0, description="Total number of items")
+    success: int = Field(..., ge=0, description="Number of successful uploads")
+    failed: int = Field(..., ge=0, description="Number of failed uploads")
+    results: list[BatchUploadResult] = Field(..., description="Individual results in order")
+
+    @property
+    def media_keys(self) -> list[str]:
+        """
+        Keys of all uploads, in request order.
+
+        Raises
+        ------
+            LarkServiceError
+                If any item failed, so a partial key list is never used by
+                mistake (details list the failed indexes and errors); read
+                ``results`` to handle partial failures
+        """
+        if self.failed:
+            failures = [r for r in self.results if r.status != "success"]
+            raise LarkServiceError(
+                f"{self.failed} of {self.total} uploads failed",
+                details={
+                    "failed_indexes": [r.index for r in failures],
+                    "errors": [r.error for r in failures],
+                },
+            )
+        return [r.media_key for r in self.results if r.media_key is not None]
@@ -16,6 +16,11 @@ from lark_service.monitoring.websocket_metrics import (
     token_active_count,
     token_refresh_total,
     websocket_connection_status,
+    websocket_event_backpressure_seconds,
+    websocket_event_handler_duration_seconds,
+    websocket_event_in_flight,
+    websocket_event_queue_depth,
+    websocket_event_total,
     websocket_reconnect_total,
 )
 
@@ -24,6 +29,11 @@ __all__ = [
     "metrics",
     "websocket_connection_status",
     "websocket_reconnect_total",
+    "websocket_event_total",
+    "websocket_event_queue_depth",
+    "websocket_event_in_flight",
+    "websocket_event_handler_duration_seconds",
+    "websocket_event_backpressure_seconds",
     "auth_session_total",
     "auth_session_active",
     "auth_session_expired_total",
@@ -15,6 +15,39 @@ websocket_reconnect_total = Counter(
     ["app_id", "outcome"],
 )
 
+# WebSocket event dispatch metrics
+websocket_event_total = Counter(
+    "lark_service_websocket_event_total",
+    "Total WebSocket events by dispatch outcome",
+    ["app_id", "event_type", "outcome"],
+)
+
+websocket_event_queue_depth = Gauge(
+    "lark_service_websocket_event_queue_depth",
+    "WebSocket events waiting for a handler slot",
+    ["app_id", "event_type"],
+)
+
+websocket_event_in_flight = Gauge(
+    "lark_service_websocket_event_in_flight",
+    "WebSocket event handlers currently running",
+    ["app_id", "event_type"],
+)
+
+websocket_event_handler_duration_seconds = Histogram(
+    "lark_service_websocket_event_handler_duration_seconds",
+    "WebSocket event handler duration in seconds",
+    ["app_id", "event_type"],
+    buckets=(0.01, 0.05, 0.1, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0),
+)
+
+websocket_event_backpressure_seconds = Histogram(
+    "lark_service_websocket_event_backpressure_seconds",
+    "Time the receive thread waited for queue space",
+    ["app_id", "event_type"],
+    buckets=(0.001, 0.01, 0.05, 0.1, 0.5, 1.0, 2.5, 5.0),
+)
+
 # Auth session metrics
 auth_session_total = Counter(
     "lark_service_auth_session_total",
@@ -19,10 +19,26 @@ Example usage:
 
 from .callback_router import CallbackRouter
 from .callback_server import CallbackServer
+from .dispatcher import DeferredDispatcher
 from .manager import CallbackServerManager
+from .work_queue import (
+    InMemoryWorkQueue,
+    RabbitMQWorkQueue,
+    SQLiteWorkQueue,
+    WorkItem,
+    WorkQueue,
+    create_work_queue,
+)
 
 __all__ = [
     "CallbackRouter",
     "CallbackServer",
     "CallbackServerManager",
+    "DeferredDispatcher",
+    "InMemoryWorkQueue",
+    "RabbitMQWorkQueue",
+    "SQLiteWorkQueue",
+    "WorkItem",
+    "WorkQueue",
+    "create_work_queue",
 ]
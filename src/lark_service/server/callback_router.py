@@ -4,13 +4,31 @@ This module provides a flexible routing system for registering and dispatching
 different callback handlers based on callback type.
 """
 
-from collections.abc import Callable
+import asyncio
+import threading
+from collections.abc import Callable, Coroutine
 from typing import Any
 
 from lark_service.utils.logger import get_logger
 
 logger = get_logger()
 
+_thread_state = threading.local()
+
+
+def run_coroutine(coro: Coroutine[Any, Any, Any]) -> Any:
+    """Run a coroutine on the calling thread's reusable event loop.
+
+    Each server thread keeps one event loop for its lifetime instead of
+    creating and closing a loop per request.
+    """
+    loop: asyncio.AbstractEventLoop | None = getattr(_thread_state, "loop", None)
+    if loop is None or loop.is_closed():
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        _thread_state.loop = loop
+    return loop.run_until_complete(coro)
+
 
 class CallbackRouter:
     """Router for dispatching Feishu callbacks to registered handlers.
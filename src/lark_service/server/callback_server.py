@@ -1,21 +1,238 @@
 """HTTP server for handling Feishu callbacks.
 
-This module provides a lightweight HTTP server using Python's standard library
-http.server for receiving and processing Feishu callbacks without external
-dependencies like FastAPI or Flask.
+This module provides a lightweight HTTP server for receiving and processing
+Feishu callbacks without external frameworks like FastAPI or Flask. Four modes
+are available:
+
+- "sync": Python's standard library http.server, one request at a time
+- "async": aiohttp on one long-lived event loop; handlers are awaited
+  directly and many requests are served concurrently
+- "threaded": http.server with a bounded pool of worker threads
+- "prefork": several forked "threaded" worker processes accepting on one
+  shared listening socket (POSIX only)
+
+Any mode can defer POST callbacks to a DeferredDispatcher (see
+CallbackServer.enable_deferred): callbacks are acknowledged as soon as
+they are verified and queued, and handlers run on worker threads.
 """
 
 import asyncio
 import json
+import os
+import signal
+import socket
+import threading
+import time
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
+from email.message import Message
 from http.server import BaseHTTPRequestHandler, HTTPServer
 from typing import Any
+from urllib.parse import parse_qs, urlparse
+
+from aiohttp import web
 
 from lark_service.cardkit.callback_handler import CallbackHandler as LarkCallbackHandler
-from lark_service.server.callback_router import CallbackRouter
+from lark_service.cardkit.models import CallbackCheck
+from lark_service.core.exceptions import InvalidParameterError, QueueFullError
+from lark_service.server.callback_router import CallbackRouter, run_coroutine
+from lark_service.server.dispatcher import DeferredDispatcher
+from lark_service.server.work_queue import WorkQueue
 from lark_service.utils.logger import get_logger
 
 logger = get_logger()
 
+# Supported CallbackServer modes
+SERVER_MODES = ("sync", "async", "threaded", "prefork")
+
+# Worker threads per process in "threaded" and "prefork" modes
+DEFAULT_MAX_WORKERS = 32
+
+# Pause before replacing a prefork worker that exited unexpectedly
+PREFORK_RESPAWN_DELAY = 1.0
+
+# Feishu waits 3 seconds for a card callback response; answer before that
+DEFAULT_RESPONSE_TIMEOUT = 2.5
+
+OAUTH_MISSING_PARAMS_HTML = "<h1>授权失败</h1><p>缺少必需参数</p>"
+OAUTH_SUCCESS_HTML = "<h1>授权成功！</h1><p>您可以关闭此页面，返回飞书查看授权状态。</p>"
+
+_HTML_PAGE = """
+<!DOCTYPE html>
+<html>
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>飞书授权</title>
+    <style>
+        body {{
+            font-family: -apple-system, BlinkMacSystemFont, "Segoe UI", Roboto, "Helvetica Neue", Arial, sans-serif;
+            display: flex;
+            justify-content: center;
+            align-items: center;
+            min-height: 100vh;
+            margin: 0;
+            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+        }}
+        .container {{
+            background: white;
+            padding: 2rem;
+            border-radius: 10px;
+            box-shadow: 0 10px 40px rgba(0,0,0,0.2);
+            text-align: center;
+            max-width: 500px;
+        }}
+        h1 {{
+            color: #333;
+            margin-bottom: 1rem;
+        }}
+        p {{
+            color: #666;
+            line-height: 1.6;
+        }}
+    </style>
+</head>
+<body>
+    <div class="container">
+        {html}
+    </div>
+</body>
+</html>
+        """
+
+
+class PooledHTTPServer(HTTPServer):
+    """HTTPServer that handles requests on a bounded thread pool.
+
+    At most ``max_workers`` requests are processed at once. When all
+    workers are busy the accept loop waits for a free slot, so excess
+    connections queue in the kernel listen backlog instead of spawning
+    unbounded threads.
+    """
+
+    def __init__(
+        self,
+        server_address: tuple[str, int],
+        handler_class: type[BaseHTTPRequestHandler],
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        bind_and_activate: bool = True,
+    ) -> None:
+        super().__init__(server_address, handler_class, bind_and_activate)
+        self.max_workers = max_workers
+        self._slots = threading.BoundedSemaphore(max_workers)
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="CallbackWorker"
+        )
+
+    def get_request(self) -> tuple[socket.socket, Any]:
+        """Accept a connection as a blocking socket.
+
+        The listening socket is non-blocking in prefork mode, where several
+        processes race to accept the same connection.
+        """
+        request, client_address = self.socket.accept()
+        request.setblocking(True)
+        return request, client_address
+
+    def process_request(self, request: Any, client_address: Any) -> None:
+        """Hand the request to a worker thread, waiting for a free slot."""
+        self._slots.acquire()
+        try:
+            self._executor.submit(self._process_in_worker, request, client_address)
+        except RuntimeError:
+            self._slots.release()
+            self.shutdown_request(request)
+
+    def _process_in_worker(self, request: Any, client_address: Any) -> None:
+        try:
+            self.finish_request(request, client_address)
+        except Exception:
+            self.handle_error(request, client_address)
+        finally:
+            self.shutdown_request(request)
+            self._slots.release()
+
+    def server_close(self) -> None:
+        """Close the socket and wait for in-flight requests."""
+        super().server_close()
+        self._executor.shutdown(wait=True)
+
+
+def render_html_page(html: str) -> str:
+    """Wrap an HTML fragment in the authorization result page."""
+    return _HTML_PAGE.format(html=html)
+
+
+def health_payload(router: CallbackRouter) -> dict[str, Any]:
+    """Build the health check response body."""
+    return {
+        "status": "ok",
+        "message": "Lark Callback Server is running",
+        "registered_handlers": router.list_handlers(),
+    }
+
+
+def oauth_callback_data(code: str, state: str) -> dict[str, Any]:
+    """Transform OAuth redirect query parameters into a routable callback."""
+    return {
+        "type": "oauth_redirect",
+        "authorization_code": code,
+        "state": state,
+        "session_id": state,
+    }
+
+
+def signature_headers(
+    headers: Message | Mapping[str, str],
+) -> tuple[str | None, str | None, str | None]:
+    """Return the (timestamp, nonce, signature) request headers."""
+    return (
+        headers.get("X-Lark-Request-Timestamp"),
+        headers.get("X-Lark-Request-Nonce"),
+        headers.get("X-Lark-Signature"),
+    )
+
+
+def rejected_callback_response(check: CallbackCheck) -> dict[str, Any]:
+    """Return the response to a request that failed ``check_request``.
+
+    Duplicates are acknowledged like accepted callbacks (no card update),
+    so Feishu stops redelivering them.
+    """
+    if check is CallbackCheck.DUPLICATE:
+        return {}
+    if check is CallbackCheck.EXPIRED:
+        return {"error": "Request timestamp expired", "status": "error"}
+    return {"error": "Invalid signature", "status": "error"}
+
+
+def precheck_callback(
+    lark_callback_handler: LarkCallbackHandler,
+    request_data: dict[str, Any],
+) -> dict[str, Any] | None:
+    """Answer URL verification requests.
+
+    Signatures, timestamps and replays are checked on the raw body by
+    ``LarkCallbackHandler.check_request`` before it is parsed.
+
+    Parameters
+    ----------
+        lark_callback_handler: Handler used for verification
+        request_data: Callback data from Feishu
+
+    Returns
+    -------
+        dict | None: Response to send without routing, or None to route
+    """
+    if request_data.get("type") == "url_verification":
+        logger.info("Handling URL verification request")
+        return lark_callback_handler.handle_url_verification(
+            challenge=request_data.get("challenge", ""),
+            token=request_data.get("token", ""),
+        )
+
+    return None
+
 
 class CallbackRequestHandler(BaseHTTPRequestHandler):
     """HTTP request handler for Feishu callbacks.
@@ -27,25 +244,17 @@ class CallbackRequestHandler(BaseHTTPRequestHandler):
     # Class variables set by CallbackServer
     router: CallbackRouter
     lark_callback_handler: LarkCallbackHandler
+    dispatcher: DeferredDispatcher | None = None
 
     def do_GET(self) -> None:  # noqa: N802
         """Handle GET requests (health check and OAuth redirect)."""
-        from urllib.parse import parse_qs, urlparse
-
         parsed_url = urlparse(self.path)
         path = parsed_url.path
         query_params = parse_qs(parsed_url.query)
 
         # Health check endpoint
         if path == "/" or path == "/health":
-            self._send_json_response(
-                200,
-                {
-                    "status": "ok",
-                    "message": "Lark Callback Server is running",
-                    "registered_handlers": self.router.list_handlers(),
-                },
-            )
+            self._send_json_response(200, health_payload(self.router))
             return
 
         # OAuth redirect callback endpoint
@@ -63,34 +272,18 @@ class CallbackRequestHandler(BaseHTTPRequestHandler):
             )
 
             if not code or not state:
-                self._send_html_response(
-                    400,
-                    "<h1>授权失败</h1><p>缺少必需参数</p>",
-                )
+                self._send_html_response(400, OAUTH_MISSING_PARAMS_HTML)
                 return
 
             # Transform to callback format and route to handler
             try:
-                callback_data = {
-                    "type": "oauth_redirect",
-                    "authorization_code": code,
-                    "state": state,
-                    "session_id": state,
-                }
+                callback_data = oauth_callback_data(code, state)
 
                 # Route to handler
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-                try:
-                    _ = loop.run_until_complete(self.router.route(callback_data))
+                run_coroutine(self.router.route(callback_data))
 
-                    # Send success HTML page
-                    self._send_html_response(
-                        200,
-                        "<h1>授权成功！</h1><p>您可以关闭此页面，返回飞书查看授权状态。</p>",
-                    )
-                finally:
-                    loop.close()
+                # Send success HTML page
+                self._send_html_response(200, OAUTH_SUCCESS_HTML)
 
             except Exception as e:
                 logger.error(f"Failed to process OAuth callback: {e}", exc_info=True)
@@ -105,16 +298,22 @@ class CallbackRequestHandler(BaseHTTPRequestHandler):
 
     def do_POST(self) -> None:  # noqa: N802
         """Handle POST requests (callback endpoints)."""
+        timestamp, nonce, signature = signature_headers(self.headers)
+        request_body = b""
         try:
             # Read request body
             content_length = int(self.headers.get("Content-Length", 0))
-            request_body = self.rfile.read(content_length).decode("utf-8")
-            request_data = json.loads(request_body)
+            request_body = self.rfile.read(content_length)
+
+            # Drop replays and bad signatures before parsing
+            check = self.lark_callback_handler.check_request(
+                request_body, timestamp, nonce, signature
+            )
+            if check is not CallbackCheck.ACCEPTED:
+                self._send_json_response(200, rejected_callback_response(check))
+                return
 
-            # Extract headers for signature verification
-            timestamp = self.headers.get("X-Lark-Request-Timestamp")
-            nonce = self.headers.get("X-Lark-Request-Nonce")
-            signature = self.headers.get("X-Lark-Signature")
+            request_data = json.loads(request_body)
 
             logger.info(
                 "Received callback request",
@@ -126,7 +325,7 @@ class CallbackRequestHandler(BaseHTTPRequestHandler):
             )
 
             # Route to appropriate handler
-            response = self._handle_callback(request_data, timestamp, nonce, signature)
+            response = self._handle_callback(request_data)
 
             self._send_json_response(200, response)
 
@@ -134,55 +333,40 @@ class CallbackRequestHandler(BaseHTTPRequestHandler):
             logger.error(f"Invalid JSON in request body: {e}")
             self._send_json_response(400, {"error": "Invalid JSON"})
 
+        except QueueFullError:
+            # Feishu redelivers events answered with a non-200 status
+            self.lark_callback_handler.forget_request(request_body, timestamp, nonce, signature)
+            self._send_json_response(503, {"error": "Callback queue is full"})
+
         except Exception as e:
             logger.error(f"Error processing callback: {e}", exc_info=True)
+            self.lark_callback_handler.forget_request(request_body, timestamp, nonce, signature)
             self._send_json_response(500, {"error": "Internal server error"})
 
-    def _handle_callback(
-        self,
-        request_data: dict[str, Any],
-        timestamp: str | None,
-        nonce: str | None,
-        signature: str | None,
-    ) -> dict[str, Any]:
-        """Handle callback logic with signature verification.
+    def _handle_callback(self, request_data: dict[str, Any]) -> dict[str, Any]:
+        """Handle a verified callback.
 
         Parameters
         ----------
             request_data: Callback data from Feishu
-            timestamp: Request timestamp header
-            nonce: Request nonce header
-            signature: Request signature header
 
         Returns
         -------
             dict: Response to send back to Feishu
         """
-        callback_type = request_data.get("type")
-
-        # Handle URL verification (no signature verification needed)
-        if callback_type == "url_verification":
-            logger.info("Handling URL verification request")
-            return self.lark_callback_handler.handle_url_verification(
-                challenge=request_data.get("challenge", ""),
-                token=request_data.get("token", ""),
-            )
+        early_response = precheck_callback(self.lark_callback_handler, request_data)
+        if early_response is not None:
+            return early_response
 
-        # Verify signature for other callback types
-        if signature and timestamp and nonce:
-            body = json.dumps(request_data, separators=(",", ":"))
-            if not self.lark_callback_handler.verify_signature(timestamp, nonce, body, signature):
-                logger.warning("Signature verification failed")
-                return {"error": "Invalid signature", "status": "error"}
+        # Acknowledge now and process later
+        if self.dispatcher is not None:
+            ack = self.dispatcher.submit(request_data)
+            if ack is not None:
+                return ack
 
         # Route to registered handler
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        try:
-            response = loop.run_until_complete(self.router.route(request_data))
-            return response
-        finally:
-            loop.close()
+        response: dict[str, Any] = run_coroutine(self.router.route(request_data))
+        return response
 
     def _send_json_response(self, status_code: int, data: dict[str, Any]) -> None:
         """Send JSON response.
@@ -208,55 +392,171 @@ class CallbackRequestHandler(BaseHTTPRequestHandler):
         self.send_response(status_code)
         self.send_header("Content-type", "text/html; charset=utf-8")
         self.end_headers()
-        html_page = f"""
-<!DOCTYPE html>
-<html>
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>飞书授权</title>
-    <style>
-        body {{
-            font-family: -apple-system, BlinkMacSystemFont, "Segoe UI", Roboto, "Helvetica Neue", Arial, sans-serif;
-            display: flex;
-            justify-content: center;
-            align-items: center;
-            min-height: 100vh;
-            margin: 0;
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-        }}
-        .container {{
-            background: white;
-            padding: 2rem;
-            border-radius: 10px;
-            box-shadow: 0 10px 40px rgba(0,0,0,0.2);
-            text-align: center;
-            max-width: 500px;
-        }}
-        h1 {{
-            color: #333;
-            margin-bottom: 1rem;
-        }}
-        p {{
-            color: #666;
-            line-height: 1.6;
-        }}
-    </style>
-</head>
-<body>
-    <div class="container">
-        {html}
-    </div>
-</body>
-</html>
-        """
-        self.wfile.write(html_page.encode("utf-8"))
+        self.wfile.write(render_html_page(html).encode("utf-8"))
 
     def log_message(self, format: str, *args: Any) -> None:  # noqa: A002
         """Override to use our logger instead of stderr."""
         logger.info(format % args)
 
 
+class AsyncCallbackApp:
+    """aiohttp request handlers for the "async" server mode.
+
+    All requests share the event loop the application runs on, and
+    CallbackRouter handlers are awaited directly. POST callbacks that take
+    longer than ``response_timeout`` are answered with an empty JSON object
+    (no card update) while the handler keeps running in the background, so
+    Feishu's 3-second window is met even when a handler is slow.
+
+    Attributes
+    ----------
+        router: CallbackRouter instance for routing callbacks
+        lark_callback_handler: LarkCallbackHandler for verification
+        response_timeout: Seconds to wait for a handler before answering
+            (None waits indefinitely)
+        dispatcher: Optional DeferredDispatcher for acknowledge-then-process
+    """
+
+    def __init__(
+        self,
+        router: CallbackRouter,
+        lark_callback_handler: LarkCallbackHandler,
+        response_timeout: float | None = DEFAULT_RESPONSE_TIMEOUT,
+        dispatcher: DeferredDispatcher | None = None,
+    ) -> None:
+        """Initialize async callback application.
+
+        Parameters
+        ----------
+            router: CallbackRouter instance for routing callbacks
+            lark_callback_handler: LarkCallbackHandler for verification
+            response_timeout: Seconds to wait for a handler before answering
+            dispatcher: Optional DeferredDispatcher for acknowledge-then-process
+        """
+        self.router = router
+        self.lark_callback_handler = lark_callback_handler
+        self.response_timeout = response_timeout
+        self.dispatcher = dispatcher
+        self._background: set[asyncio.Task[dict[str, Any]]] = set()
+
+    def build(self) -> web.Application:
+        """Create the aiohttp application with all routes."""
+        app = web.Application()
+        app.router.add_get("/", self.handle_health)
+        app.router.add_get("/health", self.handle_health)
+        app.router.add_get("/callback", self.handle_oauth_redirect)
+        app.router.add_get("/{tail:.*}", self.handle_not_found)
+        app.router.add_post("/{tail:.*}", self.handle_callback)
+        return app
+
+    async def handle_health(self, request: web.Request) -> web.Response:
+        """Handle health check requests."""
+        return web.json_response(health_payload(self.router))
+
+    async def handle_not_found(self, request: web.Request) -> web.Response:
+        """Answer unknown GET paths."""
+        return web.json_response({"error": "Not found"}, status=404)
+
+    async def handle_oauth_redirect(self, request: web.Request) -> web.Response:
+        """Handle OAuth redirect callbacks."""
+        code = request.query.get("code")
+        state = request.query.get("state")  # state = session_id
+
+        logger.info(
+            "Received OAuth redirect callback",
+            extra={"has_code": bool(code), "session_id": state},
+        )
+
+        if not code or not state:
+            return self._html_response(400, OAUTH_MISSING_PARAMS_HTML)
+
+        try:
+            await self.router.route(oauth_callback_data(code, state))
+        except Exception as e:
+            logger.error(f"Failed to process OAuth callback: {e}", exc_info=True)
+            return self._html_response(500, f"<h1>授权处理失败</h1><p>{str(e)}</p>")
+
+        return self._html_response(200, OAUTH_SUCCESS_HTML)
+
+    async def handle_callback(self, request: web.Request) -> web.Response:
+        """Handle POST callbacks (card actions, events)."""
+        request_body = await request.read()
+        timestamp, nonce, signature = signature_headers(request.headers)
+
+        # Drop replays and bad signatures before parsing
+        check = self.lark_callback_handler.check_request(request_body, timestamp, nonce, signature)
+        if check is not CallbackCheck.ACCEPTED:
+            return web.json_response(rejected_callback_response(check))
+
+        try:
+            request_data = json.loads(request_body)
+
+            logger.info(
+                "Received callback request",
+                extra={
+                    "path": request.path,
+                    "type": request_data.get("type"),
+                    "has_signature": bool(signature),
+                },
+            )
+
+            response = precheck_callback(self.lark_callback_handler, request_data)
+            if response is None and self.dispatcher is not None:
+                # Durable queues may block; keep the event loop free
+                response = await asyncio.to_thread(self.dispatcher.submit, request_data)
+            if response is None:
+                response = await self._route_within_deadline(request_data)
+
+            return web.json_response(response)
+
+        except json.JSONDecodeError as e:
+            logger.error(f"Invalid JSON in request body: {e}")
+            return web.json_response({"error": "Invalid JSON"}, status=400)
+
+        except QueueFullError:
+            self.lark_callback_handler.forget_request(request_body, timestamp, nonce, signature)
+            return web.json_response({"error": "Callback queue is full"}, status=503)
+
+        except Exception as e:
+            logger.error(f"Error processing callback: {e}", exc_info=True)
+            self.lark_callback_handler.forget_request(request_body, timestamp, nonce, signature)
+            return web.json_response({"error": "Internal server error"}, status=500)
+
+    async def _route_within_deadline(self, request_data: dict[str, Any]) -> dict[str, Any]:
+        """Route a callback, answering with {} if the handler is too slow."""
+        task = asyncio.create_task(self.router.route(request_data))
+        if self.response_timeout is None:
+            return await task
+
+        try:
+            return await asyncio.wait_for(asyncio.shield(task), self.response_timeout)
+        except TimeoutError:
+            self._background.add(task)
+            task.add_done_callback(self._background.discard)
+            logger.warning(
+                "Callback handler exceeded response timeout, continuing in background",
+                extra={
+                    "type": request_data.get("type"),
+                    "timeout": self.response_timeout,
+                },
+            )
+            return {}
+
+    async def drain(self) -> None:
+        """Wait for handlers still running in the background to finish."""
+        if self._background:
+            await asyncio.gather(*self._background, return_exceptions=True)
+
+    @staticmethod
+    def _html_response(status_code: int, html: str) -> web.Response:
+        return web.Response(
+            status=status_code,
+            text=render_html_page(html),
+            content_type="text/html",
+            charset="utf-8",
+        )
+
+
 class CallbackServer:
     """HTTP callback server for Feishu.
 
@@ -269,6 +569,11 @@ class CallbackServer:
         port: Server port
         router: CallbackRouter instance for routing callbacks
         lark_callback_handler: LarkCallbackHandler for verification
+        mode: "sync", "async", "threaded" or "prefork"
+        response_timeout: Async mode deadline for callback handlers
+        max_workers: Worker threads per process ("threaded"/"prefork")
+        processes: Worker processes ("prefork")
+        dispatcher: DeferredDispatcher when deferred processing is enabled
 
     Example
     ----------
@@ -287,6 +592,14 @@ class CallbackServer:
         >>>
         >>> # Start server
         >>> server.start()
+        >>>
+        >>> # Serve concurrent callbacks on one event loop
+        >>> server = CallbackServer("0.0.0.0", 8080, "v_xxx", mode="async")
+        >>>
+        >>> # One process per core, 16 worker threads each
+        >>> server = CallbackServer(
+        ...     "0.0.0.0", 8080, "v_xxx", mode="prefork", max_workers=16
+        ... )
     """
 
     def __init__(
@@ -295,6 +608,10 @@ class CallbackServer:
         port: int,
         verification_token: str,
         encrypt_key: str | None = None,
+        mode: str = "sync",
+        response_timeout: float | None = DEFAULT_RESPONSE_TIMEOUT,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        processes: int | None = None,
     ) -> None:
         """Initialize callback server.
 
@@ -304,9 +621,34 @@ class CallbackServer:
             port: Server port (e.g., 8080)
             verification_token: Lark verification token
             encrypt_key: Optional encryption key for signature verification
+            mode: "sync" (default), "async", "threaded" or "prefork"
+            response_timeout: Async mode only; seconds to wait for a POST
+                handler before answering with {} (None waits indefinitely)
+            max_workers: Threaded/prefork modes; concurrent requests per
+                process
+            processes: Prefork mode; worker processes (defaults to the CPU
+                count). Handlers are inherited through fork(), so database
+                connections should be opened lazily in each worker.
         """
+        if mode not in SERVER_MODES:
+            raise InvalidParameterError(
+                f"mode must be one of {', '.join(SERVER_MODES)}, got '{mode}'"
+            )
+        if response_timeout is not None and response_timeout <= 0:
+            raise InvalidParameterError("response_timeout must be positive")
+        if max_workers < 1:
+            raise InvalidParameterError("max_workers must be at least 1")
+        if processes is not None and processes < 1:
+            raise InvalidParameterError("processes must be at least 1")
+        if mode == "prefork" and not hasattr(os, "fork"):
+            raise InvalidParameterError("prefork mode requires os.fork (POSIX)")
+
         self.host = host
         self.port = port
+        self.mode = mode
+        self.response_timeout = response_timeout
+        self.max_workers = max_workers
+        self.processes = processes or os.cpu_count() or 1
 
         # Initialize router and callback handler
         self.router = CallbackRouter()
@@ -318,8 +660,14 @@ class CallbackServer:
         # Set class variables for request handler
         CallbackRequestHandler.router = self.router
         CallbackRequestHandler.lark_callback_handler = self.lark_callback_handler
+        CallbackRequestHandler.dispatcher = None
 
+        self.dispatcher: DeferredDispatcher | None = None
         self._httpd: HTTPServer | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._stop_event: asyncio.Event | None = None
+        self._children: set[int] = set()
+        self._stopping = threading.Event()
 
     def register_handler(
         self,
@@ -341,6 +689,40 @@ class CallbackServer:
         """
         self.router.register(callback_type, handler)
 
+    def enable_deferred(
+        self,
+        queue: WorkQueue | None = None,
+        **options: Any,
+    ) -> DeferredDispatcher:
+        """Acknowledge POST callbacks immediately and process them from a queue.
+
+        Verified callbacks are deduplicated, queued and answered with ``{}``;
+        worker threads started with the server run the handlers and retry
+        failures. Handlers of deferred types cannot return a card update in
+        the HTTP response; limit deferral with ``deferred_types``.
+
+        Parameters
+        ----------
+            queue: WorkQueue backend (default: InMemoryWorkQueue)
+            **options: DeferredDispatcher options (workers, max_attempts,
+                retry_delay, deferred_types, ...)
+
+        Returns
+        -------
+            DeferredDispatcher: The dispatcher (also available as .dispatcher)
+
+        Example
+        ----------
+            >>> from lark_service.server.work_queue import SQLiteWorkQueue
+            >>> server.enable_deferred(
+            ...     SQLiteWorkQueue("data/callback_queue.db"),
+            ...     deferred_types={"card_action_trigger"},
+            ... )
+        """
+        self.dispatcher = DeferredDispatcher(self.router, queue, **options)
+        CallbackRequestHandler.dispatcher = self.dispatcher
+        return self.dispatcher
+
     def start(self) -> None:
         """Start the HTTP server.
 
@@ -350,22 +732,131 @@ class CallbackServer:
         ----------
             >>> server.start()  # Server runs until interrupted
         """
-        server_address = (self.host, self.port)
-        self._httpd = HTTPServer(server_address, CallbackRequestHandler)
-
         logger.info(
             f"Starting Lark Callback Server on {self.host}:{self.port}",
-            extra={"host": self.host, "port": self.port},
+            extra={"host": self.host, "port": self.port, "mode": self.mode},
         )
         logger.info(f"Callback endpoint: http://{self.host}:{self.port}/callback")
         logger.info(f"Health check: http://{self.host}:{self.port}/health")
         logger.info(f"Registered handlers: {', '.join(self.router.list_handlers()) or 'None'}")
 
+        if self.mode == "async":
+            try:
+                asyncio.run(self.serve_async())
+            except KeyboardInterrupt:
+                logger.info("Shutting down server...")
+            return
+
+        self._stopping.clear()
+        server_address = (self.host, self.port)
+        if self.mode == "prefork":
+            self._serve_prefork()
+            return
+
+        if self.dispatcher is not None:
+            self.dispatcher.start()
+
+        if self.mode == "threaded":
+            self._httpd = PooledHTTPServer(server_address, CallbackRequestHandler, self.max_workers)
+        else:
+            self._httpd = HTTPServer(server_address, CallbackRequestHandler)
+
         try:
             self._httpd.serve_forever()
         except KeyboardInterrupt:
             logger.info("Shutting down server...")
             self.stop()
+        finally:
+            self._httpd.server_close()
+
+    def _serve_prefork(self) -> None:
+        """Bind once, fork worker processes and replace any that die."""
+        httpd = PooledHTTPServer((self.host, self.port), CallbackRequestHandler, self.max_workers)
+        # Workers race to accept; losers must not block in accept()
+        httpd.socket.setblocking(False)
+
+        logger.info(
+            f"Starting {self.processes} worker processes",
+            extra={"processes": self.processes, "max_workers": self.max_workers},
+        )
+        try:
+            for _ in range(self.processes):
+                self._fork_worker(httpd)
+            while self._children:
+                try:
+                    pid, status = os.wait()
+                except ChildProcessError:
+                    break
+                except KeyboardInterrupt:
+                    logger.info("Shutting down server...")
+                    self.stop()
+                    continue
+                self._children.discard(pid)
+                if not self._stopping.is_set():
+                    logger.warning(
+                        f"Worker process {pid} exited unexpectedly, restarting",
+                        extra={"pid": pid, "status": status},
+                    )
+                    time.sleep(PREFORK_RESPAWN_DELAY)
+                    self._fork_worker(httpd)
+        finally:
+            self._children.clear()
+            httpd.socket.close()
+
+    def _fork_worker(self, httpd: PooledHTTPServer) -> None:
+        """Fork one worker process serving the shared socket."""
+        pid = os.fork()
+        if pid:
+            self._children.add(pid)
+            return
+
+        exit_code = 0
+        try:
+            # The parent handles Ctrl+C and forwards SIGTERM
+            signal.signal(signal.SIGINT, signal.SIG_IGN)
+            signal.signal(
+                signal.SIGTERM,
+                lambda signum, frame: threading.Thread(target=httpd.shutdown).start(),
+            )
+            # Threads do not survive fork(); each worker runs its own
+            if self.dispatcher is not None:
+                self.dispatcher.start()
+            httpd.serve_forever()
+            httpd.server_close()
+            if self.dispatcher is not None:
+                self.dispatcher.stop()
+        except BaseException:
+            logger.error("Callback worker process failed", exc_info=True)
+            exit_code = 1
+        finally:
+            os._exit(exit_code)
+
+    async def serve_async(self) -> None:
+        """Serve callbacks with aiohttp on the running event loop.
+
+        Returns after stop() is called. Use this directly to embed the
+        server in an application that already runs an event loop.
+        """
+        self._loop = asyncio.get_running_loop()
+        self._stop_event = asyncio.Event()
+
+        if self.dispatcher is not None:
+            self.dispatcher.start()
+
+        app = AsyncCallbackApp(
+            self.router, self.lark_callback_handler, self.response_timeout, self.dispatcher
+        )
+        runner = web.AppRunner(app.build(), access_log=None)
+        await runner.setup()
+        try:
+            site = web.TCPSite(runner, self.host, self.port)
+            await site.start()
+            await self._stop_event.wait()
+        finally:
+            await runner.cleanup()
+            await app.drain()
+            self._loop = None
+            self._stop_event = None
 
     def stop(self) -> None:
         """Stop the HTTP server.
@@ -374,6 +865,22 @@ class CallbackServer:
         ----------
             >>> server.stop()
         """
+        self._stopping.set()
+
         if self._httpd:
             self._httpd.shutdown()
             logger.info("Server stopped")
+
+        for pid in list(self._children):
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                self._children.discard(pid)
+
+        loop, stop_event = self._loop, self._stop_event
+        if loop is not None and stop_event is not None:
+            loop.call_soon_threadsafe(stop_event.set)
+            logger.info("Server stopped")
+
+        if self.dispatcher is not None:
+            self.dispatcher.stop()
@@ -0,0 +1,240 @@
+"""Acknowledge-then-process dispatching of callbacks.
+
+DeferredDispatcher lets the callback server answer Feishu immediately:
+a verified callback is deduplicated, stored in a WorkQueue and
+acknowledged, and worker threads run the CallbackRouter handler later,
+retrying failures with exponential backoff. Callback latency no longer
+depends on handler cost (Feishu API calls, token exchange, ...).
+"""
+
+import hashlib
+import json
+import threading
+from typing import Any
+
+from lark_service.core.exceptions import InvalidParameterError, QueueFullError
+from lark_service.server.callback_router import CallbackRouter, run_coroutine
+from lark_service.server.work_queue import InMemoryWorkQueue, WorkItem, WorkQueue
+from lark_service.utils.logger import get_logger
+from lark_service.utils.ttl_set import TTLSet
+
+logger = get_logger()
+
+
+def callback_id(callback_data: dict[str, Any]) -> str:
+    """Return a stable ID of a callback for deduplication.
+
+    Uses ``header.event_id`` (v2 events and card actions), then top-level
+    ``event_id``/``uuid``, and falls back to a digest of the body.
+    """
+    header = callback_data.get("header")
+    if isinstance(header, dict) and header.get("event_id"):
+        return str(header["event_id"])
+    for key in ("event_id", "uuid"):
+        if callback_data.get(key):
+            return str(callback_data[key])
+    body = json.dumps(callback_data, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return hashlib.sha256(body.encode("utf-8")).hexdigest()
+
+
+class DeferredDispatcher:
+    """Queue callbacks on receipt and process them on worker threads.
+
+    Attributes
+    ----------
+        router: CallbackRouter whose handlers process the items
+        queue: WorkQueue backend
+        workers: Number of worker threads
+        max_attempts: Attempts per item before it is dead-lettered
+        retry_delay: Delay before the first retry (doubles per attempt)
+        max_retry_delay: Upper bound of the retry delay
+        deferred_types: Callback types to defer (None defers every type)
+        ack_response: Body returned to Feishu for accepted callbacks
+
+    Example
+    ----------
+        >>> dispatcher = DeferredDispatcher(router, SQLiteWorkQueue("data/queue.db"))
+        >>> dispatcher.start()
+        >>> dispatcher.submit({"type": "card_action_trigger", ...})
+        {}
+    """
+
+    def __init__(
+        self,
+        router: CallbackRouter,
+        queue: WorkQueue | None = None,
+        workers: int = 4,
+        max_attempts: int = 3,
+        retry_delay: float = 1.0,
+        max_retry_delay: float = 60.0,
+        dedup_ttl: float = 600.0,
+        dedup_max_size: int = 100_000,
+        deferred_types: set[str] | None = None,
+        ack_response: dict[str, Any] | None = None,
+    ) -> None:
+        """Initialize dispatcher.
+
+        Parameters
+        ----------
+            router: CallbackRouter whose handlers process the items
+            queue: WorkQueue backend (defaults to an InMemoryWorkQueue)
+            workers: Number of worker threads
+            max_attempts: Attempts per item before it is dead-lettered
+            retry_delay: Delay before the first retry in seconds
+            max_retry_delay: Upper bound of the retry delay in seconds
+            dedup_ttl: Seconds a callback ID is remembered in-process
+            dedup_max_size: Maximum remembered callback IDs
+            deferred_types: Callback types to defer (None defers all)
+            ack_response: Body returned for accepted callbacks (default {})
+        """
+        if workers < 1:
+            raise InvalidParameterError("workers must be at least 1")
+        if max_attempts < 1:
+            raise InvalidParameterError("max_attempts must be at least 1")
+
+        self.router = router
+        self.queue = queue or InMemoryWorkQueue()
+        self.workers = workers
+        self.max_attempts = max_attempts
+        self.retry_delay = retry_delay
+        self.max_retry_delay = max_retry_delay
+        self.deferred_types = deferred_types
+        self.ack_response = ack_response or {}
+
+        self._seen = TTLSet(ttl_seconds=dedup_ttl, max_size=dedup_max_size)
+        self._threads: list[threading.Thread] = []
+        self._stopping = threading.Event()
+        self._stats_lock = threading.Lock()
+        self._stats = dict.fromkeys(
+            ("accepted", "duplicates", "rejected", "processed", "retried", "failed"), 0
+        )
+
+    def _count(self, name: str) -> None:
+        with self._stats_lock:
+            self._stats[name] += 1
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """Counters plus the current queue depth."""
+        with self._stats_lock:
+            stats = dict(self._stats)
+        stats["queued"] = self.queue.qsize()
+        return stats
+
+    def is_running(self) -> bool:
+        """Return True while worker threads are running."""
+        return any(thread.is_alive() for thread in self._threads)
+
+    def submit(self, callback_data: dict[str, Any]) -> dict[str, Any] | None:
+        """Deduplicate and enqueue a verified callback.
+
+        Parameters
+        ----------
+            callback_data: Callback data from Feishu
+
+        Returns
+        -------
+            dict | None: Acknowledgement to send, or None if this callback
+            type is not deferred and must be routed inline
+
+        Raises
+        ------
+            QueueFullError: If the queue is at capacity
+        """
+        callback_type = callback_data.get("type")
+        if not callback_type:
+            return None
+        if self.deferred_types is not None and callback_type not in self.deferred_types:
+            return None
+
+        item_id = callback_id(callback_data)
+        if not self._seen.add(item_id):
+            self._count("duplicates")
+            logger.info(
+                "Duplicate callback ignored",
+                extra={"callback_type": callback_type, "callback_id": item_id},
+            )
+            return dict(self.ack_response)
+
+        try:
+            accepted = self.queue.put(WorkItem(item_id, callback_type, callback_data))
+        except QueueFullError:
+            # Let Feishu's redelivery through once there is room again
+            self._seen.discard(item_id)
+            self._count("rejected")
+            logger.warning(
+                "Callback queue full, rejecting callback",
+                extra={"callback_type": callback_type, "callback_id": item_id},
+            )
+            raise
+
+        self._count("accepted" if accepted else "duplicates")
+        return dict(self.ack_response)
+
+    def start(self) -> None:
+        """Start worker threads (no-op if already running)."""
+        if self.is_running():
+            return
+        self._stopping.clear()
+        self._threads = [
+            threading.Thread(target=self._worker_loop, name=f"CallbackQueueWorker-{i}", daemon=True)
+            for i in range(self.workers)
+        ]
+        for thread in self._threads:
+            thread.start()
+        logger.info("Deferred callback workers started", extra={"workers": self.workers})
+
+    def stop(self, timeout: float = 10.0) -> None:
+        """Stop worker threads after their current item."""
+        self._stopping.set()
+        for thread in self._threads:
+            thread.join(timeout)
+        self._threads = []
+
+    def _worker_loop(self) -> None:
+        while not self._stopping.is_set():
+            try:
+                item = self.queue.get(timeout=0.5)
+            except Exception as e:
+                logger.error(f"Failed to fetch queued callback: {e}", exc_info=True)
+                self._stopping.wait(1.0)
+                continue
+            if item is not None:
+                self.process(item)
+        self.queue.close()
+
+    def process(self, item: WorkItem) -> None:
+        """Run the handler for one claimed item and settle it in the queue."""
+        handler = self.router.handlers.get(item.callback_type)
+        if handler is None:
+            logger.error(
+                f"No handler registered for queued callback type: {item.callback_type}",
+                extra={"callback_id": item.id},
+            )
+            self.queue.fail(item, "no handler")
+            self._count("failed")
+            return
+
+        try:
+            run_coroutine(handler(item.payload))
+        except Exception as e:
+            if item.attempts + 1 >= self.max_attempts:
+                logger.error(
+                    f"Queued callback failed permanently: {e}",
+                    exc_info=True,
+                    extra={"callback_id": item.id, "attempts": item.attempts + 1},
+                )
+                self.queue.fail(item, str(e))
+                self._count("failed")
+            else:
+                delay = min(self.retry_delay * 2**item.attempts, self.max_retry_delay)
+                logger.warning(
+                    f"Queued callback failed, retrying in {delay:.1f}s: {e}",
+                    extra={"callback_id": item.id, "attempts": item.attempts + 1},
+                )
+                self.queue.retry(item, delay, str(e))
+                self._count("retried")
+            return
+
+        self.queue.ack(item)
+        self._count("processed")
@@ -9,8 +9,10 @@ import threading
 from typing import Any
 
 from lark_service.auth.card_auth_handler import CardAuthHandler
-from lark_service.server.callback_server import CallbackServer
+from lark_service.server.callback_server import DEFAULT_MAX_WORKERS, CallbackServer
+from lark_service.server.dispatcher import DeferredDispatcher
 from lark_service.server.handlers.card_auth import create_card_auth_handler
+from lark_service.server.work_queue import WorkQueue
 from lark_service.utils.logger import get_logger
 
 logger = get_logger()
@@ -47,6 +49,11 @@ class CallbackServerManager:
         >>>
         >>> # Stop server
         >>> manager.stop()
+        >>>
+        >>> # Scale approval-card storms across cores
+        >>> manager = CallbackServerManager(
+        ...     verification_token="v_xxx", mode="prefork", processes=4, max_workers=16
+        ... )
     """
 
     def __init__(
@@ -56,6 +63,9 @@ class CallbackServerManager:
         host: str = "0.0.0.0",  # nosec B104
         port: int = 8080,
         auto_start: bool = False,
+        mode: str | None = None,
+        max_workers: int | None = None,
+        processes: int | None = None,
     ) -> None:
         """Initialize callback server manager.
 
@@ -66,12 +76,24 @@ class CallbackServerManager:
             host: Server host (defaults to env var or "0.0.0.0")
             port: Server port (defaults to env var or 8080)
             auto_start: Whether to auto-start server if enabled
+            mode: Server mode, "sync", "async", "threaded" or "prefork"
+                (defaults to env var CALLBACK_SERVER_MODE or "sync")
+            max_workers: Worker threads per process in threaded/prefork mode
+                (defaults to env var CALLBACK_SERVER_WORKERS or 32)
+            processes: Worker processes in prefork mode (defaults to env var
+                CALLBACK_SERVER_PROCESSES or the CPU count)
         """
         self.verification_token = verification_token
         self.encrypt_key = encrypt_key
         self.host = host if host != "0.0.0.0" else os.getenv("CALLBACK_SERVER_HOST", "0.0.0.0")  # nosec B104
         self.port = port if port != 8080 else int(os.getenv("CALLBACK_SERVER_PORT", "8080"))
         self.auto_start = auto_start
+        self.mode = mode or os.getenv("CALLBACK_SERVER_MODE", "sync").lower()
+        self.max_workers = max_workers or int(
+            os.getenv("CALLBACK_SERVER_WORKERS", str(DEFAULT_MAX_WORKERS))
+        )
+        env_processes = os.getenv("CALLBACK_SERVER_PROCESSES")
+        self.processes = processes or (int(env_processes) if env_processes else None)
 
         self.server: CallbackServer | None = None
         self.server_thread: threading.Thread | None = None
@@ -87,6 +109,9 @@ class CallbackServerManager:
                 "host": self.host,
                 "port": self.port,
                 "auto_start": self.auto_start,
+                "mode": self.mode,
+                "max_workers": self.max_workers,
+                "processes": self.processes,
             },
         )
 
@@ -129,6 +154,20 @@ class CallbackServerManager:
         """
         return self._enabled and not self._is_running
 
+    def _ensure_server(self) -> CallbackServer:
+        """Create the callback server on first handler registration."""
+        if not self.server:
+            self.server = CallbackServer(
+                host=self.host,
+                port=self.port,
+                verification_token=self.verification_token,
+                encrypt_key=self.encrypt_key,
+                mode=self.mode,
+                max_workers=self.max_workers,
+                processes=self.processes,
+            )
+        return self.server
+
     def register_card_auth_handler(self, card_auth_handler: CardAuthHandler) -> None:
         """Register card authorization callback handler.
 
@@ -143,23 +182,17 @@ class CallbackServerManager:
         ----------
             >>> manager.register_card_auth_handler(card_auth_handler)
         """
-        if not self.server:
-            self.server = CallbackServer(
-                host=self.host,
-                port=self.port,
-                verification_token=self.verification_token,
-                encrypt_key=self.encrypt_key,
-            )
+        server = self._ensure_server()
 
         # Register card action trigger handler
         card_handler = create_card_auth_handler(card_auth_handler)
-        self.server.register_handler("card_action_trigger", card_handler)
+        server.register_handler("card_action_trigger", card_handler)
 
         # Register OAuth redirect handler for authorization code flow
         from lark_service.server.handlers.oauth_redirect import create_oauth_redirect_handler
 
         oauth_handler = create_oauth_redirect_handler(card_auth_handler)
-        self.server.register_handler("oauth_redirect", oauth_handler)
+        server.register_handler("oauth_redirect", oauth_handler)
 
         logger.info("Card auth handlers registered (card_action_trigger + oauth_redirect)")
 
@@ -177,17 +210,43 @@ class CallbackServerManager:
             ...     return {"status": "ok"}
             >>> manager.register_handler("custom_event", custom_handler)
         """
-        if not self.server:
-            self.server = CallbackServer(
-                host=self.host,
-                port=self.port,
-                verification_token=self.verification_token,
-                encrypt_key=self.encrypt_key,
-            )
+        server = self._ensure_server()
 
-        self.server.register_handler(callback_type, handler)
+        server.register_handler(callback_type, handler)
         logger.info(f"Custom handler registered: {callback_type}")
 
+    def enable_deferred_processing(
+        self,
+        queue: WorkQueue | None = None,
+        **options: Any,
+    ) -> DeferredDispatcher:
+        """Acknowledge callbacks immediately and run handlers from a queue.
+
+        Parameters
+        ----------
+            queue: WorkQueue backend (default: in-memory)
+            **options: DeferredDispatcher options (workers, max_attempts,
+                deferred_types, ...)
+
+        Returns
+        -------
+            DeferredDispatcher: The server's dispatcher
+
+        Example
+        ----------
+            >>> from lark_service.server.work_queue import create_work_queue
+            >>> manager.enable_deferred_processing(
+            ...     create_work_queue("sqlite", path="data/callback_queue.db"),
+            ...     deferred_types={"card_action_trigger"},
+            ... )
+        """
+        dispatcher = self._ensure_server().enable_deferred(queue, **options)
+        logger.info(
+            "Deferred callback processing enabled",
+            extra={"queue": type(dispatcher.queue).__name__, "workers": dispatcher.workers},
+        )
+        return dispatcher
+
     def start(self) -> None:
         """Start the callback server in a background thread.
 
@@ -278,13 +337,18 @@ class CallbackServerManager:
                 "running": True,
                 "host": "0.0.0.0",
                 "port": 8080,
+                "mode": "sync",
                 "handlers": ["card_action_trigger"]
             }
         """
-        return {
+        status: dict[str, Any] = {
             "enabled": self._enabled,
             "running": self._is_running,
             "host": self.host,
             "port": self.port,
+            "mode": self.mode,
             "handlers": self.server.router.list_handlers() if self.server else [],
         }
+        if self.server and self.server.dispatcher:
+            status["queue"] = self.server.dispatcher.stats
+        return status
@@ -0,0 +1,67 @@
+"""JSON encoding backend for outgoing payloads.
+
+Message and card content is serialized to compact JSON through ``dumps``.
+The standard library encoder is always available; when ``orjson`` is
+installed (``pip install lark-service[fast-json]``) it is used by default,
+which encodes large cards several times faster. The backend can be pinned
+with ``set_json_backend`` (e.g. in tests or to compare output).
+"""
+
+import json
+from collections.abc import Callable
+from typing import Any
+
+from lark_service.core.exceptions import InvalidParameterError
+
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:  # pragma: no cover - depends on the environment
+    HAS_ORJSON = False
+
+
+def _stdlib_dumps(obj: Any) -> str:
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
+
+
+def _orjson_dumps(obj: Any) -> str:
+    return orjson.dumps(obj).decode()
+
+
+_BACKENDS: dict[str, Callable[[Any], str]] = {"json": _stdlib_dumps}
+if HAS_ORJSON:
+    _BACKENDS["orjson"] = _orjson_dumps
+
+_backend = "orjson" if HAS_ORJSON else "json"
+
+
+def available_json_backends() -> list[str]:
+    """Return the names of installed JSON backends."""
+    return list(_BACKENDS)
+
+
+def get_json_backend() -> str:
+    """Return the name of the active JSON backend."""
+    return _backend
+
+
+def set_json_backend(name: str) -> None:
+    """Select the JSON backend (``"json"`` or ``"orjson"``).
+
+    Raises
+    ----------
+        InvalidParameterError: If the backend is unknown or not installed
+    """
+    global _backend
+    if name not in _BACKENDS:
+        raise InvalidParameterError(
+            f"JSON backend not available: {name}",
+            details={"available": available_json_backends()},
+        )
+    _backend = name
+
+
+def dumps(obj: Any) -> str:
+    """Serialize ``obj`` to compact JSON with the active backend."""
+    return _BACKENDS[_backend](obj)
@@ -0,0 +1,91 @@
+"""Bounded set with per-entry expiry.
+
+Used to remember recently seen IDs (event IDs, nonces) so duplicates can
+be dropped without unbounded memory growth.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Hashable
+
+from lark_service.core.exceptions import InvalidParameterError
+
+
+class TTLSet:
+    """Thread-safe set whose members expire after ``ttl_seconds``.
+
+    Holds at most ``max_size`` members; when full, the oldest member is
+    evicted even if it has not expired yet.
+
+    Attributes
+    ----------
+        ttl_seconds: Member lifetime in seconds
+        max_size: Maximum number of members
+
+    Example
+    ----------
+        >>> seen = TTLSet(ttl_seconds=300, max_size=10000)
+        >>> seen.add("evt_1")
+        True
+        >>> seen.add("evt_1")
+        False
+    """
+
+    def __init__(self, ttl_seconds: float = 600.0, max_size: int = 100_000) -> None:
+        """Initialize TTL set.
+
+        Parameters
+        ----------
+            ttl_seconds: Member lifetime in seconds
+            max_size: Maximum number of members
+        """
+        if ttl_seconds <= 0:
+            raise InvalidParameterError("ttl_seconds must be positive")
+        if max_size < 1:
+            raise InvalidParameterError("max_size must be at least 1")
+        self.ttl_seconds = ttl_seconds
+        self.max_size = max_size
+        self._expires: OrderedDict[Hashable, float] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        with self._lock:
+            self._purge(time.monotonic())
+            return len(self._expires)
+
+    def __contains__(self, key: Hashable) -> bool:
+        with self._lock:
+            expires_at = self._expires.get(key)
+            return expires_at is not None and expires_at > time.monotonic()
+
+    def add(self, key: Hashable) -> bool:
+        """Add ``key`` and return True if it was not already a live member."""
+        now = time.monotonic()
+        with self._lock:
+            self._purge(now)
+            if key in self._expires:
+                return False
+            while len(self._expires) >= self.max_size:
+                self._expires.popitem(last=False)
+            self._expires[key] = now + self.ttl_seconds
+            return True
+
+    def discard(self, key: Hashable) -> None:
+        """Remove ``key`` if present (e.g. to allow a retry)."""
+        with self._lock:
+            self._expires.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove all members."""
+        with self._lock:
+            self._expires.clear()
+
+    def _purge(self, now: float) -> None:
+        # Insertion order equals expiry order because the TTL is fixed
+        expires = self._expires
+        while expires:
+            key, expires_at = next(iter(expires.items()))
+            if expires_at > now:
+                break
+            del expires[key]
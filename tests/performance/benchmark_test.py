@@ -21,8 +21,15 @@ from typing import Any
 # 添加项目路径
 sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src"))
 
+from lark_service.cardkit.builder import CardBuilder  # noqa: E402
+from lark_service.cardkit.models import CardConfig  # noqa: E402
+from lark_service.cardkit.payload import CardPayload  # noqa: E402
+from lark_service.cardkit.template import CardTemplate  # noqa: E402
+from lark_service.clouddoc.models import CellData  # noqa: E402
+from lark_service.clouddoc.sheet.client import SheetClient  # noqa: E402
 from lark_service.core.models.token_storage import TokenStorage  # noqa: E402
 from lark_service.core.retry import retry_on_error  # noqa: E402
+from lark_service.utils import json_codec  # noqa: E402
 from lark_service.utils.logger import setup_logger  # noqa: E402
 from lark_service.utils.masking import mask_email, mask_mobile, mask_token  # noqa: E402
 from lark_service.utils.validators import (  # noqa: E402
@@ -224,6 +231,95 @@ def test_token_model_performance(benchmark: PerformanceBenchmark):
     token_should_refresh_bench()
 
 
+def test_sheet_read_performance(benchmark: PerformanceBenchmark):
+    """测试 Sheet 10 万单元格读取的解析性能 (不含 HTTP)"""
+    from unittest.mock import Mock
+
+    rows, cols = 10000, 10
+    values = [[f"r{r}c{c}" for c in range(cols)] for r in range(rows)]
+
+    client = SheetClient(Mock())
+    client._fetch_values = lambda *args: values  # type: ignore[method-assign]
+
+    @benchmark.benchmark(
+        "Sheet读取 - 原始校验模型", "每个单元格完整校验 CellData (旧实现, 10万单元格)"
+    )
+    def validated_cells_bench(iterations=5):
+        [
+            [
+                CellData(
+                    value=v,
+                    formula=None,
+                    number_format=None,
+                    font_size=None,
+                    font_color=None,
+                    background_color=None,
+                    bold=None,
+                    italic=None,
+                    underline=None,
+                    align=None,
+                    vertical_align=None,
+                )
+                for v in row
+            ]
+            for row in values
+        ]
+
+    @benchmark.benchmark("Sheet读取 - get_sheet_data", "仅传 value 构造 CellData (10万单元格)")
+    def sheet_data_bench(iterations=5):
+        client.get_sheet_data("cli_bench", "shtcn_bench", "sheet1", "A1:J10000")
+
+    @benchmark.benchmark("Sheet读取 - get_sheet_values", "原始嵌套列表, 无模型构造 (10万单元格)")
+    def sheet_values_bench(iterations=5):
+        client.get_sheet_values("cli_bench", "shtcn_bench", "sheet1", "A1:J10000")
+
+    validated_cells_bench(iterations=5)
+    sheet_data_bench(iterations=5)
+    sheet_values_bench(iterations=5)
+
+
+def test_card_serialization_performance(benchmark: PerformanceBenchmark):
+    """测试卡片构建 + 序列化吞吐量 (cards/s, 不含 HTTP)"""
+    fields = {f"字段{i}": f"值{i}" for i in range(10)}
+
+    def approval_card(applicant: str) -> dict:
+        return CardBuilder().build_approval_card(
+            title="请假申请",
+            applicant=applicant,
+            fields=fields,
+            approve_action_id="approve",
+            reject_action_id="reject",
+        )
+
+    template = CardTemplate.compile(approval_card("{{applicant}}"))
+
+    @benchmark.benchmark(
+        "卡片序列化 - dict 路径", "模板方法 + CardUpdater 再次校验 + json.dumps (旧实现)"
+    )
+    def dict_path_bench(iterations=5000):
+        card = approval_card("张三")
+        json.dumps(CardConfig(**card).model_dump(exclude_none=True))
+
+    @benchmark.benchmark("卡片序列化 - 编译模板", "CardTemplate.render 直接生成 JSON")
+    def template_bench(iterations=5000):
+        template.render(applicant="张三")
+
+    dict_path_bench(iterations=5000)
+    default_backend = json_codec.get_json_backend()
+    for backend in json_codec.available_json_backends():
+        json_codec.set_json_backend(backend)
+
+        @benchmark.benchmark(
+            f"卡片序列化 - CardPayload ({backend})", "模板方法 + 单次序列化 (校验一次)"
+        )
+        def payload_bench(iterations=5000):
+            CardPayload.from_card(approval_card("张三"), validate=False)
+
+        payload_bench(iterations=5000)
+    json_codec.set_json_backend(default_backend)
+    template_bench(iterations=5000)
+
+
 def print_summary(benchmark: PerformanceBenchmark):
     """打印性能摘要"""
     print(f"\n{'=' * 60}")
@@ -290,6 +386,8 @@ def main():
         test_token_model_performance(benchmark)
         test_token_storage_performance(benchmark)
         test_retry_mechanism_performance(benchmark)
+        test_sheet_read_performance(benchmark)
+        test_card_serialization_performance(benchmark)
 
         # 打印摘要
         print_summary(benchmark)
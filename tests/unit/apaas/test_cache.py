@@ -0,0 +1,331 @@
+"""
+Unit tests for the aPaaS SQL result cache.
+
+Tests SQL normalization helpers, both cache backends and the
+WorkspaceTableClient.sql_query integration.
+"""
+
+import json
+import threading
+from unittest.mock import Mock, patch
+
+import pytest
+
+from lark_service.apaas.cache import (
+    DatabaseSQLResultCache,
+    InMemorySQLResultCache,
+    SQLCacheKey,
+    is_read_only_sql,
+    normalize_sql,
+    referenced_tables,
+)
+from lark_service.apaas.client import WorkspaceTableClient
+from lark_service.core.credential_pool import CredentialPool
+from lark_service.core.exceptions import InvalidParameterError
+
+TEST_APP_ID = "cli_a1b2c3d4e5f6g7h8"
+TEST_USER_TOKEN = "u-test1234567890abcdef"
+TEST_WORKSPACE_ID = "ws_test001"
+
+
+def _key(sql: str, workspace_id: str = TEST_WORKSPACE_ID) -> SQLCacheKey:
+    return SQLCacheKey(workspace_id, "scope", normalize_sql(sql))
+
+
+def _sql_response(rows: list) -> Mock:
+    response = Mock()
+    response.json.return_value = {"code": 0, "data": {"result": json.dumps([json.dumps(rows)])}}
+    return response
+
+
+class TestSQLHelpers:
+    """Test SQL normalization and classification."""
+
+    def test_normalize_sql_keeps_literals(self) -> None:
+        """Test whitespace collapses outside literals only."""
+        sql = "SELECT  id\n FROM   customers WHERE name = 'a  b';"
+        assert normalize_sql(sql) == "SELECT id FROM customers WHERE name = 'a  b'"
+
+    def test_is_read_only_sql(self) -> None:
+        """Test writes are never treated as cacheable."""
+        assert is_read_only_sql("SELECT * FROM customers WHERE note = 'delete me'")
+        assert is_read_only_sql("with t as (select 1) select * from t")
+        assert not is_read_only_sql("INSERT INTO customers (name) VALUES ('x')")
+        assert not is_read_only_sql("WITH d AS (DELETE FROM customers RETURNING id) SELECT 1")
+
+    def test_referenced_tables(self) -> None:
+        """Test table names are extracted from FROM/JOIN/INTO/UPDATE."""
+        sql = 'SELECT * FROM "Customers" c JOIN public.orders o ON o.cid = c.id'
+        assert referenced_tables(sql) == {"customers", "orders"}
+        assert referenced_tables("UPDATE follow_ups SET a = 1") == {"follow_ups"}
+        assert referenced_tables("SELECT 1") == {"*"}
+
+
+class TestInMemorySQLResultCache:
+    """Test the in-process cache backend."""
+
+    def test_roundtrip_returns_fresh_objects(self) -> None:
+        """Test hits decode a new copy each time."""
+        cache = InMemorySQLResultCache()
+        cache.set(_key("SELECT 1"), {"*"}, [{"id": "1"}])
+
+        first = cache.get(_key("SELECT  1"))
+        assert first == [{"id": "1"}]
+        first[0]["id"] = "changed"
+        assert cache.get(_key("SELECT 1")) == [{"id": "1"}]
+        assert (cache.hits, cache.misses) == (2, 0)
+
+    def test_ttl_expiry(self) -> None:
+        """Test expired entries are not returned."""
+        cache = InMemorySQLResultCache(ttl_seconds=10)
+        with patch("lark_service.apaas.cache.time.monotonic", return_value=100.0):
+            cache.set(_key("SELECT 1"), {"*"}, [])
+        with patch("lark_service.apaas.cache.time.monotonic", return_value=111.0):
+            assert cache.get(_key("SELECT 1")) is None
+        assert len(cache) == 0
+
+    def test_entry_and_byte_bounds(self) -> None:
+        """Test least recently used entries are evicted."""
+        cache = InMemorySQLResultCache(max_entries=2)
+        cache.set(_key("SELECT 1"), {"a"}, [])
+        cache.set(_key("SELECT 2"), {"a"}, [])
+        cache.get(_key("SELECT 1"))
+        cache.set(_key("SELECT 3"), {"a"}, [])
+
+        assert cache.get(_key("SELECT 2")) is None
+        assert cache.get(_key("SELECT 1")) == []
+
+        small = InMemorySQLResultCache(max_bytes=20)
+        small.set(_key("SELECT 1"), {"a"}, [{"note": "x" * 50}])
+        assert len(small) == 0
+
+    def test_invalidate_by_table(self) -> None:
+        """Test only entries of the workspace reading the table are dropped."""
+        cache = InMemorySQLResultCache()
+        cache.set(_key("SELECT * FROM a"), {"a"}, [])
+        cache.set(_key("SELECT * FROM b"), {"b"}, [])
+        cache.set(_key("SELECT now()"), {"*"}, [])
+        cache.set(_key("SELECT * FROM a", "ws_other"), {"a"}, [])
+
+        assert cache.invalidate(TEST_WORKSPACE_ID, {"a"}) == 2
+        assert cache.get(_key("SELECT * FROM b")) == []
+        assert cache.get(_key("SELECT * FROM a", "ws_other")) == []
+
+    def test_invalid_bounds(self) -> None:
+        """Test invalid settings are rejected."""
+        with pytest.raises(InvalidParameterError):
+            InMemorySQLResultCache(ttl_seconds=0)
+
+    def test_result_read_during_write_not_stored(self) -> None:
+        """Test rows of a query overlapping an invalidation are not cached."""
+        cache = InMemorySQLResultCache()
+        generation = cache.generation(TEST_WORKSPACE_ID)
+        cache.invalidate(TEST_WORKSPACE_ID, {"a"})
+        cache.set(_key("SELECT * FROM a"), {"a"}, [{"id": "old"}], generation)
+        assert cache.get(_key("SELECT * FROM a")) is None
+
+        cache.set(
+            _key("SELECT * FROM a"), {"a"}, [{"id": "new"}], cache.generation(TEST_WORKSPACE_ID)
+        )
+        assert cache.get(_key("SELECT * FROM a")) == [{"id": "new"}]
+        # Other workspaces keep their own generation
+        cache.set(_key("SELECT 1", "ws_other"), {"*"}, [], generation)
+        assert cache.get(_key("SELECT 1", "ws_other")) == []
+
+    def test_counters_are_thread_safe(self) -> None:
+        """Test concurrent lookups are all counted."""
+        cache = InMemorySQLResultCache()
+        cache.set(_key("SELECT 1"), {"*"}, [])
+
+        def lookup() -> None:
+            for _ in range(500):
+                cache.get(_key("SELECT 1"))
+                cache.get(_key("SELECT 2"))
+
+        threads = [threading.Thread(target=lookup) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert (cache.hits, cache.misses) == (4000, 4000)
+
+
+class TestDatabaseSQLResultCache:
+    """Test the shared database backend."""
+
+    @pytest.fixture
+    def cache(self, tmp_path):
+        """Create cache on a temporary SQLite database."""
+        cache = DatabaseSQLResultCache(f"sqlite:///{tmp_path / 'cache.db'}", max_entries=2)
+        yield cache
+        cache.close()
+
+    def test_shared_between_instances(self, cache, tmp_path) -> None:
+        """Test a second instance on the same database sees entries."""
+        cache.set(_key("SELECT * FROM a"), {"a"}, [{"id": 1}])
+
+        other = DatabaseSQLResultCache(f"sqlite:///{tmp_path / 'cache.db'}")
+        try:
+            assert other.get(_key("SELECT * FROM a")) == [{"id": 1}]
+            assert other.invalidate(TEST_WORKSPACE_ID, {"a"}) == 1
+        finally:
+            other.close()
+
+        assert cache.get(_key("SELECT * FROM a")) is None
+
+    def test_invalidate_unknown_tables(self, cache) -> None:
+        """Test entries with unknown tables are dropped by any write."""
+        cache.set(_key("SELECT 1"), {"*"}, [])
+        cache.set(_key("SELECT * FROM b"), {"b"}, [])
+
+        assert cache.invalidate(TEST_WORKSPACE_ID, {"a"}) == 1
+        assert cache.get(_key("SELECT * FROM b")) == []
+
+    def test_result_read_during_write_not_stored(self, cache) -> None:
+        """Test rows of a query overlapping an invalidation are not cached."""
+        generation = cache.generation(TEST_WORKSPACE_ID)
+        cache.invalidate(TEST_WORKSPACE_ID, {"a"})
+        cache.set(_key("SELECT * FROM a"), {"a"}, [{"id": 1}], generation)
+
+        assert cache.get(_key("SELECT * FROM a")) is None
+
+    def test_prune_enforces_max_entries(self, cache) -> None:
+        """Test prune keeps at most max_entries rows."""
+        for i in range(4):
+            cache.set(_key(f"SELECT {i}"), {"*"}, [])
+
+        assert cache.prune() == 2
+
+
+class TestClientResultCache:
+    """Test sql_query cache integration."""
+
+    @pytest.fixture
+    def cache(self) -> InMemorySQLResultCache:
+        """Create in-memory cache."""
+        return InMemorySQLResultCache()
+
+    @pytest.fixture
+    def client(self, cache: InMemorySQLResultCache) -> WorkspaceTableClient:
+        """Create client with result cache."""
+        return WorkspaceTableClient(Mock(spec=CredentialPool), result_cache=cache)
+
+    def _query(self, client: WorkspaceTableClient, sql: str, token: str = TEST_USER_TOKEN) -> list:
+        return client.sql_query(
+            app_id=TEST_APP_ID, user_access_token=token, workspace_id=TEST_WORKSPACE_ID, sql=sql
+        )
+
+    @patch("lark_service.apaas.client.requests.post")
+    def test_repeated_select_hits_cache(
+        self, mock_post: Mock, client: WorkspaceTableClient
+    ) -> None:
+        """Test identical SELECTs call the API once."""
+        mock_post.return_value = _sql_response([{"id": "1"}])
+
+        assert self._query(client, "SELECT id FROM customers") == [{"id": "1"}]
+        assert self._query(client, "SELECT id\n  FROM customers;") == [{"id": "1"}]
+        assert mock_post.call_count == 1
+
+    @patch("lark_service.apaas.client.requests.post")
+    def test_cache_is_scoped_per_user(self, mock_post: Mock, client: WorkspaceTableClient) -> None:
+        """Test another user token does not see cached rows."""
+        mock_post.return_value = _sql_response([])
+
+        self._query(client, "SELECT id FROM customers")
+        self._query(client, "SELECT id FROM customers", token="u-other1234567890abc")
+
+        assert mock_post.call_count == 2
+
+    @patch("lark_service.apaas.client.requests.post")
+    def test_write_invalidates_table(self, mock_post: Mock, client: WorkspaceTableClient) -> None:
+        """Test create_record invalidates cached reads of the same table."""
+        mock_post.side_effect = [
+            _sql_response([{"id": "1"}]),
+            _sql_response([{"id": "2"}]),
+            _sql_response([{"id": "1"}, {"id": "2"}]),
+        ]
+
+        self._query(client, "SELECT id FROM customers")
+        client.create_record(
+            app_id=TEST_APP_ID,
+            user_access_token=TEST_USER_TOKEN,
+            table_id="customers",
+            workspace_id=TEST_WORKSPACE_ID,
+            fields={"name": "x"},
+        )
+
+        assert self._query(client, "SELECT id FROM customers") == [{"id": "1"}, {"id": "2"}]
+        assert mock_post.call_count == 3
+
+    @patch("lark_service.apaas.client.requests.post")
+    def test_refresh_stores_new_result(
+        self, mock_post: Mock, client: WorkspaceTableClient, cache: InMemorySQLResultCache
+    ) -> None:
+        """Test refresh=True bypasses the lookup but stores the new result."""
+        mock_post.side_effect = [_sql_response([{"v": 1}]), _sql_response([{"v": 2}])]
+
+        self._query(client, "SELECT v FROM t")
+        fresh = client.sql_query(
+            app_id=TEST_APP_ID,
+            user_access_token=TEST_USER_TOKEN,
+            workspace_id=TEST_WORKSPACE_ID,
+            sql="SELECT v FROM t",
+            refresh=True,
+        )
+
+        assert fresh == [{"v": 2}]
+        assert self._query(client, "SELECT v FROM t") == [{"v": 2}]
+
+    @patch("lark_service.apaas.client.requests.post")
+    def test_use_cache_false_bypasses_cache(
+        self, mock_post: Mock, client: WorkspaceTableClient, cache: InMemorySQLResultCache
+    ) -> None:
+        """Test use_cache=False neither reads nor stores results."""
+        mock_post.return_value = _sql_response([{"v": 1}])
+
+        for _ in range(2):
+            client.sql_query(
+                app_id=TEST_APP_ID,
+                user_access_token=TEST_USER_TOKEN,
+                workspace_id=TEST_WORKSPACE_ID,
+                sql="SELECT v FROM t",
+                use_cache=False,
+            )
+
+        assert mock_post.call_count == 2
+        assert len(cache) == 0
+
+    @patch("lark_service.apaas.client.requests.post")
+    def test_streamed_pages_not_cached(
+        self, mock_post: Mock, client: WorkspaceTableClient, cache: InMemorySQLResultCache
+    ) -> None:
+        """Test iter_sql and parallel iter_records leave the cache untouched."""
+        mock_post.side_effect = [
+            _sql_response([{"id": "1"}, {"id": "2"}]),
+            _sql_response([{"id": "3"}]),
+            _sql_response([{"id": "1"}]),
+        ]
+
+        rows = list(
+            client.iter_sql(
+                app_id=TEST_APP_ID,
+                user_access_token=TEST_USER_TOKEN,
+                workspace_id=TEST_WORKSPACE_ID,
+                sql="SELECT id FROM customers ORDER BY id",
+                page_size=2,
+            )
+        )
+        records = list(
+            client.iter_records(
+                app_id=TEST_APP_ID,
+                user_access_token=TEST_USER_TOKEN,
+                table_id="customers",
+                workspace_id=TEST_WORKSPACE_ID,
+                parallel=True,
+                total=1,
+            )
+        )
+
+        assert len(rows) == 3 and len(records) == 1
+        assert len(cache) == 0
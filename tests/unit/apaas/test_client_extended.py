@@ -14,6 +14,7 @@ This file focuses on testing core functionality that was previously untested:
 Target: Increase coverage from 49.24% to 62%
 """
 
+import threading
 from unittest.mock import Mock, patch
 
 import pytest
@@ -336,6 +337,105 @@ class TestSQLQueryExecution:
             )
 
 
+class TestSQLStreaming:
+    """Test iter_sql pagination and SQL result decoding."""
+
+    @pytest.fixture
+    def client(self) -> WorkspaceTableClient:
+        """Create WorkspaceTableClient instance."""
+        return WorkspaceTableClient(Mock(spec=CredentialPool))
+
+    @patch("lark_service.apaas.client.requests.post")
+    def test_sql_query_unwrapped_rows(self, mock_post: Mock, client: WorkspaceTableClient) -> None:
+        """Test rows returned without the inner JSON string are accepted."""
+        mock_post.return_value.json.return_value = {
+            "code": 0,
+            "data": {"result": '[{"id": "1"}]'},
+        }
+
+        results = client.sql_query(
+            app_id=TEST_APP_ID,
+            user_access_token=TEST_USER_TOKEN,
+            workspace_id=TEST_WORKSPACE_ID,
+            sql="SELECT id FROM customers",
+        )
+
+        assert results == [{"id": "1"}]
+
+    @patch.object(WorkspaceTableClient, "sql_query")
+    def test_iter_sql_offset_pages(
+        self, mock_sql_query: Mock, client: WorkspaceTableClient
+    ) -> None:
+        """Test OFFSET paging stops on a short page."""
+        mock_sql_query.side_effect = [[{"id": 1}, {"id": 2}], [{"id": 3}]]
+
+        rows = client.iter_sql(
+            app_id=TEST_APP_ID,
+            user_access_token=TEST_USER_TOKEN,
+            workspace_id=TEST_WORKSPACE_ID,
+            sql="SELECT id FROM customers ORDER BY id;",
+            page_size=2,
+        )
+
+        assert [row["id"] for row in rows] == [1, 2, 3]
+        statements = [call.kwargs["sql"] for call in mock_sql_query.call_args_list]
+        assert statements == [
+            "SELECT * FROM (SELECT id FROM customers ORDER BY id) AS _page LIMIT 2 OFFSET 0",
+            "SELECT * FROM (SELECT id FROM customers ORDER BY id) AS _page LIMIT 2 OFFSET 2",
+        ]
+
+    @patch.object(WorkspaceTableClient, "sql_query")
+    def test_iter_sql_keyset_pages(
+        self, mock_sql_query: Mock, client: WorkspaceTableClient
+    ) -> None:
+        """Test keyset paging continues after the last key."""
+        mock_sql_query.side_effect = [[{"id": "a"}, {"id": "b"}], []]
+
+        rows = list(
+            client.iter_sql(
+                app_id=TEST_APP_ID,
+                user_access_token=TEST_USER_TOKEN,
+                workspace_id=TEST_WORKSPACE_ID,
+                sql="SELECT id FROM customers",
+                page_size=2,
+                key_column="id",
+            )
+        )
+
+        assert len(rows) == 2
+        assert mock_sql_query.call_args.kwargs["sql"] == (
+            "SELECT * FROM (SELECT id FROM customers) AS _page WHERE id > 'b' ORDER BY id LIMIT 2"
+        )
+
+    @patch.object(WorkspaceTableClient, "sql_query")
+    def test_iter_sql_is_lazy(self, mock_sql_query: Mock, client: WorkspaceTableClient) -> None:
+        """Test the next page is only requested when the current one is consumed."""
+        mock_sql_query.return_value = [{"id": 1}, {"id": 2}]
+
+        rows = client.iter_sql(
+            app_id=TEST_APP_ID,
+            user_access_token=TEST_USER_TOKEN,
+            workspace_id=TEST_WORKSPACE_ID,
+            sql="SELECT id FROM customers ORDER BY id",
+            page_size=2,
+        )
+        next(rows)
+
+        assert mock_sql_query.call_count == 1
+
+    def test_iter_sql_rejects_non_select(self, client: WorkspaceTableClient) -> None:
+        """Test write statements cannot be paged."""
+        with pytest.raises(InvalidParameterError, match="only supports SELECT"):
+            next(
+                client.iter_sql(
+                    app_id=TEST_APP_ID,
+                    user_access_token=TEST_USER_TOKEN,
+                    workspace_id=TEST_WORKSPACE_ID,
+                    sql="DELETE FROM customers",
+                )
+            )
+
+
 class TestRecordQueryOperations:
     """Test record query operations."""
 
@@ -454,6 +554,119 @@ class TestRecordQueryOperations:
             )
 
 
+class TestRecordIteration:
+    """Test iter_records auto-pagination."""
+
+    @pytest.fixture
+    def client(self) -> WorkspaceTableClient:
+        """Create WorkspaceTableClient instance."""
+        return WorkspaceTableClient(Mock(spec=CredentialPool))
+
+    @staticmethod
+    def _page(items: list, page_token: str | None = None) -> Mock:
+        import json
+
+        response = Mock()
+        response.json.return_value = {
+            "code": 0,
+            "data": {
+                "items": json.dumps(items),
+                "has_more": page_token is not None,
+                "page_token": page_token,
+                "total": 3,
+            },
+        }
+        return response
+
+    @patch("lark_service.apaas.client.requests.get")
+    def test_iter_records_follows_page_tokens(
+        self, mock_get: Mock, client: WorkspaceTableClient
+    ) -> None:
+        """Test all pages are read with the maximum page size."""
+        mock_get.side_effect = [
+            self._page([{"id": "r1", "name": "A", "_created_by": "x"}, {"id": "r2"}], "p2"),
+            self._page([{"id": "r3", "name": "C"}]),
+        ]
+
+        records = list(
+            client.iter_records(
+                app_id=TEST_APP_ID,
+                user_access_token=TEST_USER_TOKEN,
+                table_id=TEST_TABLE_ID,
+                workspace_id=TEST_WORKSPACE_ID,
+            )
+        )
+
+        assert [r.record_id for r in records] == ["r1", "r2", "r3"]
+        assert records[0].fields == {"name": "A"}
+        assert mock_get.call_args_list[0].kwargs["params"] == {"page_size": 500}
+        assert mock_get.call_args_list[1].kwargs["params"]["page_token"] == "p2"
+
+    @patch("lark_service.apaas.client.requests.get")
+    def test_iter_records_repeated_token(
+        self, mock_get: Mock, client: WorkspaceTableClient
+    ) -> None:
+        """Test a page token that does not advance stops iteration."""
+        mock_get.side_effect = [self._page([{"id": "r1"}], "p2"), self._page([{"id": "r2"}], "p2")]
+
+        with pytest.raises(APIError, match="Pagination did not advance"):
+            list(
+                client.iter_records(
+                    app_id=TEST_APP_ID,
+                    user_access_token=TEST_USER_TOKEN,
+                    table_id=TEST_TABLE_ID,
+                    workspace_id=TEST_WORKSPACE_ID,
+                )
+            )
+
+    @patch.object(WorkspaceTableClient, "sql_query")
+    def test_iter_records_parallel(
+        self, mock_sql_query: Mock, client: WorkspaceTableClient
+    ) -> None:
+        """Test parallel mode plans OFFSET pages from the known total."""
+
+        def _rows(**kwargs: str) -> list[dict[str, str]]:
+            offset = int(kwargs["sql"].rsplit("OFFSET ", 1)[1])
+            return [{"id": f"r{i}"} for i in range(offset, min(offset + 2, 5))]
+
+        mock_sql_query.side_effect = _rows
+
+        records = list(
+            client.iter_records(
+                app_id=TEST_APP_ID,
+                user_access_token=TEST_USER_TOKEN,
+                table_id=TEST_TABLE_ID,
+                workspace_id=TEST_WORKSPACE_ID,
+                page_size=2,
+                parallel=True,
+                total=5,
+            )
+        )
+
+        assert [r.record_id for r in records] == [f"r{i}" for i in range(5)]
+        assert mock_sql_query.call_count == 3
+
+    @patch.object(WorkspaceTableClient, "sql_query")
+    def test_iter_records_parallel_counts_rows(
+        self, mock_sql_query: Mock, client: WorkspaceTableClient
+    ) -> None:
+        """Test parallel mode issues a COUNT(*) when total is unknown."""
+        mock_sql_query.side_effect = [[{"total": 1}], [{"id": "r0"}]]
+
+        records = list(
+            client.iter_records(
+                app_id=TEST_APP_ID,
+                user_access_token=TEST_USER_TOKEN,
+                table_id=TEST_TABLE_ID,
+                workspace_id=TEST_WORKSPACE_ID,
+                parallel=True,
+            )
+        )
+
+        assert [r.record_id for r in records] == ["r0"]
+        assert "COUNT(*)" in mock_sql_query.call_args_list[0].kwargs["sql"]
+
+
 class TestRecordCRUDOperations:
     """Test record create, update, delete operations."""
 
@@ -706,6 +919,278 @@ class TestBatchOperationsLargeDatasets:
             )
 
 
+class TestBatchCreateChunking:
+    """Test size-aware, concurrent batch inserts."""
+
+    @pytest.fixture
+    def client(self) -> WorkspaceTableClient:
+        """Create WorkspaceTableClient instance."""
+        return WorkspaceTableClient(Mock(spec=CredentialPool))
+
+    @staticmethod
+    def _echo_ids(**kwargs: str) -> list[dict[str, str]]:
+        """Return one id per inserted row, taken from the SQL itself."""
+        sql = kwargs["sql"]
+        return [{"id": part.split("'")[1]} for part in sql.split("VALUES ", 1)[1].split("), (")]
+
+    @patch.object(WorkspaceTableClient, "sql_query")
+    def test_batches_split_by_payload_size(
+        self, mock_sql_query: Mock, client: WorkspaceTableClient
+    ) -> None:
+        """Test batches close when the SQL size limit would be exceeded."""
+        mock_sql_query.side_effect = self._echo_ids
+        records = [{"name": f"u{i:03d}", "note": "x" * 200} for i in range(40)]
+
+        result = client.batch_create_records(
+            app_id=TEST_APP_ID,
+            user_access_token=TEST_USER_TOKEN,
+            table_id=TEST_TABLE_ID,
+            workspace_id=TEST_WORKSPACE_ID,
+            records=records,
+            max_batch_bytes=2048,
+        )
+
+        statements = [call.kwargs["sql"] for call in mock_sql_query.call_args_list]
+        assert len(statements) > 1
+        assert all(len(sql.encode()) <= 2048 for sql in statements)
+        # IDs are returned in input order despite concurrent execution
+        assert result == [f"u{i:03d}" for i in range(40)]
+
+    @patch.object(WorkspaceTableClient, "sql_query")
+    def test_insert_statement_shape(
+        self, mock_sql_query: Mock, client: WorkspaceTableClient
+    ) -> None:
+        """Test a batch becomes one multi-row INSERT ... RETURNING id."""
+        mock_sql_query.return_value = [{"id": "a"}, {"id": "b"}]
+
+        client.batch_create_records(
+            app_id=TEST_APP_ID,
+            user_access_token=TEST_USER_TOKEN,
+            table_id=TEST_TABLE_ID,
+            workspace_id=TEST_WORKSPACE_ID,
+            records=[{"name": "O'Neil", "age": 3}, {"name": "Bo", "age": None}],
+        )
+
+        assert mock_sql_query.call_args.kwargs["sql"] == (
+            "INSERT INTO test_table (name, age) VALUES ('O''Neil', 3), ('Bo', NULL) RETURNING id"
+        )
+
+    @patch.object(WorkspaceTableClient, "sql_query")
+    def test_sequential_mode(self, mock_sql_query: Mock, client: WorkspaceTableClient) -> None:
+        """Test max_workers=1 runs batches one at a time in order."""
+        mock_sql_query.side_effect = self._echo_ids
+        records = [{"name": f"u{i}"} for i in range(5)]
+
+        result = client.batch_create_records(
+            app_id=TEST_APP_ID,
+            user_access_token=TEST_USER_TOKEN,
+            table_id=TEST_TABLE_ID,
+            workspace_id=TEST_WORKSPACE_ID,
+            records=records,
+            batch_size=2,
+            max_workers=1,
+        )
+
+        assert mock_sql_query.call_count == 3
+        assert result == [f"u{i}" for i in range(5)]
+
+    @patch.object(WorkspaceTableClient, "sql_query")
+    def test_failed_batch_reports_committed_ranges(
+        self, mock_sql_query: Mock, client: WorkspaceTableClient
+    ) -> None:
+        """Test later batches that were already applied are reported on failure."""
+        started = threading.Barrier(4, timeout=5)
+
+        def run(**kwargs: str) -> list[dict[str, str]]:
+            started.wait()
+            if "'u0'" in kwargs["sql"]:
+                raise APIError("Batch insert failed")
+            return self._echo_ids(**kwargs)
+
+        mock_sql_query.side_effect = run
+        records = [{"name": f"u{i}"} for i in range(8)]
+
+        with pytest.raises(APIError, match="3 later batches were applied") as exc_info:
+            client.batch_create_records(
+                app_id=TEST_APP_ID,
+                user_access_token=TEST_USER_TOKEN,
+                table_id=TEST_TABLE_ID,
+                workspace_id=TEST_WORKSPACE_ID,
+                records=records,
+                batch_size=2,
+                max_workers=4,
+            )
+
+        details = exc_info.value.details
+        assert details["failed_ranges"] == [[0, 2]]
+        assert details["committed_ranges"] == [[2, 2], [4, 2], [6, 2]]
+        assert details["committed_rows"] == 6
+
+    def test_invalid_tuning(self, client: WorkspaceTableClient) -> None:
+        """Test invalid payload size and worker settings are rejected."""
+        with pytest.raises(InvalidParameterError, match="max_batch_bytes"):
+            client.batch_create_records(
+                app_id=TEST_APP_ID,
+                user_access_token=TEST_USER_TOKEN,
+                table_id=TEST_TABLE_ID,
+                workspace_id=TEST_WORKSPACE_ID,
+                records=[{"name": "x"}],
+                max_batch_bytes=10,
+            )
+        with pytest.raises(InvalidParameterError, match="max_workers"):
+            client.batch_create_records(
+                app_id=TEST_APP_ID,
+                user_access_token=TEST_USER_TOKEN,
+                table_id=TEST_TABLE_ID,
+                workspace_id=TEST_WORKSPACE_ID,
+                records=[{"name": "x"}],
+                max_workers=0,
+            )
+
+
+class TestBatchUpdateStrategies:
+    """Test grouped and CASE update strategies."""
+
+    @pytest.fixture
+    def client(self) -> WorkspaceTableClient:
+        """Create WorkspaceTableClient instance."""
+        return WorkspaceTableClient(Mock(spec=CredentialPool))
+
+    def _update(self, client: WorkspaceTableClient, records: list, **kwargs: object) -> int:
+        return client.batch_update_records(
+            app_id=TEST_APP_ID,
+            user_access_token=TEST_USER_TOKEN,
+            table_id=TEST_TABLE_ID,
+            workspace_id=TEST_WORKSPACE_ID,
+            records=records,
+            **kwargs,
+        )
+
+    @patch.object(WorkspaceTableClient, "sql_query")
+    def test_grouped_identical_changes(
+        self, mock_sql_query: Mock, client: WorkspaceTableClient
+    ) -> None:
+        """Test identical changes share one WHERE id IN statement."""
+        mock_sql_query.return_value = []
+        records = [("r1", {"stage": "won"}), ("r2", {"stage": "lost"}), ("r3", {"stage": "won"})]
+
+        result = self._update(client, records, strategy="grouped")
+
+        assert result == 3
+        statements = sorted(call.kwargs["sql"] for call in mock_sql_query.call_args_list)
+        assert statements == [
+            "UPDATE test_table SET stage = 'lost' WHERE id IN ('r2')",
+            "UPDATE test_table SET stage = 'won' WHERE id IN ('r1', 'r3')",
+        ]
+
+    @patch.object(WorkspaceTableClient, "sql_query")
+    def test_failed_update_reports_committed_ranges(
+        self, mock_sql_query: Mock, client: WorkspaceTableClient
+    ) -> None:
+        """Test an update applied concurrently with a failed one is reported."""
+        started = threading.Barrier(2, timeout=5)
+
+        def run(**kwargs: str) -> list[dict[str, str]]:
+            started.wait()
+            if "'won'" in kwargs["sql"]:
+                raise APIError("Batch update failed")
+            return []
+
+        mock_sql_query.side_effect = run
+        records = [("r1", {"stage": "won"}), ("r2", {"stage": "lost"})]
+
+        with pytest.raises(APIError, match="Failed to update batch") as exc_info:
+            self._update(client, records, strategy="grouped", max_workers=2)
+
+        details = exc_info.value.details
+        assert len(details["failed_ranges"]) == 1
+        assert details["committed_rows"] == 1
+
+    @patch.object(WorkspaceTableClient, "sql_query")
+    def test_failed_grouped_update_reports_record_indices(
+        self, mock_sql_query: Mock, client: WorkspaceTableClient
+    ) -> None:
+        """Test a grouped batch of non-contiguous records is reported by its indices."""
+        started = threading.Barrier(2, timeout=5)
+
+        def run(**kwargs: str) -> list[dict[str, str]]:
+            started.wait()
+            if "= 2" in kwargs["sql"]:
+                raise APIError("Batch update failed")
+            return []
+
+        mock_sql_query.side_effect = run
+        records = [("a", {"x": 1}), ("b", {"x": 2}), ("c", {"x": 1})]
+
+        with pytest.raises(APIError, match="batch at index 1") as exc_info:
+            self._update(client, records, strategy="grouped", max_workers=2)
+
+        details = exc_info.value.details
+        assert details["committed_ranges"] == [[0, 1], [2, 1]]
+        assert details["failed_ranges"] == [[1, 1]]
+        assert details["committed_rows"] == 2
+
+    @patch.object(WorkspaceTableClient, "sql_query")
+    def test_case_strategy(self, mock_sql_query: Mock, client: WorkspaceTableClient) -> None:
+        """Test CASE strategy only emits branches for changed fields."""
+        mock_sql_query.return_value = []
+        records = [("r1", {"a": 1, "b": "x"}), ("r2", {"a": 2})]
+
+        self._update(client, records, strategy="case")
+
+        assert mock_sql_query.call_args.kwargs["sql"] == (
+            "UPDATE test_table SET a = CASE WHEN id = 'r1' THEN 1 WHEN id = 'r2' THEN 2 "
+            "ELSE a END, b = CASE WHEN id = 'r1' THEN 'x' ELSE b END WHERE id IN ('r1', 'r2')"
+        )
+
+    @patch.object(WorkspaceTableClient, "sql_query")
+    def test_auto_prefers_grouped_for_shared_values(
+        self, mock_sql_query: Mock, client: WorkspaceTableClient
+    ) -> None:
+        """Test auto picks grouped statements when values repeat."""
+        mock_sql_query.return_value = []
+        records = [(f"r{i}", {"stage": "won"}) for i in range(300)]
+
+        self._update(client, records)
+
+        assert mock_sql_query.call_count == 1
+        assert "CASE" not in mock_sql_query.call_args.kwargs["sql"]
+
+    @patch.object(WorkspaceTableClient, "sql_query")
+    def test_auto_prefers_case_for_distinct_values(
+        self, mock_sql_query: Mock, client: WorkspaceTableClient
+    ) -> None:
+        """Test auto picks CASE when every record has distinct values."""
+        mock_sql_query.return_value = []
+        records = [(f"r{i}", {"score": i}) for i in range(300)]
+
+        result = self._update(client, records)
+
+        assert result == 300
+        assert mock_sql_query.call_count == 1
+        assert "CASE" in mock_sql_query.call_args.kwargs["sql"]
+
+    @patch.object(WorkspaceTableClient, "sql_query")
+    def test_payload_limit_respected(
+        self, mock_sql_query: Mock, client: WorkspaceTableClient
+    ) -> None:
+        """Test both strategies keep statements under max_batch_bytes."""
+        mock_sql_query.return_value = []
+        records = [(f"rec-{i:05d}", {"note": "备注" * (i % 5), "score": i}) for i in range(400)]
+
+        for strategy in ("grouped", "case"):
+            mock_sql_query.reset_mock()
+            assert self._update(client, records, strategy=strategy, max_batch_bytes=4096) == 400
+            assert all(
+                len(call.kwargs["sql"].encode()) <= 4096 for call in mock_sql_query.call_args_list
+            )
+
+    def test_invalid_strategy(self, client: WorkspaceTableClient) -> None:
+        """Test unknown strategy is rejected."""
+        with pytest.raises(InvalidParameterError, match="strategy must be one of"):
+            self._update(client, [("r1", {"a": 1})], strategy="values")
+
+
 class TestAPIErrorMapping:
     """Test API error code mapping."""
 
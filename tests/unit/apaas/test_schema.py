@@ -0,0 +1,210 @@
+"""
+Unit tests for the aPaaS workspace schema cache.
+
+Tests SchemaCache bounds and WorkspaceTableClient schema lookups,
+refresh, DDL invalidation and write-path column checks.
+"""
+
+import json
+from unittest.mock import Mock, patch
+
+import pytest
+
+from lark_service.apaas.client import WorkspaceTableClient
+from lark_service.apaas.models import FieldType
+from lark_service.apaas.schema import SchemaCache, WorkspaceSchema
+from lark_service.core.credential_pool import CredentialPool
+from lark_service.core.exceptions import InvalidParameterError, NotFoundError
+
+TEST_APP_ID = "cli_a1b2c3d4e5f6g7h8"
+TEST_USER_TOKEN = "u-test1234567890abcdef"
+TEST_WORKSPACE_ID = "ws_test001"
+
+
+def _tables_response(*columns: str, strict: bool = False) -> Mock:
+    response = Mock()
+    response.json.return_value = {
+        "code": 0,
+        "data": {
+            "items": [
+                {
+                    "name": "customers",
+                    "columns": [
+                        {"name": "id", "data_type": "uuid", "is_allow_null": False},
+                        {"name": "_created_at", "data_type": "timestamptz", "is_allow_null": False},
+                        {"name": "name", "data_type": "varchar", "is_allow_null": not strict},
+                        {"name": "score", "data_type": "INT8"},
+                        *({"name": c, "data_type": "timestamptz"} for c in columns),
+                    ],
+                },
+                {"name": "orders", "columns": []},
+            ]
+        },
+    }
+    return response
+
+
+def _sql_response(rows: list) -> Mock:
+    response = Mock()
+    response.json.return_value = {"code": 0, "data": {"result": json.dumps([json.dumps(rows)])}}
+    return response
+
+
+class TestSchemaCache:
+    """Test the in-memory schema cache."""
+
+    def test_ttl_and_scope(self) -> None:
+        """Test entries expire and are kept per user scope."""
+        cache = SchemaCache(ttl_seconds=10)
+        cache.set("alice", WorkspaceSchema(TEST_WORKSPACE_ID, {}, loaded_at=100.0))
+
+        with patch("lark_service.apaas.schema.time.monotonic", return_value=105.0):
+            assert cache.get(TEST_WORKSPACE_ID, "alice") is not None
+            assert cache.get(TEST_WORKSPACE_ID, "bob") is None
+        with patch("lark_service.apaas.schema.time.monotonic", return_value=110.0):
+            assert cache.get(TEST_WORKSPACE_ID, "alice") is None
+        assert (cache.hits, cache.misses) == (1, 2)
+
+    def test_max_workspaces_evicts_oldest(self) -> None:
+        """Test the oldest loaded schema is evicted first."""
+        cache = SchemaCache(max_workspaces=2)
+        for i, loaded_at in enumerate([3.0, 1.0, 2.0]):
+            cache.set("scope", WorkspaceSchema(f"ws_{i}", {}, loaded_at=loaded_at))
+
+        assert len(cache) == 2
+        assert cache.invalidate("ws_1") == 0
+        assert cache.invalidate() == 2
+
+    def test_invalid_settings(self) -> None:
+        """Test invalid settings are rejected."""
+        with pytest.raises(InvalidParameterError):
+            SchemaCache(ttl_seconds=0)
+
+
+class TestClientSchemaCache:
+    """Test schema lookups through WorkspaceTableClient."""
+
+    @pytest.fixture
+    def client(self) -> WorkspaceTableClient:
+        """Create client with schema cache."""
+        return WorkspaceTableClient(
+            Mock(spec=CredentialPool), app_id=TEST_APP_ID, schema_cache=SchemaCache()
+        )
+
+    @patch("lark_service.apaas.client.requests.get")
+    def test_tables_and_fields_share_one_request(
+        self, mock_get: Mock, client: WorkspaceTableClient
+    ) -> None:
+        """Test listing tables, fields and types costs one API call."""
+        mock_get.return_value = _tables_response()
+
+        tables = client.list_workspace_tables(TEST_USER_TOKEN, TEST_WORKSPACE_ID)
+        fields = client.list_fields(TEST_USER_TOKEN, "customers", TEST_WORKSPACE_ID)
+        types = client.get_field_types(TEST_USER_TOKEN, "customers", TEST_WORKSPACE_ID)
+
+        assert [t.name for t in tables] == ["customers", "orders"]
+        assert [f.field_name for f in fields] == ["id", "_created_at", "name", "score"]
+        assert types == {
+            "id": FieldType.TEXT,
+            "_created_at": FieldType.DATETIME,
+            "name": FieldType.TEXT,
+            "score": FieldType.NUMBER,
+        }
+        assert mock_get.call_count == 1
+
+    @patch("lark_service.apaas.client.requests.get")
+    def test_refresh_reloads(self, mock_get: Mock, client: WorkspaceTableClient) -> None:
+        """Test refresh=True and refresh_schema() bypass the cache."""
+        mock_get.side_effect = [_tables_response(), _tables_response("seen_at")]
+
+        client.list_fields(TEST_USER_TOKEN, "customers", TEST_WORKSPACE_ID)
+        fields = client.list_fields(TEST_USER_TOKEN, "customers", TEST_WORKSPACE_ID, refresh=True)
+
+        assert fields[-1].field_type == FieldType.DATETIME
+        assert client.refresh_schema(TEST_WORKSPACE_ID) == 1
+
+    @patch("lark_service.apaas.client.requests.get")
+    def test_missing_table_reloads_once(self, mock_get: Mock, client: WorkspaceTableClient) -> None:
+        """Test a table missing from the cached schema triggers one reload."""
+        mock_get.return_value = _tables_response()
+        client.list_workspace_tables(TEST_USER_TOKEN, TEST_WORKSPACE_ID)
+
+        with pytest.raises(NotFoundError):
+            client.list_fields(TEST_USER_TOKEN, "missing", TEST_WORKSPACE_ID)
+        assert mock_get.call_count == 2
+
+    @patch("lark_service.apaas.client.requests.post")
+    @patch("lark_service.apaas.client.requests.get")
+    def test_write_rejects_unknown_field(
+        self, mock_get: Mock, mock_post: Mock, client: WorkspaceTableClient
+    ) -> None:
+        """Test unknown columns fail before any SQL is sent."""
+        mock_get.return_value = _tables_response()
+
+        with pytest.raises(InvalidParameterError, match="nmae"):
+            client.create_record(TEST_USER_TOKEN, "customers", TEST_WORKSPACE_ID, {"nmae": "x"})
+        mock_post.assert_not_called()
+
+    @patch("lark_service.apaas.client.requests.post")
+    @patch("lark_service.apaas.client.requests.get")
+    def test_insert_rejects_missing_required_field(
+        self, mock_get: Mock, mock_post: Mock, client: WorkspaceTableClient
+    ) -> None:
+        """Test inserts without a NOT NULL column fail; system columns are exempt."""
+        mock_get.return_value = _tables_response(strict=True)
+
+        table_schema = client._get_table_schema(
+            TEST_USER_TOKEN, "customers", TEST_WORKSPACE_ID, "test"
+        )
+        assert table_schema.required_fields == ("name",)
+
+        with pytest.raises(InvalidParameterError, match="name") as exc_info:
+            client.batch_create_records(
+                TEST_USER_TOKEN,
+                "customers",
+                TEST_WORKSPACE_ID,
+                [{"name": "a"}, {"score": 1}, {"name": None}],
+            )
+        assert exc_info.value.details["record_index"] == 1
+        with pytest.raises(InvalidParameterError, match="Missing required"):
+            client.create_record(TEST_USER_TOKEN, "customers", TEST_WORKSPACE_ID, {"score": 1})
+        mock_post.assert_not_called()
+
+        # Updates may leave required columns out
+        mock_post.return_value = _sql_response([{"id": "1"}])
+        client.update_record(TEST_USER_TOKEN, "customers", TEST_WORKSPACE_ID, "1", {"score": 2})
+        mock_post.assert_called_once()
+
+    @patch("lark_service.apaas.client.requests.post")
+    @patch("lark_service.apaas.client.requests.get")
+    def test_write_uses_cached_schema(
+        self, mock_get: Mock, mock_post: Mock, client: WorkspaceTableClient
+    ) -> None:
+        """Test repeated writes check columns without schema requests."""
+        mock_get.return_value = _tables_response()
+        mock_post.return_value = _sql_response([{"id": "1"}])
+
+        for _ in range(3):
+            client.create_record(TEST_USER_TOKEN, "customers", TEST_WORKSPACE_ID, {"name": "x"})
+        client.batch_update_records(
+            TEST_USER_TOKEN, "customers", TEST_WORKSPACE_ID, [("1", {"score": 2})]
+        )
+
+        assert mock_get.call_count == 1
+
+    @patch("lark_service.apaas.client.requests.post")
+    @patch("lark_service.apaas.client.requests.get")
+    def test_ddl_invalidates_schema(
+        self, mock_get: Mock, mock_post: Mock, client: WorkspaceTableClient
+    ) -> None:
+        """Test ALTER TABLE through sql_query drops the cached schema."""
+        mock_get.side_effect = [_tables_response(), _tables_response("seen_at")]
+        mock_post.return_value = _sql_response([])
+
+        client.list_fields(TEST_USER_TOKEN, "customers", TEST_WORKSPACE_ID)
+        client.sql_query(
+            TEST_USER_TOKEN, TEST_WORKSPACE_ID, "ALTER TABLE customers ADD seen_at timestamptz"
+        )
+        types = client.get_field_types(TEST_USER_TOKEN, "customers", TEST_WORKSPACE_ID)
+
+        assert types["seen_at"] == FieldType.DATETIME
@@ -5,12 +5,15 @@ Simplified tests focused on achieving 75% coverage for CardBuilder and CallbackH
 
 import hashlib
 import hmac
+import time
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import Mock
 
 import pytest
 
 from lark_service.cardkit.builder import CardBuilder
 from lark_service.cardkit.callback_handler import CallbackHandler
+from lark_service.cardkit.models import CallbackCheck
 from lark_service.core.exceptions import InvalidParameterError, ValidationError
 
 # === CardBuilder Tests ===
@@ -122,6 +125,14 @@ class TestCardBuilder:
         assert card_builder._elements[0]["img_key"] == "img_key_123"
         assert card_builder._elements[0]["title"]["content"] == "My Image"
 
+    def test_fluent_add_images(self, card_builder: CardBuilder) -> None:
+        """Test fluent add_images adds one element per key."""
+        result = card_builder.add_images(["img_v2_a", "img_v2_b"], alt="Chart")
+
+        assert result is card_builder
+        assert [e["img_key"] for e in card_builder._elements] == ["img_v2_a", "img_v2_b"]
+        assert card_builder._elements[1]["alt"]["content"] == "Chart"
+
     def test_fluent_add_note(self, card_builder: CardBuilder) -> None:
         """Test fluent add_note method."""
         result = card_builder.add_note("Important message", note_type="warning")
@@ -297,6 +308,12 @@ class TestCardBuilder:
 # === CallbackHandler Tests ===
 
 
+def _sign(timestamp: str, nonce: str, body: bytes, key: str = "test_key") -> str:
+    """Sign a callback body the way Lark does."""
+    message = timestamp.encode() + nonce.encode() + key.encode() + body
+    return hmac.new(key.encode(), message, hashlib.sha256).hexdigest()
+
+
 @pytest.fixture
 def callback_handler() -> CallbackHandler:
     """Create CallbackHandler with test credentials."""
@@ -366,6 +383,89 @@ class TestCallbackHandler:
 
         assert is_valid is True
 
+    def test_check_request(self, callback_handler: CallbackHandler) -> None:
+        """Test replayed, stale and forged requests are rejected before parsing."""
+        body = b'{"schema":"2.0","header":{"event_id":"evt_1"}}'
+        timestamp = str(int(time.time()))
+        signature = _sign(timestamp, "n1", body)
+
+        check = callback_handler.check_request
+        assert check(body, timestamp, "n1", signature) is CallbackCheck.ACCEPTED
+        assert check(body, timestamp, "n1", signature) is CallbackCheck.DUPLICATE
+        assert check(body, "1234567890", "n2", _sign("1234567890", "n2", body)) is (
+            CallbackCheck.DUPLICATE
+        )
+        other = b'{"header":{"event_id":"evt_2"}}'
+        assert check(other, "1234567890", "n3", _sign("1234567890", "n3", other)) is (
+            CallbackCheck.EXPIRED
+        )
+        assert check(other, timestamp, "n3", "forged") is CallbackCheck.INVALID_SIGNATURE
+        assert callback_handler.stats[CallbackCheck.DUPLICATE] == 2
+
+    def test_stats_counted_across_threads(self, callback_handler_no_key: CallbackHandler) -> None:
+        """Test concurrent checks from server threads are all counted."""
+
+        def check_many(worker: int) -> None:
+            for i in range(500):
+                callback_handler_no_key.check_request(
+                    f'{{"header":{{"event_id":"evt_{worker}_{i % 250}"}}}}'
+                )
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(check_many, range(8)))
+
+        assert callback_handler_no_key.stats[CallbackCheck.ACCEPTED] == 8 * 250
+        assert callback_handler_no_key.stats[CallbackCheck.DUPLICATE] == 8 * 250
+
+    def test_duplicate_event_skips_parsing(self, callback_handler_no_key: CallbackHandler) -> None:
+        """Test a redelivered event_id is recognized from the raw body alone."""
+        check = callback_handler_no_key.check_request
+        assert check('{"header":{"event_id":"evt_1"},"n":1}') is CallbackCheck.ACCEPTED
+        assert check('{"header":{"event_id":"evt_1"}, not json') is CallbackCheck.DUPLICATE
+
+        callback_handler_no_key.forget_request('{"header":{"event_id":"evt_1"}}')
+        assert check('{"header":{"event_id":"evt_1"}}') is CallbackCheck.ACCEPTED
+
+    def test_nested_event_id_is_not_a_dedup_key(
+        self, callback_handler_no_key: CallbackHandler
+    ) -> None:
+        """Test an event_id inside action.value does not dedup different clicks."""
+        check = callback_handler_no_key.check_request
+        for user in ("ou_1", "ou_2"):
+            body = (
+                f'{{"open_id":"{user}","action":{{"value":{{"event_id":"approve"}}}},'
+                f'"token":"v_test_token"}}'
+            )
+            assert check(body) is CallbackCheck.ACCEPTED
+
+    def test_unsigned_requests_not_remembered_with_key(
+        self, callback_handler: CallbackHandler
+    ) -> None:
+        """Test unsigned requests cannot suppress the signed callback."""
+        body = b'{"schema":"2.0","header":{"event_id":"evt_1"}}'
+        timestamp = str(int(time.time()))
+
+        assert callback_handler.check_request(body) is CallbackCheck.ACCEPTED
+        assert (
+            callback_handler.check_request(body, timestamp, "n1", _sign(timestamp, "n1", body))
+            is CallbackCheck.ACCEPTED
+        )
+
+    def test_handle_callback_forgets_failed_request(
+        self, callback_handler_no_key: CallbackHandler, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test a callback whose routing raises is processed again on retry."""
+        data = {"type": "card_action_trigger", "header": {"event_id": "evt_1"}}
+        route = Mock(side_effect=[RuntimeError("boom"), {"status": "success"}])
+        monkeypatch.setattr(callback_handler_no_key, "route_callback", route)
+
+        with pytest.raises(RuntimeError):
+            callback_handler_no_key.handle_callback(data)
+        assert callback_handler_no_key.handle_callback(data) == {"status": "success"}
+        assert callback_handler_no_key.handle_callback(data)["message"] == (
+            "Duplicate callback ignored"
+        )
+
     def test_handle_url_verification(self, callback_handler: CallbackHandler) -> None:
         """Test URL verification."""
         result = callback_handler.handle_url_verification(
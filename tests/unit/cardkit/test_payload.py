@@ -0,0 +1,55 @@
+"""Unit tests for pre-serialized card payloads and JSON backends."""
+
+import json
+
+import pytest
+
+from lark_service.cardkit.builder import CardBuilder
+from lark_service.cardkit.payload import CardPayload
+from lark_service.core.exceptions import InvalidParameterError
+from lark_service.utils import json_codec
+
+
+@pytest.fixture(params=json_codec.available_json_backends())
+def backend(request: pytest.FixtureRequest):
+    """Run a test with every installed JSON backend."""
+    previous = json_codec.get_json_backend()
+    json_codec.set_json_backend(request.param)
+    yield request.param
+    json_codec.set_json_backend(previous)
+
+
+def test_build_payload_matches_build(backend: str) -> None:
+    """Test the payload serializes the same card that build() returns."""
+    expected = CardBuilder().add_header("标题").add_text("内容").build()
+    payload = CardBuilder().add_header("标题").add_text("内容").build_payload()
+
+    assert isinstance(payload, str)
+    assert payload.to_dict() == expected
+    assert "标题" in payload  # compact UTF-8, not \\u escapes
+
+
+def test_template_render_returns_payload() -> None:
+    """Test compiled templates render payloads."""
+    template = CardBuilder().add_text("{{text}}").compile()
+
+    payload = template.render(text="hi")
+
+    assert isinstance(payload, CardPayload)
+    assert payload.to_dict()["elements"][0]["text"]["content"] == "hi"
+
+
+def test_from_card_and_from_json() -> None:
+    """Test validation on from_card and trusted wrapping on from_json."""
+    card = {"elements": [{"tag": "hr"}]}
+
+    assert json.loads(CardPayload.from_card(card)) == card
+    assert CardPayload.from_json(b'{"elements":[]}') == '{"elements":[]}'
+    with pytest.raises(InvalidParameterError, match="Invalid card content"):
+        CardPayload.from_card({"elements": []})
+
+
+def test_unknown_backend_rejected() -> None:
+    """Test selecting a backend that is not installed fails."""
+    with pytest.raises(InvalidParameterError, match="not available"):
+        json_codec.set_json_backend("simdjson")
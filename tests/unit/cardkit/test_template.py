@@ -0,0 +1,107 @@
+"""Unit tests for compiled card templates.
+
+Tests that rendering a compiled template produces the same card as
+building it directly, and that slot values are escaped and type-checked.
+"""
+
+import json
+
+import pytest
+
+from lark_service.cardkit.builder import CardBuilder
+from lark_service.cardkit.template import CardTemplate
+from lark_service.core.exceptions import InvalidParameterError
+
+
+@pytest.fixture
+def approval_template() -> CardTemplate:
+    """Compile an approval card with text slots."""
+    return CardTemplate.compile(
+        CardBuilder().build_approval_card(
+            title="{{title}}",
+            applicant="{{applicant}}",
+            fields={"Days": "{{days}}"},
+            approve_action_id="approve_{{request_id}}",
+            reject_action_id="reject_{{request_id}}",
+        )
+    )
+
+
+def test_render_matches_template_method(approval_template: CardTemplate) -> None:
+    """Test rendered JSON equals the card built with the same values."""
+    expected = CardBuilder().build_approval_card(
+        title="Leave Request",
+        applicant="张三",
+        fields={"Days": "3"},
+        approve_action_id="approve_r1",
+        reject_action_id="reject_r1",
+    )
+
+    rendered = approval_template.render(
+        title="Leave Request", applicant="张三", days="3", request_id="r1"
+    )
+
+    assert json.loads(rendered) == expected
+    assert set(approval_template.slots) == {"title", "applicant", "days", "request_id"}
+
+
+def test_values_are_escaped(approval_template: CardTemplate) -> None:
+    """Test quotes, backslashes and newlines cannot break the JSON."""
+    applicant = 'Bob", "tag": "injected\\\n{{title}}'
+    card = approval_template.render_dict(title="T", applicant=applicant, days="1", request_id="r")
+
+    assert card["elements"][0]["text"]["content"] == f"**申请人**: {applicant}"
+    assert card["header"]["title"]["content"] == "T"
+
+
+def test_typed_slots_render_json_literals() -> None:
+    """Test whole-value slots render as numbers and booleans."""
+    template = (
+        CardBuilder()
+        .add_header("Job {{job}}")
+        .add_markdown("{{done}}/{{total}} done")
+        .compile(slots={"done": int, "total": int})
+    )
+    card = CardBuilder().build_card(
+        elements=[
+            {"tag": "progress", "percent": "{{percent}}", "final": "{{final}}"},
+        ]
+    )
+    progress = CardTemplate.compile(card, slots={"percent": float, "final": bool})
+
+    assert json.loads(template.render(job="sync", done=3, total=10))["elements"][0]["text"] == {
+        "tag": "lark_md",
+        "content": "3/10 done",
+    }
+    assert json.loads(progress.render(percent=50, final=False))["elements"][0] == {
+        "tag": "progress",
+        "percent": 50,
+        "final": False,
+    }
+
+
+def test_render_validates_values() -> None:
+    """Test missing, unknown and mistyped values are rejected."""
+    template = CardTemplate.compile(
+        {"elements": [{"tag": "div", "count": "{{count}}", "text": "{{text}}"}]},
+        slots={"count": int},
+    )
+
+    with pytest.raises(InvalidParameterError, match="do not match"):
+        template.render(count=1)
+    with pytest.raises(InvalidParameterError, match="do not match"):
+        template.render(count=1, text="a", extra="b")
+    with pytest.raises(InvalidParameterError, match="expects int"):
+        template.render(count=True, text="a")
+    with pytest.raises(InvalidParameterError, match="expects str"):
+        template.render(count=1, text=5)
+
+
+def test_compile_rejects_invalid_templates() -> None:
+    """Test invalid cards and slot declarations fail at compile time."""
+    with pytest.raises(InvalidParameterError, match="Invalid card template"):
+        CardTemplate.compile({"elements": []})
+    with pytest.raises(InvalidParameterError, match="Unsupported type"):
+        CardTemplate.compile({"elements": [{"tag": "hr"}]}, slots={"x": list})  # type: ignore[dict-item]
+    with pytest.raises(InvalidParameterError, match="not found"):
+        CardTemplate.compile({"elements": [{"tag": "hr"}]}, slots={"x": int})
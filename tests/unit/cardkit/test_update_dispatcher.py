@@ -0,0 +1,105 @@
+"""Unit tests for the coalescing card update dispatcher."""
+
+import threading
+import time
+from unittest.mock import Mock
+
+import pytest
+
+from lark_service.cardkit.update_dispatcher import CardUpdateDispatcher
+from lark_service.core.exceptions import InvalidParameterError, LarkServiceError, QueueFullError
+
+
+class RecordingUpdater:
+    """CardUpdater stand-in recording (message_id, content, time) per update."""
+
+    def __init__(self, delay: float = 0.0) -> None:
+        self.delay = delay
+        self.calls: list[tuple[str, dict, float]] = []
+        self.lock = threading.Lock()
+
+    def update_card_content(self, app_id: str, message_id: str, card_content: dict) -> dict:
+        time.sleep(self.delay)
+        with self.lock:
+            self.calls.append((message_id, card_content, time.monotonic()))
+        return {"success": True, "message_id": message_id}
+
+    def sent(self, message_id: str) -> list[dict]:
+        return [content for mid, content, _ in self.calls if mid == message_id]
+
+
+def card(step: int) -> dict:
+    return {"elements": [{"tag": "div", "text": {"content": str(step)}}]}
+
+
+def test_burst_is_coalesced_to_latest() -> None:
+    """Test a burst of updates results in few PATCHes ending with the last one."""
+    updater = RecordingUpdater()
+    with CardUpdateDispatcher(updater, max_rate=20, debounce=0.01) as dispatcher:
+        for step in range(200):
+            dispatcher.submit("cli_a", "om_1", card(step))
+            time.sleep(0.0005)
+        assert dispatcher.flush(timeout=5)
+
+    sent = updater.sent("om_1")
+    assert sent[-1] == card(199)
+    assert len(sent) < 20
+    assert dispatcher.stats["coalesced"] == 200 - len(sent)
+    times = [t for _, _, t in updater.calls]
+    assert all(b - a >= 0.04 for a, b in zip(times, times[1:], strict=False))
+
+
+def test_messages_are_updated_in_parallel() -> None:
+    """Test slow updates of one card do not hold back other cards."""
+    updater = RecordingUpdater(delay=0.2)
+    with CardUpdateDispatcher(updater, debounce=0, workers=4) as dispatcher:
+        started = time.monotonic()
+        for i in range(4):
+            dispatcher.submit("cli_a", f"om_{i}", card(i))
+        assert dispatcher.flush(timeout=5)
+
+    assert time.monotonic() - started < 0.6
+    assert sorted(mid for mid, _, _ in updater.calls) == ["om_0", "om_1", "om_2", "om_3"]
+
+
+def test_close_delivers_pending_state() -> None:
+    """Test closing sends pending content without waiting for its slot."""
+    updater = RecordingUpdater()
+    dispatcher = CardUpdateDispatcher(updater, max_rate=0.1, debounce=30)
+    dispatcher.start()
+    dispatcher.submit("cli_a", "om_1", card(1))
+    dispatcher.submit("cli_a", "om_1", card(2))
+
+    started = time.monotonic()
+    dispatcher.close()
+
+    assert time.monotonic() - started < 2
+    assert updater.sent("om_1") == [card(2)]
+    with pytest.raises(LarkServiceError, match="closed"):
+        dispatcher.submit("cli_a", "om_1", card(3))
+
+
+def test_failed_update_is_retried_unless_superseded() -> None:
+    """Test failed content is sent again on the next slot."""
+    updater = Mock()
+    updater.update_card_content.side_effect = [RuntimeError("rate limited"), {"success": True}]
+    with CardUpdateDispatcher(updater, max_rate=50, debounce=0) as dispatcher:
+        dispatcher.submit("cli_a", "om_1", card(1))
+        assert dispatcher.flush(timeout=5)
+
+    assert updater.update_card_content.call_count == 2
+    assert dispatcher.stats["retried"] == 1
+    assert dispatcher.stats["sent"] == 1
+
+
+def test_limits() -> None:
+    """Test invalid settings and the pending bound."""
+    with pytest.raises(InvalidParameterError):
+        CardUpdateDispatcher(Mock(), max_rate=0)
+
+    dispatcher = CardUpdateDispatcher(Mock(), max_pending=1)
+    dispatcher.submit("cli_a", "om_1", card(1))
+    dispatcher.submit("cli_a", "om_1", card(2))
+    with pytest.raises(QueueFullError):
+        dispatcher.submit("cli_a", "om_2", card(1))
+    assert dispatcher.stats["pending"] == 1
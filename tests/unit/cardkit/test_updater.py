@@ -68,3 +68,28 @@ class TestCardUpdater:
                 message_id="",
                 card_content={"elements": []},
             )
+
+
+class TestCardPayloadUpdate:
+    """Test updating cards with pre-serialized payloads."""
+
+    def test_payload_sent_without_revalidation(
+        self, card_updater: CardUpdater, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test a CardPayload is patched as is, without CardConfig validation."""
+        from unittest.mock import Mock
+
+        from lark_service.cardkit import payload as payload_module
+        from lark_service.cardkit.builder import CardBuilder
+
+        mock_client = card_updater.credential_pool._get_sdk_client.return_value
+        mock_client.im.v1.message.patch.return_value.success.return_value = True
+        payload = CardBuilder().add_text("Done").build_payload()
+        validate = Mock(side_effect=AssertionError("validated again"))
+        monkeypatch.setattr(payload_module, "CardConfig", validate)
+
+        card_updater.update_card_content("cli_test1234567890ab", "om_test", payload)
+
+        request = mock_client.im.v1.message.patch.call_args.args[0]
+        assert request.request_body.content is payload
+        validate.assert_not_called()
@@ -4,13 +4,14 @@ Unit tests for SheetClient.
 Tests data operations, formatting, and layout management.
 """
 
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
 import pytest
 
+from lark_service.clouddoc.models import CellData
 from lark_service.clouddoc.sheet.client import SheetClient
 from lark_service.core.credential_pool import CredentialPool
-from lark_service.core.exceptions import InvalidParameterError
+from lark_service.core.exceptions import InvalidParameterError, NotFoundError
 
 
 class TestSheetClientValidation:
@@ -437,3 +438,122 @@ class TestSheetClientOperations:
         )
 
         assert result is True
+
+
+class TestSheetClientValues:
+    """Test SheetClient value reads with mocked HTTP responses."""
+
+    @pytest.fixture
+    def client(self):
+        """Create SheetClient instance."""
+        pool = Mock(spec=CredentialPool)
+        pool.get_token.return_value = "test_tenant_token"
+        return SheetClient(pool)
+
+    @pytest.fixture
+    def values_response(self):
+        """Mock Sheets v2 values response."""
+        response = Mock()
+        response.status_code = 200
+        response.json.return_value = {
+            "code": 0,
+            "data": {"valueRange": {"values": [["Name", "Age"], ["John", None]]}},
+        }
+        return response
+
+    @patch("lark_service.clouddoc.sheet.client.requests.get")
+    def test_get_sheet_data_builds_cell_data(self, mock_get, client, values_response):
+        """Test get_sheet_data returns CellData with empty string for None."""
+        mock_get.return_value = values_response
+
+        data = client.get_sheet_data("cli_test1234567890ab", "shtcn123", "sheet1", "A1:B2")
+
+        assert all(isinstance(cell, CellData) for row in data for cell in row)
+        assert [[cell.value for cell in row] for row in data] == [["Name", "Age"], ["John", ""]]
+        assert data[0][0].bold is None
+        assert mock_get.call_args.kwargs["params"]["valueRenderOption"] == "ToString"
+
+    @patch("lark_service.clouddoc.sheet.client.requests.get")
+    def test_get_sheet_values_returns_raw_lists(self, mock_get, client, values_response):
+        """Test get_sheet_values returns plain nested lists."""
+        mock_get.return_value = values_response
+
+        values = client.get_sheet_values("cli_test1234567890ab", "shtcn123", "sheet1", "A1:B2")
+
+        assert values == [["Name", "Age"], ["John", None]]
+        assert "sheet1!A1:B2" in mock_get.call_args.args[0]
+
+    def test_get_sheet_values_empty_range(self, client):
+        """Test get_sheet_values fails with empty range."""
+        with pytest.raises(InvalidParameterError, match="Range string cannot be empty"):
+            client.get_sheet_values("cli_test1234567890ab", "shtcn123", "sheet1", "")
+
+
+class TestSheetClientBlockReads:
+    """Test concurrent row-block reads of large ranges."""
+
+    @pytest.fixture
+    def client(self):
+        """Create SheetClient whose raw fetch echoes the requested range."""
+        client = SheetClient(Mock(spec=CredentialPool))
+        client._fetch_values = Mock(side_effect=lambda app_id, token, full_range: [[full_range]])
+        return client
+
+    def test_blocks_are_yielded_in_order(self, client):
+        """Test a bounded range is split into ordered row blocks."""
+        blocks = list(
+            client.iter_sheet_value_blocks(
+                "cli_test1234567890ab",
+                "shtcn123",
+                "sheet1",
+                range_str="B2:D11",
+                block_rows=4,
+                max_workers=2,
+            )
+        )
+
+        assert blocks == [[["sheet1!B2:D5"]], [["sheet1!B6:D9"]], [["sheet1!B10:D11"]]]
+        assert client._fetch_values.call_count == 3
+
+    def test_open_range_uses_sheet_dimensions(self, client):
+        """Test open-ended ranges are bounded with get_sheet_info."""
+        client.get_sheet_info = Mock(
+            return_value=[
+                {"sheet_id": "other", "title": "o", "index": 0},
+                {"sheet_id": "sheet1", "title": "s", "index": 1, "row_count": 5, "column_count": 3},
+            ]
+        )
+
+        rows = client.get_large_sheet_values(
+            "cli_test1234567890ab", "shtcn123", "sheet1", block_rows=2
+        )
+
+        assert rows == [["sheet1!A1:C2"], ["sheet1!A3:C4"], ["sheet1!A5:C5"]]
+
+    def test_default_block_rows_respects_cell_limit(self, client):
+        """Test default block size keeps each request under MAX_READ_CELLS."""
+        client.MAX_READ_CELLS = 100
+
+        rows = client.get_large_sheet_values("cli_test1234567890ab", "shtcn123", "sheet1", "A1:J25")
+
+        assert rows == [["sheet1!A1:J10"], ["sheet1!A11:J20"], ["sheet1!A21:J25"]]
+
+    def test_lowercase_range_is_accepted(self, client):
+        """Test column letters are matched case-insensitively."""
+        rows = client.get_large_sheet_values(
+            "cli_test1234567890ab", "shtcn123", "sheet1", "b2:c5", block_rows=2
+        )
+
+        assert rows == [["sheet1!B2:C3"], ["sheet1!B4:C5"]]
+
+    def test_unknown_sheet_raises(self, client):
+        """Test missing sheet raises NotFoundError."""
+        client.get_sheet_info = Mock(return_value=[])
+
+        with pytest.raises(NotFoundError, match="Sheet not found"):
+            client.get_large_sheet_values("cli_test1234567890ab", "shtcn123", "sheet1", "A:J")
+
+    def test_invalid_range_raises(self, client):
+        """Test non-A1 ranges are rejected."""
+        with pytest.raises(InvalidParameterError, match="Unsupported range"):
+            client.get_large_sheet_values("cli_test1234567890ab", "shtcn123", "sheet1", "R1C1:R2C2")
@@ -0,0 +1,217 @@
+"""
+Unit tests for SheetClient batch APIs and SheetWriteBuffer.
+
+Tests range chunking, batch request payloads and write coalescing.
+"""
+
+from unittest.mock import Mock, patch
+
+import pytest
+
+from lark_service.clouddoc.sheet.client import SheetClient
+from lark_service.clouddoc.sheet.writer import SheetWriteBuffer
+from lark_service.core.credential_pool import CredentialPool
+from lark_service.core.exceptions import APIError, InvalidParameterError
+
+
+def _response(data):
+    response = Mock()
+    response.status_code = 200
+    response.json.return_value = {"code": 0, "msg": "success", "data": data}
+    return response
+
+
+@pytest.fixture
+def client():
+    """Create SheetClient instance."""
+    pool = Mock(spec=CredentialPool)
+    pool.get_token.return_value = "test_tenant_token"
+    return SheetClient(pool)
+
+
+class TestBatchGet:
+    """Test SheetClient.batch_get_sheet_values."""
+
+    @patch("lark_service.clouddoc.sheet.client.requests.get")
+    def test_batch_get_preserves_order(self, mock_get, client):
+        """Test values are returned in request order and chunked."""
+        client.MAX_BATCH_RANGES = 2
+        mock_get.side_effect = [
+            _response({"valueRanges": [{"values": [["a"]]}, {"values": [["b"]]}]}),
+            _response({"valueRanges": [{"values": None}]}),
+        ]
+
+        result = client.batch_get_sheet_values(
+            "cli_test1234567890ab", "shtcn123", ["s1!A1:A1", "s1!B1:B1", "s2!C1:C1"]
+        )
+
+        assert result == [[["a"]], [["b"]], []]
+        assert mock_get.call_count == 2
+        assert mock_get.call_args_list[0].kwargs["params"]["ranges"] == "s1!A1:A1,s1!B1:B1"
+        assert mock_get.call_args_list[0].args[0].endswith("/values_batch_get")
+
+    @patch("lark_service.clouddoc.sheet.client.requests.get")
+    def test_batch_get_count_mismatch(self, mock_get, client):
+        """Test mismatched response length raises APIError."""
+        client.retry_strategy.max_retries = 0
+        mock_get.return_value = _response({"valueRanges": []})
+
+        with pytest.raises(APIError, match="expected 1"):
+            client.batch_get_sheet_values("cli_test1234567890ab", "shtcn123", ["s1!A1:A1"])
+
+    def test_batch_get_requires_sheet_prefix(self, client):
+        """Test ranges without sheet ID are rejected."""
+        with pytest.raises(InvalidParameterError, match="sheet ID"):
+            client.batch_get_sheet_values("cli_test1234567890ab", "shtcn123", ["A1:B2"])
+
+
+class TestBatchUpdate:
+    """Test SheetClient.batch_update_sheet_data."""
+
+    @patch("lark_service.clouddoc.sheet.client.requests.post")
+    def test_batch_update_single_request(self, mock_post, client):
+        """Test many small ranges are sent in one request."""
+        mock_post.return_value = _response(
+            {"responses": [{"updatedCells": 2}, {"updatedCells": 1}]}
+        )
+
+        updated = client.batch_update_sheet_data(
+            "cli_test1234567890ab",
+            "shtcn123",
+            [("s1!A1", [["x", "y"]]), ("s2!C5:C5", [[1]])],
+        )
+
+        assert updated == 3
+        assert mock_post.call_count == 1
+        payload = mock_post.call_args.kwargs["json"]
+        assert payload == {
+            "valueRanges": [
+                {"range": "s1!A1:B1", "values": [["x", "y"]]},
+                {"range": "s2!C5:C5", "values": [[1]]},
+            ]
+        }
+
+    @patch("lark_service.clouddoc.sheet.client.requests.post")
+    def test_batch_update_splits_by_cell_limit(self, mock_post, client):
+        """Test oversized ranges are split by rows across requests."""
+        client.MAX_WRITE_CELLS = 4
+        mock_post.side_effect = [
+            _response({"responses": [{"updatedCells": 4}]}),
+            _response({"responses": [{"updatedCells": 2}]}),
+        ]
+
+        updated = client.batch_update_sheet_data(
+            "cli_test1234567890ab",
+            "shtcn123",
+            [("s1!B2", [[1, 2], [3, 4], [5, 6]])],
+        )
+
+        assert updated == 6
+        ranges = [
+            [vr["range"] for vr in call.kwargs["json"]["valueRanges"]]
+            for call in mock_post.call_args_list
+        ]
+        assert ranges == [["s1!B2:C3"], ["s1!B4:C4"]]
+
+    def test_batch_update_empty(self, client):
+        """Test empty input is rejected."""
+        with pytest.raises(InvalidParameterError, match="Value ranges cannot be empty"):
+            client.batch_update_sheet_data("cli_test1234567890ab", "shtcn123", [])
+
+
+class TestSheetWriteBuffer:
+    """Test SheetWriteBuffer coalescing."""
+
+    @pytest.fixture
+    def writer(self, client):
+        """Create writer with mocked batch update."""
+        client.batch_update_sheet_data = Mock(return_value=4)
+        return client.buffered_writer("cli_test1234567890ab", "shtcn123")
+
+    def test_rows_below_are_merged(self, writer):
+        """Test consecutive rows with same columns become one range."""
+        for i in range(1, 4):
+            writer.write("s1", f"A{i}", [[f"r{i}", i]])
+
+        assert writer.pending_ranges == ["s1!A1:B3"]
+
+    def test_columns_right_are_merged(self, writer):
+        """Test blocks directly to the right are merged."""
+        writer.write("s1", "A1", [[1], [2]])
+        writer.write("s1", "B1:B2", [[3], [4]])
+
+        assert writer.pending_ranges == ["s1!A1:B2"]
+
+    def test_non_adjacent_writes_kept_separate(self, writer):
+        """Test gaps, other sheets and width changes are not merged."""
+        writer.write("s1", "A1", [[1, 2]])
+        writer.write("s1", "A3", [[3, 4]])
+        writer.write("s2", "A4", [[5, 6]])
+        writer.write("s2", "A5", [[7]])
+
+        assert writer.pending_ranges == ["s1!A1:B1", "s1!A3:B3", "s2!A4:B4", "s2!A5:A5"]
+
+    def test_context_manager_flushes_once(self, writer):
+        """Test exit flushes pending writes in a single batch call."""
+        with writer:
+            writer.write("s1", "A1", [["h1", "h2"]])
+            writer.write("s1", "A2", [["v1", "v2"]])
+
+        writer.client.batch_update_sheet_data.assert_called_once_with(
+            "cli_test1234567890ab", "shtcn123", [("s1!A1:B2", [["h1", "h2"], ["v1", "v2"]])]
+        )
+        assert writer.cells_written == 4
+        assert writer.pending_ranges == []
+
+    def test_failed_flush_keeps_pending(self, writer):
+        """Test writes stay pending when the batch request fails and are retried."""
+        writer.client.batch_update_sheet_data.side_effect = [APIError("HTTP 500"), 2]
+        writer.write("s1", "A1", [[1, 2]])
+
+        with pytest.raises(APIError):
+            writer.flush()
+
+        assert writer.pending_ranges == ["s1!A1:B1"]
+        assert writer.cells_written == 0
+
+        assert writer.flush() == 2
+        assert writer.pending_ranges == []
+        assert writer.client.batch_update_sheet_data.call_count == 2
+
+    def test_failed_auto_flush_keeps_pending(self, client):
+        """Test a failing auto flush does not drop the write that triggered it."""
+        client.batch_update_sheet_data = Mock(side_effect=APIError("HTTP 500"))
+        writer = SheetWriteBuffer(client, "cli_test1234567890ab", "shtcn123", auto_flush_cells=2)
+
+        with pytest.raises(APIError):
+            writer.write("s1", "A1", [[1, 2]])
+
+        assert writer.pending_ranges == ["s1!A1:B1"]
+
+    def test_error_discards_pending(self, writer):
+        """Test pending writes are not flushed when the block raises."""
+        with pytest.raises(RuntimeError), writer:
+            writer.write("s1", "A1", [[1]])
+            raise RuntimeError("boom")
+
+        writer.client.batch_update_sheet_data.assert_not_called()
+
+    def test_auto_flush(self, client):
+        """Test auto flush when pending cells reach the threshold."""
+        client.batch_update_sheet_data = Mock(return_value=1)
+        writer = SheetWriteBuffer(client, "cli_test1234567890ab", "shtcn123", auto_flush_cells=4)
+
+        writer.write("s1", "A1", [[1, 2]])
+        client.batch_update_sheet_data.assert_not_called()
+        writer.write("s1", "D1", [[3, 4]])
+
+        client.batch_update_sheet_data.assert_called_once()
+        assert writer.pending_ranges == []
+
+    def test_caller_lists_are_not_mutated(self, writer):
+        """Test merging does not modify caller-owned rows."""
+        first = [[1], [2]]
+        writer.write("s1", "A1", first)
+        writer.write("s1", "B1", [[3], [4]])
+
+        assert first == [[1], [2]]
@@ -0,0 +1,175 @@
+"""
+Unit tests for document block tree loading.
+
+Tests BlockTree navigation and DocClient.load_block_tree pagination,
+concurrent subtree fetches and revision-keyed caching.
+"""
+
+from unittest.mock import Mock, patch
+
+import pytest
+
+from lark_service.clouddoc.blocks import BlockNode, BlockTree
+from lark_service.clouddoc.client import DocClient
+from lark_service.core.credential_pool import CredentialPool
+from lark_service.core.exceptions import NotFoundError
+
+DOC_ID = "doxcn1234567890abcdefghij"
+APP_ID = "cli_test1234567890ab"
+
+
+def _response(data, status_code=200, code=0):
+    response = Mock()
+    response.status_code = status_code
+    response.json.return_value = {"code": code, "msg": "success", "data": data}
+    return response
+
+
+def _block(block_id, parent_id, children=()):
+    return {
+        "block_id": block_id,
+        "block_type": 2,
+        "parent_id": parent_id,
+        "children": list(children),
+    }
+
+
+class FakeDocApi:
+    """Route GET requests to canned metadata and children pages."""
+
+    def __init__(self, revision_id, children):
+        self.revision_id = revision_id
+        self.children = children
+        self.paths = []
+
+    def __call__(self, url, headers=None, params=None, timeout=None):
+        path = url.split("/docx/v1/", 1)[1]
+        self.paths.append(path)
+        if path == f"documents/{DOC_ID}":
+            return _response({"document": {"document_id": DOC_ID, "revision_id": self.revision_id}})
+
+        block_id = path.split("/")[3]
+        pages = self.children[block_id]
+        index = int(params.get("page_token") or 0)
+        has_more = index + 1 < len(pages)
+        data = {"items": pages[index], "has_more": has_more}
+        if has_more:
+            data["page_token"] = str(index + 1)
+        return _response(data)
+
+
+class TestBlockTree:
+    """Test BlockTree navigation."""
+
+    def test_walk_in_document_order(self):
+        """Test depth-first walk follows child order."""
+        tree = BlockTree(document_id=DOC_ID, revision_id=1, root_id=DOC_ID)
+        for node in [
+            BlockNode(DOC_ID, 1, None, ["a", "b"], {}),
+            BlockNode("a", 2, DOC_ID, ["a1"], {}),
+            BlockNode("a1", 2, "a", [], {}),
+            BlockNode("b", 2, DOC_ID, [], {}),
+        ]:
+            tree.nodes[node.block_id] = node
+
+        assert [node.block_id for node in tree.walk()] == [DOC_ID, "a", "a1", "b"]
+        assert [node.block_id for node in tree.children_of(DOC_ID)] == ["a", "b"]
+        assert "a1" in tree
+        assert tree.get("missing") is None
+
+
+class TestDocClientLoadBlockTree:
+    """Test DocClient.load_block_tree."""
+
+    @pytest.fixture
+    def client(self):
+        """Create DocClient with mocked credential pool."""
+        pool = Mock(spec=CredentialPool)
+        pool.get_token.return_value = "test_tenant_token"
+        return DocClient(pool)
+
+    @pytest.fixture
+    def api(self):
+        """Document with a paginated root and one nested subtree."""
+        return FakeDocApi(
+            revision_id=7,
+            children={
+                DOC_ID: [
+                    [_block("a", DOC_ID, ["a1", "a2"])],
+                    [_block("b", DOC_ID)],
+                ],
+                "a": [[_block("a1", "a"), _block("a2", "a")]],
+            },
+        )
+
+    def test_load_block_tree(self, client, api):
+        """Test pages are joined and nested children are loaded."""
+        with patch("lark_service.clouddoc.client.requests.get", side_effect=api):
+            tree = client.load_block_tree(DOC_ID, app_id=APP_ID)
+
+        assert tree.revision_id == 7
+        assert tree.root.children == ("a", "b")
+        assert [node.block_id for node in tree.walk()] == [DOC_ID, "a", "a1", "a2", "b"]
+        assert tree.get("a2").parent_id == "a"
+        # metadata + 2 root pages + 1 subtree page
+        assert len(api.paths) == 4
+
+    def test_children_requested_at_revision(self, client, api):
+        """Test child lists are read at the metadata revision."""
+        with patch("lark_service.clouddoc.client.requests.get", side_effect=api) as mock_get:
+            client.load_block_tree(DOC_ID, app_id=APP_ID)
+
+        params = [call.kwargs["params"] for call in mock_get.call_args_list[1:]]
+        assert all(p["document_revision_id"] == 7 for p in params)
+        assert all(p["page_size"] == DocClient.BLOCK_PAGE_SIZE for p in params)
+
+    def test_cache_hit_costs_one_request(self, client, api):
+        """Test unchanged revision returns the cached tree after one request."""
+        with patch("lark_service.clouddoc.client.requests.get", side_effect=api):
+            first = client.load_block_tree(DOC_ID, app_id=APP_ID)
+            api.paths.clear()
+            second = client.load_block_tree(DOC_ID, app_id=APP_ID)
+
+        assert second is first
+        assert api.paths == [f"documents/{DOC_ID}"]
+
+    def test_cached_tree_is_frozen(self, client, api):
+        """Test the shared tree rejects structural edits and copy() is independent."""
+        with patch("lark_service.clouddoc.client.requests.get", side_effect=api):
+            tree = client.load_block_tree(DOC_ID, app_id=APP_ID)
+
+        with pytest.raises(TypeError):
+            del tree.nodes["b"]  # type: ignore[attr-defined]
+        with pytest.raises(AttributeError):
+            tree.root.children.clear()  # type: ignore[attr-defined]
+
+        mutable = tree.copy()
+        mutable.root.children.remove("b")
+        mutable.nodes.pop("b")
+        mutable.nodes["a"].data["block_type"] = 99
+
+        assert tree.root.children == ("a", "b")
+        assert "b" in tree
+        assert tree.nodes["a"].data["block_type"] == 2
+
+    def test_cache_miss_on_new_revision(self, client, api):
+        """Test a new revision reloads the tree."""
+        with patch("lark_service.clouddoc.client.requests.get", side_effect=api):
+            first = client.load_block_tree(DOC_ID, app_id=APP_ID)
+            api.revision_id = 8
+            second = client.load_block_tree(DOC_ID, app_id=APP_ID)
+
+        assert second is not first
+        assert second.revision_id == 8
+
+    def test_document_not_found(self, client):
+        """Test metadata 404 raises NotFoundError."""
+        response = Mock()
+        response.status_code = 404
+        response.json.return_value = {"code": 1770002, "msg": "not found"}
+
+        with (
+            patch("lark_service.clouddoc.client.requests.get", return_value=response),
+            pytest.raises(NotFoundError),
+        ):
+            client.load_block_tree(DOC_ID, app_id=APP_ID)
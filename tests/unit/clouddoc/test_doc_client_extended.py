@@ -230,6 +230,151 @@ class TestDocClientAppendContent:
             )
 
 
+class TestDocClientAppendContentStream:
+    """Test streaming append of large block sequences."""
+
+    @pytest.fixture
+    def client(self):
+        """Create DocClient instance."""
+        pool = Mock(spec=CredentialPool)
+        pool.get_token.return_value = "test_tenant_token_12345678"
+        return DocClient(pool)
+
+    @staticmethod
+    def _ok():
+        response = Mock()
+        response.status_code = 200
+        response.json.return_value = {"code": 0, "msg": "success", "data": {"children": []}}
+        return response
+
+    @staticmethod
+    def _invalid():
+        response = Mock()
+        response.status_code = 400
+        response.json.return_value = {"code": 1770001, "msg": "invalid param"}
+        return response
+
+    @staticmethod
+    def _blocks(count):
+        return (ContentBlock(block_type="paragraph", content=f"line {i}") for i in range(count))
+
+    @staticmethod
+    def _contents(call):
+        return [
+            child["text"]["elements"][0]["text_run"]["content"]
+            for child in call.kwargs["json"]["children"]
+        ]
+
+    @patch("lark_service.clouddoc.client.requests.post")
+    def test_stream_batches_in_order(self, mock_post, client):
+        """Test blocks are flushed in ordered batches of at most 100."""
+        mock_post.return_value = self._ok()
+        progress = []
+
+        appended = client.append_content_stream(
+            doc_id="doxcn1234567890abcdefghij",
+            blocks=self._blocks(250),
+            on_batch=lambda index, count: progress.append((index, count)),
+            app_id="cli_test1234567890ab",
+        )
+
+        assert appended == 250
+        assert progress == [(0, 100), (1, 100), (2, 50)]
+        assert [len(self._contents(call)) for call in mock_post.call_args_list] == [100, 100, 50]
+        assert self._contents(mock_post.call_args_list[1])[0] == "line 100"
+        tokens = {call.kwargs["params"]["client_token"] for call in mock_post.call_args_list}
+        assert len(tokens) == 3
+
+    @patch("lark_service.clouddoc.client.requests.post")
+    def test_stream_failure_reports_resume_point(self, mock_post, client):
+        """Test a failed batch stops the stream and reports acknowledged batches."""
+        mock_post.side_effect = [self._ok(), self._invalid(), self._ok(), self._ok()]
+
+        with pytest.raises(InvalidParameterError) as exc_info:
+            client.append_content_stream(
+                doc_id="doxcn1234567890abcdefghij",
+                blocks=self._blocks(30),
+                batch_size=10,
+                app_id="cli_test1234567890ab",
+            )
+
+        assert exc_info.value.details["acknowledged_batches"] == 1
+        assert exc_info.value.details["appended_blocks"] == 10
+        # The batch queued behind the failed one is never sent
+        assert mock_post.call_count == 2
+
+    @patch("lark_service.clouddoc.client.requests.post")
+    def test_stream_resume_skips_acknowledged_batches(self, mock_post, client):
+        """Test start_batch resumes after the last acknowledged batch."""
+        mock_post.return_value = self._ok()
+        progress = []
+
+        appended = client.append_content_stream(
+            doc_id="doxcn1234567890abcdefghij",
+            blocks=self._blocks(30),
+            batch_size=10,
+            start_batch=1,
+            on_batch=lambda index, count: progress.append(index),
+            app_id="cli_test1234567890ab",
+        )
+
+        assert appended == 20
+        assert progress == [1, 2]
+        assert self._contents(mock_post.call_args_list[0])[0] == "line 10"
+
+    @patch("lark_service.clouddoc.client.requests.post")
+    def test_stream_resume_reuses_client_tokens(self, mock_post, client):
+        """Test a resumed stream sends the same client_token for each batch."""
+        mock_post.return_value = self._ok()
+
+        for start_batch in (0, 1):
+            client.append_content_stream(
+                doc_id="doxcn1234567890abcdefghij",
+                blocks=self._blocks(30),
+                batch_size=10,
+                start_batch=start_batch,
+                app_id="cli_test1234567890ab",
+                stream_id="import-1",
+            )
+
+        tokens = [call.kwargs["params"]["client_token"] for call in mock_post.call_args_list]
+        assert len(set(tokens)) == 3
+        assert tokens[3:] == tokens[1:3]
+
+    @patch("lark_service.clouddoc.client.requests.post")
+    def test_stream_callback_failure_counts_in_flight_batch(self, mock_post, client):
+        """Test a batch in flight when on_batch raises is reported as acknowledged."""
+        mock_post.return_value = self._ok()
+
+        def on_batch(index, count):
+            raise RuntimeError("checkpoint store unavailable")
+
+        with pytest.raises(APIError) as exc_info:
+            client.append_content_stream(
+                doc_id="doxcn1234567890abcdefghij",
+                blocks=self._blocks(30),
+                batch_size=10,
+                on_batch=on_batch,
+                app_id="cli_test1234567890ab",
+                stream_id="import-1",
+            )
+
+        assert mock_post.call_count == 2
+        assert exc_info.value.details["acknowledged_batches"] == 2
+        assert exc_info.value.details["appended_blocks"] == 20
+        assert exc_info.value.details["stream_id"] == "import-1"
+
+    def test_stream_invalid_batch_size(self, client):
+        """Test batch_size above the API limit is rejected."""
+        with pytest.raises(InvalidParameterError, match="Invalid batch_size"):
+            client.append_content_stream(
+                doc_id="doxcn1234567890abcdefghij",
+                blocks=self._blocks(1),
+                batch_size=101,
+                app_id="cli_test1234567890ab",
+            )
+
+
 class TestDocClientGetDocument:
     """Test get document operations."""
 
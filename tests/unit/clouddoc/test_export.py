@@ -0,0 +1,216 @@
+"""
+Unit tests for columnar bulk export.
+
+Tests ColumnarTable, CSV streaming and the export paths of
+SheetClient and BitableClient.
+"""
+
+import io
+from unittest.mock import Mock, patch
+
+import pytest
+
+from lark_service.clouddoc.bitable.client import BitableClient
+from lark_service.clouddoc.export import ColumnarTable, column_letter, write_csv
+from lark_service.clouddoc.sheet.client import SheetClient
+from lark_service.core.credential_pool import CredentialPool
+from lark_service.core.exceptions import InvalidParameterError
+
+
+def _response(data):
+    response = Mock()
+    response.status_code = 200
+    response.json.return_value = {"code": 0, "msg": "success", "data": data}
+    return response
+
+
+class TestColumnarTable:
+    """Test ColumnarTable helpers."""
+
+    def test_column_letter(self):
+        """Test 0-based index to column letters."""
+        assert column_letter(0) == "A"
+        assert column_letter(25) == "Z"
+        assert column_letter(26) == "AA"
+        assert column_letter(27) == "AB"
+
+    def test_append_row_pads_short_rows(self):
+        """Test positional rows are padded with None."""
+        table = ColumnarTable(columns=["a", "b", "c"])
+        table.append_row(["1", "2", "3"])
+        table.append_row(["4"])
+
+        assert table.num_rows == 2
+        assert table.to_pydict() == {"a": ["1", "4"], "b": ["2", None], "c": ["3", None]}
+
+    def test_append_record_discovers_columns(self):
+        """Test keyed rows add new columns and backfill None."""
+        table = ColumnarTable(columns=["id"])
+        table.append_record({"id": 1, "name": "John"})
+        table.append_record({"id": 2, "age": 30})
+
+        assert table.columns == ["id", "name", "age"]
+        assert table.data["name"] == ["John", None]
+        assert table.data["age"] == [None, 30]
+        assert list(table.iter_rows()) == [(1, "John", None), (2, None, 30)]
+
+    def test_to_csv_serializes_nested_values(self):
+        """Test CSV output writes None as empty and nested values as JSON."""
+        table = ColumnarTable(columns=["name", "tags"])
+        table.append_row(["John", ["a", "b"]])
+        table.append_row([None, None])
+
+        buffer = io.StringIO()
+        count = table.to_csv(buffer)
+
+        assert count == 2
+        assert buffer.getvalue().splitlines() == ["name,tags", 'John,"[""a"",""b""]"', ","]
+
+    def test_write_csv_consumes_generator(self):
+        """Test rows are streamed from a generator."""
+        buffer = io.StringIO()
+        count = write_csv(buffer, ((i, i * 2) for i in range(3)), header=["x", "y"])
+
+        assert count == 3
+        assert buffer.getvalue().splitlines()[-1] == "2,4"
+
+
+class TestSheetClientExport:
+    """Test SheetClient.export_columns."""
+
+    @pytest.fixture
+    def client(self):
+        """Create SheetClient with mocked credential pool."""
+        pool = Mock(spec=CredentialPool)
+        pool.get_token.return_value = "test_tenant_token"
+        return SheetClient(pool)
+
+    def test_export_columns_empty_range(self, client):
+        """Test export fails with empty range."""
+        with pytest.raises(InvalidParameterError, match="Range string cannot be empty"):
+            client.export_columns("cli_test1234567890ab", "shtcn123", "sheet1", "")
+
+    @patch("lark_service.clouddoc.sheet.client.requests.get")
+    def test_export_columns_with_header(self, mock_get, client):
+        """Test header row becomes column names and rows are transposed."""
+        mock_get.return_value = _response(
+            {"valueRange": {"values": [["Name", "", "Name"], ["John", "30"], ["Jane", "25", "x"]]}}
+        )
+
+        table = client.export_columns("cli_test1234567890ab", "shtcn123", "sheet1", "B1:D3")
+
+        assert table.columns == ["Name", "C", "D"]
+        assert table.to_pydict() == {
+            "Name": ["John", "Jane"],
+            "C": ["30", "25"],
+            "D": [None, "x"],
+        }
+
+    @patch("lark_service.clouddoc.sheet.client.requests.get")
+    def test_export_columns_without_header(self, mock_get, client):
+        """Test column letters are used when header_row is False."""
+        mock_get.return_value = _response({"valueRange": {"values": [["1", "2"], ["3", "4"]]}})
+
+        table = client.export_columns(
+            "cli_test1234567890ab", "shtcn123", "sheet1", "A1:B2", header_row=False
+        )
+
+        assert table.to_pydict() == {"A": ["1", "3"], "B": ["2", "4"]}
+
+    @patch("lark_service.clouddoc.sheet.client.requests.get")
+    def test_export_columns_lowercase_range(self, mock_get, client):
+        """Test the start column of a lowercase range names the columns."""
+        mock_get.return_value = _response({"valueRange": {"values": [["1", "2"]]}})
+
+        table = client.export_columns(
+            "cli_test1234567890ab", "shtcn123", "sheet1", "c1:d1", header_row=False
+        )
+
+        assert table.columns == ["C", "D"]
+
+
+class TestBitableClientExport:
+    """Test BitableClient columnar and CSV export."""
+
+    @pytest.fixture
+    def client(self):
+        """Create BitableClient with mocked credential pool."""
+        pool = Mock(spec=CredentialPool)
+        pool.get_token.return_value = "test_tenant_token"
+        return BitableClient(pool)
+
+    @patch("requests.post")
+    def test_export_columns_pages_through_results(self, mock_post, client):
+        """Test all pages are exported and columns discovered from data."""
+        mock_post.side_effect = [
+            _response(
+                {
+                    "items": [{"record_id": "rec1", "fields": {"Name": "John"}}],
+                    "has_more": True,
+                    "page_token": "p2",
+                }
+            ),
+            _response(
+                {
+                    "items": [{"record_id": "rec2", "fields": {"Age": 25}}],
+                    "has_more": False,
+                }
+            ),
+        ]
+
+        table = client.export_columns("cli_test1234567890ab", "bascn123", "tbl123")
+
+        assert mock_post.call_count == 2
+        assert mock_post.call_args_list[1].kwargs["json"]["page_token"] == "p2"
+        assert table.to_pydict() == {
+            "record_id": ["rec1", "rec2"],
+            "Name": ["John", None],
+            "Age": [None, 25],
+        }
+
+    @patch("requests.post")
+    def test_export_columns_selected_fields(self, mock_post, client):
+        """Test field_names limits columns and is sent to the API."""
+        mock_post.return_value = _response(
+            {
+                "items": [{"record_id": "rec1", "fields": {"Name": "John", "Extra": 1}}],
+                "has_more": False,
+            }
+        )
+
+        table = client.export_columns(
+            "cli_test1234567890ab", "bascn123", "tbl123", field_names=["Name", "Age"]
+        )
+
+        assert mock_post.call_args.kwargs["json"]["field_names"] == ["Name", "Age"]
+        assert table.to_pydict() == {"record_id": ["rec1"], "Name": ["John"], "Age": [None]}
+
+    @patch("requests.post")
+    def test_export_csv_streams_rows(self, mock_post, client):
+        """Test CSV export writes header and one line per record."""
+        mock_post.return_value = _response(
+            {
+                "items": [
+                    {"record_id": "rec1", "fields": {"Name": "John", "Tags": ["a"]}},
+                    {"record_id": "rec2", "fields": {"Name": "Jane"}},
+                ],
+                "has_more": False,
+            }
+        )
+
+        buffer = io.StringIO()
+        count = client.export_csv(
+            "cli_test1234567890ab", "bascn123", "tbl123", buffer, field_names=["Name", "Tags"]
+        )
+
+        assert count == 2
+        assert buffer.getvalue().splitlines() == [
+            "record_id,Name,Tags",
+            'rec1,John,"[""a""]"',
+            "rec2,Jane,",
+        ]
+
+    def test_export_columns_invalid_page_size(self, client):
+        """Test export fails with invalid page size."""
+        with pytest.raises(InvalidParameterError, match="Invalid page_size"):
+            client.export_columns("cli_test1234567890ab", "bascn123", "tbl123", page_size=501)
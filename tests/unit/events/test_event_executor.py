@@ -0,0 +1,134 @@
+"""Unit tests for EventExecutor.
+
+Tests cover per-event-type concurrency limits, queueing, backpressure
+rejection, async handlers and handler failures.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+
+import pytest
+
+from lark_service.core.exceptions import QueueFullError
+from lark_service.events.executor import EventExecutor
+
+
+def test_submit_does_not_block_on_slow_handler() -> None:
+    """Test submit returns while the handler is still running."""
+    executor = EventExecutor("cli_test", max_workers=2)
+    release = threading.Event()
+    done: list[int] = []
+
+    def handler(event: int) -> None:
+        release.wait(5)
+        done.append(event)
+
+    started = time.monotonic()
+    executor.submit("im.message.receive_v1", handler, 1)
+    assert time.monotonic() - started < 0.5
+    assert done == []
+
+    release.set()
+    assert executor.wait_idle(5)
+    assert done == [1]
+    executor.shutdown()
+
+
+def test_concurrency_limit_per_event_type() -> None:
+    """Test one event type cannot exceed its limit or starve other types."""
+    executor = EventExecutor("cli_test", max_workers=4)
+    executor.set_concurrency("im.message.receive_v1", 1)
+    release = threading.Event()
+    lock = threading.Lock()
+    running = {"now": 0, "max": 0}
+    other = threading.Event()
+
+    def slow(event: int) -> None:
+        with lock:
+            running["now"] += 1
+            running["max"] = max(running["max"], running["now"])
+        release.wait(5)
+        with lock:
+            running["now"] -= 1
+
+    for i in range(5):
+        executor.submit("im.message.receive_v1", slow, i)
+    executor.submit("im.chat.updated_v1", lambda event: other.set(), None)
+
+    assert other.wait(5)
+    assert executor.stats()["im.message.receive_v1"]["queued"] == 4
+
+    release.set()
+    assert executor.wait_idle(5)
+    assert running["max"] == 1
+    assert executor.stats()["im.message.receive_v1"]["completed"] == 5
+    executor.shutdown()
+
+
+def test_full_queue_rejects_after_backpressure() -> None:
+    """Test submit waits for queue space and then raises QueueFullError."""
+    executor = EventExecutor(
+        "cli_test", max_workers=1, default_concurrency=1, max_queue=1, block_timeout=0.05
+    )
+    release = threading.Event()
+
+    executor.submit("im.message.receive_v1", lambda event: release.wait(5), 1)
+    executor.submit("im.message.receive_v1", lambda event: None, 2)
+
+    started = time.monotonic()
+    with pytest.raises(QueueFullError):
+        executor.submit("im.message.receive_v1", lambda event: None, 3)
+    assert time.monotonic() - started >= 0.05
+    assert executor.stats()["im.message.receive_v1"]["rejected"] == 1
+
+    release.set()
+    assert executor.wait_idle(5)
+    executor.shutdown()
+
+
+def test_non_blocking_submit_rejects_full_queue_at_once() -> None:
+    """Test submit with block=False raises QueueFullError without waiting."""
+    executor = EventExecutor(
+        "cli_test", max_workers=1, default_concurrency=1, max_queue=1, block_timeout=5.0
+    )
+    release = threading.Event()
+
+    executor.submit("im.message.receive_v1", lambda event: release.wait(5), 1)
+    executor.submit("im.message.receive_v1", lambda event: None, 2, block=False)
+
+    started = time.monotonic()
+    with pytest.raises(QueueFullError):
+        executor.submit("im.message.receive_v1", lambda event: None, 3, block=False)
+    assert time.monotonic() - started < 1.0
+    assert executor.stats()["im.message.receive_v1"]["rejected"] == 1
+
+    release.set()
+    assert executor.wait_idle(5)
+    executor.shutdown()
+
+
+def test_async_and_failing_handlers() -> None:
+    """Test async handlers are awaited and failures are counted."""
+    executor = EventExecutor("cli_test")
+    results: list[str] = []
+
+    async def async_handler(event: str) -> None:
+        results.append(event)
+
+    def failing(event: str) -> None:
+        raise RuntimeError("boom")
+
+    executor.submit("im.message.receive_v1", async_handler, "hello")
+    executor.submit("im.chat.disbanded_v1", failing, "chat")
+
+    assert executor.wait_idle(5)
+    assert results == ["hello"]
+    stats = executor.stats()
+    assert stats["im.message.receive_v1"]["completed"] == 1
+    assert stats["im.chat.disbanded_v1"]["failed"] == 1
+    executor.shutdown()
+
+    with pytest.raises(QueueFullError):
+        executor.submit("im.message.receive_v1", async_handler, "late")
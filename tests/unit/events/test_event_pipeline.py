@@ -0,0 +1,185 @@
+"""Unit tests for EventPipeline and EventDeduplicator.
+
+Tests cover duplicate dropping (in memory and persisted), ordering keys,
+serial processing per chat and parallel processing across chats.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+from lark_service.core.exceptions import QueueFullError
+from lark_service.events.executor import EventExecutor
+from lark_service.events.pipeline import (
+    EventDeduplicator,
+    EventPipeline,
+    event_id_of,
+    event_order_key,
+)
+
+
+def message_event(event_id: str, chat_id: str, text: str = "") -> dict[str, Any]:
+    """Build a parsed im.message.receive_v1 event."""
+    return {
+        "header": {"event_id": event_id, "event_type": "im.message.receive_v1"},
+        "event": {"message": {"chat_id": chat_id, "message_id": f"om_{event_id}", "text": text}},
+    }
+
+
+def test_event_id_and_order_key() -> None:
+    """Test IDs and keys are read from dicts and SDK-style objects."""
+    sdk_event = SimpleNamespace(
+        header=SimpleNamespace(event_id="evt_2"),
+        event=SimpleNamespace(context=SimpleNamespace(open_message_id="om_card")),
+    )
+
+    assert event_id_of(message_event("evt_1", "oc_1")) == "evt_1"
+    assert event_order_key(message_event("evt_1", "oc_1")) == "oc_1"
+    assert event_id_of(sdk_event) == "evt_2"
+    assert event_order_key(sdk_event) == "om_card"
+    assert event_order_key({"event": {"chat_id": "oc_2"}}) == "oc_2"
+    assert event_order_key({"event": {"user_id": "ou_1"}}) is None
+
+
+def test_deduplicator_persists_across_instances(tmp_path: Path) -> None:
+    """Test persisted IDs survive a restart and can be discarded."""
+    path = tmp_path / "events.db"
+    first = EventDeduplicator(path=path)
+    assert first.add("evt_1") is True
+    assert first.add("evt_1") is False
+    first.close()
+
+    restarted = EventDeduplicator(path=path)
+    assert restarted.add("evt_1") is False
+    restarted.discard("evt_1")
+    assert restarted.add("evt_1") is True
+    restarted.close()
+
+
+def test_deduplicator_write_failure_counts_as_new(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test a locked or broken database does not drop events."""
+    dedup = EventDeduplicator(path=tmp_path / "events.db")
+
+    def locked() -> sqlite3.Connection:
+        raise sqlite3.OperationalError("database is locked")
+
+    monkeypatch.setattr(dedup, "_connection", locked)
+
+    assert dedup.add("evt_1") is True
+    assert dedup.add("evt_1") is False  # still caught in memory
+    dedup.discard("evt_1")
+    assert dedup.add("evt_1") is True
+
+
+def test_pipeline_checks_sqlite_on_worker_thread(tmp_path: Path) -> None:
+    """Test the persisted check runs off the submitting thread and drops stored IDs."""
+    path = tmp_path / "events.db"
+    EventDeduplicator(path=path).add("evt_old")
+
+    dedup = EventDeduplicator(path=path)
+    persisted_threads: list[threading.Thread] = []
+    add_persisted = dedup.add_persisted
+
+    def recording_add_persisted(event_id: str) -> bool:
+        persisted_threads.append(threading.current_thread())
+        return add_persisted(event_id)
+
+    dedup.add_persisted = recording_add_persisted  # type: ignore[method-assign]
+    executor = EventExecutor("cli_test")
+    pipeline = EventPipeline(executor, dedup)
+    handled: list[str] = []
+
+    for event_id in ("evt_old", "evt_new"):
+        pipeline.submit(
+            "im.message.receive_v1",
+            lambda e: handled.append(e["header"]["event_id"]),
+            message_event(event_id, "oc_1"),
+        )
+
+    assert executor.wait_idle(5)
+    assert handled == ["evt_new"]
+    assert pipeline.stats["duplicates"] == 1
+    assert len(persisted_threads) == 2
+    assert threading.current_thread() not in persisted_threads
+
+
+def test_pipeline_drops_duplicate_events() -> None:
+    """Test a redelivered event reaches the handler once."""
+    executor = EventExecutor("cli_test")
+    pipeline = EventPipeline(executor)
+    handled: list[str] = []
+
+    for _ in range(3):
+        pipeline.submit(
+            "im.message.receive_v1",
+            lambda e: handled.append(e["header"]["event_id"]),
+            message_event("evt_1", "oc_1"),
+        )
+
+    assert executor.wait_idle(5)
+    assert handled == ["evt_1"]
+    assert pipeline.stats["duplicates"] == 2
+    executor.shutdown()
+
+
+def test_pipeline_orders_per_chat_and_parallelizes_chats() -> None:
+    """Test events of one chat run serially in order while chats overlap."""
+    executor = EventExecutor("cli_test", max_workers=4, default_concurrency=4)
+    pipeline = EventPipeline(executor)
+    lock = threading.Lock()
+    handled: dict[str, list[int]] = {"oc_a": [], "oc_b": []}
+    active: dict[str, int] = {"oc_a": 0, "oc_b": 0}
+    overlap = {"chat": 0, "max_total": 0}
+
+    def handler(event: dict[str, Any]) -> None:
+        chat_id = event["event"]["message"]["chat_id"]
+        with lock:
+            active[chat_id] += 1
+            overlap["chat"] = max(overlap["chat"], active[chat_id])
+            overlap["max_total"] = max(overlap["max_total"], sum(active.values()))
+        time.sleep(0.01)
+        with lock:
+            handled[chat_id].append(int(event["event"]["message"]["text"]))
+            active[chat_id] -= 1
+
+    for i in range(10):
+        for chat_id in ("oc_a", "oc_b"):
+            pipeline.submit(
+                "im.message.receive_v1", handler, message_event(f"{chat_id}_{i}", chat_id, str(i))
+            )
+
+    assert executor.wait_idle(5)
+    assert handled == {"oc_a": list(range(10)), "oc_b": list(range(10))}
+    assert overlap["chat"] == 1
+    assert overlap["max_total"] == 2
+    assert pipeline.stats["keys"] == 0
+    executor.shutdown()
+
+
+def test_pipeline_rejects_beyond_max_pending() -> None:
+    """Test a full lane raises QueueFullError and forgets the event ID."""
+    executor = EventExecutor("cli_test")
+    pipeline = EventPipeline(executor, max_pending=1)
+    release = threading.Event()
+
+    pipeline.submit("im.message.receive_v1", lambda e: release.wait(5), message_event("e1", "oc"))
+    pipeline.submit("im.message.receive_v1", lambda e: None, message_event("e2", "oc"))
+    with pytest.raises(QueueFullError):
+        pipeline.submit("im.message.receive_v1", lambda e: None, message_event("e3", "oc"))
+
+    release.set()
+    assert executor.wait_idle(5)
+    pipeline.submit("im.message.receive_v1", lambda e: None, message_event("e3", "oc"))
+    assert executor.wait_idle(5)
+    assert pipeline.stats["rejected"] == 1
+    assert pipeline.stats["submitted"] == 3
+    executor.shutdown()
@@ -0,0 +1,138 @@
+"""Unit tests for WebSocketSupervisor.
+
+Tests cover connecting active apps, hot add/remove on sync, reconnecting
+apps whose secret changed, and per-app health.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Iterator
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+import pytest
+
+from lark_service.events.supervisor import WebSocketSupervisor
+from lark_service.events.types import WebSocketConfig, WebSocketConnectionStatus
+
+
+class FakeClient:
+    """Client whose connection stays up until stopped."""
+
+    def __init__(self, config: WebSocketConfig) -> None:
+        self.config = config
+        self.status = WebSocketConnectionStatus()
+        self.executor = Mock()
+        self.stopped = False
+
+    async def run_async(self, stop: asyncio.Event) -> None:
+        self.status.mark_connected()
+        await stop.wait()
+        self.status.mark_disconnected()
+        self.stopped = True
+
+
+@pytest.fixture
+def sdk_loop(monkeypatch: pytest.MonkeyPatch) -> Iterator[asyncio.AbstractEventLoop]:
+    """Give the supervisor its own loop in place of the SDK module loop."""
+    loop = asyncio.new_event_loop()
+    mock_lark = Mock()
+    mock_lark.ws.client.loop = loop
+    monkeypatch.setattr("lark_service.events.supervisor.lark", mock_lark)
+    yield loop
+    loop.close()
+
+
+def make_manager(apps: dict[str, str]) -> Mock:
+    """Return an ApplicationManager mock listing ``apps`` as active."""
+    manager = Mock()
+    manager.encryption_key = b"key"
+    manager.list_applications.side_effect = lambda status=None: [
+        SimpleNamespace(app_id=app_id, get_decrypted_secret=lambda key, s=secret: s)
+        for app_id, secret in apps.items()
+    ]
+    return manager
+
+
+def test_supervisor_hot_adds_and_removes_apps(sdk_loop: asyncio.AbstractEventLoop) -> None:
+    """Test enabled apps are connected and disabled apps disconnected on sync."""
+    apps = {"cli_a": "secret_a", "cli_b": "secret_b"}
+    clients: list[FakeClient] = []
+
+    def factory(config: WebSocketConfig) -> FakeClient:
+        clients.append(FakeClient(config))
+        return clients[-1]
+
+    supervisor = WebSocketSupervisor(make_manager(apps), factory, sync_interval=3600)
+    with supervisor:
+        health = supervisor.health()
+        assert set(health) == {"cli_a", "cli_b"}
+        assert all(status.is_connected for status in health.values())
+
+        del apps["cli_a"]
+        apps["cli_c"] = "secret_c"
+        supervisor.sync(timeout=5)
+
+        assert set(supervisor.health()) == {"cli_b", "cli_c"}
+        assert clients[0].stopped is True
+        clients[0].executor.shutdown.assert_called_once_with(wait=False)
+
+    assert all(client.stopped for client in clients)
+    assert [client.config.app_id for client in clients] == ["cli_a", "cli_b", "cli_c"]
+
+
+def test_failing_factory_does_not_block_other_apps(
+    sdk_loop: asyncio.AbstractEventLoop,
+) -> None:
+    """Test one app whose client cannot be created is skipped and retried."""
+    apps = {"cli_bad": "secret_bad", "cli_good": "secret_good"}
+    broken = {"cli_bad"}
+
+    def factory(config: WebSocketConfig) -> FakeClient:
+        if config.app_id in broken:
+            raise ValueError("bad handler config")
+        return FakeClient(config)
+
+    with WebSocketSupervisor(make_manager(apps), factory, sync_interval=3600) as supervisor:
+        assert set(supervisor.health()) == {"cli_good"}
+
+        broken.clear()
+        supervisor.sync(timeout=5)
+        assert set(supervisor.health()) == {"cli_bad", "cli_good"}
+
+
+def test_failed_initial_sync_still_starts(sdk_loop: asyncio.AbstractEventLoop) -> None:
+    """Test start() completes and schedules the sync loop when the first sync fails."""
+    manager = make_manager({"cli_a": "secret_a"})
+    side_effect = manager.list_applications.side_effect
+    manager.list_applications.side_effect = RuntimeError("database unavailable")
+
+    supervisor = WebSocketSupervisor(manager, FakeClient, sync_interval=3600)
+    with supervisor:
+        assert supervisor._sync_task is not None
+        assert supervisor.health() == {}
+
+        manager.list_applications.side_effect = side_effect
+        supervisor.sync(timeout=5)
+        assert set(supervisor.health()) == {"cli_a"}
+
+    assert supervisor._thread is None
+
+
+def test_supervisor_reconnects_on_secret_change(sdk_loop: asyncio.AbstractEventLoop) -> None:
+    """Test an app whose secret changed gets a new client."""
+    apps = {"cli_a": "old"}
+    clients: list[FakeClient] = []
+
+    def factory(config: WebSocketConfig) -> FakeClient:
+        clients.append(FakeClient(config))
+        return clients[-1]
+
+    with WebSocketSupervisor(make_manager(apps), factory, sync_interval=3600) as supervisor:
+        apps["cli_a"] = "new"
+        supervisor.sync(timeout=5)
+
+        assert [client.config.app_secret for client in clients] == ["old", "new"]
+        assert clients[0].stopped is True
+        assert supervisor.health()["cli_a"].is_connected is True
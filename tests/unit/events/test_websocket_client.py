@@ -7,13 +7,13 @@ event handler registration behavior.
 from __future__ import annotations
 
 import asyncio
-from unittest.mock import Mock
+from unittest.mock import AsyncMock, Mock
 
 import pytest
 
 from lark_service.events.exceptions import WebSocketConnectionError
 from lark_service.events.types import WebSocketConfig
-from lark_service.events.websocket_client import LarkWebSocketClient
+from lark_service.events.websocket_client import LarkWebSocketClient, reconnect_delay
 
 
 @pytest.fixture
@@ -22,6 +22,8 @@ def mock_lark(monkeypatch: pytest.MonkeyPatch) -> Mock:
     mock_lark = Mock()
     builder = Mock()
     builder.register_p2_card_action_trigger.return_value = builder
+    builder.register_p2_im_message_receive_v1.return_value = builder
+    builder.register_p2_customized_event.return_value = builder
     builder.build.return_value = Mock()
     mock_lark.EventDispatcherHandler.builder.return_value = builder
 
@@ -51,7 +53,9 @@ def test_websocket_client_reconnect_with_backoff(mock_lark: Mock) -> None:
     """Test WebSocket client reconnects with exponential backoff."""
     from unittest.mock import patch
 
-    config = WebSocketConfig(app_id="cli_test1234567890ab", app_secret="secret")
+    config = WebSocketConfig(
+        app_id="cli_test1234567890ab", app_secret="secret", reconnect_jitter=0.0
+    )
     client = LarkWebSocketClient(config)
 
     connect_mock = Mock(
@@ -104,3 +108,107 @@ def test_websocket_client_register_handler(mock_lark: Mock) -> None:
 
     builder = mock_lark.EventDispatcherHandler.builder.return_value
     builder.register_p2_card_action_trigger.assert_called_once_with(handler)
+
+
+def test_websocket_client_dispatches_events_to_executor(mock_lark: Mock) -> None:
+    """Test message and customized events are registered through the executor."""
+    config = WebSocketConfig(app_id="cli_test1234567890ab", app_secret="secret")
+    executor = Mock()
+    client = LarkWebSocketClient(config, executor=executor)
+    message_handler = Mock()
+    custom_handler = Mock()
+
+    client.register_handler("im.message.receive_v1", message_handler, max_concurrency=2)
+    client.register_handler("approval_instance", custom_handler)
+    client.connect()
+
+    executor.set_concurrency.assert_called_once_with("im.message.receive_v1", 2)
+    builder = mock_lark.EventDispatcherHandler.builder.return_value
+    dispatch = builder.register_p2_im_message_receive_v1.call_args.args[0]
+    dispatch("event")
+    executor.submit.assert_called_once_with(
+        "im.message.receive_v1", message_handler, "event", block=True
+    )
+    message_handler.assert_not_called()
+
+    event_type, custom_dispatch = builder.register_p2_customized_event.call_args.args
+    assert event_type == "approval_instance"
+    custom_dispatch("raw")
+    executor.submit.assert_called_with("approval_instance", custom_handler, "raw", block=True)
+
+
+def test_websocket_client_shared_loop_dispatch_does_not_block(mock_lark: Mock) -> None:
+    """Test handlers built for a shared event loop never wait for queue space."""
+    config = WebSocketConfig(app_id="cli_test1234567890ab", app_secret="secret")
+    executor = Mock()
+    client = LarkWebSocketClient(config, executor=executor)
+    handler = Mock()
+    client.register_handler("im.message.receive_v1", handler)
+
+    client._build_event_handler(block=False)
+
+    builder = mock_lark.EventDispatcherHandler.builder.return_value
+    builder.register_p2_im_message_receive_v1.call_args.args[0]("event")
+    executor.submit.assert_called_once_with("im.message.receive_v1", handler, "event", block=False)
+
+
+def test_reconnect_delay_is_jittered() -> None:
+    """Test reconnect delays stay within the jitter range and the cap."""
+    config = WebSocketConfig(app_id="cli_test1234567890ab", app_secret="secret")
+
+    for attempt, ceiling in [(0, 1.0), (1, 2.0), (2, 4.0), (3, 8.0), (6, 8.0)]:
+        delays = {reconnect_delay(config, attempt) for _ in range(20)}
+        assert all(ceiling / 2 <= delay <= ceiling for delay in delays)
+        assert len(delays) > 1
+
+
+@pytest.mark.asyncio
+async def test_websocket_client_run_async_reconnects(
+    mock_lark: Mock, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test run_async retries failed connects and disconnects when stopped."""
+    sdk_client = Mock()
+    sdk_client._connect = AsyncMock(side_effect=[RuntimeError("refused"), None])
+    sdk_client._ping_loop = AsyncMock()
+    sdk_client._disconnect = AsyncMock()
+    sdk_client._conn = object()
+    monkeypatch.setattr(
+        "lark_service.events.websocket_client._SupervisedClient", Mock(return_value=sdk_client)
+    )
+    config = WebSocketConfig(
+        app_id="cli_test1234567890ab", app_secret="secret", reconnect_base_delay=0.01
+    )
+    client = LarkWebSocketClient(config)
+    stop = asyncio.Event()
+
+    task = asyncio.create_task(client.run_async(stop, poll_interval=0.01))
+    for _ in range(100):
+        if client.is_connected():
+            break
+        await asyncio.sleep(0.01)
+
+    assert client.is_connected() is True
+    assert sdk_client._connect.await_count == 2
+    stop.set()
+    await asyncio.wait_for(task, 1)
+
+    sdk_client._disconnect.assert_awaited_once()
+    assert client.is_connected() is False
+
+
+def test_sdk_exposes_internals_used_by_run_async() -> None:
+    """Test the installed lark-oapi still has the private API run_async drives.
+
+    run_async calls these SDK internals directly; a lark-oapi release that
+    renames them must fail here rather than at connect time.
+    """
+    import lark_oapi as lark
+
+    from lark_service.events.websocket_client import _SupervisedClient
+
+    for name in ("_connect", "_disconnect", "_ping_loop", "_receive_message_loop"):
+        assert asyncio.iscoroutinefunction(getattr(lark.ws.Client, name, None)), name
+
+    ws_client = _SupervisedClient("cli_test1234567890ab", "secret", auto_reconnect=False)
+    assert hasattr(ws_client, "_conn")
+    assert ws_client._conn is None
@@ -9,6 +9,7 @@ from unittest.mock import Mock, patch
 
 import pytest
 
+from lark_service.cardkit.payload import CardPayload
 from lark_service.core.exceptions import InvalidParameterError, RetryableError
 from lark_service.messaging.client import MessagingClient
 from lark_service.messaging.models import ImageAsset
@@ -357,6 +358,22 @@ class TestSendCardMessage:
 
         assert result["message_id"] == "om_card_msg_123"
 
+    def test_send_card_payload_as_is(self, messaging_client: MessagingClient) -> None:
+        """Test a pre-serialized CardPayload is sent without re-serializing."""
+        mock_client = messaging_client.credential_pool._get_sdk_client.return_value
+        mock_client.im.v1.message.create.return_value.success.return_value = True
+        payload = CardPayload.from_card({"elements": [{"tag": "hr"}]})
+
+        messaging_client.send_card_message(
+            app_id="cli_test1234567890ab",
+            receiver_id="ou_receiver123456789",
+            card_content=payload,
+        )
+
+        request = mock_client.im.v1.message.create.call_args.args[0]
+        assert request.request_body.content is payload
+        assert request.request_body.msg_type == "interactive"
+
     def test_send_card_message_empty_content(self, messaging_client: MessagingClient) -> None:
         """Test send_card_message with empty card content."""
         with pytest.raises(InvalidParameterError, match="Card content cannot be empty"):
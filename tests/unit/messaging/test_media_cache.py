@@ -0,0 +1,171 @@
+"""
+Unit tests for the media upload dedup cache.
+
+Tests both cache backends and MediaUploader reusing keys of content it
+has already uploaded.
+"""
+
+from unittest.mock import MagicMock, Mock
+
+import pytest
+
+from lark_service.core.credential_pool import CredentialPool
+from lark_service.core.exceptions import InvalidParameterError
+from lark_service.messaging.media_cache import (
+    DatabaseMediaCache,
+    InMemoryMediaCache,
+    MediaCacheKey,
+)
+from lark_service.messaging.media_uploader import MediaUploader
+
+
+class TestInMemoryMediaCache:
+    """Test the in-process backend."""
+
+    def test_scoped_by_app_and_variant(self):
+        """Test keys of another app or image_type are not shared."""
+        cache = InMemoryMediaCache()
+        key = MediaCacheKey("cli_a", "image", "d1", "message")
+        cache.set(key, "img_v2_1", 10)
+
+        assert cache.get(key).media_key == "img_v2_1"
+        assert cache.get(MediaCacheKey("cli_b", "image", "d1", "message")) is None
+        assert cache.get(MediaCacheKey("cli_a", "image", "d1", "avatar")) is None
+        assert (cache.hits, cache.misses) == (1, 2)
+
+    def test_lru_bound_and_invalidate(self):
+        """Test the least recently used entry is evicted."""
+        cache = InMemoryMediaCache(max_entries=2)
+        keys = [MediaCacheKey("cli_a", "file", f"d{i}") for i in range(3)]
+        cache.set(keys[0], "file_v2_0", 1)
+        cache.set(keys[1], "file_v2_1", 1)
+        cache.get(keys[0])
+        cache.set(keys[2], "file_v2_2", 1)
+
+        assert cache.get(keys[1]) is None
+        assert cache.get(keys[0]) is not None
+        assert cache.invalidate("cli_a") == 2
+        assert len(cache) == 0
+
+    def test_invalid_settings(self):
+        """Test non-positive limits are rejected."""
+        with pytest.raises(InvalidParameterError):
+            InMemoryMediaCache(ttl_seconds=0)
+        with pytest.raises(InvalidParameterError):
+            InMemoryMediaCache(max_entries=0)
+
+
+class TestDatabaseMediaCache:
+    """Test the persistent backend on SQLite."""
+
+    def test_persists_across_instances(self, tmp_path):
+        """Test entries survive a new cache instance on the same database."""
+        url = f"sqlite:///{tmp_path / 'media.db'}"
+        key = MediaCacheKey("cli_a", "image", "d1", "message")
+        first = DatabaseMediaCache(url)
+        first.set(key, "img_v2_1", 10)
+        first.close()
+
+        second = DatabaseMediaCache(url)
+        cached = second.get(key)
+        assert cached is not None and cached.media_key == "img_v2_1"
+        assert cached.file_size == 10
+        assert second.invalidate("cli_a") == 1
+        assert second.get(key) is None
+        second.close()
+
+    def test_concurrent_writers_upsert(self, tmp_path):
+        """Test two processes storing the same content do not conflict."""
+        url = f"sqlite:///{tmp_path / 'media.db'}"
+        key = MediaCacheKey("cli_a", "image", "d1", "message")
+        first, second = DatabaseMediaCache(url), DatabaseMediaCache(url)
+
+        first.set(key, "img_v2_1", 10)
+        second.set(key, "img_v2_2", 10)
+
+        assert first.get(key).media_key == "img_v2_2"
+        first.close()
+        second.close()
+
+    def test_prune_expired_and_overflow(self, tmp_path):
+        """Test pruning removes expired entries and keeps the newest ones."""
+        cache = DatabaseMediaCache(f"sqlite:///{tmp_path / 'media.db'}", max_entries=2)
+        for i in range(3):
+            cache.set(MediaCacheKey("cli_a", "file", f"d{i}"), f"file_v2_{i}", 1)
+
+        assert cache.prune() == 1
+        assert cache.get(MediaCacheKey("cli_a", "file", "d2")) is not None
+        cache.close()
+
+
+class TestMediaUploaderDedup:
+    """Test MediaUploader with a cache."""
+
+    @pytest.fixture
+    def sdk_client(self):
+        """Create a mock SDK client returning fixed keys."""
+        client = MagicMock()
+        response = MagicMock()
+        response.success.return_value = True
+        response.data.image_key = "img_v2_logo"
+        response.data.file_key = "file_v2_report"
+        client.im.v1.image.create.return_value = response
+        client.im.v1.file.create.return_value = response
+        return client
+
+    @pytest.fixture
+    def uploader(self, sdk_client):
+        """Create a MediaUploader with an in-memory cache."""
+        pool = Mock(spec=CredentialPool)
+        pool._get_sdk_client.return_value = sdk_client
+        return MediaUploader(pool, cache=InMemoryMediaCache())
+
+    def test_same_image_uploaded_once(self, uploader, sdk_client, tmp_path):
+        """Test identical content under another path reuses the key."""
+        (tmp_path / "a.png").write_bytes(b"logo")
+        (tmp_path / "b.png").write_bytes(b"logo")
+
+        first = uploader.upload_image("cli_a", tmp_path / "a.png")
+        second = uploader.upload_image("cli_a", tmp_path / "b.png")
+
+        assert first.image_key == second.image_key == "img_v2_logo"
+        assert second.upload_time == first.upload_time
+        assert sdk_client.im.v1.image.create.call_count == 1
+
+    def test_changed_content_is_uploaded(self, uploader, sdk_client, tmp_path):
+        """Test a modified file misses the cache."""
+        path = tmp_path / "chart.png"
+        path.write_bytes(b"v1")
+        uploader.upload_image("cli_a", path)
+        path.write_bytes(b"v2")
+        uploader.upload_image("cli_a", path)
+
+        assert sdk_client.im.v1.image.create.call_count == 2
+
+    def test_file_dedup_keyed_by_name(self, uploader, sdk_client, tmp_path):
+        """Test files are reused only under the same name and type."""
+        (tmp_path / "report.pdf").write_bytes(b"%PDF")
+        (tmp_path / "copy.pdf").write_bytes(b"%PDF")
+
+        uploader.upload_file("cli_a", tmp_path / "report.pdf", file_type="pdf")
+        asset = uploader.upload_file("cli_a", tmp_path / "report.pdf", file_type="pdf")
+        uploader.upload_file("cli_a", tmp_path / "copy.pdf", file_type="pdf")
+
+        assert asset.file_key == "file_v2_report"
+        assert sdk_client.im.v1.file.create.call_count == 2
+
+    def test_cache_failure_does_not_fail_upload(self, sdk_client, tmp_path):
+        """Test an unavailable cache is logged and the upload still succeeds."""
+        cache = InMemoryMediaCache()
+        cache._get = Mock(side_effect=RuntimeError("database is locked"))
+        cache._set = Mock(side_effect=RuntimeError("database is locked"))
+        pool = Mock(spec=CredentialPool)
+        pool._get_sdk_client.return_value = sdk_client
+        uploader = MediaUploader(pool, cache=cache)
+        (tmp_path / "logo.png").write_bytes(b"logo")
+
+        asset = uploader.upload_image("cli_a", tmp_path / "logo.png")
+
+        assert asset.image_key == "img_v2_logo"
+        assert sdk_client.im.v1.image.create.call_count == 1
+        assert uploader.upload_image("cli_a", tmp_path / "logo.png").image_key == "img_v2_logo"
@@ -0,0 +1,95 @@
+"""
+Unit tests for upload sources.
+
+Tests paths, bytes-like objects, memory-mapped files and caller streams
+as rewindable sources, and that they encode correctly through the SDK
+multipart encoder.
+"""
+
+import hashlib
+import io
+
+import pytest
+from lark_oapi.core.utils.files import Files
+from requests_toolbelt import MultipartEncoder
+
+from lark_service.core.exceptions import InvalidParameterError
+from lark_service.messaging import media_source
+from lark_service.messaging.media_source import UploadSource
+
+DATA = bytes(range(256)) * 8
+
+
+@pytest.mark.parametrize("source", [DATA, bytearray(DATA), memoryview(DATA)])
+def test_bytes_like_sources(source):
+    """Test in-memory content reads, rewinds and hashes without a name."""
+    with UploadSource.open(source) as upload:
+        assert upload.size == len(DATA)
+        assert upload.name is None
+        assert upload.stream.read(10) == DATA[:10]
+        upload.rewind()
+        assert upload.stream.read() == DATA
+        assert upload.digest() == hashlib.sha256(DATA).hexdigest()
+        assert upload.head(4) == DATA[:4]
+
+
+def test_stream_source_starts_at_current_position():
+    """Test caller streams are read from their position and left open."""
+    stream = io.BytesIO(b"header" + DATA)
+    stream.seek(6)
+    with UploadSource.open(stream, file_name="data.bin") as upload:
+        assert upload.size == len(DATA)
+        assert upload.digest() == hashlib.sha256(DATA).hexdigest()
+        assert upload.stream.read() == DATA
+        upload.rewind()
+        assert upload.stream.tell() == 0
+    assert not stream.closed
+
+
+def test_large_file_is_memory_mapped(tmp_path, monkeypatch):
+    """Test files above the threshold are read through mmap."""
+    monkeypatch.setattr(media_source, "MMAP_THRESHOLD", 1024)
+    path = tmp_path / "big.png"
+    path.write_bytes(DATA)
+
+    upload = UploadSource.open(path)
+    assert upload.name == "big.png"
+    assert not isinstance(upload.stream, io.BufferedReader)
+    assert upload.digest() == hashlib.sha256(DATA).hexdigest()
+    assert upload.stream.read() == DATA
+    upload.close()
+    assert upload.stream.closed
+
+
+def test_invalid_sources(tmp_path):
+    """Test missing files and non-seekable streams are rejected."""
+    with pytest.raises(InvalidParameterError, match="File not found"):
+        UploadSource.open(tmp_path / "missing.png")
+
+    class Pipe(io.RawIOBase):
+        def readable(self):
+            return True
+
+    with pytest.raises(InvalidParameterError, match="seekable"):
+        UploadSource.open(Pipe())
+
+
+@pytest.mark.parametrize("threshold", [1, 1 << 30])
+def test_multipart_encoding_is_repeatable(tmp_path, monkeypatch, threshold):
+    """Test every attempt encodes the full content after a rewind."""
+    monkeypatch.setattr(media_source, "MMAP_THRESHOLD", threshold)
+    path = tmp_path / "chart.png"
+    path.write_bytes(DATA)
+
+    with UploadSource.open(path) as upload:
+        bodies = []
+        for _ in range(2):
+            upload.rewind()
+            encoder = MultipartEncoder(
+                Files.parse_form_data({"image_type": "message", "image": upload.stream}),
+                boundary="boundary",
+            )
+            bodies.append(encoder.to_string())
+
+    assert bodies[0] == bodies[1]
+    assert DATA in bodies[0]
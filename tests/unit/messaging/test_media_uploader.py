@@ -4,13 +4,25 @@ Unit tests for MediaUploader.
 Tests file size validation, file type validation, and upload logic.
 """
 
+import hashlib
+import io
+import threading
+import time
 from unittest.mock import MagicMock, Mock, patch
 
 import pytest
 
 from lark_service.core.credential_pool import CredentialPool
-from lark_service.core.exceptions import InvalidParameterError
-from lark_service.messaging.media_uploader import MediaUploader
+from lark_service.core.exceptions import (
+    InvalidParameterError,
+    LarkServiceError,
+    RetryableError,
+)
+from lark_service.core.retry import RetryStrategy
+from lark_service.messaging.media_cache import InMemoryMediaCache
+from lark_service.messaging.media_uploader import MediaUploader, UploadItem
+
+PNG_BYTES = b"\x89PNG\r\n\x1a\n" + b"\x00" * 64
 
 
 class TestMediaUploaderValidation:
@@ -97,22 +109,142 @@ class TestMediaUploaderUpload:
         """Create MediaUploader instance."""
         return MediaUploader(mock_credential_pool)
 
-    @pytest.mark.skip(reason="Requires complex SDK mocking - integration test preferred")
     def test_upload_image_success(self, uploader, tmp_path, mock_credential_pool):
         """Test successful image upload."""
-        pass
+        image = tmp_path / "test.png"
+        image.write_bytes(PNG_BYTES)
+
+        asset = uploader.upload_image("cli_a1b2c3d4e5f6g7h8", image)
+
+        assert asset.image_key == "img_v2_test123"
+        assert asset.file_size == len(PNG_BYTES)
+        client = mock_credential_pool._get_sdk_client.return_value
+        request = client.im.v1.image.create.call_args.args[0]
+        assert request.body.image_type == "message"
+
+    def test_upload_image_from_bytes_detects_format(self, uploader):
+        """Test unnamed in-memory images are validated by their signature."""
+        asset = uploader.upload_image("cli_a1b2c3d4e5f6g7h8", PNG_BYTES)
+        assert asset.image_key == "img_v2_test123"
+
+        with pytest.raises(InvalidParameterError, match="Unsupported image format"):
+            uploader.upload_image("cli_a1b2c3d4e5f6g7h8", b"not an image")
+
+    def test_upload_retry_rewinds_source(self, mock_credential_pool):
+        """Test every attempt uploads the full content of a fresh request."""
+        client = mock_credential_pool._get_sdk_client.return_value
+        success = client.im.v1.image.create.return_value
+        uploaded: list[bytes] = []
+
+        def create(request):
+            uploaded.append(request.body.image.read())
+            if len(uploaded) == 1:
+                raise RetryableError("connection reset")
+            return success
+
+        client.im.v1.image.create.side_effect = create
+        uploader = MediaUploader(mock_credential_pool, RetryStrategy(max_retries=2, base_delay=0))
+
+        asset = uploader.upload_image("cli_a1b2c3d4e5f6g7h8", io.BytesIO(PNG_BYTES))
+
+        assert asset.image_key == "img_v2_test123"
+        assert uploaded == [PNG_BYTES, PNG_BYTES]
 
     def test_upload_image_file_not_found(self, uploader):
         """Test image upload with non-existent file."""
         with pytest.raises(InvalidParameterError, match="Image file not found"):
             uploader.upload_image("cli_a1b2c3d4e5f6g7h8", "/nonexistent/file.jpg")
 
-    @pytest.mark.skip(reason="Requires complex SDK mocking - integration test preferred")
     def test_upload_file_success(self, uploader, tmp_path, mock_credential_pool):
         """Test successful file upload."""
-        pass
+        document = tmp_path / "report.pdf"
+        document.write_bytes(b"%PDF-1.4")
+
+        asset = uploader.upload_file("cli_a1b2c3d4e5f6g7h8", document, file_type="pdf")
+
+        assert asset.file_key == "file_v2_test456"
+        assert (asset.file_name, asset.file_type) == ("report.pdf", "application/pdf")
+        client = mock_credential_pool._get_sdk_client.return_value
+        request = client.im.v1.file.create.call_args.args[0]
+        assert request.body.file_name == "report.pdf"
+
+    def test_upload_file_from_bytes_requires_name(self, uploader):
+        """Test in-memory files need an explicit file name."""
+        with pytest.raises(InvalidParameterError, match="file_name is required"):
+            uploader.upload_file("cli_a1b2c3d4e5f6g7h8", b"a,b\n1,2\n")
+
+        asset = uploader.upload_file("cli_a1b2c3d4e5f6g7h8", b"a,b\n1,2\n", file_name="r.csv")
+        assert asset.file_name == "r.csv"
 
     def test_upload_file_not_found(self, uploader):
         """Test file upload with non-existent file."""
         with pytest.raises(InvalidParameterError, match="File not found"):
             uploader.upload_file("cli_a1b2c3d4e5f6g7h8", "/nonexistent/file.pdf")
+
+
+class TestMediaUploaderBatch:
+    """Test MediaUploader.upload_many."""
+
+    @pytest.fixture
+    def sdk_client(self):
+        """Create a mock SDK client whose uploads take a little time."""
+        client = MagicMock()
+        lock = threading.Lock()
+        client.active = client.peak = 0
+
+        def create(request):
+            with lock:
+                client.active += 1
+                client.peak = max(client.peak, client.active)
+            time.sleep(0.05)
+            with lock:
+                client.active -= 1
+            response = MagicMock()
+            response.success.return_value = True
+            response.data.image_key = f"img_v2_{hashlib.md5(request.body.image.read()).hexdigest()}"
+            return response
+
+        client.im.v1.image.create.side_effect = create
+        return client
+
+    @pytest.fixture
+    def pool(self, sdk_client):
+        """Create mock credential pool."""
+        pool = Mock(spec=CredentialPool)
+        pool._get_sdk_client.return_value = sdk_client
+        return pool
+
+    def test_results_in_order_with_failures(self, pool, sdk_client, tmp_path):
+        """Test items run concurrently and failures are reported per item."""
+        images = [PNG_BYTES + bytes([i]) for i in range(4)]
+        items = [images[0], "/nonexistent/a.png", images[1], UploadItem(images[2]), images[3]]
+
+        response = MediaUploader(pool).upload_many("cli_a1b2c3d4e5f6g7h8", items, max_workers=4)
+
+        assert (response.total, response.success, response.failed) == (5, 4, 1)
+        assert [r.index for r in response.results] == [0, 1, 2, 3, 4]
+        assert response.results[1].status == "failed"
+        assert "not found" in response.results[1].error
+        assert sdk_client.peak > 1
+        with pytest.raises(LarkServiceError, match="1 of 5 uploads failed") as exc_info:
+            response.media_keys  # noqa: B018
+        assert exc_info.value.details["failed_indexes"] == [1]
+        assert len([r.media_key for r in response.results if r.media_key]) == 4
+
+    def test_identical_items_uploaded_once(self, pool, sdk_client):
+        """Test concurrent uploads of the same content share one upload."""
+        uploader = MediaUploader(pool, cache=InMemoryMediaCache())
+
+        response = uploader.upload_many("cli_a1b2c3d4e5f6g7h8", [PNG_BYTES] * 6, max_workers=6)
+
+        assert response.success == 6
+        assert len(set(response.media_keys)) == 1
+        assert sdk_client.im.v1.image.create.call_count == 1
+
+    def test_invalid_arguments(self, pool):
+        """Test empty batches and invalid worker counts are rejected."""
+        uploader = MediaUploader(pool)
+        with pytest.raises(InvalidParameterError, match="cannot be empty"):
+            uploader.upload_many("cli_a1b2c3d4e5f6g7h8", [])
+        with pytest.raises(InvalidParameterError, match="max_workers"):
+            uploader.upload_many("cli_a1b2c3d4e5f6g7h8", [PNG_BYTES], max_workers=0)
@@ -0,0 +1,224 @@
+"""Unit tests for the callback HTTP server.
+
+Tests cover the aiohttp async mode (health check, URL verification,
+concurrent handler execution, the response deadline, OAuth redirects)
+and the bounded thread pool used by the threaded and prefork modes.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import threading
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+import pytest
+from aiohttp.test_utils import TestClient, TestServer
+
+from lark_service.cardkit.callback_handler import CallbackHandler
+from lark_service.core.exceptions import InvalidParameterError
+from lark_service.server.callback_router import CallbackRouter
+from lark_service.server.callback_server import (
+    AsyncCallbackApp,
+    CallbackRequestHandler,
+    CallbackServer,
+    PooledHTTPServer,
+    run_coroutine,
+)
+
+
+@pytest.fixture
+def router() -> CallbackRouter:
+    """Create an empty callback router."""
+    return CallbackRouter()
+
+
+async def _client(router: CallbackRouter, response_timeout: float | None = 2.5) -> TestClient:
+    app = AsyncCallbackApp(router, CallbackHandler("v_token"), response_timeout)
+    client = TestClient(TestServer(app.build()))
+    await client.start_server()
+    return client
+
+
+async def test_health_and_not_found(router: CallbackRouter) -> None:
+    """Test GET endpoints answer without routing."""
+    router.register("card_action_trigger", lambda data: None)
+    client = await _client(router)
+    try:
+        health = await client.get("/health")
+        assert (await health.json())["registered_handlers"] == ["card_action_trigger"]
+        assert (await client.get("/unknown")).status == 404
+    finally:
+        await client.close()
+
+
+async def test_duplicate_callbacks_routed_once(router: CallbackRouter) -> None:
+    """Test a redelivered event is acknowledged without reaching the handler."""
+    handled: list[str] = []
+
+    async def handler(data: dict[str, Any]) -> dict[str, Any]:
+        handled.append(data["header"]["event_id"])
+        return {"toast": "ok"}
+
+    router.register("card_action_trigger", handler)
+    client = await _client(router)
+    event = {"type": "card_action_trigger", "header": {"event_id": "evt_1"}}
+    try:
+        first = await client.post("/", json=event)
+        second = await client.post("/", json=event)
+        assert await first.json() == {"toast": "ok"}
+        assert (second.status, await second.json()) == (200, {})
+        assert handled == ["evt_1"]
+    finally:
+        await client.close()
+
+
+async def test_url_verification(router: CallbackRouter) -> None:
+    """Test URL verification echoes the challenge."""
+    client = await _client(router)
+    try:
+        resp = await client.post(
+            "/callback",
+            json={"type": "url_verification", "challenge": "abc", "token": "v_token"},
+        )
+        assert await resp.json() == {"challenge": "abc"}
+    finally:
+        await client.close()
+
+
+async def test_handlers_run_concurrently(router: CallbackRouter) -> None:
+    """Test slow handlers overlap on the shared event loop."""
+    active = 0
+    peak = 0
+
+    async def handler(data: dict[str, Any]) -> dict[str, Any]:
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.05)
+        active -= 1
+        return {"ok": data["n"]}
+
+    router.register("card_action_trigger", handler)
+    client = await _client(router)
+    try:
+        responses = await asyncio.gather(
+            *(client.post("/", json={"type": "card_action_trigger", "n": n}) for n in range(5))
+        )
+        assert [await r.json() for r in responses] == [{"ok": n} for n in range(5)]
+        assert peak == 5
+    finally:
+        await client.close()
+
+
+async def test_slow_handler_answered_before_deadline(router: CallbackRouter) -> None:
+    """Test a handler over the deadline gets {} and still completes."""
+    finished = asyncio.Event()
+
+    async def handler(data: dict[str, Any]) -> dict[str, Any]:
+        await asyncio.sleep(0.2)
+        finished.set()
+        return {"toast": "late"}
+
+    router.register("card_action_trigger", handler)
+    client = await _client(router, response_timeout=0.05)
+    try:
+        resp = await client.post("/", json={"type": "card_action_trigger"})
+        assert await resp.json() == {}
+        await asyncio.wait_for(finished.wait(), 1)
+    finally:
+        await client.close()
+
+
+async def test_oauth_redirect(router: CallbackRouter) -> None:
+    """Test OAuth redirect is routed as an oauth_redirect callback."""
+    received: list[dict[str, Any]] = []
+
+    async def handler(data: dict[str, Any]) -> dict[str, Any]:
+        received.append(data)
+        return {}
+
+    router.register("oauth_redirect", handler)
+    client = await _client(router)
+    try:
+        assert (await client.get("/callback?code=c1&state=s1")).status == 200
+        assert (await client.get("/callback?code=c1")).status == 400
+    finally:
+        await client.close()
+
+    assert received == [
+        {
+            "type": "oauth_redirect",
+            "authorization_code": "c1",
+            "state": "s1",
+            "session_id": "s1",
+        }
+    ]
+
+
+def test_invalid_settings() -> None:
+    """Test unknown modes and worker counts are rejected."""
+    with pytest.raises(InvalidParameterError):
+        CallbackServer("127.0.0.1", 0, "v_token", mode="fast")
+    with pytest.raises(InvalidParameterError):
+        CallbackServer("127.0.0.1", 0, "v_token", mode="threaded", max_workers=0)
+
+
+def test_run_coroutine_reuses_thread_loop() -> None:
+    """Test sync handlers share one event loop per thread."""
+
+    async def current_loop() -> asyncio.AbstractEventLoop:
+        return asyncio.get_running_loop()
+
+    def loops() -> tuple[Any, Any]:
+        return run_coroutine(current_loop()), run_coroutine(current_loop())
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        first, second = executor.submit(loops).result()
+    assert first is second
+
+
+def test_pooled_server_bounds_concurrency() -> None:
+    """Test the threaded server runs at most max_workers requests at once."""
+    router = CallbackRouter()
+    lock = threading.Lock()
+    active = 0
+    peak = 0
+
+    async def handler(data: dict[str, Any]) -> dict[str, Any]:
+        nonlocal active, peak
+        with lock:
+            active += 1
+            peak = max(peak, active)
+        await asyncio.sleep(0.1)
+        with lock:
+            active -= 1
+        return {"n": data["n"]}
+
+    router.register("card_action_trigger", handler)
+    CallbackRequestHandler.router = router
+    CallbackRequestHandler.lark_callback_handler = CallbackHandler("v_token")
+
+    httpd = PooledHTTPServer(("127.0.0.1", 0), CallbackRequestHandler, max_workers=2)
+    serve_thread = threading.Thread(target=httpd.serve_forever)
+    serve_thread.start()
+    url = f"http://127.0.0.1:{httpd.server_address[1]}/"
+
+    def post(n: int) -> dict[str, Any]:
+        body = json.dumps({"type": "card_action_trigger", "n": n}).encode()
+        with urllib.request.urlopen(urllib.request.Request(url, data=body), timeout=5) as resp:
+            result: dict[str, Any] = json.loads(resp.read())
+            return result
+
+    try:
+        with ThreadPoolExecutor(max_workers=6) as executor:
+            results = list(executor.map(post, range(6)))
+    finally:
+        httpd.shutdown()
+        httpd.server_close()
+        serve_thread.join()
+
+    assert results == [{"n": n} for n in range(6)]
+    assert peak == 2
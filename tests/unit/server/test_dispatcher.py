@@ -0,0 +1,226 @@
+"""Unit tests for deferred callback processing.
+
+Tests cover the in-memory and SQLite work queues, the DeferredDispatcher
+(deduplication, retries, dead letters) and the 503 answer of the server
+when the queue is full.
+"""
+
+from __future__ import annotations
+
+import time
+from pathlib import Path
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+from aiohttp.test_utils import TestClient, TestServer
+
+from lark_service.cardkit.callback_handler import CallbackHandler
+from lark_service.core.exceptions import QueueFullError
+from lark_service.server.callback_router import CallbackRouter
+from lark_service.server.callback_server import AsyncCallbackApp
+from lark_service.server.dispatcher import DeferredDispatcher, callback_id
+from lark_service.server.work_queue import (
+    InMemoryWorkQueue,
+    RabbitMQWorkQueue,
+    SQLiteWorkQueue,
+    WorkItem,
+)
+from lark_service.utils.ttl_set import TTLSet
+
+
+def _event(event_id: str, callback_type: str = "card_action_trigger") -> dict[str, Any]:
+    return {"schema": "2.0", "type": callback_type, "header": {"event_id": event_id}}
+
+
+def test_ttl_set_expiry_and_bound() -> None:
+    """Test members expire and the oldest member is evicted when full."""
+    seen = TTLSet(ttl_seconds=0.05, max_size=2)
+    assert seen.add("a") is True
+    assert seen.add("a") is False
+    seen.add("b")
+    seen.add("c")
+    assert "a" not in seen
+    assert len(seen) == 2
+    time.sleep(0.06)
+    assert len(seen) == 0
+
+
+def test_callback_id() -> None:
+    """Test event IDs are preferred over the body digest."""
+    assert callback_id(_event("evt_1")) == "evt_1"
+    assert callback_id({"uuid": "u1"}) == "u1"
+    assert callback_id({"a": 1, "b": 2}) == callback_id({"b": 2, "a": 1})
+
+
+def test_in_memory_queue_retry_and_capacity() -> None:
+    """Test delayed retries and QueueFullError at capacity."""
+    queue = InMemoryWorkQueue(maxsize=1)
+    queue.put(WorkItem("1", "t", {}))
+    with pytest.raises(QueueFullError):
+        queue.put(WorkItem("2", "t", {}))
+
+    item = queue.get(timeout=0)
+    assert item is not None
+    queue.retry(item, delay=0.05)
+    assert queue.get(timeout=0) is None
+    retried = queue.get(timeout=1)
+    assert retried is not None and retried.attempts == 1
+    queue.fail(retried, "boom")
+    assert list(queue.dead_letters) == [retried]
+    assert queue.qsize() == 0
+
+
+def test_rabbitmq_retry_uses_queue_per_delay() -> None:
+    """Test retries go to a TTL queue of their delay, not per-message expiration."""
+    with patch("lark_service.server.work_queue.pika.BlockingConnection") as connection:
+        channel = connection.return_value.channel.return_value
+        queue = RabbitMQWorkQueue(queue_name="cb")
+        for delay in (4.0, 1.0, 4.0):
+            queue.retry(WorkItem("1", "t", {}, receipt=7), delay)
+
+    declared = {
+        call.args[0]: call.kwargs["arguments"]
+        for call in channel.queue_declare.call_args_list
+        if call.args[0].startswith("cb.retry.")
+    }
+    assert declared == {
+        "cb.retry.4000": {
+            "x-message-ttl": 4000,
+            "x-dead-letter-exchange": "",
+            "x-dead-letter-routing-key": "cb",
+        },
+        "cb.retry.1000": {
+            "x-message-ttl": 1000,
+            "x-dead-letter-exchange": "",
+            "x-dead-letter-routing-key": "cb",
+        },
+    }
+    publishes = channel.basic_publish.call_args_list
+    assert [call.kwargs["routing_key"] for call in publishes] == [
+        "cb.retry.4000",
+        "cb.retry.1000",
+        "cb.retry.4000",
+    ]
+    assert all(call.kwargs["properties"].expiration is None for call in publishes)
+
+
+def test_sqlite_queue_dedup_and_lease(tmp_path: Path) -> None:
+    """Test processed IDs are ignored and expired leases are reclaimed."""
+    queue = SQLiteWorkQueue(tmp_path / "queue.db", visibility_timeout=0.05, poll_interval=0.01)
+    assert queue.put(WorkItem("1", "t", {"n": 1})) is True
+    assert queue.put(WorkItem("1", "t", {"n": 1})) is False
+
+    claimed = queue.get(timeout=0)
+    assert claimed is not None and claimed.payload == {"n": 1}
+    assert queue.get(timeout=0) is None
+    # The worker "crashed": the item reappears once the lease expires
+    reclaimed = queue.get(timeout=1)
+    assert reclaimed is not None and reclaimed.id == "1"
+
+    queue.ack(reclaimed)
+    assert queue.qsize() == 0
+    assert queue.put(WorkItem("1", "t", {"n": 1})) is False
+
+    queue.put(WorkItem("2", "t", {}))
+    failed = queue.get(timeout=0)
+    assert failed is not None
+    queue.fail(failed, "boom")
+    assert [item.id for item in queue.failed_items()] == ["2"]
+    queue.close()
+
+
+def test_dispatcher_acks_and_deduplicates() -> None:
+    """Test callbacks are acknowledged at once and processed exactly once."""
+    router = CallbackRouter()
+    handled: list[str] = []
+
+    async def handler(data: dict[str, Any]) -> dict[str, Any]:
+        handled.append(data["header"]["event_id"])
+        return {"toast": "ignored"}
+
+    router.register("card_action_trigger", handler)
+    dispatcher = DeferredDispatcher(router, workers=2)
+
+    assert dispatcher.submit(_event("evt_1")) == {}
+    assert dispatcher.submit(_event("evt_1")) == {}
+    assert dispatcher.submit({"type": "url_verification"}) == {}
+
+    dispatcher.start()
+    try:
+        deadline = time.monotonic() + 2
+        while dispatcher.stats["queued"] and time.monotonic() < deadline:
+            time.sleep(0.01)
+    finally:
+        dispatcher.stop()
+
+    assert handled == ["evt_1"]
+    stats = dispatcher.stats
+    assert stats["duplicates"] == 1
+    assert stats["processed"] == 1
+    assert stats["failed"] == 1  # no handler for url_verification
+
+
+def test_dispatcher_skips_non_deferred_types() -> None:
+    """Test types outside deferred_types are left to inline routing."""
+    dispatcher = DeferredDispatcher(CallbackRouter(), deferred_types={"im.message.receive_v1"})
+    assert dispatcher.submit(_event("evt_1")) is None
+    assert dispatcher.stats["accepted"] == 0
+
+
+def test_dispatcher_retries_then_dead_letters() -> None:
+    """Test failing handlers are retried with backoff, then dead-lettered."""
+    router = CallbackRouter()
+    attempts: list[int] = []
+
+    async def flaky(data: dict[str, Any]) -> dict[str, Any]:
+        attempts.append(len(attempts))
+        if data["header"]["event_id"] == "evt_bad" or len(attempts) < 2:
+            raise RuntimeError("downstream unavailable")
+        return {}
+
+    router.register("card_action_trigger", flaky)
+    queue = InMemoryWorkQueue()
+    dispatcher = DeferredDispatcher(router, queue, max_attempts=2, retry_delay=0.01)
+
+    dispatcher.submit(_event("evt_ok"))
+    for _ in range(2):
+        item = queue.get(timeout=1)
+        assert item is not None
+        dispatcher.process(item)
+    assert dispatcher.stats["processed"] == 1
+
+    dispatcher.submit(_event("evt_bad"))
+    for _ in range(2):
+        item = queue.get(timeout=1)
+        assert item is not None
+        dispatcher.process(item)
+    assert [item.id for item in queue.dead_letters] == ["evt_bad"]
+    assert dispatcher.stats["retried"] == 2
+
+
+def test_dispatcher_queue_full_allows_redelivery() -> None:
+    """Test a rejected callback is not remembered as seen."""
+    dispatcher = DeferredDispatcher(CallbackRouter(), InMemoryWorkQueue(maxsize=1))
+    dispatcher.submit(_event("evt_1"))
+    with pytest.raises(QueueFullError):
+        dispatcher.submit(_event("evt_2"))
+
+    dispatcher.queue.get(timeout=0)
+    assert dispatcher.submit(_event("evt_2")) == {}
+    assert dispatcher.stats["rejected"] == 1
+
+
+async def test_async_app_answers_503_when_queue_full() -> None:
+    """Test the server asks Feishu to redeliver when the queue is full."""
+    dispatcher = DeferredDispatcher(CallbackRouter(), InMemoryWorkQueue(maxsize=1))
+    app = AsyncCallbackApp(CallbackRouter(), CallbackHandler("v_token"), dispatcher=dispatcher)
+    client = TestClient(TestServer(app.build()))
+    await client.start_server()
+    try:
+        first = await client.post("/", json=_event("evt_1"))
+        assert (first.status, await first.json()) == (200, {})
+        second = await client.post("/", json=_event("evt_2"))
+        assert second.status == 503
+    finally:
+        await client.close()